@@ -0,0 +1,180 @@
+import numpy as np
+import pandas as pd
+from analysis.factor_panel import FactorPanel
+from analysis.portfolio_analyzer import factor_analysis_regression_batch
+from analysis.portfolio_statistics import calculate_portfolio_statistics_frame, portfolio_statistics_keys
+from analysis.relative_statistics import calculate_relative_statistics, align_return_panels
+
+# Relative statistics of the portfolio against each benchmark (see calculate_relative_statistics())
+benchmark_relative_keys = ["tracking_error", "information_ratio", "beta", "alpha", "up_capture", "down_capture"]
+
+# Factor regression outputs of every series (see factor_analysis_regression_batch())
+benchmark_factor_keys = ["factor_alpha", "Mkt_rf", "SMB", "HML", "Mom", "r_squared"]
+
+# Columns of compare_portfolio_with_benchmarks()
+benchmark_comparison_keys = portfolio_statistics_keys + ["sortino_ratio"] + benchmark_relative_keys + benchmark_factor_keys
+
+# Sections of print_benchmark_comparison(): (title, [(key, label, format)])
+benchmark_comparison_sections = [
+    ("Performance", [
+        ("mean_return", "Mean Return", "{:.2%}"),
+        ("annualized_return", "Annualized Return", "{:.2%}"),
+        ("std_dev", "Volatility", "{:.2%}"),
+        ("annualized_volatility", "Annualized Volatility", "{:.2%}"),
+        ("sharpe_ratio", "Sharpe Ratio (rf=0)", "{:.2f}"),
+        ("sortino_ratio", "Sortino Ratio (rf=0)", "{:.2f}"),
+        ("cumulative_return", "Cumulative Return", "{:.2%}"),
+        ("max_drawdown", "Maximum Drawdown", "{:.2%}")]),
+    ("Portfolio vs. Benchmark", [
+        ("tracking_error", "Tracking Error", "{:.2%}"),
+        ("information_ratio", "Information Ratio", "{:.2f}"),
+        ("beta", "Beta", "{:.2f}"),
+        ("alpha", "Alpha (annualized)", "{:.2%}"),
+        ("up_capture", "Up Capture", "{:.2f}"),
+        ("down_capture", "Down Capture", "{:.2f}")]),
+    ("Factor Exposures", [
+        ("factor_alpha", "Alpha (monthly, %)", "{:+.2f}"),
+        ("Mkt_rf", "Mkt_rf", "{:+.2f}"),
+        ("SMB", "SMB", "{:+.2f}"),
+        ("HML", "HML", "{:+.2f}"),
+        ("Mom", "Mom", "{:+.2f}"),
+        ("r_squared", "R²", "{:.2f}")])
+]
+
+
+def compare_portfolio_with_benchmarks(portfolio_returns: pd.Series, benchmark_returns: pd.DataFrame, interval: str = "monthly",
+                                      factor_panel: FactorPanel | None = None, portfolio_name: str = "MVP") -> pd.DataFrame:
+    """
+    Compares a portfolio with several market benchmarks in one pass, e.g., the minimum variance portfolio with all
+    indices of valid_mkt_benchmarks in config.py. All series are evaluated on their common dates, so the rows are
+    directly comparable:
+    - performance statistics of every series (calculate_portfolio_statistics_frame() and the Sortino ratio),
+    - relative statistics of the portfolio against every benchmark (calculate_relative_statistics()),
+    - factor exposures of every series from one batch regression on the Fama-French + Momentum factors
+      (factor_analysis_regression_batch()), so the tilts of the portfolio can be read against those of each benchmark.
+
+    Parameters
+    ----------
+    portfolio_returns : pd.Series
+        Time series of returns of the portfolio (with datetime index).
+    benchmark_returns : pd.DataFrame
+        Returns with one column per benchmark (with datetime index), e.g., the output of fetch_returns_with_benchmarks().
+    interval : str, optional
+        Frequency of the returns (used for annualization). One of: 'daily', 'monthly', 'yearly'. Default is 'monthly'.
+        The factor regression requires monthly returns and is skipped (NaN) for other intervals.
+    factor_panel : FactorPanel, optional
+        Factor data to regress on. Defaults to the process-wide panel of get_factor_panel().
+    portfolio_name : str, optional
+        Row label of the portfolio. The default is "MVP". Must differ from the benchmark names.
+
+    Raises
+    ------
+    TypeError
+        If portfolio_returns is not a pandas Series, benchmark_returns is not a pandas DataFrame, or portfolio_name
+        is not a string.
+    ValueError
+        If there are no benchmarks, the portfolio name equals a benchmark name, the series share fewer than 2 dates,
+        the interval is not recognized, or the factor regression has fewer than 5 observations.
+    RuntimeError
+        If the factor regression fails.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per series (the portfolio first, then the benchmarks) and the columns of benchmark_comparison_keys.
+        The relative statistics are NaN in the row of the portfolio.
+    """
+
+    # Type and value checks
+    if not isinstance(portfolio_returns, pd.Series):
+        raise TypeError("Portfolio returns must be a pandas Series.")
+    if not isinstance(benchmark_returns, pd.DataFrame):
+        raise TypeError("Benchmark returns must be a pandas DataFrame.")
+    if not isinstance(portfolio_name, str):
+        raise TypeError("Portfolio name must be a string.")
+    if benchmark_returns.shape[1] == 0:
+        raise ValueError("At least one benchmark is required.")
+    if portfolio_name in benchmark_returns.columns:
+        raise ValueError(f"Portfolio name '{portfolio_name}' is also the name of a benchmark.")
+
+    # Common dates of all series
+    portfolios, benchmarks = align_return_panels(portfolio_returns.to_frame(portfolio_name), benchmark_returns)
+    combined = pd.concat([portfolios, benchmarks], axis=1)
+
+    # Relative statistics of all series against all benchmarks in one call: the rows of the portfolio give the
+    # relative statistics, and the (benchmark-independent) Sortino ratio of every series comes along
+    relative_df = calculate_relative_statistics(combined, benchmarks, interval=interval)
+    first_benchmark = benchmarks.columns[0]
+
+    comparison_df = calculate_portfolio_statistics_frame(combined, interval=interval)
+    comparison_df["sortino_ratio"] = relative_df.xs(first_benchmark, level="benchmark")["sortino_ratio"]
+    portfolio_relative = relative_df.xs(portfolio_name, level="portfolio")
+    for key in benchmark_relative_keys:
+        comparison_df[key] = portfolio_relative[key].reindex(comparison_df.index)
+
+    # Factor regression of all series with one factorization
+    if interval.lower() == "monthly":
+        tidy_df = factor_analysis_regression_batch(combined, factor_panel=factor_panel)
+        coefs = tidy_df.pivot(index="portfolio", columns="term", values="coef")
+        comparison_df["factor_alpha"] = coefs["const"]
+        for factor in ["Mkt_rf", "SMB", "HML", "Mom"]:
+            comparison_df[factor] = coefs[factor]
+        comparison_df["r_squared"] = tidy_df.groupby("portfolio")["r_squared"].first()
+    else:
+        for key in benchmark_factor_keys:
+            comparison_df[key] = np.nan
+
+    return comparison_df[benchmark_comparison_keys]
+
+
+def print_benchmark_comparison(comparison_df: pd.DataFrame, column_width: int = 12) -> None:
+    """
+    Prints the output of compare_portfolio_with_benchmarks() as one table with a column per series and a row per
+    statistic, grouped into performance, relative statistics and factor exposures. Undefined values are shown as "-".
+
+    Parameters
+    ----------
+    comparison_df : pd.DataFrame
+        Output of compare_portfolio_with_benchmarks().
+    column_width : int, optional
+        Width of each series column (default = 12 characters).
+
+    Raises
+    ------
+    TypeError
+        If comparison_df is not a pandas DataFrame or column_width is not an integer.
+    ValueError
+        If comparison_df is empty or column_width is not positive.
+    KeyError
+        If columns of benchmark_comparison_keys are missing.
+
+    Returns
+    -------
+    None
+        Only prints the table to the console.
+    """
+
+    # Type and value checks
+    if not isinstance(comparison_df, pd.DataFrame):
+        raise TypeError("Comparison must be provided as a pandas DataFrame.")
+    if not isinstance(column_width, int) or isinstance(column_width, bool):
+        raise TypeError("Column width must be an integer.")
+    if comparison_df.empty:
+        raise ValueError("Comparison DataFrame cannot be empty.")
+    if column_width <= 0:
+        raise ValueError("Column width must be positive.")
+    missing_keys = [key for key in benchmark_comparison_keys if key not in comparison_df.columns]
+    if missing_keys:
+        raise KeyError(f"Missing column(s) in benchmark comparison: {missing_keys}.")
+
+    label_width = 24
+    header = f"{'':<{label_width}}" + "".join(f"{str(name):>{column_width}}" for name in comparison_df.index)
+
+    print("\n\t=== Portfolio vs. All Benchmarks ===")
+    for title, rows in benchmark_comparison_sections:
+        print(f"\n{title}")
+        print(header)
+        for key, label, fmt in rows:
+            cells = [fmt.format(value) if np.isfinite(value) else "-" for value in comparison_df[key]]
+            print(f"{label:<{label_width}}" + "".join(f"{cell:>{column_width}}" for cell in cells))
+    print()
@@ -0,0 +1,213 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from config import bootstrap_replicates, bootstrap_chunk_size
+from analysis.factor_panel import FactorPanel
+from analysis.portfolio_analyzer import get_factor_regression_data
+from analysis.ols_engine import fit_ols
+
+valid_bootstrap_methods = ("stationary", "moving")
+
+
+def bootstrap_indices(n_obs: int, n_replicates: int, block_length: float, method: str = "stationary",
+                      rng: np.random.Generator | None = None) -> np.ndarray:
+    """
+    Draws the resampled observation indices of all bootstrap replicates at once as one 2D array.
+    Blocks wrap around the end of the sample (circular), so every observation is drawn with the same probability.
+
+    - "stationary": blocks of random length (geometric with mean block_length), as in Politis and Romano (1994).
+      Every position starts a new block with probability 1 / block_length.
+    - "moving": blocks of fixed length round(block_length) with random starts.
+
+    Parameters
+    ----------
+    n_obs : int
+        Number of observations T in the sample.
+    n_replicates : int
+        Number of bootstrap replicates B.
+    block_length : float
+        (Mean) block length. Must be at least 1; a length of 1 gives the i.i.d. bootstrap.
+    method : str, optional
+        "stationary" (default) or "moving".
+    rng : np.random.Generator, optional
+        Random number generator. Defaults to a new unseeded generator.
+
+    Raises
+    ------
+    ValueError
+        If n_obs or n_replicates are not positive, block_length is below 1, or the method is not supported.
+
+    Returns
+    -------
+    np.ndarray
+        Indices as B x T integer array.
+    """
+
+    if n_obs <= 0 or n_replicates <= 0:
+        raise ValueError("n_obs and n_replicates must be positive.")
+    if block_length < 1:
+        raise ValueError("block_length must be at least 1.")
+    if method not in valid_bootstrap_methods:
+        raise ValueError(f"Unsupported bootstrap method '{method}'. Use one of {valid_bootstrap_methods}.")
+    rng = np.random.default_rng() if rng is None else rng
+
+    if method == "moving":
+        length = max(int(round(block_length)), 1)
+        n_blocks = -(-n_obs // length) # Ceiling division
+        starts = rng.integers(0, n_obs, size=(n_replicates, n_blocks))
+        indices = (starts[:, :, None] + np.arange(length)).reshape(n_replicates, -1)[:, :n_obs]
+        return indices % n_obs
+
+    # Stationary bootstrap: position of the latest block start for every position, then offset from that start
+    positions = np.arange(n_obs)
+    new_block = rng.random((n_replicates, n_obs)) < 1.0 / block_length
+    new_block[:, 0] = True
+    block_start = np.maximum.accumulate(np.where(new_block, positions, 0), axis=1)
+    starts = rng.integers(0, n_obs, size=(n_replicates, n_obs))
+    first_index = np.take_along_axis(starts, block_start, axis=1)
+
+    return (first_index + positions - block_start) % n_obs
+
+
+def bootstrap_ols_coefficients(y: np.ndarray, X: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """
+    Fits the OLS regressions of all bootstrap replicates at once (X must contain the intercept column).
+    A replicate only changes how often each observation is used, so its cross-products are weighted sums of the
+    per-observation cross-products: with the count matrix C (B x T), X_b'X_b = C P with P = [x_t x_t'] (T x k²) and
+    X_b'y_b = C [x_t y_t]. All replicates are then solved in one batched call.
+
+    Parameters
+    ----------
+    y : np.ndarray
+        Dependent variable with T observations.
+    X : np.ndarray
+        Regressors as T x k matrix (including the intercept).
+    indices : np.ndarray
+        Resampled indices as B x T integer array, see bootstrap_indices().
+
+    Returns
+    -------
+    np.ndarray
+        Coefficients as B x k array. Replicates with linearly dependent regressors are NaN.
+    """
+
+    n_replicates, n_obs = indices.shape
+    k = X.shape[1]
+
+    # Count matrix: how often observation t is drawn in replicate b
+    flat = (np.arange(n_replicates)[:, None] * n_obs + indices).ravel()
+    counts = np.bincount(flat, minlength=n_replicates * n_obs).reshape(n_replicates, n_obs).astype(float)
+
+    XtX = (counts @ (X[:, :, None] * X[:, None, :]).reshape(n_obs, k * k)).reshape(n_replicates, k, k)
+    Xty = counts @ (X * y[:, None])
+
+    try:
+        return np.linalg.solve(XtX, Xty[:, :, None])[:, :, 0]
+    except np.linalg.LinAlgError:
+        # At least one singular replicate (e.g., a constant regressor) -> solve one by one
+        coef = np.full((n_replicates, k), np.nan)
+        for b in range(n_replicates):
+            try:
+                coef[b] = np.linalg.solve(XtX[b], Xty[b])
+            except np.linalg.LinAlgError:
+                pass
+        return coef
+
+
+def run_bootstrap_chunk(y: np.ndarray, X: np.ndarray, n_replicates: int, block_length: float, method: str,
+                        seed: np.random.SeedSequence) -> np.ndarray:
+    """
+    Draws and fits one chunk of bootstrap replicates with its own random stream (worker function of the process pool).
+    """
+
+    indices = bootstrap_indices(len(y), n_replicates, block_length, method, np.random.default_rng(seed))
+
+    return bootstrap_ols_coefficients(y, X, indices)
+
+
+def bootstrap_factor_exposures(portfolio_returns: pd.Series, n_replicates: int = bootstrap_replicates,
+                               block_length: float | None = None, method: str = "stationary", confidence: float = 0.95,
+                               seed: int | None = None, n_jobs: int = 1, factor_panel: FactorPanel | None = None) -> pd.DataFrame:
+    """
+    Estimates confidence intervals for the alpha and the factor exposures (betas) of factor_analysis_regression()
+    with a block bootstrap, which keeps the autocorrelation of monthly returns within blocks.
+
+    The replicates are processed in chunks of bootstrap_chunk_size (config.py). Every chunk has its own random
+    stream spawned from the seed, so the results for a given seed are identical for any number of processes.
+
+    Parameters
+    ----------
+    portfolio_returns : pd.Series
+        Monthly returns of the portfolio (with datetime index).
+    n_replicates : int, optional
+        Number of bootstrap replicates. Defaults to bootstrap_replicates from config.py.
+    block_length : float, optional
+        (Mean) block length in months. Defaults to T^(1/3), rounded up.
+    method : str, optional
+        "stationary" (default, random block lengths) or "moving" (fixed block length).
+    confidence : float, optional
+        Confidence level of the percentile intervals. The default is 0.95.
+    seed : int, optional
+        Seed for reproducible results. The default is None (not reproducible).
+    n_jobs : int, optional
+        Number of worker processes. The default is 1 (no process pool).
+    factor_panel : FactorPanel, optional
+        Factor data to regress on. Defaults to the process-wide panel of get_factor_panel().
+
+    Raises
+    ------
+    TypeError
+        If portfolio_returns is not a pandas Series with datetime index, or n_replicates/n_jobs are not integers.
+    ValueError
+        If the returns are invalid (see get_factor_regression_data()), there are fewer than 10 overlapping months,
+        n_replicates/n_jobs are not positive, confidence is not in (0, 1), or the method/block length are invalid.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per term (alpha, Mkt_rf, SMB, HML, Mom) with the columns estimate (full-sample OLS), std_err
+        (standard deviation of the replicates), ci_lower and ci_upper.
+    """
+
+    for name, value in (("n_replicates", n_replicates), ("n_jobs", n_jobs)):
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"{name} must be an integer.")
+        if value <= 0:
+            raise ValueError(f"{name} must be a positive integer.")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1.")
+    if method not in valid_bootstrap_methods:
+        raise ValueError(f"Unsupported bootstrap method '{method}'. Use one of {valid_bootstrap_methods}.")
+
+    excess, factors = get_factor_regression_data(portfolio_returns, factor_panel)
+    if len(excess) < 10:
+        raise ValueError("Not enough overlapping data points to bootstrap the regression (need at least 10).")
+
+    y = excess.to_numpy(dtype=float)
+    X = np.column_stack([np.ones(len(y)), factors.to_numpy(dtype=float)])
+    block_length = float(np.ceil(len(y) ** (1 / 3))) if block_length is None else block_length
+    if block_length < 1:
+        raise ValueError("block_length must be at least 1.")
+
+    # Fixed chunks with spawned random streams -> results do not depend on n_jobs
+    chunk_sizes = [min(bootstrap_chunk_size, n_replicates - start) for start in range(0, n_replicates, bootstrap_chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    args = [(y, X, size, block_length, method, chunk_seed) for size, chunk_seed in zip(chunk_sizes, seeds)]
+
+    if n_jobs == 1 or len(args) == 1:
+        chunks = [run_bootstrap_chunk(*arg) for arg in args]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(args))) as executor:
+            chunks = list(executor.map(run_bootstrap_chunk, *zip(*args)))
+    coef = np.vstack(chunks)
+
+    names = ["alpha"] + list(factors.columns)
+    estimate = fit_ols(y, X[:, 1:], add_constant=True).params.to_numpy()
+    tail = (1 - confidence) / 2 * 100
+
+    return pd.DataFrame({
+        "estimate": estimate,
+        "std_err": np.nanstd(coef, axis=0, ddof=1),
+        "ci_lower": np.nanpercentile(coef, tail, axis=0),
+        "ci_upper": np.nanpercentile(coef, 100 - tail, axis=0)
+    }, index=names)
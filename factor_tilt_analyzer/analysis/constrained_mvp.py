@@ -0,0 +1,392 @@
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from scipy import optimize
+from config import mvp_cov_estimator, mvp_long_only, mvp_max_weight, mvp_factor_targets
+from analysis.covariance_estimators import estimate_covariance
+from analysis.factor_covariance import estimate_factor_covariance, factor_model_columns
+from analysis.minimum_variance_portfolio import valid_cov_estimators, get_asset_factor_betas
+
+
+@dataclass(frozen=True)
+class ActiveSetResult:
+    """
+    Result of solve_active_set_qp().
+    """
+
+    x: np.ndarray                   # Optimal solution
+    at_lower: np.ndarray            # Boolean mask of the variables fixed at their lower bound
+    at_upper: np.ndarray            # Boolean mask of the variables fixed at their upper bound
+    active_rows: np.ndarray         # Indices of the active inequality rows (C x <= d)
+    iterations: int                 # Number of active-set iterations
+    objective: float                # ½xᵀHx + qᵀx
+
+
+def find_feasible_point(lower: np.ndarray, upper: np.ndarray, A_eq: np.ndarray, b_eq: np.ndarray,
+                        C: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """
+    Returns a vertex of the feasible set {A_eq x = b_eq, C x <= d, lower <= x <= upper} from a linear program
+    with zero objective (cold start of solve_active_set_qp()).
+
+    Raises
+    ------
+    ValueError
+        If the constraints are infeasible.
+    """
+
+    result = optimize.linprog(np.zeros(len(lower)), A_ub=C if len(C) else None, b_ub=d if len(C) else None,
+                              A_eq=A_eq, b_eq=b_eq, bounds=np.column_stack([lower, upper]), method="highs")
+    if result.status != 0:
+        raise ValueError(f"The portfolio constraints are infeasible: {result.message}")
+
+    return np.clip(result.x, lower, upper)
+
+
+def solve_active_set_qp(H: np.ndarray, q: np.ndarray, lower: np.ndarray, upper: np.ndarray, A_eq: np.ndarray,
+                        b_eq: np.ndarray, C: np.ndarray | None = None, d: np.ndarray | None = None,
+                        x0: np.ndarray | None = None, max_iter: int | None = None, tol: float = 1e-10) -> ActiveSetResult:
+    """
+    Solves the convex quadratic program
+
+        min ½xᵀHx + qᵀx   s.t.   A_eq x = b_eq,   C x <= d,   lower <= x <= upper
+
+    with a primal active-set method (Nocedal and Wright, Algorithm 16.3). Variables at an active bound are fixed,
+    so every iteration only solves the KKT system of the free variables and the working constraints. Each iteration
+    adds the first blocking constraint or releases the constraint with the most negative multiplier, until all
+    multipliers have the correct sign.
+
+    A feasible x0 (e.g., the solution of the previous rebalance) is used as warm start: its active constraints form
+    the initial working set, so small changes of H converge in a few iterations. Without (a feasible) x0, the solver
+    starts from a vertex of the feasible set (see find_feasible_point()).
+
+    Parameters
+    ----------
+    H : np.ndarray
+        Positive definite N x N matrix.
+    q : np.ndarray
+        Linear term of length N.
+    lower, upper : np.ndarray
+        Bounds of length N (-inf/inf for unbounded variables).
+    A_eq, b_eq : np.ndarray
+        Equality constraints as m x N matrix and vector of length m.
+    C, d : np.ndarray, optional
+        Inequality constraints as p x N matrix and vector of length p.
+    x0 : np.ndarray, optional
+        Warm start. Ignored if it violates the constraints.
+    max_iter : int, optional
+        Maximum number of iterations. Defaults to 10 * (N + p) + 100.
+    tol : float, optional
+        Relative tolerance of the optimality and feasibility checks. The default is 1e-10.
+
+    Raises
+    ------
+    ValueError
+        If the constraints are infeasible.
+    RuntimeError
+        If the solver does not converge within max_iter iterations.
+
+    Returns
+    -------
+    ActiveSetResult
+        Solution, active constraints and number of iterations.
+    """
+
+    n = len(q)
+    C = np.zeros((0, n)) if C is None else np.atleast_2d(C)
+    d = np.zeros(0) if d is None else np.asarray(d, dtype=float)
+    A_eq = np.atleast_2d(A_eq)
+    max_iter = 10 * (n + len(C)) + 100 if max_iter is None else max_iter
+    scale = max(np.abs(np.diag(H)).max(), np.abs(q).max() if n else 0.0, 1e-300) # Scale of the multipliers
+    feas_tol = 1e-9
+
+    # Warm start if feasible, otherwise a vertex of the feasible set
+    feasible = (
+        x0 is not None
+        and np.all(x0 >= lower - feas_tol) and np.all(x0 <= upper + feas_tol)
+        and np.allclose(A_eq @ x0, b_eq, atol=feas_tol) and np.all(C @ x0 <= d + feas_tol)
+    )
+    x = np.clip(x0, lower, upper) if feasible else find_feasible_point(lower, upper, A_eq, b_eq, C, d)
+
+    # Working set: variables fixed at a bound and active inequality rows
+    at_lower = np.isclose(x, lower, rtol=0.0, atol=feas_tol)
+    at_upper = np.isclose(x, upper, rtol=0.0, atol=feas_tol) & ~at_lower
+    x[at_lower], x[at_upper] = lower[at_lower], upper[at_upper]
+    active_rows = []
+
+    for iteration in range(1, max_iter + 1):
+        free = ~(at_lower | at_upper)
+        E = np.vstack([A_eq, C[active_rows]]) # Working equality constraints
+        n_free, n_eq = int(free.sum()), len(E)
+
+        # KKT system of the free variables: [H_FF E_Fᵀ; E_F 0] [x_F; ν] = [-q_F - H_FB x_B; e - E_B x_B]
+        kkt = np.zeros((n_free + n_eq, n_free + n_eq))
+        kkt[:n_free, :n_free] = H[np.ix_(free, free)]
+        kkt[:n_free, n_free:] = E[:, free].T
+        kkt[n_free:, :n_free] = E[:, free]
+        rhs = np.concatenate([
+            -q[free] - H[np.ix_(free, ~free)] @ x[~free],
+            np.concatenate([b_eq, d[active_rows]]) - E[:, ~free] @ x[~free]
+        ])
+        try:
+            solution = np.linalg.solve(kkt, rhs)
+        except np.linalg.LinAlgError:
+            solution = np.linalg.lstsq(kkt, rhs, rcond=None)[0] # Redundant working constraints
+        p = np.zeros(n)
+        p[free] = solution[:n_free] - x[free]
+        nu = solution[n_free:]
+
+        if np.abs(p).max(initial=0.0) <= feas_tol * max(1.0, np.abs(x).max()):
+            # Stationary on the working set: check the signs of the multipliers
+            gradient = H @ x + q + E.T @ nu
+            multipliers = np.concatenate([
+                np.where(at_lower, gradient, np.inf),   # Lower bounds: g_i >= 0
+                np.where(at_upper, -gradient, np.inf),  # Upper bounds: g_i <= 0
+                nu[len(A_eq):]                          # Inequality rows: μ >= 0
+            ])
+            worst = int(np.argmin(multipliers)) if len(multipliers) else 0
+            if not len(multipliers) or multipliers[worst] >= -tol * scale:
+                return ActiveSetResult(x, at_lower, at_upper, np.array(sorted(active_rows), dtype=int), iteration,
+                                       float(0.5 * x @ H @ x + q @ x))
+
+            # Release the constraint with the most negative multiplier
+            if worst < n:
+                at_lower[worst] = False
+            elif worst < 2 * n:
+                at_upper[worst - n] = False
+            else:
+                active_rows.pop(worst - 2 * n)
+            continue
+
+        # Step length: largest α <= 1 that keeps all constraints outside the working set satisfied
+        alpha, blocking = 1.0, None
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios_lower = np.where(free & (p < 0), (lower - x) / p, np.inf)
+            ratios_upper = np.where(free & (p > 0), (upper - x) / p, np.inf)
+            Cp = C @ p
+            inactive = np.ones(len(C), dtype=bool)
+            inactive[active_rows] = False
+            ratios_rows = np.where(inactive & (Cp > 1e-12 * np.abs(p).max()), (d - C @ x) / Cp, np.inf)
+        for kind, ratios in (("lower", ratios_lower), ("upper", ratios_upper), ("row", ratios_rows)):
+            if len(ratios) and ratios.min() < alpha:
+                alpha, blocking = max(float(ratios.min()), 0.0), (kind, int(np.argmin(ratios)))
+
+        x = x + alpha * p
+        if blocking is not None:
+            kind, index = blocking
+            if kind == "lower":
+                at_lower[index], x[index] = True, lower[index]
+            elif kind == "upper":
+                at_upper[index], x[index] = True, upper[index]
+            else:
+                active_rows.append(index)
+
+    raise RuntimeError(f"Active-set QP did not converge within {max_iter} iterations.")
+
+
+def solve_constrained_mvp(returns_df: pd.DataFrame, long_only: bool = True, max_weight: float | pd.Series | None = None,
+                          min_weight: float | pd.Series | None = None, groups: dict[str, str] | pd.Series | None = None,
+                          group_caps: dict[str, float] | None = None, previous_weights: pd.Series | None = None,
+                          cov_estimator: str = mvp_cov_estimator, factor_targets: dict[str, float] | None = None) -> tuple[pd.Series, ActiveSetResult]:
+    """
+    Computes the minimum variance portfolio under investment constraints with the active-set QP engine
+    (see solve_active_set_qp()): fully invested (weights sum to 100%), optionally long-only, with per-asset
+    weight limits, caps on the total weight of asset groups (e.g., sectors) and factor exposure targets.
+
+    Parameters
+    ----------
+    returns_df : pd.DataFrame
+        Returns of each asset (columns = assets, rows = time periods).
+    long_only : bool, optional
+        If True (default), short positions are not allowed (lower bound 0).
+    max_weight : float | pd.Series, optional
+        Upper bound per asset, as one value for all assets or per ticker (missing tickers are unbounded).
+    min_weight : float | pd.Series, optional
+        Lower bound per asset (overrides the bound of long_only), as one value or per ticker.
+    groups : dict[str, str] | pd.Series, optional
+        Group of each ticker, e.g., {"AAPL": "Tech", "MSFT": "Tech", "KO": "Staples"}.
+    group_caps : dict[str, float], optional
+        Maximum total weight per group, e.g., {"Tech": 0.4}.
+    previous_weights : pd.Series, optional
+        Weights of the previous rebalance as warm start (tickers not in returns_df are ignored, new tickers start at 0).
+    cov_estimator : str, optional
+        Covariance estimator, see calculate_mvp_weights(). Defaults to mvp_cov_estimator from config.py.
+    factor_targets : dict[str, float], optional
+        Factor exposures the portfolio must have, e.g., {"HML": 0.3}, as equality constraints on the weighted
+        asset betas (see calculate_mvp_weights(), requires a datetime index). The default is None (no targets).
+
+    Raises
+    ------
+    TypeError
+        If returns_df is not a pandas DataFrame, or factor targets are given without a datetime index.
+    ValueError
+        If the DataFrame is empty, contains NaNs, has fewer than 2 assets or too few time periods, the covariance
+        estimator is not supported, a capped group has no tickers, the factor targets are invalid, or the
+        constraints are infeasible.
+    RuntimeError
+        If the QP solver does not converge.
+
+    Returns
+    -------
+    mvp_weights : pd.Series
+        Optimal weights (summing to 100%) of the constrained minimum variance portfolio.
+    result : ActiveSetResult
+        Details of the QP solution (active constraints, number of iterations).
+    """
+
+    # Input validation
+    if not isinstance(returns_df, pd.DataFrame):
+        raise TypeError("Input must be a pd.DataFrame object with stock returns.")
+    if returns_df.empty:
+        raise ValueError("Input DataFrame cannot be empty.")
+    if returns_df.isnull().values.any():
+        raise ValueError("Input DataFrame contains NaN values. Please handle missing data before proceeding.")
+    if returns_df.shape[1] < 2:
+        raise ValueError("At least two assets are required to compute the minimum variance portfolio.")
+    if cov_estimator not in valid_cov_estimators:
+        raise ValueError(f"Unsupported covariance estimator '{cov_estimator}'. Use one of {valid_cov_estimators}.")
+    if cov_estimator == "sample" and returns_df.shape[0] <= returns_df.shape[1]:
+        raise ValueError("Number of observations must exceed the number of assets to ensure covariance matrix invertibility. "
+                         "Use a shrinkage covariance estimator (e.g., 'ledoit_wolf') for more assets.")
+    if (returns_df.max() == returns_df.min()).any():
+        raise ValueError("Covariance matrix is singular because some assets have zero variance. Try removing constant or redundant assets.")
+    if factor_targets:
+        unknown = [factor for factor in factor_targets if factor not in factor_model_columns]
+        if unknown:
+            raise ValueError(f"Unsupported factor targets {unknown}. Use factors of {factor_model_columns}.")
+        if len(factor_targets) + 1 > returns_df.shape[1]:
+            raise ValueError("The number of factor targets must be smaller than the number of assets.")
+
+    tickers = returns_df.columns
+    n = len(tickers)
+    if cov_estimator == "factor":
+        H = estimate_factor_covariance(returns_df).to_dense().to_numpy()
+    else:
+        H = estimate_covariance(returns_df, cov_estimator)[0].to_numpy()
+
+    # Per-asset bounds
+    lower = np.full(n, 0.0 if long_only else -np.inf)
+    upper = np.full(n, np.inf)
+    for bound, value in ((lower, min_weight), (upper, max_weight)):
+        if isinstance(value, pd.Series):
+            limits = value.reindex(tickers).to_numpy(dtype=float)
+            bound[~np.isnan(limits)] = limits[~np.isnan(limits)]
+        elif value is not None:
+            bound[:] = value
+
+    # Group caps as inequality rows: sum of the weights in the group <= cap
+    groups = pd.Series(groups if groups is not None else {}, dtype=object).reindex(tickers)
+    C, d = np.zeros((0, n)), np.zeros(0)
+    if group_caps:
+        rows = []
+        for group, cap in group_caps.items():
+            members = (groups == group).to_numpy()
+            if not members.any():
+                raise ValueError(f"Group '{group}' has no tickers in the portfolio.")
+            rows.append(members.astype(float))
+        C, d = np.vstack(rows), np.array(list(group_caps.values()), dtype=float)
+
+    x0 = None
+    if previous_weights is not None:
+        x0 = previous_weights.reindex(tickers).fillna(0.0).to_numpy(dtype=float)
+
+    # Fully invested (1ᵀw = 1) and one row of asset betas per targeted factor (βᵀw = target)
+    A_eq, b_eq = np.ones((1, n)), np.ones(1)
+    if factor_targets:
+        betas = get_asset_factor_betas(returns_df)[list(factor_targets)]
+        A_eq = np.vstack([A_eq, betas.to_numpy().T])
+        b_eq = np.concatenate([b_eq, [float(target) for target in factor_targets.values()]])
+
+    result = solve_active_set_qp(H, np.zeros(n), lower, upper, A_eq, b_eq, C, d, x0=x0)
+    mvp_weights = pd.Series(result.x, index=tickers)
+
+    return mvp_weights, result
+
+
+def calculate_constrained_mvp_weights(returns_df: pd.DataFrame, long_only: bool = True, max_weight: float | pd.Series | None = None,
+                                      min_weight: float | pd.Series | None = None, groups: dict[str, str] | pd.Series | None = None,
+                                      group_caps: dict[str, float] | None = None, previous_weights: pd.Series | None = None,
+                                      cov_estimator: str = mvp_cov_estimator, factor_targets: dict[str, float] | None = None) -> pd.Series:
+    """
+    Computes the weights of the constrained minimum variance portfolio, see solve_constrained_mvp().
+
+    Parameters
+    ----------
+    returns_df : pd.DataFrame
+        Returns of each asset (columns = assets, rows = time periods).
+    long_only : bool, optional
+        If True (default), short positions are not allowed (lower bound 0).
+    max_weight : float | pd.Series, optional
+        Upper bound per asset, as one value for all assets or per ticker (missing tickers are unbounded).
+    min_weight : float | pd.Series, optional
+        Lower bound per asset (overrides the bound of long_only), as one value or per ticker.
+    groups : dict[str, str] | pd.Series, optional
+        Group of each ticker, e.g., {"AAPL": "Tech", "MSFT": "Tech", "KO": "Staples"}.
+    group_caps : dict[str, float], optional
+        Maximum total weight per group, e.g., {"Tech": 0.4}.
+    previous_weights : pd.Series, optional
+        Weights of the previous rebalance as warm start.
+    cov_estimator : str, optional
+        Covariance estimator, see calculate_mvp_weights(). Defaults to mvp_cov_estimator from config.py.
+    factor_targets : dict[str, float], optional
+        Factor exposures the portfolio must have, e.g., {"HML": 0.3}. The default is None (no targets).
+
+    Raises
+    ------
+    TypeError
+        If returns_df is not a pandas DataFrame, or factor targets are given without a datetime index.
+    ValueError
+        If the DataFrame is empty, contains NaNs, has fewer than 2 assets or too few time periods, the covariance
+        estimator is not supported, a capped group has no tickers, the factor targets are invalid, or the
+        constraints are infeasible.
+    RuntimeError
+        If the QP solver does not converge.
+
+    Returns
+    -------
+    mvp_weights : pd.Series
+        Optimal weights (summing to 100%) with the tickers as index, like calculate_mvp_weights().
+    """
+
+    mvp_weights, _ = solve_constrained_mvp(returns_df, long_only=long_only, max_weight=max_weight, min_weight=min_weight,
+                                           groups=groups, group_caps=group_caps, previous_weights=previous_weights,
+                                           cov_estimator=cov_estimator, factor_targets=factor_targets)
+
+    return mvp_weights
+
+
+def calculate_constrained_mvp_portfolio(returns_df: pd.DataFrame, long_only: bool = mvp_long_only,
+                                        max_weight: float | None = mvp_max_weight, cov_estimator: str = mvp_cov_estimator,
+                                        factor_targets: dict[str, float] | None = mvp_factor_targets) -> pd.Series:
+    """
+    Calculates the time series of portfolio returns of the constrained minimum variance portfolio
+    (like calculate_mvp_portfolio()), with the constraints and factor targets of config.py by default.
+
+    Parameters
+    ----------
+    returns_df : pd.DataFrame
+        A DataFrame containing return time series for each asset (columns = assets, rows = time periods).
+    long_only : bool, optional
+        If True, short positions are not allowed. Defaults to mvp_long_only from config.py.
+    max_weight : float, optional
+        Upper bound of every asset weight, None for no cap. Defaults to mvp_max_weight from config.py.
+    cov_estimator : str, optional
+        Covariance estimator, see calculate_mvp_weights(). Defaults to mvp_cov_estimator from config.py.
+    factor_targets : dict[str, float], optional
+        Factor exposures of the portfolio, e.g., {"HML": 0.3}, see solve_constrained_mvp().
+        Defaults to mvp_factor_targets from config.py.
+
+    Raises
+    ------
+    TypeError, ValueError, RuntimeError
+        See calculate_constrained_mvp_weights().
+
+    Returns
+    -------
+    portfolio_returns : pd.Series
+        Time series of portfolio returns of the constrained MVP.
+    """
+
+    mvp_weights = calculate_constrained_mvp_weights(returns_df, long_only=long_only, max_weight=max_weight, cov_estimator=cov_estimator,
+                                                    factor_targets=factor_targets)
+
+    return returns_df @ mvp_weights
@@ -0,0 +1,195 @@
+import numpy as np
+import pandas as pd
+
+
+def sample_covariance(returns: np.ndarray) -> tuple[np.ndarray, float]:
+    """
+    Unbiased sample covariance matrix (same as pd.DataFrame.cov()). Singular if there are not more observations than assets.
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        Returns as T x N matrix (rows = time periods, columns = assets).
+
+    Returns
+    -------
+    tuple[np.ndarray, float]
+        N x N covariance matrix and the shrinkage intensity (always 0).
+    """
+
+    X = returns - returns.mean(axis=0)
+
+    return X.T @ X / (len(X) - 1), 0.0
+
+
+def ledoit_wolf_covariance(returns: np.ndarray) -> tuple[np.ndarray, float]:
+    """
+    Ledoit-Wolf (2004) linear shrinkage of the sample covariance matrix S towards the scaled identity μI
+    (μ = average variance): Σ = δμI + (1 - δ)S. The intensity δ minimizes the expected Frobenius loss and is
+    estimated in closed form from the dispersion of the per-period outer products x_t x_t' around S.
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        Returns as T x N matrix (rows = time periods, columns = assets).
+
+    Returns
+    -------
+    tuple[np.ndarray, float]
+        N x N covariance matrix (positive definite for any T >= 2) and the shrinkage intensity δ in [0, 1].
+    """
+
+    T, N = returns.shape
+    X = returns - returns.mean(axis=0)
+    S = X.T @ X / T # Maximum likelihood estimate, as in the original paper
+    mu = np.trace(S) / N
+
+    # d² = ||S - μI||², b² = (1/T²) Σ_t ||x_t x_t' - S||² = (Σ_t ||x_t||⁴ / T - ||S||²) / T
+    S_norm = np.einsum("ij,ij->", S, S)
+    d2 = S_norm - 2 * mu * np.trace(S) + mu * mu * N
+    b2 = (np.sum(np.einsum("ij,ij->i", X, X) ** 2) / T - S_norm) / T
+    shrinkage = min(b2, d2) / d2 if d2 > 0 else 1.0
+
+    cov = (1 - shrinkage) * S
+    cov[np.diag_indices(N)] += shrinkage * mu
+
+    return cov, float(shrinkage)
+
+
+def oas_covariance(returns: np.ndarray) -> tuple[np.ndarray, float]:
+    """
+    Oracle approximating shrinkage (OAS) of Chen, Wiesel, Eldar and Hero (2010) towards the scaled identity μI.
+    Same target as Ledoit-Wolf, but the intensity is derived for Gaussian returns, which typically shrinks more
+    (and more accurately) on short histories.
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        Returns as T x N matrix (rows = time periods, columns = assets).
+
+    Returns
+    -------
+    tuple[np.ndarray, float]
+        N x N covariance matrix and the shrinkage intensity in [0, 1].
+    """
+
+    T, N = returns.shape
+    X = returns - returns.mean(axis=0)
+    S = X.T @ X / T
+    mu = np.trace(S) / N
+
+    # With a = ||S||² / N²: δ = (a + μ²) / ((T + 1)(a - μ² / N)), capped at 1
+    alpha = np.einsum("ij,ij->", S, S) / N ** 2
+    denominator = (T + 1) * (alpha - mu * mu / N)
+    shrinkage = min((alpha + mu * mu) / denominator, 1.0) if denominator > 0 else 1.0
+
+    cov = (1 - shrinkage) * S
+    cov[np.diag_indices(N)] += shrinkage * mu
+
+    return cov, float(shrinkage)
+
+
+def constant_correlation_covariance(returns: np.ndarray) -> tuple[np.ndarray, float]:
+    """
+    Ledoit-Wolf (2003) shrinkage of the sample covariance matrix S towards the constant-correlation target F,
+    which keeps the sample variances and sets every correlation to the average sample correlation r̄:
+    Σ = δF + (1 - δ)S with δ = max(0, min(1, (π - ρ) / (γT))).
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        Returns as T x N matrix (rows = time periods, columns = assets).
+
+    Raises
+    ------
+    ValueError
+        If an asset has zero variance (its correlations are undefined).
+
+    Returns
+    -------
+    tuple[np.ndarray, float]
+        N x N covariance matrix and the shrinkage intensity δ in [0, 1].
+    """
+
+    T, N = returns.shape
+    X = returns - returns.mean(axis=0)
+    S = X.T @ X / T
+    variances = np.diag(S).copy()
+    if (np.ptp(returns, axis=0) == 0).any():
+        raise ValueError("Constant-correlation shrinkage requires a positive variance for every asset.")
+    std = np.sqrt(variances)
+
+    # Target: average off-diagonal correlation with the sample variances
+    corr = S / np.outer(std, std)
+    r_bar = (corr.sum() - N) / (N * (N - 1))
+    F = r_bar * np.outer(std, std)
+    F[np.diag_indices(N)] = variances
+
+    # π: sum of the asymptotic variances of the entries of √T S
+    X2 = X * X
+    pi_mat = X2.T @ X2 / T - S * S
+    pi = pi_mat.sum()
+
+    # ρ: asymptotic covariances between the entries of the target and of S
+    theta = (X2 * X).T @ X / T - variances[:, None] * S
+    theta[np.diag_indices(N)] = 0.0
+    rho = np.trace(pi_mat) + r_bar * np.sum(np.outer(1 / std, std) * theta)
+
+    # γ: misspecification of the target
+    gamma = np.einsum("ij,ij->", F - S, F - S)
+    shrinkage = max(0.0, min(1.0, (pi - rho) / gamma / T)) if gamma > 0 else 1.0
+
+    return shrinkage * F + (1 - shrinkage) * S, float(shrinkage)
+
+
+# Supported estimators by name (see estimate_covariance())
+covariance_estimators = {
+    "sample": sample_covariance,
+    "ledoit_wolf": ledoit_wolf_covariance,
+    "constant_correlation": constant_correlation_covariance,
+    "oas": oas_covariance
+}
+
+
+def estimate_covariance(returns_df: pd.DataFrame, estimator: str = "sample") -> tuple[pd.DataFrame, float]:
+    """
+    Estimates the covariance matrix of asset returns with one of the covariance_estimators. All estimators are
+    closed-form and cost O(TN²) for T periods and N assets; the shrinkage estimators are well-conditioned even
+    with more assets than observations.
+
+    Parameters
+    ----------
+    returns_df : pd.DataFrame
+        Returns of each asset (columns = assets, rows = time periods).
+    estimator : str, optional
+        "sample" (default), "ledoit_wolf", "constant_correlation" or "oas".
+
+    Raises
+    ------
+    TypeError
+        If returns_df is not a pandas DataFrame or is not numeric.
+    ValueError
+        If the estimator is not supported, or returns_df contains NaNs or fewer than 2 time periods.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, float]
+        Covariance matrix (assets as index and columns) and the shrinkage intensity (0 for the sample estimator).
+    """
+
+    if not isinstance(returns_df, pd.DataFrame):
+        raise TypeError("Input must be a pd.DataFrame object with stock returns.")
+    if estimator not in covariance_estimators:
+        raise ValueError(f"Unsupported covariance estimator '{estimator}'. Use one of {tuple(covariance_estimators)}.")
+    try:
+        returns = returns_df.to_numpy(dtype=float)
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"Returns must be numeric: {e}")
+    if np.isnan(returns).any():
+        raise ValueError("Input DataFrame contains NaN values. Please handle missing data before proceeding.")
+    if returns.shape[0] < 2 or returns.shape[1] == 0:
+        raise ValueError("At least two time periods and one asset are required to estimate a covariance matrix.")
+
+    cov, shrinkage = covariance_estimators[estimator](returns)
+
+    return pd.DataFrame(cov, index=returns_df.columns, columns=returns_df.columns), shrinkage
@@ -0,0 +1,142 @@
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from scipy import linalg
+from analysis.factor_panel import FactorPanel, to_period_ordinals
+from analysis.portfolio_analyzer import get_factor_panel
+from analysis.ols_engine import fit_ols_batch
+
+factor_model_columns = ["Mkt_rf", "SMB", "HML", "Mom"]
+
+
+@dataclass(frozen=True)
+class FactorCovariance:
+    """
+    Factor-structured covariance matrix Σ = BFBᵀ + D of N assets and k factors, stored as its components
+    (O(Nk) memory instead of O(N²)). Linear systems Σx = b are solved with the Woodbury identity
+
+        Σ⁻¹ = D⁻¹ - D⁻¹B (F⁻¹ + BᵀD⁻¹B)⁻¹ BᵀD⁻¹
+
+    which only factorizes the k x k capacitance matrix F⁻¹ + BᵀD⁻¹B, so a solve costs O(Nk²) and Σ is never formed.
+    """
+
+    loadings: pd.DataFrame          # B: factor exposures (N x k), assets as index and factors as columns
+    factor_cov: pd.DataFrame        # F: covariance matrix of the factors (k x k)
+    specific_var: pd.Series         # Diagonal of D: residual (idiosyncratic) variance per asset
+
+    @property
+    def size(self) -> int:
+        """Number of assets N."""
+        return len(self.specific_var)
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        """
+        Returns x with Σx = b via the Woodbury identity.
+
+        Parameters
+        ----------
+        b : np.ndarray
+            Right-hand side as vector of length N or N x m matrix.
+
+        Returns
+        -------
+        np.ndarray
+            Solution with the shape of b.
+        """
+
+        B = self.loadings.to_numpy()
+        d_inv = 1.0 / self.specific_var.to_numpy()
+        D_inv_b = d_inv[:, None] * b if np.ndim(b) == 2 else d_inv * b
+        D_inv_B = d_inv[:, None] * B
+
+        # Capacitance matrix F⁻¹ + BᵀD⁻¹B (k x k)
+        F_inv = linalg.cho_solve(linalg.cho_factor(self.factor_cov.to_numpy()), np.eye(B.shape[1]))
+        capacitance = linalg.cho_factor(F_inv + B.T @ D_inv_B)
+
+        return D_inv_b - D_inv_B @ linalg.cho_solve(capacitance, B.T @ D_inv_b)
+
+    def portfolio_variance(self, weights: np.ndarray) -> float:
+        """
+        Returns the variance wᵀΣw of a portfolio in O(Nk).
+        """
+
+        exposure = self.loadings.to_numpy().T @ weights
+
+        return float(exposure @ self.factor_cov.to_numpy() @ exposure + np.sum(self.specific_var.to_numpy() * weights ** 2))
+
+    def to_dense(self) -> pd.DataFrame:
+        """
+        Returns the full N x N covariance matrix (only intended for small universes, e.g., for inspection).
+        """
+
+        B = self.loadings.to_numpy()
+        cov = B @ self.factor_cov.to_numpy() @ B.T
+        cov[np.diag_indices(self.size)] += self.specific_var.to_numpy()
+
+        return pd.DataFrame(cov, index=self.loadings.index, columns=self.loadings.index)
+
+
+def estimate_factor_covariance(returns_df: pd.DataFrame, factor_panel: FactorPanel | None = None) -> FactorCovariance:
+    """
+    Estimates the factor-model covariance matrix of asset returns with the factors of factor_analysis_regression()
+    (Mkt_rf, SMB, HML and Mom). All assets are regressed on the factors in one batched OLS solve (one QR
+    factorization of the factor matrix), which gives the loadings B and the residual variances D; F is the sample
+    covariance matrix of the factors. Only the months with factor data are used.
+
+    Parameters
+    ----------
+    returns_df : pd.DataFrame
+        Monthly returns with datetime index and one column per asset.
+    factor_panel : FactorPanel, optional
+        Factor data to regress on. Defaults to the process-wide panel of get_factor_panel().
+
+    Raises
+    ------
+    TypeError
+        If returns_df is not a DataFrame with datetime index, or contains non-numeric data.
+    ValueError
+        If returns_df is empty, contains NaNs or more than one observation per month, has not more months with
+        factor data than coefficients, or an asset is fully explained by the factors (zero residual variance).
+
+    Returns
+    -------
+    FactorCovariance
+        Loadings, factor covariance and residual variances, all in decimal returns (like returns_df).
+    """
+
+    # Input validation
+    if not isinstance(returns_df, pd.DataFrame):
+        raise TypeError("Returns must be provided as pandas DataFrame.")
+    if not isinstance(returns_df.index, pd.DatetimeIndex):
+        raise TypeError("Returns must have a datetime index.")
+    if returns_df.empty:
+        raise ValueError("Returns must be non-empty.")
+    try:
+        returns = returns_df.to_numpy(dtype=float)
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"Returns must be numeric: {e}")
+    if np.isnan(returns).any():
+        raise ValueError("Returns contain NaN values. Please handle missing data before proceeding.")
+
+    periods = to_period_ordinals(returns_df.index)
+    if len(np.unique(periods)) != len(periods):
+        raise ValueError("Returns must contain at most one observation per month.")
+
+    # Align the returns with the factors by their monthly period; the factors are in percent
+    factor_panel = get_factor_panel() if factor_panel is None else factor_panel
+    factor_values, found = factor_panel.lookup(returns_df.index)
+    factors = pd.DataFrame(factor_values[found], columns=factor_panel.columns)[factor_model_columns].to_numpy() / 100
+    if found.sum() <= len(factor_model_columns) + 1:
+        raise ValueError(f"Need more months with factor data ({found.sum()}) than coefficients ({len(factor_model_columns) + 1}).")
+
+    # One batched regression of all assets on the factors
+    result = fit_ols_batch(returns[found], factors, add_constant=True)
+    specific_var = result.ssr.to_numpy() / result.df_resid
+    if (specific_var <= 0).any():
+        raise ValueError("Some assets are fully explained by the factors (zero residual variance).")
+
+    return FactorCovariance(
+        loadings=pd.DataFrame(result.params.to_numpy()[1:].T, index=returns_df.columns, columns=factor_model_columns),
+        factor_cov=pd.DataFrame(np.cov(factors, rowvar=False), index=factor_model_columns, columns=factor_model_columns),
+        specific_var=pd.Series(specific_var, index=returns_df.columns)
+    )
@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+
+
+def to_period_ordinals(dates: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Converts dates into monthly integer periods (year * 12 + month - 1), e.g., 2020-01-31 -> 24240.
+    All dates within the same month map to the same period.
+
+    Parameters
+    ----------
+    dates : pd.DatetimeIndex
+        Dates to convert.
+
+    Raises
+    ------
+    TypeError
+        If dates is not a DatetimeIndex.
+
+    Returns
+    -------
+    np.ndarray
+        Monthly periods as int64 array.
+    """
+
+    if not isinstance(dates, pd.DatetimeIndex):
+        raise TypeError("Dates must be provided as pandas DatetimeIndex.")
+
+    return dates.year.to_numpy(dtype=np.int64) * 12 + dates.month.to_numpy(dtype=np.int64) - 1
+
+
+class FactorPanel:
+    """
+    Read-only factor dataset keyed on monthly integer periods (see to_period_ordinals()).
+    The factors are stored on a dense monthly grid from the first to the last period, with missing months as NaN rows.
+    The row of a period is therefore a simple offset, so date windows are O(1) array views and return series are
+    aligned by integer lookups instead of datetime index joins. A panel is built once per process and shared by all
+    regressions (see get_factor_panel() in portfolio_analyzer.py).
+    """
+
+    def __init__(self, factors_df: pd.DataFrame):
+        """
+        Parameters
+        ----------
+        factors_df : pd.DataFrame
+            Factor dataset with datetime index and one column per factor, as returned by create_factor_dataset().
+
+        Raises
+        ------
+        TypeError
+            If factors_df is not a DataFrame with datetime index.
+        ValueError
+            If factors_df is empty or contains more than one observation per month.
+        """
+
+        if not isinstance(factors_df, pd.DataFrame) or not isinstance(factors_df.index, pd.DatetimeIndex):
+            raise TypeError("Factors must be provided as pandas DataFrame with datetime index.")
+        if factors_df.empty:
+            raise ValueError("Factor dataset must be non-empty.")
+
+        periods = to_period_ordinals(factors_df.index)
+        if len(np.unique(periods)) != len(periods):
+            raise ValueError("Factor dataset must contain at most one observation per month.")
+
+        self.columns = list(factors_df.columns)
+        self.first_period = int(periods.min())
+        n_periods = int(periods.max()) - self.first_period + 1
+
+        # Dense grid: the row of a period is period - first_period
+        values = np.full((n_periods, len(self.columns)), np.nan)
+        values[periods - self.first_period] = factors_df.to_numpy(dtype=float)
+        values.setflags(write=False) # Shared by all callers, so it must not be modified
+        self.values = values
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    def get_rows(self, start: str | pd.Timestamp, end: str | pd.Timestamp) -> slice:
+        """
+        Returns the row slice of the months from start to end (both inclusive), clipped to the panel.
+
+        Parameters
+        ----------
+        start, end : str | pd.Timestamp
+            First and last date of the window, e.g., "2020-01" or pd.Timestamp("2020-12-31").
+
+        Returns
+        -------
+        slice
+            Rows of the window in the values array.
+        """
+
+        first = to_period_ordinals(pd.DatetimeIndex([pd.Timestamp(start)]))[0] - self.first_period
+        last = to_period_ordinals(pd.DatetimeIndex([pd.Timestamp(end)]))[0] - self.first_period
+
+        return slice(int(min(max(first, 0), len(self))), int(min(max(last + 1, 0), len(self))))
+
+    def window(self, start: str | pd.Timestamp, end: str | pd.Timestamp) -> np.ndarray:
+        """
+        Returns the factor values of the months from start to end (both inclusive) as a view without copying.
+        Missing months are NaN rows.
+        """
+
+        return self.values[self.get_rows(start, end)]
+
+    def lookup(self, dates: pd.DatetimeIndex) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Aligns dates with the factor panel by their monthly period.
+
+        Parameters
+        ----------
+        dates : pd.DatetimeIndex
+            Dates of the observations to align, e.g., the index of a return series.
+
+        Raises
+        ------
+        TypeError
+            If dates is not a DatetimeIndex.
+
+        Returns
+        -------
+        values : np.ndarray
+            Factor values per date (one row per date), NaN where the panel has no data for the month.
+        found : np.ndarray
+            Boolean mask of the dates with complete factor data.
+        """
+
+        rows = to_period_ordinals(dates) - self.first_period
+        inside = (rows >= 0) & (rows < len(self))
+
+        values = np.full((len(rows), len(self.columns)), np.nan)
+        values[inside] = self.values[rows[inside]]
+        found = inside & ~np.isnan(values).any(axis=1)
+
+        return values, found
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Returns the panel as DataFrame with one row per month (first day of the month), including the NaN gaps.
+        """
+
+        periods = np.arange(self.first_period, self.first_period + len(self))
+        index = pd.to_datetime({"year": periods // 12, "month": periods % 12 + 1, "day": 1})
+
+        return pd.DataFrame(self.values, index=pd.DatetimeIndex(index), columns=self.columns)
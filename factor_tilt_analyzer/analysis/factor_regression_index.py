@@ -0,0 +1,214 @@
+import numpy as np
+import pandas as pd
+from analysis.factor_panel import FactorPanel, to_period_ordinals
+from analysis.portfolio_analyzer import get_factor_regression_data
+
+
+class FactorRegressionIndex:
+    """
+    Precomputed prefix sums of the cross-products X'X, X'y and y'y of a regression (with intercept).
+    The sums of any interval of observations are the difference of two prefix sums, so the coefficients and R²
+    of a regression over any [start, end] interval are answered in O(k³), independent of the interval length.
+    The data is centered on its full-sample means before summing, which keeps the differences of large prefix
+    sums accurate; slopes and R² are unaffected and the intercept is shifted back.
+    """
+
+    def __init__(self, y: pd.Series, X: pd.DataFrame, intercept_name: str = "const"):
+        """
+        Parameters
+        ----------
+        y : pd.Series
+            Dependent variable with datetime index (one observation per month).
+        X : pd.DataFrame
+            Regressors with the same index as y. The column names are used as coefficient names.
+        intercept_name : str, optional
+            Name of the intercept in the results. The default is "const".
+
+        Raises
+        ------
+        TypeError
+            If y is not a Series or X is not a DataFrame, or they lack a datetime index or numeric data.
+        ValueError
+            If y is empty, the indexes of y and X differ, the data contains missing values, or
+            there is more than one observation per month.
+        """
+
+        if not isinstance(y, pd.Series) or not isinstance(X, pd.DataFrame):
+            raise TypeError("y must be a pandas Series and X a pandas DataFrame.")
+        if not isinstance(y.index, pd.DatetimeIndex):
+            raise TypeError("y and X must have a datetime index.")
+        if len(y) == 0:
+            raise ValueError("y must be non-empty.")
+        if not y.index.equals(X.index):
+            raise ValueError("y and X must have the same index.")
+        try:
+            y_values = y.to_numpy(dtype=float)
+            X_values = X.to_numpy(dtype=float)
+        except (TypeError, ValueError) as e:
+            raise TypeError(f"y and X must be numeric: {e}")
+        if np.isnan(y_values).any() or np.isnan(X_values).any():
+            raise ValueError("y and X must not contain missing values.")
+
+        # Sort by period, so the rows of an interval are contiguous and found by binary search
+        periods = to_period_ordinals(y.index)
+        order = np.argsort(periods, kind="stable")
+        periods, y_values, X_values = periods[order], y_values[order], X_values[order]
+        if (np.diff(periods) == 0).any():
+            raise ValueError("y and X must contain at most one observation per month.")
+
+        self.names = [intercept_name] + [str(col) for col in X.columns]
+        self.periods = periods
+
+        # Center the data and add the intercept column
+        self.y_mean = y_values.mean()
+        self.X_mean = X_values.mean(axis=0)
+        y_c = y_values - self.y_mean
+        X_c = np.column_stack([np.ones(len(y_c)), X_values - self.X_mean])
+
+        # Prefix sums with a leading zero row: the sums of rows [i, j) are P[j] - P[i]
+        k = X_c.shape[1]
+        self.P_xx = np.zeros((len(y_c) + 1, k, k))
+        self.P_xx[1:] = np.cumsum(X_c[:, :, None] * X_c[:, None, :], axis=0)
+        self.P_xy = np.zeros((len(y_c) + 1, k))
+        self.P_xy[1:] = np.cumsum(X_c * y_c[:, None], axis=0)
+        self.P_yy = np.concatenate([[0.0], np.cumsum(y_c * y_c)])
+
+    def __len__(self) -> int:
+        return len(self.periods)
+
+    def get_rows(self, start: str | pd.Timestamp, end: str | pd.Timestamp) -> tuple[int, int]:
+        """
+        Returns the row range [first, last) of the months from start to end (both inclusive).
+        """
+
+        first_period, last_period = to_period_ordinals(pd.DatetimeIndex([pd.Timestamp(start), pd.Timestamp(end)]))
+
+        return int(np.searchsorted(self.periods, first_period, side="left")), int(np.searchsorted(self.periods, last_period, side="right"))
+
+    def solve(self, first: np.ndarray, last: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Fits the regressions over the row ranges [first, last) from the prefix sums (vectorized over all ranges).
+
+        Returns
+        -------
+        coef : np.ndarray
+            Coefficients per range (intercept first), NaN if a range has too few observations or is singular.
+        rsquared : np.ndarray
+            R² per range.
+        nobs : np.ndarray
+            Number of observations per range.
+        """
+
+        k = len(self.names)
+        nobs = np.maximum(last - first, 0)
+        XtX = self.P_xx[last] - self.P_xx[first]
+        Xty = self.P_xy[last] - self.P_xy[first]
+        yty = self.P_yy[last] - self.P_yy[first]
+
+        coef = np.full((len(nobs), k), np.nan)
+        valid = nobs > k
+        try:
+            # One batched solve for all intervals
+            coef[valid] = np.linalg.solve(XtX[valid], Xty[valid][:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            # At least one singular interval (e.g., a constant regressor) -> solve one by one and skip those
+            for i in np.flatnonzero(valid):
+                try:
+                    coef[i] = np.linalg.solve(XtX[i], Xty[i])
+                except np.linalg.LinAlgError:
+                    valid[i] = False
+
+        # Centered R²: TSS = y'y - n * mean(y)², with the mean of the centered data as (X'y)[0] / n
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ssr = yty - np.einsum("ij,ij->i", coef, Xty)
+            tss = yty - Xty[:, 0] ** 2 / nobs
+            rsquared = np.where(valid & (tss > 0), 1.0 - np.maximum(ssr, 0.0) / tss, np.nan)
+
+        # Undo the centering: intercept = a + mean(y) - b'mean(X)
+        coef[:, 0] += self.y_mean - coef[:, 1:] @ self.X_mean
+
+        return coef, rsquared, nobs
+
+    def query(self, start: str | pd.Timestamp, end: str | pd.Timestamp) -> pd.Series:
+        """
+        Returns the regression over the months from start to end (both inclusive), e.g., query("2008-01", "2009-12").
+
+        Parameters
+        ----------
+        start, end : str | pd.Timestamp
+            First and last month of the interval.
+
+        Returns
+        -------
+        pd.Series
+            Coefficients (intercept under intercept_name), "r_squared" and "nobs". The coefficients and R² are NaN
+            if the interval does not contain more observations than coefficients.
+        """
+
+        first, last = self.get_rows(start, end)
+        coef, rsquared, nobs = self.solve(np.array([first]), np.array([last]))
+
+        return pd.Series(np.append(coef[0], [rsquared[0], nobs[0]]), index=self.names + ["r_squared", "nobs"])
+
+    def query_many(self, intervals: list[tuple[str | pd.Timestamp, str | pd.Timestamp]]) -> pd.DataFrame:
+        """
+        Returns the regressions over many intervals at once, see query().
+
+        Parameters
+        ----------
+        intervals : list[tuple[str | pd.Timestamp, str | pd.Timestamp]]
+            Pairs of first and last month, e.g., [("2008-01", "2009-12"), ("2020-01", "2020-12")].
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per interval (in input order) with the columns start, end, the coefficients, r_squared and nobs.
+        """
+
+        if not intervals:
+            return pd.DataFrame(columns=["start", "end"] + self.names + ["r_squared", "nobs"])
+
+        starts = pd.DatetimeIndex([pd.Timestamp(start) for start, _ in intervals])
+        ends = pd.DatetimeIndex([pd.Timestamp(end) for _, end in intervals])
+        first = np.searchsorted(self.periods, to_period_ordinals(starts), side="left")
+        last = np.searchsorted(self.periods, to_period_ordinals(ends), side="right")
+        coef, rsquared, nobs = self.solve(first, last)
+
+        results_df = pd.DataFrame(coef, columns=self.names)
+        results_df.insert(0, "start", starts)
+        results_df.insert(1, "end", ends)
+        results_df["r_squared"] = rsquared
+        results_df["nobs"] = nobs
+
+        return results_df
+
+
+def build_factor_regression_index(portfolio_returns: pd.Series, factor_panel: FactorPanel | None = None) -> FactorRegressionIndex:
+    """
+    Builds the prefix cross-product index of the factor model of factor_analysis_regression()
+    (excess return on Mkt_rf, SMB, HML and Mom) for a portfolio, e.g., for regime analysis over many sub-periods.
+
+    Parameters
+    ----------
+    portfolio_returns : pd.Series
+        Monthly returns of the portfolio (with datetime index).
+    factor_panel : FactorPanel, optional
+        Factor data to regress on. Defaults to the process-wide panel of get_factor_panel().
+
+    Raises
+    ------
+    TypeError
+        If portfolio_returns is not a pandas Series with datetime index.
+    ValueError
+        If portfolio_returns is empty, contains missing values or more than one observation per month,
+        or if the returns do not overlap with the factor data.
+
+    Returns
+    -------
+    FactorRegressionIndex
+        Index answering interval queries; the intercept is reported as "alpha".
+    """
+
+    excess, factors = get_factor_regression_data(portfolio_returns, factor_panel)
+
+    return FactorRegressionIndex(excess, factors, intercept_name="alpha")
@@ -1,7 +1,17 @@
 import numpy as np
 import pandas as pd
+from config import mvp_max_condition, mvp_fallback, mvp_cov_estimator, mvp_factor_targets
+from analysis.covariance_factorization import CovarianceFactorization, factorize_covariance
+from analysis.covariance_estimators import covariance_estimators, estimate_covariance
+from analysis.factor_covariance import FactorCovariance, estimate_factor_covariance, factor_model_columns
+from analysis.factor_panel import FactorPanel
+from analysis.portfolio_analyzer import factor_analysis_regression_batch
 
-def calculate_mvp_weights(returns_df: pd.DataFrame) -> pd.Series:
+# Covariance estimators of the MVP: the estimators of covariance_estimators.py and the factor model ("factor")
+valid_cov_estimators = tuple(covariance_estimators) + ("factor",)
+
+def calculate_mvp_weights(returns_df: pd.DataFrame, max_condition: float = mvp_max_condition, fallback: str = mvp_fallback,
+                          cov_estimator: str = mvp_cov_estimator, factor_targets: dict[str, float] | None = None) -> pd.Series:
     """
     Computes a closed-end solution for the minimum variance portfolio (MVP) based on the input DataFrame, that contains
     the time series of returns. A theoretical background on the calculation is provided in e.g., Page 10 of https://faculty.washington.edu/ezivot/econ424/portfolioTheoryMatrix.pdf
@@ -11,14 +21,28 @@ def calculate_mvp_weights(returns_df: pd.DataFrame) -> pd.Series:
     returns_df : pd.DataFrame
         DataFrame with the time series of returns of each stock that is going to be a part of the minimum variance portfolio.
         (columns = assets, rows = time periods).
+    max_condition : float, optional
+        Largest condition number of the covariance matrix that is solved exactly. Defaults to mvp_max_condition from config.py.
+    fallback : str, optional
+        Solver for ill-conditioned covariance matrices, "ridge" or "pinv". Defaults to mvp_fallback from config.py.
+    cov_estimator : str, optional
+        Covariance estimator, see analysis/covariance_estimators.py. Defaults to mvp_cov_estimator from config.py.
+        The shrinkage estimators ("ledoit_wolf", "constant_correlation", "oas") also work with more assets than time periods.
+        "factor" uses the factor-model covariance of analysis/factor_covariance.py (requires a datetime index), which
+        scales to thousands of assets because the N x N covariance matrix is never formed.
+    factor_targets : dict[str, float], optional
+        Factor exposures the portfolio must have, e.g., {"HML": 0.3} or {"SMB": 0.0, "Mom": 0.0} for a neutral portfolio.
+        Supported factors are Mkt_rf, SMB, HML and Mom. The portfolio exposure is the weighted sum of the asset betas
+        of factor_analysis_regression_batch() (requires a datetime index). The default is None (no targets).
 
     Raises
     ------
     TypeError
-        If input is not a pandas DataFrame.
+        If input is not a pandas DataFrame, or factor targets are given without a datetime index.
     ValueError
-        If the DataFrame is empty, contains NaNs, has fewer than 2 assets,
-        has too few time periods, or the covariance matrix is not invertible.
+        If the DataFrame is empty, contains NaNs, has fewer than 2 assets, has too few time periods
+        (not more than assets for the sample estimator), an asset has zero variance, the estimator is not supported,
+        or the factor targets are invalid or cannot be reached (e.g., more targets than assets allow).
     
     Returns
     -------
@@ -26,6 +50,45 @@ def calculate_mvp_weights(returns_df: pd.DataFrame) -> pd.Series:
         Optimal weights (summing to 100%) for the minimum variance portfolio.
 
     """
+
+    mvp_weights, _ = solve_mvp(returns_df, max_condition=max_condition, fallback=fallback, cov_estimator=cov_estimator,
+                               factor_targets=factor_targets)
+
+    return mvp_weights
+
+def solve_mvp(returns_df: pd.DataFrame, max_condition: float = mvp_max_condition, fallback: str = mvp_fallback,
+              cov_estimator: str = mvp_cov_estimator, factor_targets: dict[str, float] | None = None) -> tuple[pd.Series, CovarianceFactorization | FactorCovariance]:
+    """
+    Computes the minimum variance portfolio like calculate_mvp_weights() and additionally returns the factorization of
+    the covariance matrix (with its condition number and the solver that was used), so callers can reuse it for
+    further solves, e.g., factorization.solve(b) for Σ⁻¹b.
+
+    The weights w = Σ⁻¹1 / (1ᵀΣ⁻¹1) are computed without inverting Σ: a Cholesky factorization (Σ = LLᵀ) is solved
+    for Σ⁻¹1. If Σ is singular or its condition number exceeds max_condition (e.g., nearly collinear assets),
+    the fallback solver is used (see factorize_covariance()).
+
+    With factor targets, the weights minimize the variance subject to the linear constraints Aw = b, where A stacks
+    the vector of ones and the asset betas of the targeted factors. The KKT conditions give w = Σ⁻¹Aᵀλ with
+    (AΣ⁻¹Aᵀ)λ = b, so only m + 1 right-hand sides are solved with the same factorization (m = number of targets),
+    plus a tiny (m + 1) x (m + 1) Schur complement system. No iterative optimizer is needed.
+
+    Parameters
+    ----------
+    returns_df, max_condition, fallback, cov_estimator, factor_targets
+        See calculate_mvp_weights().
+
+    Raises
+    ------
+    TypeError, ValueError
+        See calculate_mvp_weights().
+
+    Returns
+    -------
+    mvp_weights : pd.Series
+        Optimal weights (summing to 100%) for the minimum variance portfolio.
+    factorization : CovarianceFactorization | FactorCovariance
+        Factorization of the covariance matrix, or the factor-model covariance for cov_estimator="factor".
+    """
     
     # Input validation 
     if not isinstance(returns_df, pd.DataFrame):
@@ -38,34 +101,94 @@ def calculate_mvp_weights(returns_df: pd.DataFrame) -> pd.Series:
         raise ValueError("Input DataFrame contains NaN values. Please handle missing data before proceeding.")
     if returns_df.shape[1] < 2:
         raise ValueError("At least two assets are required to compute the minimum variance portfolio.")
-    if returns_df.shape[0] <= returns_df.shape[1]:
-        raise ValueError("Number of observations must exceed the number of assets to ensure covariance matrix invertibility.")
+    if cov_estimator not in valid_cov_estimators:
+        raise ValueError(f"Unsupported covariance estimator '{cov_estimator}'. Use one of {valid_cov_estimators}.")
+    # The sample covariance matrix is singular without more observations than assets, the shrinkage estimators are not
+    if cov_estimator == "sample" and returns_df.shape[0] <= returns_df.shape[1]:
+        raise ValueError("Number of observations must exceed the number of assets to ensure covariance matrix invertibility. "
+                         "Use a shrinkage covariance estimator (e.g., 'ledoit_wolf') for more assets.")
+    if returns_df.shape[0] < 2:
+        raise ValueError("At least two time periods are required to estimate the covariance matrix.")
+    if factor_targets:
+        unknown = [factor for factor in factor_targets if factor not in factor_model_columns]
+        if unknown:
+            raise ValueError(f"Unsupported factor targets {unknown}. Use factors of {factor_model_columns}.")
+        if len(factor_targets) + 1 > returns_df.shape[1]:
+            raise ValueError("The number of factor targets must be smaller than the number of assets.")
     
-    # Calculate covariance matrix based on the DataFrame with the stock return time series
-    cov_matrix = returns_df.cov()
-    # Convert to numpy matrix
-    cov = cov_matrix.values
+    # Assets without any variation make the covariance matrix singular, no solver can fix this
+    if (returns_df.max() == returns_df.min()).any():
+        raise ValueError("Covariance matrix is singular because some assets have zero variance. Try removing constant or redundant assets.")
+
     # Create vector of 1, needed to calculate the MVP
-    ones = np.ones(len(cov))
+    ones = np.ones(returns_df.shape[1])
 
     # MVP weights follow the formula: w = Σ⁻¹1 / (1ᵀΣ⁻¹1)
     # Σ is the covariance matrix
     # 1 is the vector of ones
     # T stands refers to transposed matrix
-    try:
-        inv_cov = np.linalg.inv(cov) # inverse
-    except np.linalg.LinAlgError:
-        raise ValueError("Covariance matrix is singular and cannot be inverted. Try removing collinear or redundant assets.")
+    if cov_estimator == "factor":
+        # Σ = BFBᵀ + D is solved with the Woodbury identity in O(Nk²), without forming the N x N matrix
+        factorization = estimate_factor_covariance(returns_df)
+    else:
+        # Calculate covariance matrix based on the DataFrame with the stock return time series
+        cov_matrix, _ = estimate_covariance(returns_df, cov_estimator)
+        # Σ⁻¹1 is computed by solving Σx = 1 with the Cholesky factors, which is faster and more accurate than an inverse
+        factorization = factorize_covariance(cov_matrix.values, max_condition=max_condition, fallback=fallback)
 
-    weights = inv_cov @ ones # matrix multiplication notation
-    weights /= ones.T @ inv_cov @ ones
+    if factor_targets:
+        # Constraints Aw = b: budget (1ᵀw = 1) and one row of asset betas per targeted factor
+        betas = get_asset_factor_betas(returns_df)[list(factor_targets)]
+        A = np.vstack([ones, betas.to_numpy().T])
+        b = np.array([1.0] + [float(target) for target in factor_targets.values()])
+        # KKT system via the Schur complement: w = Σ⁻¹Aᵀλ with (AΣ⁻¹Aᵀ)λ = b
+        cov_inv_At = factorization.solve(A.T)
+        schur = A @ cov_inv_At
+        try:
+            lagrange = np.linalg.solve(schur, b)
+        except np.linalg.LinAlgError:
+            raise ValueError("The factor targets cannot be reached because the asset betas are linearly dependent.")
+        weights = cov_inv_At @ lagrange
+    else:
+        weights = factorization.solve(ones)
+        weights /= ones @ weights
 
     # Put into a pandas Series with tickers as index
     mvp_weights = pd.Series(weights, index=returns_df.columns)
 
-    return mvp_weights
+    return mvp_weights, factorization
+
+def get_asset_factor_betas(returns_df: pd.DataFrame, factor_panel: FactorPanel | None = None) -> pd.DataFrame:
+    """
+    Returns the factor betas of every asset from the batched factor regression of factor_analysis_regression_batch()
+    (excess return on Mkt_rf, SMB, HML and Mom). The beta of a fully invested portfolio is the weighted sum of the
+    asset betas, so factor exposures are linear constraints on the weights.
+
+    Parameters
+    ----------
+    returns_df : pd.DataFrame
+        Monthly returns with datetime index and one column per asset.
+    factor_panel : FactorPanel, optional
+        Factor data to regress on. Defaults to the process-wide panel of get_factor_panel().
+
+    Raises
+    ------
+    TypeError, ValueError, RuntimeError
+        See factor_analysis_regression_batch().
+
+    Returns
+    -------
+    pd.DataFrame
+        Betas with the assets as index and the factors Mkt_rf, SMB, HML and Mom as columns.
+    """
+
+    tidy_df = factor_analysis_regression_batch(returns_df, factor_panel)
+    betas = tidy_df[tidy_df["term"] != "const"].pivot(index="portfolio", columns="term", values="coef")
+
+    return betas.reindex(index=returns_df.columns, columns=factor_model_columns)
 
-def calculate_mvp_portfolio(returns_df: pd.DataFrame) -> pd.Series:
+def calculate_mvp_portfolio(returns_df: pd.DataFrame, cov_estimator: str = mvp_cov_estimator,
+                            factor_targets: dict[str, float] | None = mvp_factor_targets) -> pd.Series:
     """
     Calculates the time series of portfolio returns for the minimum variance portfolio (MVP).
 
@@ -73,6 +196,11 @@ def calculate_mvp_portfolio(returns_df: pd.DataFrame) -> pd.Series:
     ----------
     returns_df : pd.DataFrame
         A DataFrame containing return time series for each asset (columns = assets, rows = time periods).
+    cov_estimator : str, optional
+        Covariance estimator, see calculate_mvp_weights(). Defaults to mvp_cov_estimator from config.py.
+    factor_targets : dict[str, float], optional
+        Factor exposures of the portfolio, e.g., {"HML": 0.3}, see calculate_mvp_weights().
+        Defaults to mvp_factor_targets from config.py.
 
     Raises
     ------
@@ -97,7 +225,7 @@ def calculate_mvp_portfolio(returns_df: pd.DataFrame) -> pd.Series:
         raise ValueError("Input DataFrame contains NaN values. Please handle missing data first.")
 
     # Compute weights
-    mvp_weights = calculate_mvp_weights(returns_df)
+    mvp_weights = calculate_mvp_weights(returns_df, cov_estimator=cov_estimator, factor_targets=factor_targets)
     if not isinstance(mvp_weights, pd.Series):
         raise TypeError("Returned MVP weights must be a pandas Series.")
        
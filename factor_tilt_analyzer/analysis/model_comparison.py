@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+from analysis.factor_panel import FactorPanel
+from analysis.portfolio_analyzer import get_factor_regression_data
+from analysis.ols_engine import fit_nested_ols, nested_f_test
+
+# Nested factor models, from the smallest to the largest; each model adds factors to the previous one
+nested_factor_models = {
+    "CAPM": ["Mkt_rf"],
+    "FF3": ["Mkt_rf", "SMB", "HML"],
+    "Carhart": ["Mkt_rf", "SMB", "HML", "Mom"]
+}
+
+
+def compare_factor_models(portfolio_returns: pd.Series, factor_panel: FactorPanel | None = None) -> pd.DataFrame:
+    """
+    Fits the nested factor models CAPM, Fama-French 3-factor and Carhart 4-factor for a portfolio in one pass
+    (a single QR decomposition of the Carhart design matrix, see fit_nested_ols()), and tests every model against
+    the previous one with a partial F-test.
+
+    Parameters
+    ----------
+    portfolio_returns : pd.Series
+        Monthly returns of the portfolio (with datetime index).
+    factor_panel : FactorPanel, optional
+        Factor data to regress on. Defaults to the process-wide panel of get_factor_panel().
+
+    Raises
+    ------
+    TypeError
+        If portfolio_returns is not a pandas Series with datetime index.
+    ValueError
+        If the returns are invalid (see get_factor_regression_data()), or if there are fewer than 5 overlapping months.
+    RuntimeError
+        If the regression models fail to fit.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per model (CAPM, FF3, Carhart) with the columns alpha, Mkt_rf, SMB, HML, Mom (NaN for factors that are
+        not in the model), r_squared, adj_r_squared, f_stat, f_pvalue (against the previous model; NaN for CAPM) and nobs.
+    """
+
+    excess, factors = get_factor_regression_data(portfolio_returns, factor_panel)
+    if len(excess) < 5:
+        raise ValueError("Not enough overlapping data points to run regression.")
+
+    # The columns of the largest model, so every smaller model is a column prefix
+    columns = list(nested_factor_models.values())[-1]
+    try:
+        results = fit_nested_ols(excess, factors[columns], [len(model) for model in nested_factor_models.values()])
+    except Exception as e:
+        raise RuntimeError(f"Failed to fit nested regression models: {e}")
+
+    rows = []
+    for i, result in enumerate(results):
+        f_stat, f_pvalue = (np.nan, np.nan) if i == 0 else nested_f_test(results[i - 1], result)[:2]
+        row = {"alpha": result.alpha}
+        row.update({factor: result.params.get(factor, np.nan) for factor in columns})
+        row.update({
+            "r_squared": result.rsquared,
+            "adj_r_squared": result.rsquared_adj,
+            "f_stat": f_stat,
+            "f_pvalue": f_pvalue,
+            "nobs": result.nobs
+        })
+        rows.append(row)
+
+    return pd.DataFrame(rows, index=list(nested_factor_models))
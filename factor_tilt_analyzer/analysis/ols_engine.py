@@ -0,0 +1,341 @@
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+
+@dataclass(frozen=True)
+class OLSResult:
+    """
+    Result of fit_ols(). The attribute names follow the statsmodels RegressionResults,
+    so both results can be used interchangeably for the supported statistics.
+    """
+
+    params: pd.Series      # Coefficients, including the intercept "const" (if fitted)
+    bse: pd.Series         # Standard errors of the coefficients
+    tvalues: pd.Series     # t-statistics of the coefficients
+    rsquared: float        # Coefficient of determination
+    rsquared_adj: float    # R² adjusted for the number of regressors
+    nobs: int              # Number of observations
+    df_resid: int          # Degrees of freedom of the residuals
+    ssr: float             # Sum of squared residuals
+
+    @property
+    def alpha(self) -> float:
+        """Intercept of the regression (NaN if no intercept was fitted)."""
+        return float(self.params.get("const", np.nan))
+
+    @property
+    def betas(self) -> pd.Series:
+        """Coefficients without the intercept."""
+        return self.params.drop("const", errors="ignore")
+
+
+@dataclass(frozen=True)
+class OLSBatchResult:
+    """
+    Result of fit_ols_batch(): the regressions of several dependent variables on the same regressors.
+    Coefficient statistics have one row per coefficient and one column per dependent variable.
+    """
+
+    params: pd.DataFrame   # Coefficients, including the intercept "const" (if fitted)
+    bse: pd.DataFrame      # Standard errors of the coefficients
+    tvalues: pd.DataFrame  # t-statistics of the coefficients
+    rsquared: pd.Series    # Coefficient of determination per dependent variable
+    rsquared_adj: pd.Series
+    nobs: int
+    df_resid: int
+    ssr: pd.Series         # Sum of squared residuals per dependent variable
+
+
+def fit_ols(y: pd.Series | np.ndarray, X: pd.DataFrame | np.ndarray, add_constant: bool = True) -> OLSResult:
+    """
+    Fits an ordinary least squares regression of y on X via a QR decomposition of the design matrix.
+    The QR solve avoids forming X'X, so it is numerically as stable as statsmodels, but without the overhead of
+    building a full model object. The (X'X)^-1 needed for the standard errors follows from the triangular factor R.
+
+    Parameters
+    ----------
+    y : pd.Series | np.ndarray
+        Dependent variable with T observations.
+    X : pd.DataFrame | np.ndarray
+        Regressors as T x k matrix. Column names of a DataFrame are used as coefficient names,
+        otherwise the names are "x1", ..., "xk".
+    add_constant : bool, optional
+        If True, an intercept named "const" is added as first regressor. The default is True.
+
+    Raises
+    ------
+    TypeError
+        If y or X cannot be converted to numeric arrays.
+    ValueError
+        If the shapes of y and X do not match, the data contains missing values, there are not more observations
+        than coefficients, or the regressors are linearly dependent.
+
+    Returns
+    -------
+    OLSResult
+        Coefficients, standard errors, t-statistics and goodness-of-fit measures.
+    """
+
+    try:
+        y = np.asarray(y, dtype=float)
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"y and X must be numeric: {e}")
+    if y.ndim != 1:
+        raise ValueError("y must be one-dimensional and X must have one row per observation of y.")
+
+    batch = fit_ols_batch(y[:, None], X, add_constant=add_constant)
+
+    return OLSResult(
+        params=batch.params[0].rename(None),
+        bse=batch.bse[0].rename(None),
+        tvalues=batch.tvalues[0].rename(None),
+        rsquared=float(batch.rsquared[0]),
+        rsquared_adj=float(batch.rsquared_adj[0]),
+        nobs=batch.nobs,
+        df_resid=batch.df_resid,
+        ssr=float(batch.ssr[0])
+    )
+
+
+def fit_ols_batch(Y: pd.DataFrame | np.ndarray, X: pd.DataFrame | np.ndarray, add_constant: bool = True) -> OLSBatchResult:
+    """
+    Fits the OLS regressions of every column of Y on the same regressors X at once. X is factorized a single time
+    (X = QR), and all coefficients follow from one triangular solve R B = Q'Y, so the cost of additional dependent
+    variables is a matrix product instead of a new factorization.
+
+    Parameters
+    ----------
+    Y : pd.DataFrame | np.ndarray
+        Dependent variables as T x m matrix. Column names of a DataFrame are used as result columns,
+        otherwise the columns are numbered from 0.
+    X : pd.DataFrame | np.ndarray
+        Regressors as T x k matrix, see fit_ols().
+    add_constant : bool, optional
+        If True, an intercept named "const" is added as first regressor. The default is True.
+
+    Raises
+    ------
+    TypeError
+        If Y or X cannot be converted to numeric arrays.
+    ValueError
+        If the shapes of Y and X do not match, the data contains missing values, there are not more observations
+        than coefficients, or the regressors are linearly dependent.
+
+    Returns
+    -------
+    OLSBatchResult
+        Coefficients, standard errors, t-statistics and goodness-of-fit measures of all regressions.
+    """
+
+    names = [str(col) for col in X.columns] if isinstance(X, pd.DataFrame) else None
+    targets = list(Y.columns) if isinstance(Y, pd.DataFrame) else None
+    try:
+        Y = np.asarray(Y, dtype=float)
+        X = np.asarray(X, dtype=float)
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"Y and X must be numeric: {e}")
+
+    if X.ndim == 1:
+        X = X[:, None]
+    if Y.ndim != 2 or X.ndim != 2 or X.shape[0] != Y.shape[0]:
+        raise ValueError("Y must be two-dimensional and X must have one row per observation of Y.")
+    if np.isnan(Y).any() or np.isnan(X).any():
+        raise ValueError("Y and X must not contain missing values.")
+
+    names = names if names is not None else [f"x{i}" for i in range(1, X.shape[1] + 1)]
+    targets = targets if targets is not None else list(range(Y.shape[1]))
+    if add_constant:
+        X = np.column_stack([np.ones(X.shape[0]), X])
+        names = ["const"] + names
+
+    nobs, k = X.shape
+    if nobs <= k:
+        raise ValueError(f"Need more observations ({nobs}) than coefficients ({k}).")
+
+    # X = QR -> coefficients solve R B = Q'Y
+    Q, R = np.linalg.qr(X)
+    diag = np.abs(np.diag(R))
+    if diag.min() <= np.finfo(float).eps * max(nobs, k) * diag.max():
+        raise ValueError("The regressors are linearly dependent.")
+    coef = np.linalg.solve(R, Q.T @ Y)
+
+    resid = Y - X @ coef
+    ssr = np.einsum("ij,ij->j", resid, resid)
+    df_resid = nobs - k
+
+    # (X'X)^-1 = R^-1 R^-T, so the variances are the squared row norms of R^-1 (shared by all regressions)
+    R_inv = np.linalg.solve(R, np.eye(k))
+    bse = np.sqrt(np.outer(np.sum(R_inv ** 2, axis=1), ssr / df_resid))
+
+    # R² is centered if the model has an intercept, and uncentered otherwise (as in statsmodels)
+    Y_dev = Y - Y.mean(axis=0) if add_constant else Y
+    tss = np.einsum("ij,ij->j", Y_dev, Y_dev)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsquared = np.where(tss > 0, 1.0 - ssr / tss, np.nan)
+        tvalues = coef / bse
+    rsquared_adj = 1.0 - (nobs - add_constant) / df_resid * (1.0 - rsquared)
+
+    return OLSBatchResult(
+        params=pd.DataFrame(coef, index=names, columns=targets),
+        bse=pd.DataFrame(bse, index=names, columns=targets),
+        tvalues=pd.DataFrame(tvalues, index=names, columns=targets),
+        rsquared=pd.Series(rsquared, index=targets),
+        rsquared_adj=pd.Series(rsquared_adj, index=targets),
+        nobs=nobs,
+        df_resid=df_resid,
+        ssr=pd.Series(ssr, index=targets)
+    )
+
+
+def fit_nested_ols(y: pd.Series | np.ndarray, X: pd.DataFrame | np.ndarray, n_regressors: list[int],
+                   add_constant: bool = True) -> list[OLSResult]:
+    """
+    Fits nested OLS models that use the first columns of X (e.g., CAPM -> Fama-French 3 -> Carhart) from a single
+    QR decomposition of the full design matrix. The QR factors of a column prefix are the leading blocks of the full
+    factors (X[:, :j] = Q[:, :j] R[:j, :j]), so every model follows from a j x j triangular solve, and its sum of
+    squared residuals is y'y minus the first j squared entries of Q'y.
+
+    Parameters
+    ----------
+    y : pd.Series | np.ndarray
+        Dependent variable with T observations.
+    X : pd.DataFrame | np.ndarray
+        Regressors of the largest model as T x k matrix, ordered so that every smaller model uses a prefix of the columns.
+    n_regressors : list[int]
+        Number of leading columns of X per model (without the intercept), e.g., [1, 3, 4]. Must be increasing.
+    add_constant : bool, optional
+        If True, every model contains an intercept named "const". The default is True.
+
+    Raises
+    ------
+    TypeError, ValueError
+        See fit_ols(). ValueError is also raised if n_regressors is empty, not increasing, or out of range.
+
+    Returns
+    -------
+    list[OLSResult]
+        One result per model, in the order of n_regressors.
+    """
+
+    names = [str(col) for col in X.columns] if isinstance(X, pd.DataFrame) else None
+    try:
+        y = np.asarray(y, dtype=float)
+        X = np.asarray(X, dtype=float)
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"y and X must be numeric: {e}")
+
+    if X.ndim == 1:
+        X = X[:, None]
+    if y.ndim != 1 or X.ndim != 2 or X.shape[0] != y.shape[0]:
+        raise ValueError("y must be one-dimensional and X must have one row per observation of y.")
+    if np.isnan(y).any() or np.isnan(X).any():
+        raise ValueError("y and X must not contain missing values.")
+    if not n_regressors or any(j <= 0 or j > X.shape[1] for j in n_regressors) or list(n_regressors) != sorted(set(n_regressors)):
+        raise ValueError(f"n_regressors must be increasing numbers between 1 and {X.shape[1]}.")
+
+    names = names if names is not None else [f"x{i}" for i in range(1, X.shape[1] + 1)]
+    if add_constant:
+        X = np.column_stack([np.ones(X.shape[0]), X])
+        names = ["const"] + names
+
+    nobs, k = X.shape
+    if nobs <= k:
+        raise ValueError(f"Need more observations ({nobs}) than coefficients ({k}).")
+
+    # One factorization of the full design matrix
+    Q, R = np.linalg.qr(X)
+    diag = np.abs(np.diag(R))
+    if diag.min() <= np.finfo(float).eps * max(nobs, k) * diag.max():
+        raise ValueError("The regressors are linearly dependent.")
+    z = Q.T @ y
+    yty = float(y @ y)
+
+    # R² is centered if the models have an intercept, and uncentered otherwise (as in statsmodels)
+    tss = yty - nobs * y.mean() ** 2 if add_constant else yty
+
+    results = []
+    for j in n_regressors:
+        size = j + add_constant
+        R_j = R[:size, :size]
+        coef = np.linalg.solve(R_j, z[:size])
+        ssr = max(yty - float(z[:size] @ z[:size]), 0.0)
+        df_resid = nobs - size
+
+        R_inv = np.linalg.solve(R_j, np.eye(size))
+        bse = np.sqrt(ssr / df_resid * np.sum(R_inv ** 2, axis=1))
+        rsquared = 1.0 - ssr / tss if tss > 0 else np.nan
+
+        model_names = names[:size]
+        results.append(OLSResult(
+            params=pd.Series(coef, index=model_names),
+            bse=pd.Series(bse, index=model_names),
+            tvalues=pd.Series(coef / bse, index=model_names),
+            rsquared=rsquared,
+            rsquared_adj=1.0 - (nobs - add_constant) / df_resid * (1.0 - rsquared),
+            nobs=nobs,
+            df_resid=df_resid,
+            ssr=ssr
+        ))
+
+    return results
+
+
+def nested_f_test(restricted: OLSResult, unrestricted: OLSResult) -> tuple[float, float, int, int]:
+    """
+    Partial F-test of a nested model against a larger model fitted on the same observations:
+    F = ((SSR_r - SSR_u) / q) / (SSR_u / df_u), with q additional regressors in the larger model.
+
+    Parameters
+    ----------
+    restricted : OLSResult
+        Result of the smaller model.
+    unrestricted : OLSResult
+        Result of the larger model.
+
+    Raises
+    ------
+    ValueError
+        If the models are not nested (same observations, more coefficients in the unrestricted model).
+
+    Returns
+    -------
+    tuple[float, float, int, int]
+        F-statistic, p-value, numerator and denominator degrees of freedom.
+    """
+
+    q = restricted.df_resid - unrestricted.df_resid
+    if restricted.nobs != unrestricted.nobs or q <= 0:
+        raise ValueError("The unrestricted model must have more coefficients than the restricted model on the same observations.")
+
+    f_stat = ((restricted.ssr - unrestricted.ssr) / q) / (unrestricted.ssr / unrestricted.df_resid)
+    p_value = float(stats.f.sf(f_stat, q, unrestricted.df_resid))
+
+    return float(f_stat), p_value, q, unrestricted.df_resid
+
+
+def format_ols_summary(result: OLSResult) -> str:
+    """
+    Returns a compact text summary of an OLS result (coefficients, standard errors, t-statistics and R²).
+    Cheaper than the statsmodels summary, which is only rendered on request.
+
+    Parameters
+    ----------
+    result : OLSResult
+        Output of fit_ols().
+
+    Returns
+    -------
+    str
+        Multi-line summary table.
+    """
+
+    lines = [
+        f"OLS regression: {result.nobs} observations, R² = {result.rsquared:.4f}, adj. R² = {result.rsquared_adj:.4f}",
+        f"{'':<10}{'coef':>12}{'std err':>12}{'t':>10}"
+    ]
+    for name in result.params.index:
+        lines.append(f"{name:<10}{result.params[name]:>12.4f}{result.bse[name]:>12.4f}{result.tvalues[name]:>10.3f}")
+
+    return "\n".join(lines)
@@ -3,6 +3,11 @@ import numpy as np
 import statsmodels.api as sm
 import os 
 import logging
+import threading
+from config import factor_cache_enabled
+from data.factor_cache import read_factor_cache, write_factor_cache
+from analysis.factor_panel import FactorPanel, to_period_ordinals
+from analysis.ols_engine import fit_ols, fit_ols_batch, format_ols_summary
 
 # Logging config — Log the regression model summary
 logging.basicConfig(
@@ -12,14 +17,20 @@ logging.basicConfig(
     filemode='a'  # 'a' to append 
 )
 
+# Process-wide factor panel, built on first use by get_factor_panel()
+_factor_panel = None
+_factor_panel_lock = threading.Lock()
 
-def read_fama_french_csv(path_name: str, column_names: list[str]) -> pd.DataFrame:
+
+def read_fama_french_csv(path_name: str, column_names: list[str], use_cache: bool = False) -> pd.DataFrame:
     """
     Reads a Fama-French style CSV file and returns a cleaned DataFrame with a datetime index.
 
     This function expects the CSV file to have a date index in YYYYMM format and data values
     starting from the second column. It renames the columns based on the provided list
     and converts the index to datetime format for time series compatibility.
+    With use_cache=True, the parsed file is stored in a binary cache (see data/factor_cache.py), and later calls
+    load the memory-mapped arrays instead of parsing the CSV file again.
 
     Parameters
     ----------
@@ -27,6 +38,8 @@ def read_fama_french_csv(path_name: str, column_names: list[str]) -> pd.DataFram
         Full path to the CSV file to read. The file must contain a YYYYMM-formatted index in the first column.
     column_names : list[str]
         A list of strings to rename the columns in the file. Must match the number of data columns in the CSV file.
+    use_cache : bool, optional
+        If True, the binary factor cache is used. It is rebuilt whenever the CSV file changes. The default is False.
 
     Raises
     ------
@@ -52,6 +65,14 @@ def read_fama_french_csv(path_name: str, column_names: list[str]) -> pd.DataFram
     # Check column_names is a list of strings
     if not isinstance(column_names, list) or not all(isinstance(col, str) for col in column_names):
         raise TypeError("column_names must be a list of strings.")
+
+    # Load the parsed data from the binary cache (no parsing, data stays memory-mapped)
+    cached = read_factor_cache(path_name) if use_cache else None
+    if cached is not None:
+        values, index = cached
+        if values.shape[1] != len(column_names):
+            raise ValueError(f"Expected {len(column_names)} columns, but found {values.shape[1]} in the file.")
+        return pd.DataFrame(values, index=pd.DatetimeIndex(index), columns=column_names, copy=False)
     
     try:
         # index_col = 0 -> Columns at column index 0 are set as row labels
@@ -71,11 +92,17 @@ def read_fama_french_csv(path_name: str, column_names: list[str]) -> pd.DataFram
         df.index = pd.to_datetime(df.index.astype(str), format="%Y%m")
     except Exception as e:
        raise ValueError(f"Failed to convert index to datetime (expected YYYYMM format): {e}")
+
+    if use_cache:
+        try:
+            write_factor_cache(path_name, df.to_numpy(dtype=float), df.index.to_numpy())
+        except (OSError, ValueError):
+            pass # The cache is optional, the parsed data is still returned
     
     return df
 
 
-def create_factor_dataset() -> pd.DataFrame:
+def create_factor_dataset(use_cache: bool = factor_cache_enabled) -> pd.DataFrame:
     """
     Loads and combines momentum and Fama-French factor datasets into a single DataFrame.
 
@@ -83,6 +110,12 @@ def create_factor_dataset() -> pd.DataFrame:
     and one containing the Fama-French 3-factor model data (Mkt_rf, SMB, HML, Rf).
     It joins the two datasets on their datetime index and performs basic validation.
 
+    Parameters
+    ----------
+    use_cache : bool, optional
+        If True, the CSV files are loaded from the binary factor cache (see read_fama_french_csv()).
+        Defaults to factor_cache_enabled from config.py.
+
     Raises
     ------
     FileNotFoundError
@@ -118,12 +151,12 @@ def create_factor_dataset() -> pd.DataFrame:
     
     # Error-handling for reading CSV files
     try:
-        mom_df = read_fama_french_csv(mom_path, ["Mom"])
+        mom_df = read_fama_french_csv(mom_path, ["Mom"], use_cache=use_cache)
     except Exception as e:
         raise IOError(f"Failed to read {mom_path}: {e}")
 
     try:
-        three_factors_df = read_fama_french_csv(three_factors_path, ["Mkt_rf", "SMB", "HML", "Rf"])
+        three_factors_df = read_fama_french_csv(three_factors_path, ["Mkt_rf", "SMB", "HML", "Rf"], use_cache=use_cache)
     except Exception as e:
         raise IOError(f"Failed to read {three_factors_path}: {e}")
 
@@ -145,7 +178,98 @@ def create_factor_dataset() -> pd.DataFrame:
     return combined_factors_df
 
 
-def factor_analysis_regression(portfolio_returns: pd.Series, mkt_returns: pd.Series, log: bool = True) -> pd.Series:
+def get_factor_panel() -> FactorPanel:
+    """
+    Returns the factor panel of the process. The factor dataset is loaded and converted only once,
+    so repeated regressions share the same panel.
+
+    Raises
+    ------
+    FileNotFoundError, IOError, ValueError
+        See create_factor_dataset().
+
+    Returns
+    -------
+    FactorPanel
+        Panel of the combined factor dataset (Mom, Mkt_rf, SMB, HML, Rf).
+    """
+
+    global _factor_panel
+    with _factor_panel_lock:
+        if _factor_panel is None:
+            _factor_panel = FactorPanel(create_factor_dataset())
+        return _factor_panel
+
+
+def reset_factor_panel() -> None:
+    """
+    Discards the factor panel of the process, e.g., after the input files changed. The next call of
+    get_factor_panel() loads the factor dataset again.
+    """
+
+    global _factor_panel
+    with _factor_panel_lock:
+        _factor_panel = None
+
+
+def get_factor_regression_data(portfolio_returns: pd.Series, factor_panel: FactorPanel | None = None) -> tuple[pd.Series, pd.DataFrame]:
+    """
+    Aligns monthly portfolio returns with the factor panel and returns the data of the factor model
+    (as in factor_analysis_regression()): the excess return in percent and the regressors Mkt_rf, SMB, HML and Mom.
+    Shared by the rolling, sub-period and bootstrap regressions.
+
+    Parameters
+    ----------
+    portfolio_returns : pd.Series
+        Monthly returns of the portfolio (with datetime index).
+    factor_panel : FactorPanel, optional
+        Factor data to regress on. Defaults to the process-wide panel of get_factor_panel().
+
+    Raises
+    ------
+    TypeError
+        If portfolio_returns is not a pandas Series with datetime index.
+    ValueError
+        If portfolio_returns is empty, contains missing values or more than one observation per month,
+        or if the returns do not overlap with the factor data.
+
+    Returns
+    -------
+    excess : pd.Series
+        Excess return of the portfolio in percent for the months with factor data.
+    factors : pd.DataFrame
+        Regressors Mkt_rf, SMB, HML and Mom with the same index as excess.
+    """
+
+    # Input validation
+    if not isinstance(portfolio_returns, pd.Series):
+        raise TypeError("Portfolio returns must be provided as pandas Series.")
+    if not isinstance(portfolio_returns.index, pd.DatetimeIndex):
+        raise TypeError("Portfolio returns must have a datetime index.")
+    if len(portfolio_returns) == 0:
+        raise ValueError("Portfolio returns must be non-empty.")
+    if portfolio_returns.isnull().any():
+        raise ValueError("Portfolio returns contain missing values. Please clean the data first.")
+
+    periods = to_period_ordinals(portfolio_returns.index)
+    if len(np.unique(periods)) != len(periods):
+        raise ValueError("Portfolio returns must contain at most one observation per month.")
+
+    # Align the returns with the factors by their monthly period
+    factor_panel = get_factor_panel() if factor_panel is None else factor_panel
+    factor_values, found = factor_panel.lookup(portfolio_returns.index)
+    if not found.any():
+        raise ValueError("Portfolio returns do not overlap with the factor data.")
+    factors = pd.DataFrame(factor_values[found], index=portfolio_returns.index[found], columns=factor_panel.columns)
+
+    # Excess return in percent
+    excess = portfolio_returns[found] * 100 - factors["Rf"]
+
+    return excess, factors[["Mkt_rf", "SMB", "HML", "Mom"]]
+
+
+def factor_analysis_regression(portfolio_returns: pd.Series, mkt_returns: pd.Series, log: bool = True,
+                               factor_panel: FactorPanel | None = None, full_summary: bool = False) -> pd.Series:
     """
     Fits an OLS regression of portfolio returns on Fama-French factors.
     Specifically, portfolio returns are regressed on Mkt_rf, SMB, HML, and Mom.
@@ -157,15 +281,20 @@ def factor_analysis_regression(portfolio_returns: pd.Series, mkt_returns: pd.Ser
     mkt_returns : pd.Series
         Time series of market benchmark returns (with datetime index).
     log : bool, optional
-        If True, logs the regression summary to file via the logging module.
+        If True, logs a compact regression summary (coefficients, standard errors, t-statistics, R²) to file via the logging module.
+    factor_panel : FactorPanel, optional
+        Factor data to regress on. Defaults to the process-wide panel of get_factor_panel().
+    full_summary : bool, optional
+        If True (and log is True), the full statsmodels summary is logged instead of the compact summary.
+        The statsmodels model is only fitted in this case. The default is False.
 
     Raises
     ------
     TypeError
         If inputs are not pandas Series or lack a datetime index.
     ValueError
-        If inputs are empty, unaligned in time, or contain missing values. If the final regression dataset has fewer 
-        than 5 rows, which would overfit the model.
+        If inputs are empty, unaligned in time, contain missing values, or contain more than one observation per month.
+        If the final regression dataset has fewer than 5 rows, which would overfit the model.
     RuntimeError
         If the regression model fails to fit.
 
@@ -200,9 +329,14 @@ def factor_analysis_regression(portfolio_returns: pd.Series, mkt_returns: pd.Ser
     # Scale by 100, so that all values are expressed as percentages for the regression
     joined_returns *= 100
     
-    # Join the combined returns to the factor DataFrame
-    combined_factors_df = create_factor_dataset()
-    final_df = joined_returns.join(combined_factors_df, how="inner")
+    # Align the returns with the factors by their monthly period (integer lookup instead of a datetime join)
+    periods = to_period_ordinals(joined_returns.index)
+    if len(np.unique(periods)) != len(periods):
+        raise ValueError("Input return series must contain at most one observation per month.")
+    factor_panel = get_factor_panel() if factor_panel is None else factor_panel
+    factor_values, found = factor_panel.lookup(joined_returns.index)
+    final_df = joined_returns[found].copy()
+    final_df[factor_panel.columns] = factor_values[found]
 
     if final_df.shape[0] < 5:
         raise ValueError("Not enough overlapping data points to run regression.")
@@ -211,31 +345,127 @@ def factor_analysis_regression(portfolio_returns: pd.Series, mkt_returns: pd.Ser
     final_df["Portfolio_excess"] = final_df["Portfolio"] - final_df["Rf"] 
 
     # Run the regression
-    X = sm.add_constant(final_df[["Mkt_rf", "SMB", "HML", "Mom"]]) # add intercept
+    X = final_df[["Mkt_rf", "SMB", "HML", "Mom"]]
     y = final_df["Portfolio_excess"]
     
-    # Fit OLS model 
-    
+    # Fit OLS model (QR solve with intercept)
     try:
-       model = sm.OLS(y, X).fit()
+       result = fit_ols(y, X, add_constant=True)
     except Exception as e:
        raise RuntimeError(f"Failed to fit OLS regression model: {e}")
     
     if log:
-        # Log model summary to file
-        logging.info("\n" + model.summary().as_text())
+        if full_summary:
+            # The statsmodels summary is much more expensive than the fit, so it is only rendered on request
+            logging.info("\n" + sm.OLS(y, sm.add_constant(X)).fit().summary().as_text())
+        else:
+            # Log compact model summary to file
+            logging.info("\n" + format_ols_summary(result))
     
     # Drop the constant 
-    betas = model.params.drop("const", errors="ignore")
+    betas = result.betas
 
     return betas
 
 
-def analyze_factor_exposures(betas: pd.Series, width: int = 20, scale: float = 1.0) -> None:
+def factor_analysis_regression_batch(returns_df: pd.DataFrame, factor_panel: FactorPanel | None = None) -> pd.DataFrame:
+    """
+    Fits the factor regression of factor_analysis_regression() for many portfolios or assets at once, e.g., for all
+    constituents of a universe. All return series are regressed on the same design matrix (intercept, Mkt_rf, SMB, HML, Mom),
+    so X is factorized once and all betas, alphas and t-statistics follow from a single matrix solve.
+    Series with different histories (missing values) are grouped by their sample, with one factorization per group.
+
+    Parameters
+    ----------
+    returns_df : pd.DataFrame
+        Returns with datetime index and one column per portfolio or asset (e.g., the output of fetch_returns()).
+    factor_panel : FactorPanel, optional
+        Factor data to regress on. Defaults to the process-wide panel of get_factor_panel().
+
+    Raises
+    ------
+    TypeError
+        If returns_df is not a DataFrame with datetime index, or contains non-numeric data.
+    ValueError
+        If returns_df is empty or contains more than one observation per month, or if a series has fewer than
+        5 observations that overlap with the factor data.
+    RuntimeError
+        If a regression fails (e.g., linearly dependent factors in the sample).
+
+    Returns
+    -------
+    pd.DataFrame
+        Tidy table with one row per portfolio and term (const, Mkt_rf, SMB, HML, Mom) and the columns
+        portfolio, term, coef, std_err, t_stat, r_squared and nobs.
+    """
+
+    # Input validation
+    if not isinstance(returns_df, pd.DataFrame):
+        raise TypeError("Returns must be provided as pandas DataFrame.")
+    if not isinstance(returns_df.index, pd.DatetimeIndex):
+        raise TypeError("Returns must have a datetime index.")
+    if returns_df.empty:
+        raise ValueError("Returns must be non-empty.")
+    try:
+        returns = returns_df.to_numpy(dtype=float)
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"Returns must be numeric: {e}")
+
+    periods = to_period_ordinals(returns_df.index)
+    if len(np.unique(periods)) != len(periods):
+        raise ValueError("Returns must contain at most one observation per month.")
+
+    # Align the returns with the factors by their monthly period
+    factor_panel = get_factor_panel() if factor_panel is None else factor_panel
+    factor_values, found = factor_panel.lookup(returns_df.index)
+    factors = pd.DataFrame(factor_values[found], columns=factor_panel.columns)
+
+    # Excess returns in percent (as in factor_analysis_regression)
+    excess = returns[found] * 100 - factors[["Rf"]].to_numpy()
+    X = factors[["Mkt_rf", "SMB", "HML", "Mom"]].to_numpy()
+
+    # Group the series by their available observations, so every group shares one factorization
+    available = ~np.isnan(excess)
+    groups = {}
+    for col in range(excess.shape[1]):
+        groups.setdefault(available[:, col].tobytes(), []).append(col)
+
+    too_short = [returns_df.columns[col] for col in range(excess.shape[1]) if available[:, col].sum() < 5]
+    if too_short:
+        raise ValueError(f"Not enough overlapping data points to run regression for: {too_short}")
+
+    tables = []
+    for cols in groups.values():
+        rows = available[:, cols[0]]
+        try:
+            result = fit_ols_batch(excess[np.ix_(rows, cols)], X[rows], add_constant=True)
+        except Exception as e:
+            raise RuntimeError(f"Failed to fit OLS regression models: {e}")
+
+        k = len(result.params)
+        tables.append(pd.DataFrame({
+            "portfolio": np.repeat(returns_df.columns[cols].to_numpy(), k),
+            "term": np.tile(["const", "Mkt_rf", "SMB", "HML", "Mom"], len(cols)),
+            "coef": result.params.to_numpy().T.ravel(),
+            "std_err": result.bse.to_numpy().T.ravel(),
+            "t_stat": result.tvalues.to_numpy().T.ravel(),
+            "r_squared": np.repeat(result.rsquared.to_numpy(), k),
+            "nobs": result.nobs
+        }, index=np.repeat(cols, k)))
+
+    # Restore the column order of the input
+    tidy_df = pd.concat(tables).sort_index(kind="stable").reset_index(drop=True)
+
+    return tidy_df
+
+
+def analyze_factor_exposures(betas: pd.Series, width: int = 20, scale: float = 1.0, beta_history: pd.DataFrame | None = None) -> None:
     """
     Visualizes factor exposures (regression betas) as a horizontal bar chart using characters
     like ▇ and ▁ to indicate the strength and direction (positive or negative) of the exposure.
-    Intended for console output.
+    Optionally, the drift of the exposures over time is shown as a sparkline per factor.
+    Intended for console output. To visualize the latest rolling window, pass its row of the
+    rolling_factor_regression() output as betas.
 
     Parameters
     ----------
@@ -247,15 +477,19 @@ def analyze_factor_exposures(betas: pd.Series, width: int = 20, scale: float = 1
     scale : float, optional
         The max absolute value to normalize exposures (e.g., a beta of 1.0 becomes the full half-bar).
         Values above/below are clamped. Default is 1.0.
+    beta_history : pd.DataFrame, optional
+        Time-varying exposures with one column per factor, e.g., the output of rolling_factor_regression().
+        If provided, a sparkline of each factor in betas is printed (with at most 2 * width points).
 
     Raises
     ------
     TypeError
         If betas is not a pandas Series, or its values are not numeric.
-        If width is not an int, or scale is not a float.
+        If width is not an int, or scale is not a float. If beta_history is not a pandas DataFrame.
     ValueError
         If betas is empty, contains non-finite values (NaN/inf), or if width/scale are non-positive.
         If width exceeds 40 characters (to avoid excessive terminal clutter).
+        If beta_history does not contain a column for every factor in betas.
     RuntimeError
         If rendering of the visual output fails unexpectedly.
 
@@ -284,6 +518,12 @@ def analyze_factor_exposures(betas: pd.Series, width: int = 20, scale: float = 1
         raise ValueError("Width must be a positive integer no greater than 40.")
     if scale <= 0:
         raise ValueError("Scale must be a positive floating point number.")
+    if beta_history is not None:
+        if not isinstance(beta_history, pd.DataFrame):
+            raise TypeError("Beta history must be provided as pandas DataFrame.")
+        missing = [factor for factor in betas.index if factor not in beta_history.columns]
+        if missing:
+            raise ValueError(f"Beta history is missing the factors: {missing}")
     
     
     print("\t=== Realized Factor Exposures ===") # Section header
@@ -317,6 +557,48 @@ def analyze_factor_exposures(betas: pd.Series, width: int = 20, scale: float = 1
         except Exception as e:
             raise RuntimeError(f"Failed to visualize factor '{factor}': {e}")
 
+    if beta_history is None:
+        return
+
+    print("\n\t=== Factor Exposure Drift ===") # Section header
+    for factor in betas.index:
+        history = beta_history[factor].dropna()
+        if history.empty:
+            continue
+        # Evenly spaced points, so long histories still fit into the console
+        if len(history) > 2 * width:
+            history = history.iloc[np.linspace(0, len(history) - 1, 2 * width).round().astype(int)]
+        print(f"{factor:<10} {render_sparkline(history.to_numpy())} ({history.iloc[0]:+.2f} → {history.iloc[-1]:+.2f})")
+
+
+def render_sparkline(values: np.ndarray) -> str:
+    """
+    Renders a sequence of numbers as a sparkline with one block character (▁ to █) per value,
+    scaled between the minimum and the maximum of the sequence. A constant sequence is drawn as a flat line.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Finite numbers to render.
+
+    Returns
+    -------
+    str
+        Sparkline with one character per value.
+    """
+
+    blocks = "▁▂▃▄▅▆▇█"
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return ""
+
+    spread = values.max() - values.min()
+    if spread == 0:
+        return blocks[0] * values.size
+    levels = ((values - values.min()) / spread * (len(blocks) - 1)).round().astype(int)
+
+    return "".join(blocks[level] for level in levels)
+
 
 def interpret_exposure(val: float) -> str:
     """
@@ -6,6 +6,12 @@ import pandas as pd
 # Monthly -> 12 months / year 
 valid_interval_factors = {"daily": 252, "monthly": 12, "yearly": 1} 
 
+# Keys of the statistics dictionary of calculate_portfolio_statistics() (and columns of calculate_portfolio_statistics_frame())
+portfolio_statistics_keys = [
+    "mean_return", "annualized_return", "std_dev",
+    "annualized_volatility", "sharpe_ratio",
+    "cumulative_return", "max_drawdown"]
+
 
 def compare_portfolio_with_market_benchmark(portfolio_returns: pd.Series, mkt_returns: pd.Series, interval: str = "monthly") -> None:
     """
@@ -157,6 +163,88 @@ def calculate_portfolio_statistics(portfolio_returns: pd.Series, interval: str =
     }
 
 
+def calculate_portfolio_statistics_frame(returns: pd.DataFrame | np.ndarray, interval: str = "monthly") -> pd.DataFrame:
+    """
+    Calculates the statistics of calculate_portfolio_statistics() for many portfolios at once, e.g., for 1,000
+    candidate portfolios. Every column is one portfolio; all statistics are computed with one NumPy reduction
+    per statistic along the time axis (including the cumulative products and running maxima of the drawdowns),
+    instead of one function call per portfolio.
+
+    Parameters
+    ----------
+    returns : pd.DataFrame | np.ndarray
+        Returns as T x P matrix (rows = time periods, columns = portfolios). Must not contain NaNs or infinite values.
+    interval : str, optional
+        Frequency of the returns (used for annualization). One of: 'daily', 'monthly', 'yearly'.
+        Default is 'monthly'.
+
+    Raises
+    ------
+    TypeError
+        If returns is not a DataFrame or 2-D ndarray of numbers, or interval is not a string.
+    ValueError
+        If returns is empty, contains invalid values, or the interval string is not recognized.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per portfolio (column names of the DataFrame, or 0, ..., P-1 for an ndarray) and one column per
+        statistic, named like the keys of calculate_portfolio_statistics().
+    """
+
+    # Type validation
+    if not isinstance(interval, str):
+        raise TypeError("Interval must be a string.")
+    if isinstance(returns, pd.DataFrame):
+        names = returns.columns
+    elif isinstance(returns, np.ndarray) and returns.ndim == 2:
+        names = pd.RangeIndex(returns.shape[1])
+    else:
+        raise TypeError("Portfolio returns must be a pandas DataFrame or a 2-D numpy array.")
+    try:
+        R = np.asarray(returns, dtype=float)
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"Portfolio returns must be numeric: {e}")
+
+    # Value checks
+    if R.size == 0:
+        raise ValueError("Portfolio returns cannot be empty.")
+    if not np.isfinite(R).all():
+        raise ValueError("Portfolio returns contain NaN or infinite values.")
+
+    interval = interval.lower()
+    if interval not in valid_interval_factors:
+        raise ValueError("Invalid interval factor. Must be one of: daily, monthly, yearly.")
+
+    interval_factor = valid_interval_factors[interval]
+
+    mean_return = R.mean(axis=0)
+    annualized_return = mean_return * interval_factor
+
+    # Sample standard deviation (ddof = 1, as in pandas), undefined for a single period
+    std_dev = R.std(axis=0, ddof=1) if R.shape[0] > 1 else np.full(R.shape[1], np.nan)
+    annualized_volatility = std_dev * np.sqrt(interval_factor)
+
+    # Sharpe ratio (assuming risk-free rate is 0), NaN without volatility
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe_ratio = np.where(annualized_volatility == 0, np.nan, annualized_return / annualized_volatility)
+
+    # Cumulative geometric return and maximum drawdown from the wealth paths of all portfolios
+    wealth = np.cumprod(1 + R, axis=0)
+    cumulative_return = wealth[-1] - 1
+    max_drawdown = (wealth / np.maximum.accumulate(wealth, axis=0) - 1).min(axis=0)
+
+    return pd.DataFrame({
+        "mean_return": mean_return,
+        "annualized_return": annualized_return,
+        "std_dev": std_dev,
+        "annualized_volatility": annualized_volatility,
+        "sharpe_ratio": sharpe_ratio,
+        "cumulative_return": cumulative_return,
+        "max_drawdown": max_drawdown
+    }, index=names)
+
+
 def print_portfolio_statistics(portfolio_stats: dict, portfolio_name: str) -> None:
     """
     Prints standardized summary statistics for a portfolio to the console.
@@ -197,10 +285,7 @@ def print_portfolio_statistics(portfolio_stats: dict, portfolio_name: str) -> No
     if len(portfolio_stats) == 0:
         raise ValueError("Portfolio statistics dictionary cannot be empty.")
     
-    required_keys = [
-       "mean_return", "annualized_return", "std_dev",
-       "annualized_volatility", "sharpe_ratio",
-       "cumulative_return", "max_drawdown"]
+    required_keys = portfolio_statistics_keys
     
     # Check if any dictionary keys are missing
     missing_keys = [key for key in required_keys if key not in portfolio_stats]
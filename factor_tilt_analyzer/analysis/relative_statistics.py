@@ -0,0 +1,153 @@
+import numpy as np
+import pandas as pd
+from analysis.portfolio_statistics import valid_interval_factors
+
+# Columns of calculate_relative_statistics()
+relative_statistics_keys = [
+    "tracking_error", "information_ratio", "beta", "alpha",
+    "up_capture", "down_capture", "sortino_ratio"]
+
+
+def align_return_panels(portfolio_returns: pd.DataFrame | pd.Series, benchmark_returns: pd.DataFrame | pd.Series) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Aligns portfolio and benchmark returns on their common dates, keeping only dates on which every series has a return.
+
+    Parameters
+    ----------
+    portfolio_returns, benchmark_returns : pd.DataFrame | pd.Series
+        Returns with one column per portfolio or benchmark.
+
+    Raises
+    ------
+    TypeError
+        If the inputs are not pandas DataFrames or Series.
+    ValueError
+        If there are fewer than 2 common dates with complete data.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, pd.DataFrame]
+        Portfolio and benchmark returns on the same dates.
+    """
+
+    panels = []
+    for name, returns in (("Portfolio", portfolio_returns), ("Benchmark", benchmark_returns)):
+        if isinstance(returns, pd.Series):
+            returns = returns.to_frame(returns.name if returns.name is not None else name)
+        if not isinstance(returns, pd.DataFrame):
+            raise TypeError(f"{name} returns must be a pandas DataFrame or Series.")
+        panels.append(returns)
+
+    portfolios, benchmarks = panels
+    combined = portfolios.join(benchmarks, how="inner", lsuffix="_portfolio", rsuffix="_benchmark").dropna()
+    if len(combined) < 2:
+        raise ValueError("Portfolio and benchmark returns must share at least two dates with complete data.")
+
+    return portfolios.loc[combined.index], benchmarks.loc[combined.index]
+
+
+def calculate_relative_statistics(portfolio_returns: pd.DataFrame | pd.Series, benchmark_returns: pd.DataFrame | pd.Series,
+                                  interval: str = "monthly") -> pd.DataFrame:
+    """
+    Calculates relative performance statistics of every portfolio against every benchmark (e.g., the indices of
+    valid_mkt_benchmarks in config.py). With T common dates, N portfolios and M benchmarks, all N x M pairs follow
+    from matrix products of the aligned T x N and T x M return panels (cross-covariances, and sums over the up and
+    down periods of each benchmark as masked products), without a loop over pairs.
+
+    - tracking_error: annualized standard deviation of the active return (portfolio - benchmark)
+    - information_ratio: annualized mean active return / tracking error
+    - beta, alpha: CAPM regression of the portfolio on the benchmark (rf=0), alpha annualized like the mean return
+    - up_capture, down_capture: mean portfolio return / mean benchmark return over the periods with positive
+      (negative) benchmark returns
+    - sortino_ratio: annualized mean return / annualized downside deviation below 0 (rf=0, independent of the benchmark)
+
+    Parameters
+    ----------
+    portfolio_returns : pd.DataFrame | pd.Series
+        Returns with one column per portfolio.
+    benchmark_returns : pd.DataFrame | pd.Series
+        Returns with one column per benchmark.
+    interval : str, optional
+        Frequency of the returns (used for annualization). One of: 'daily', 'monthly', 'yearly'.
+        Default is 'monthly'.
+
+    Raises
+    ------
+    TypeError
+        If the inputs are not pandas DataFrames or Series, contain non-numeric data, or interval is not a string.
+    ValueError
+        If there are fewer than 2 common dates with complete data, the returns contain infinite values,
+        or the interval string is not recognized.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per (portfolio, benchmark) pair, with a two-level index, and one column per statistic.
+        Statistics that are undefined (e.g., a benchmark without down periods) are NaN.
+    """
+
+    # Type and value checks
+    if not isinstance(interval, str):
+        raise TypeError("Interval must be a string.")
+    interval = interval.lower()
+    if interval not in valid_interval_factors:
+        raise ValueError("Invalid interval factor. Must be one of: daily, monthly, yearly.")
+
+    portfolios, benchmarks = align_return_panels(portfolio_returns, benchmark_returns)
+    try:
+        P = portfolios.to_numpy(dtype=float)
+        B = benchmarks.to_numpy(dtype=float)
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"Returns must be numeric: {e}")
+    if not np.isfinite(P).all() or not np.isfinite(B).all():
+        raise ValueError("Returns contain infinite values.")
+
+    T = P.shape[0]
+    interval_factor = valid_interval_factors[interval]
+
+    # Means and (cross-)covariances of all pairs: N x M from one matrix product
+    mean_P, mean_B = P.mean(axis=0), B.mean(axis=0)
+    P_c, B_c = P - mean_P, B - mean_B
+    var_P = np.einsum("ij,ij->j", P_c, P_c) / (T - 1)
+    var_B = np.einsum("ij,ij->j", B_c, B_c) / (T - 1)
+    cov_PB = P_c.T @ B_c / (T - 1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Active return: var(P - B) = var(P) + var(B) - 2 cov(P, B)
+        active_mean = mean_P[:, None] - mean_B[None, :]
+        total_var = var_P[:, None] + var_B[None, :]
+        active_var = total_var - 2 * cov_PB
+        active_var[active_var <= 1e-12 * total_var] = 0.0 # Cancellation noise of (nearly) identical series
+        tracking_error = np.sqrt(active_var * interval_factor)
+        information_ratio = np.where(tracking_error > 0, active_mean * interval_factor / tracking_error, np.nan)
+
+        # CAPM beta and alpha (rf=0)
+        beta = np.where(var_B > 0, cov_PB / var_B, np.nan)
+        alpha = (mean_P[:, None] - beta * mean_B[None, :]) * interval_factor
+
+        # Up/down capture: masked sums over the up and down periods of each benchmark
+        captures = []
+        for mask in (B > 0, B < 0):
+            mask = mask.astype(float)
+            count = mask.sum(axis=0)
+            portfolio_mean = (P.T @ mask) / count
+            benchmark_mean = np.einsum("ij,ij->j", B, mask) / count
+            captures.append(np.where(count > 0, portfolio_mean / benchmark_mean, np.nan))
+        up_capture, down_capture = captures
+
+        # Sortino ratio: downside deviation below 0 over all periods
+        downside = np.sqrt(np.mean(np.minimum(P, 0.0) ** 2, axis=0) * interval_factor)
+        sortino = np.where(downside > 0, mean_P * interval_factor / downside, np.nan)
+
+    M = B.shape[1]
+    index = pd.MultiIndex.from_product([portfolios.columns, benchmarks.columns], names=["portfolio", "benchmark"])
+
+    return pd.DataFrame({
+        "tracking_error": tracking_error.ravel(),
+        "information_ratio": information_ratio.ravel(),
+        "beta": beta.ravel(),
+        "alpha": alpha.ravel(),
+        "up_capture": up_capture.ravel(),
+        "down_capture": down_capture.ravel(),
+        "sortino_ratio": np.repeat(sortino, M)
+    }, index=index)[relative_statistics_keys]
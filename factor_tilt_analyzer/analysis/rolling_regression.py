@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+from analysis.factor_panel import FactorPanel
+from analysis.portfolio_analyzer import get_factor_regression_data
+
+
+def rolling_ols(y: pd.Series | np.ndarray, X: pd.DataFrame | np.ndarray, window: int | None = None,
+                min_periods: int | None = None, add_constant: bool = True) -> pd.DataFrame:
+    """
+    Fits OLS regressions of y on X over a rolling window (window = number of observations) or an expanding window
+    (window = None). The cross-products X'X, X'y and y'y are maintained incrementally: every step adds the newest
+    observation and, for rolling windows, removes the one that left the window. Each step costs O(k²) for the update
+    plus a k x k solve, instead of refitting the full regression per window.
+
+    Parameters
+    ----------
+    y : pd.Series | np.ndarray
+        Dependent variable with T observations.
+    X : pd.DataFrame | np.ndarray
+        Regressors as T x k matrix. Column names of a DataFrame are used as coefficient names,
+        otherwise the names are "x1", ..., "xk".
+    window : int, optional
+        Number of observations per window. None (default) uses an expanding window from the first observation.
+    min_periods : int, optional
+        Minimum number of observations for an estimate. Must exceed the number of coefficients.
+        Defaults to window (rolling) or the number of coefficients + 1 (expanding).
+    add_constant : bool, optional
+        If True, an intercept named "const" is fitted. The default is True.
+
+    Raises
+    ------
+    TypeError
+        If y or X are not numeric, or window/min_periods are not integers.
+    ValueError
+        If the shapes of y and X do not match, the data contains missing values, or window/min_periods are too small.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per observation (index of y, if y is a Series) with the coefficients, "r_squared" and "nobs"
+        of the window ending at that observation. Rows without an estimate are NaN.
+    """
+
+    index = y.index if isinstance(y, pd.Series) else pd.RangeIndex(len(y))
+    names = [str(col) for col in X.columns] if isinstance(X, pd.DataFrame) else None
+    try:
+        y = np.asarray(y, dtype=float)
+        X = np.asarray(X, dtype=float)
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"y and X must be numeric: {e}")
+
+    if X.ndim == 1:
+        X = X[:, None]
+    if y.ndim != 1 or X.ndim != 2 or X.shape[0] != y.shape[0]:
+        raise ValueError("y must be one-dimensional and X must have one row per observation of y.")
+    if np.isnan(y).any() or np.isnan(X).any():
+        raise ValueError("y and X must not contain missing values.")
+
+    names = names if names is not None else [f"x{i}" for i in range(1, X.shape[1] + 1)]
+    if add_constant:
+        X = np.column_stack([np.ones(X.shape[0]), X])
+        names = ["const"] + names
+    T, k = X.shape
+
+    for name, value in (("window", window), ("min_periods", min_periods)):
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool)):
+            raise TypeError(f"{name} must be an integer or None.")
+    min_periods = (window if window is not None else k + 1) if min_periods is None else min_periods
+    if min_periods <= k:
+        raise ValueError(f"min_periods must exceed the number of coefficients ({k}).")
+    if window is not None and window < min_periods:
+        raise ValueError("window must be at least min_periods.")
+
+    coef = np.full((T, k), np.nan)
+    rsquared = np.full(T, np.nan)
+    nobs = np.zeros(T, dtype=int)
+
+    # Running sums of the current window
+    XtX = np.zeros((k, k))
+    Xty = np.zeros(k)
+    yty = 0.0
+    y_sum = 0.0
+
+    for t in range(T):
+        # Add the newest observation
+        x_new, y_new = X[t], y[t]
+        XtX += np.outer(x_new, x_new)
+        Xty += x_new * y_new
+        yty += y_new * y_new
+        y_sum += y_new
+
+        # Remove the observation that left the rolling window
+        if window is not None and t >= window:
+            x_old, y_old = X[t - window], y[t - window]
+            XtX -= np.outer(x_old, x_old)
+            Xty -= x_old * y_old
+            yty -= y_old * y_old
+            y_sum -= y_old
+
+        n = t + 1 if window is None else min(t + 1, window)
+        nobs[t] = n
+        if n < min_periods:
+            continue
+
+        try:
+            b = np.linalg.solve(XtX, Xty)
+        except np.linalg.LinAlgError:
+            continue # Singular window (e.g., a constant regressor), no estimate
+
+        # SSR = y'y - b'X'y, R² centered with an intercept and uncentered otherwise (as in statsmodels)
+        ssr = max(yty - b @ Xty, 0.0)
+        tss = yty - y_sum * y_sum / n if add_constant else yty
+        coef[t] = b
+        rsquared[t] = 1.0 - ssr / tss if tss > 0 else np.nan
+
+    rolling_df = pd.DataFrame(coef, index=index, columns=names)
+    rolling_df["r_squared"] = rsquared
+    rolling_df["nobs"] = nobs
+
+    return rolling_df
+
+
+def rolling_factor_regression(portfolio_returns: pd.Series, window: int | None = 36, min_periods: int | None = None,
+                              factor_panel: FactorPanel | None = None) -> pd.DataFrame:
+    """
+    Estimates time-varying factor exposures of a portfolio with the factor model of factor_analysis_regression()
+    (excess return on Mkt_rf, SMB, HML and Mom) over rolling or expanding windows.
+
+    Parameters
+    ----------
+    portfolio_returns : pd.Series
+        Monthly returns of the portfolio (with datetime index).
+    window : int, optional
+        Number of months per window. The default is 36. None uses an expanding window.
+    min_periods : int, optional
+        Minimum number of months for an estimate, see rolling_ols().
+    factor_panel : FactorPanel, optional
+        Factor data to regress on. Defaults to the process-wide panel of get_factor_panel().
+
+    Raises
+    ------
+    TypeError
+        If portfolio_returns is not a pandas Series with datetime index.
+    ValueError
+        If portfolio_returns is empty, contains missing values or more than one observation per month,
+        or if the returns do not overlap with the factor data.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per month with the columns alpha, Mkt_rf, SMB, HML, Mom, r_squared and nobs.
+        Months before the first complete window are NaN.
+    """
+
+    excess, factors = get_factor_regression_data(portfolio_returns, factor_panel)
+    rolling_df = rolling_ols(excess, factors, window=window, min_periods=min_periods)
+
+    return rolling_df.rename(columns={"const": "alpha"})
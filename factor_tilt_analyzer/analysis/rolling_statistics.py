@@ -0,0 +1,190 @@
+import numpy as np
+import pandas as pd
+from analysis.portfolio_statistics import valid_interval_factors, portfolio_statistics_keys
+
+
+def prefix_sums(values: np.ndarray) -> np.ndarray:
+    """
+    Returns the prefix sums of a T x P array with a leading zero row, so the sum of rows [i, j) is P[j] - P[i].
+    """
+
+    sums = np.zeros((values.shape[0] + 1, values.shape[1]))
+    np.cumsum(values, axis=0, out=sums[1:])
+
+    return sums
+
+
+def rolling_max_drawdown(log_wealth: np.ndarray, window: int) -> np.ndarray:
+    """
+    Maximum drawdown of every window of `window` consecutive periods, for all columns at once, with the
+    van Herk/Gil-Werman block decomposition (O(T) per column, independent of the window length).
+
+    In log-wealth L, the drawdown of the window [s, t] is min over s <= i <= j <= t of L_j - L_i. The series is cut
+    into blocks of length `window`, so every window [s, t] is a suffix of one block plus a prefix of the next block.
+    Its drawdown is the smallest of the drawdown within the suffix, the drawdown within the prefix, and the drop from
+    the peak of the suffix to the trough of the prefix. These block-wise suffix/prefix quantities are running maxima
+    and minima, which NumPy computes for all blocks and columns in single accumulate calls.
+
+    Parameters
+    ----------
+    log_wealth : np.ndarray
+        Cumulative log returns L as T x P array.
+    window : int
+        Window length.
+
+    Returns
+    -------
+    np.ndarray
+        Maximum drawdowns (as simple returns, e.g., -0.25) as T x P array, where row t belongs to the window ending at t.
+        The first window - 1 rows are NaN.
+    """
+
+    T, P = log_wealth.shape
+    n_blocks = -(-T // window) # Ceiling division
+    padded = np.pad(log_wealth, ((0, n_blocks * window - T), (0, 0)), mode="edge")
+    blocks = padded.reshape(n_blocks, window, P)
+
+    # Prefix of each block (block start .. j): running minimum and drawdown
+    prefix_min = np.minimum.accumulate(blocks, axis=1)
+    prefix_drop = np.minimum.accumulate(blocks - np.maximum.accumulate(blocks, axis=1), axis=1)
+
+    # Suffix of each block (s .. block end): running maximum and drawdown, accumulated backwards
+    reverse = blocks[:, ::-1]
+    suffix_max = np.maximum.accumulate(reverse, axis=1)[:, ::-1]
+    suffix_drop = np.minimum.accumulate(np.minimum.accumulate(reverse, axis=1) - reverse, axis=1)[:, ::-1]
+
+    prefix_min, prefix_drop = prefix_min.reshape(-1, P)[:T], prefix_drop.reshape(-1, P)[:T]
+    suffix_max, suffix_drop = suffix_max.reshape(-1, P)[:T], suffix_drop.reshape(-1, P)[:T]
+
+    drop = np.full((T, P), np.nan)
+    t = np.arange(window - 1, T)
+    s = t - window + 1
+    aligned = s % window == 0 # Window coincides with a block
+    drop[t[aligned]] = prefix_drop[t[aligned]]
+    t, s = t[~aligned], s[~aligned]
+    drop[t] = np.minimum(np.minimum(suffix_drop[s], prefix_drop[t]), prefix_min[t] - suffix_max[s])
+
+    return np.expm1(drop)
+
+
+def rolling_portfolio_statistics(returns: pd.DataFrame | pd.Series, window: int | None = None, interval: str = "monthly",
+                                 min_periods: int | None = None) -> pd.DataFrame:
+    """
+    Calculates the statistics of calculate_portfolio_statistics() over rolling windows (window = number of periods)
+    or expanding windows (window = None) for every period and every return series, e.g., for the MVP and the benchmark.
+
+    All statistics are computed for all series at once in O(T) per series, independent of the window length:
+    means and volatilities from sliding sums (differences of prefix sums of the returns and squared returns,
+    centered for accuracy), cumulative returns from prefix sums of log returns, and rolling maximum drawdowns with
+    the van Herk/Gil-Werman algorithm (see rolling_max_drawdown()). Expanding drawdowns use running maxima.
+
+    Parameters
+    ----------
+    returns : pd.DataFrame | pd.Series
+        Returns with one column per series (rows = time periods in chronological order).
+    window : int, optional
+        Number of periods per window. None (default) uses an expanding window from the first period.
+    interval : str, optional
+        Frequency of the returns (used for annualization). One of: 'daily', 'monthly', 'yearly'.
+        Default is 'monthly'.
+    min_periods : int, optional
+        Minimum number of periods for a statistic. Defaults to window (rolling) or 2 (expanding).
+
+    Raises
+    ------
+    TypeError
+        If returns is not a pandas DataFrame or Series, is not numeric, or interval/window/min_periods have the wrong type.
+    ValueError
+        If returns is empty, contains NaNs, infinite values or returns of -100% or less, the interval is not
+        recognized, or window/min_periods are not positive or min_periods exceeds window.
+
+    Returns
+    -------
+    pd.DataFrame
+        Statistics with the index of returns and two column levels: metric (the keys of calculate_portfolio_statistics())
+        and series. Periods with fewer than min_periods observations are NaN.
+    """
+
+    # Type validation
+    if not isinstance(interval, str):
+        raise TypeError("Interval must be a string.")
+    if isinstance(returns, pd.Series):
+        returns = returns.to_frame(returns.name if returns.name is not None else "returns")
+    if not isinstance(returns, pd.DataFrame):
+        raise TypeError("Returns must be a pandas DataFrame or Series.")
+    for name, value in (("window", window), ("min_periods", min_periods)):
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool)):
+            raise TypeError(f"{name} must be an integer or None.")
+    try:
+        R = returns.to_numpy(dtype=float)
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"Returns must be numeric: {e}")
+
+    # Value checks
+    if R.size == 0:
+        raise ValueError("Returns cannot be empty.")
+    if not np.isfinite(R).all():
+        raise ValueError("Returns contain NaN or infinite values.")
+    if (R <= -1).any():
+        raise ValueError("Returns must be greater than -100%.")
+    interval = interval.lower()
+    if interval not in valid_interval_factors:
+        raise ValueError("Invalid interval factor. Must be one of: daily, monthly, yearly.")
+    if window is not None and window < 1:
+        raise ValueError("window must be positive.")
+    min_periods = (window if window is not None else 2) if min_periods is None else min_periods
+    if min_periods < 1 or (window is not None and min_periods > window):
+        raise ValueError("min_periods must be positive and not larger than window.")
+
+    T = R.shape[0]
+    interval_factor = valid_interval_factors[interval]
+
+    # Window [start, end) per period and its number of observations
+    end = np.arange(1, T + 1)
+    start = np.zeros(T, dtype=int) if window is None else np.maximum(end - window, 0)
+    n = (end - start)[:, None].astype(float)
+
+    # Sliding sums of the centered returns (the shift cancels out in the variance)
+    centered = R - R.mean(axis=0)
+    S1 = prefix_sums(centered)
+    S2 = prefix_sums(centered * centered)
+    sum1 = S1[end] - S1[start]
+    sum2 = S2[end] - S2[start]
+    mean_return = sum1 / n + R.mean(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = np.maximum(sum2 - sum1 * sum1 / n, 0.0) / (n - 1)
+        std_dev = np.where(n > 1, np.sqrt(variance), np.nan)
+    annualized_return = mean_return * interval_factor
+    annualized_volatility = std_dev * np.sqrt(interval_factor)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe_ratio = np.where(annualized_volatility == 0, np.nan, annualized_return / annualized_volatility)
+
+    # Cumulative geometric return of the window from prefix sums of log returns
+    L = prefix_sums(np.log1p(R))
+    cumulative_return = np.expm1(L[end] - L[start])
+
+    # Maximum drawdown (the peak is searched from the first period of the window, as in calculate_portfolio_statistics())
+    log_wealth = L[1:]
+    if window is None:
+        max_drawdown = np.expm1(np.minimum.accumulate(log_wealth - np.maximum.accumulate(log_wealth, axis=0), axis=0))
+    else:
+        max_drawdown = rolling_max_drawdown(log_wealth, window)
+        # Shorter windows at the start (min_periods < window) are expanding windows
+        head = min(window - 1, T)
+        max_drawdown[:head] = np.expm1(np.minimum.accumulate(log_wealth[:head] - np.maximum.accumulate(log_wealth[:head], axis=0), axis=0))
+
+    metrics = {
+        "mean_return": mean_return,
+        "annualized_return": annualized_return,
+        "std_dev": std_dev,
+        "annualized_volatility": annualized_volatility,
+        "sharpe_ratio": sharpe_ratio,
+        "cumulative_return": cumulative_return,
+        "max_drawdown": max_drawdown
+    }
+    values = np.concatenate([metrics[key] for key in portfolio_statistics_keys], axis=1)
+    values[(n < min_periods)[:, 0]] = np.nan
+
+    columns = pd.MultiIndex.from_product([portfolio_statistics_keys, returns.columns], names=["metric", "series"])
+
+    return pd.DataFrame(values, index=returns.index, columns=columns)
@@ -0,0 +1,218 @@
+import math
+import numpy as np
+import pandas as pd
+from analysis.portfolio_statistics import valid_interval_factors
+
+
+class StreamingPortfolioStatistics:
+    """
+    Online accumulator of the statistics of calculate_portfolio_statistics() for a return series that grows one
+    observation at a time (e.g., a live daily or monthly feed). Every update is O(1), and the history is never rescanned.
+
+    The state of a sequence of returns consists of:
+    - n, mean and M2 (sum of squared deviations), updated with Welford's algorithm,
+    - the cumulative log return G (compounded return = exp(G) - 1),
+    - the maximum and minimum cumulative log return of all prefixes, and the maximum drawdown D in log space.
+
+    Accumulators of consecutive periods (e.g., shards computed in different processes) are combined with merge():
+    the moments with the parallel formula of Chan, Golub and LeVeque, and the drawdown as the worst of both parts and
+    of the drop from the peak of the earlier part to the trough of the later part. Merging is order-sensitive
+    (the argument must follow the accumulator in time), merging with an empty accumulator is the identity.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.log_growth = 0.0         # G: cumulative log return
+        self.max_log_wealth = -math.inf  # Peak of the cumulative log return (after the first observation)
+        self.min_log_wealth = math.inf   # Trough of the cumulative log return
+        self.max_log_drawdown = 0.0   # D: most negative drop from a running peak, in log space
+
+    def __len__(self) -> int:
+        return self.n
+
+    def update(self, value: float) -> "StreamingPortfolioStatistics":
+        """
+        Adds the next return of the series in O(1).
+
+        Parameters
+        ----------
+        value : float
+            Return of the next period (e.g., 0.01 for 1%).
+
+        Raises
+        ------
+        TypeError
+            If value is not numeric.
+        ValueError
+            If value is NaN, infinite, or -100% or less.
+
+        Returns
+        -------
+        StreamingPortfolioStatistics
+            The updated accumulator (self), so updates can be chained.
+        """
+
+        if not isinstance(value, (int, float, np.integer, np.floating)) or isinstance(value, bool):
+            raise TypeError("Return must be numeric.")
+        value = float(value)
+        if not math.isfinite(value):
+            raise ValueError("Return contains NaN or infinite values.")
+        if value <= -1:
+            raise ValueError("Return must be greater than -100%.")
+
+        # Welford update of mean and M2
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+
+        # Running compounded return, peak and drawdown (the peak includes the current period)
+        self.log_growth += math.log1p(value)
+        self.max_log_wealth = max(self.max_log_wealth, self.log_growth)
+        self.min_log_wealth = min(self.min_log_wealth, self.log_growth)
+        self.max_log_drawdown = min(self.max_log_drawdown, self.log_growth - self.max_log_wealth)
+
+        return self
+
+    @classmethod
+    def from_returns(cls, returns: pd.Series | np.ndarray) -> "StreamingPortfolioStatistics":
+        """
+        Builds the accumulator of a block of returns with vectorized NumPy reductions
+        (same state as calling update() for every return).
+
+        Parameters
+        ----------
+        returns : pd.Series | np.ndarray
+            One-dimensional returns in chronological order.
+
+        Raises
+        ------
+        TypeError
+            If returns are not numeric or not one-dimensional.
+        ValueError
+            If returns contain NaN or infinite values, or returns of -100% or less.
+
+        Returns
+        -------
+        StreamingPortfolioStatistics
+            Accumulator of the block.
+        """
+
+        try:
+            values = np.asarray(returns, dtype=float)
+        except (TypeError, ValueError) as e:
+            raise TypeError(f"Returns must be numeric: {e}")
+        if values.ndim != 1:
+            raise TypeError("Returns must be one-dimensional.")
+        if not np.isfinite(values).all():
+            raise ValueError("Returns contain NaN or infinite values.")
+        if (values <= -1).any():
+            raise ValueError("Returns must be greater than -100%.")
+
+        accumulator = cls()
+        if len(values) == 0:
+            return accumulator
+
+        log_wealth = np.cumsum(np.log1p(values))
+        accumulator.n = len(values)
+        accumulator.mean = float(values.mean())
+        accumulator.m2 = float(np.sum((values - accumulator.mean) ** 2))
+        accumulator.log_growth = float(log_wealth[-1])
+        accumulator.max_log_wealth = float(log_wealth.max())
+        accumulator.min_log_wealth = float(log_wealth.min())
+        accumulator.max_log_drawdown = float((log_wealth - np.maximum.accumulate(log_wealth)).min())
+
+        return accumulator
+
+    def merge(self, other: "StreamingPortfolioStatistics") -> "StreamingPortfolioStatistics":
+        """
+        Combines this accumulator with the accumulator of the directly following periods in O(1).
+
+        Parameters
+        ----------
+        other : StreamingPortfolioStatistics
+            Accumulator of the returns after the returns of this accumulator.
+
+        Raises
+        ------
+        TypeError
+            If other is not a StreamingPortfolioStatistics.
+
+        Returns
+        -------
+        StreamingPortfolioStatistics
+            New accumulator of the concatenated periods (both inputs are unchanged).
+        """
+
+        if not isinstance(other, StreamingPortfolioStatistics):
+            raise TypeError("Only StreamingPortfolioStatistics accumulators can be merged.")
+
+        merged = StreamingPortfolioStatistics()
+        merged.__dict__.update(self.__dict__ if other.n == 0 else other.__dict__)
+        if self.n == 0 or other.n == 0:
+            return merged
+
+        # Moments: parallel update of Chan, Golub and LeVeque
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        merged.n = n
+        merged.mean = self.mean + delta * other.n / n
+        merged.m2 = self.m2 + other.m2 + delta * delta * self.n * other.n / n
+
+        # Path statistics: the later part is shifted by the cumulative log return of the earlier part
+        merged.log_growth = self.log_growth + other.log_growth
+        merged.max_log_wealth = max(self.max_log_wealth, self.log_growth + other.max_log_wealth)
+        merged.min_log_wealth = min(self.min_log_wealth, self.log_growth + other.min_log_wealth)
+        merged.max_log_drawdown = min(self.max_log_drawdown, other.max_log_drawdown,
+                                      self.log_growth + other.min_log_wealth - self.max_log_wealth)
+
+        return merged
+
+    def statistics(self, interval: str = "monthly") -> dict:
+        """
+        Returns the current statistics with the keys of calculate_portfolio_statistics().
+
+        Parameters
+        ----------
+        interval : str, optional
+            Frequency of the returns (used for annualization). One of: 'daily', 'monthly', 'yearly'.
+            Default is 'monthly'.
+
+        Raises
+        ------
+        TypeError
+            If interval is not a string.
+        ValueError
+            If the accumulator has no observations or the interval string is not recognized.
+
+        Returns
+        -------
+        dict
+            mean_return, annualized_return, std_dev, annualized_volatility, sharpe_ratio (rf=0),
+            cumulative_return and max_drawdown.
+        """
+
+        if not isinstance(interval, str):
+            raise TypeError("Interval must be a string.")
+        if self.n == 0:
+            raise ValueError("Portfolio return series cannot be empty.")
+        interval = interval.lower()
+        if interval not in valid_interval_factors:
+            raise ValueError("Invalid interval factor. Must be one of: daily, monthly, yearly.")
+
+        interval_factor = valid_interval_factors[interval]
+        annualized_return = self.mean * interval_factor
+        std_dev = math.sqrt(max(self.m2, 0.0) / (self.n - 1)) if self.n > 1 else np.nan
+        annualized_volatility = std_dev * np.sqrt(interval_factor)
+
+        return {
+            "mean_return": self.mean,
+            "annualized_return": annualized_return,
+            "std_dev": std_dev,
+            "annualized_volatility": annualized_volatility,
+            "sharpe_ratio": np.nan if annualized_volatility == 0 else annualized_return / annualized_volatility,
+            "cumulative_return": math.expm1(self.log_growth),
+            "max_drawdown": math.expm1(self.max_log_drawdown)
+        }
@@ -0,0 +1,217 @@
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from scipy import linalg
+from config import walk_forward_window, walk_forward_rebalance_every, walk_forward_refresh_every
+
+
+@dataclass(frozen=True)
+class WalkForwardResult:
+    """
+    Result of walk_forward_mvp().
+    """
+
+    returns: pd.Series              # Out-of-sample portfolio returns (periods after the first rebalance)
+    weights: pd.DataFrame           # Target weights per rebalance date (estimated with data up to and including that date)
+    turnover: pd.Series             # Sum of absolute weight changes per rebalance date (the first builds the portfolio from cash)
+
+
+class IncrementalCovarianceInverse:
+    """
+    Inverse of the scatter matrix M = Σ (x_t - x̄)(x_t - x̄)ᵀ of a window of observations (covariance = M / (n - 1)).
+    Adding or removing an observation changes M by a rank-1 term (Welford update), so M⁻¹ is updated with the
+    Sherman-Morrison formula in O(N²) instead of refactorizing in O(N³):
+
+        add x:    M' = M + n/(n+1) uuᵀ,   remove x:   M' = M - n/(n-1) uuᵀ,   with u = x - x̄
+        (M + c uuᵀ)⁻¹ = M⁻¹ - c M⁻¹u uᵀM⁻¹ / (1 + c uᵀM⁻¹u)
+    """
+
+    def __init__(self, X: np.ndarray):
+        """
+        Parameters
+        ----------
+        X : np.ndarray
+            Initial window as n x N matrix (rows = observations), with n > N.
+
+        Raises
+        ------
+        ValueError
+            If the scatter matrix of X is singular.
+        """
+
+        self.reset(X)
+
+    def reset(self, X: np.ndarray) -> None:
+        """
+        Recomputes the state from scratch for the window X (Cholesky factorization, O(nN² + N³)).
+        """
+
+        self.n = X.shape[0]
+        self.mean = X.mean(axis=0)
+        centered = X - self.mean
+        try:
+            cholesky = linalg.cho_factor(centered.T @ centered, lower=True)
+        except linalg.LinAlgError:
+            raise ValueError("Covariance matrix of the window is singular. Try a longer window or removing redundant assets.")
+        self.inverse = linalg.cho_solve(cholesky, np.eye(X.shape[1]))
+
+    def rank_one_update(self, u: np.ndarray, c: float) -> bool:
+        """
+        Applies M⁻¹ <- (M + c uuᵀ)⁻¹. Returns False (without changing the state) if the result would not be positive definite.
+        """
+
+        Mu = self.inverse @ u
+        denominator = 1.0 + c * (u @ Mu)
+        if denominator <= 1e-12:
+            return False
+        self.inverse -= (c / denominator) * np.outer(Mu, Mu)
+
+        return True
+
+    def add(self, x: np.ndarray) -> bool:
+        """
+        Adds the observation x. Returns False if the update is numerically unreliable (the state is then unchanged).
+        """
+
+        u = x - self.mean
+        if not self.rank_one_update(u, self.n / (self.n + 1)):
+            return False
+        self.mean = self.mean + u / (self.n + 1)
+        self.n += 1
+
+        return True
+
+    def remove(self, x: np.ndarray) -> bool:
+        """
+        Removes the observation x (which must be part of the window). Returns False if the downdate would make the
+        scatter matrix singular or is numerically unreliable (the state is then unchanged).
+        """
+
+        u = x - self.mean
+        if self.n <= 2 or not self.rank_one_update(u, -self.n / (self.n - 1)):
+            return False
+        self.mean = self.mean - u / (self.n - 1)
+        self.n -= 1
+
+        return True
+
+    def mvp_weights(self) -> np.ndarray:
+        """
+        Returns the minimum variance weights Σ⁻¹1 / (1ᵀΣ⁻¹1) of the window (the scale of M⁻¹ cancels out).
+        """
+
+        z = self.inverse.sum(axis=1) # M⁻¹1
+
+        return z / z.sum()
+
+
+def walk_forward_mvp(returns_df: pd.DataFrame, window: int | None = walk_forward_window, min_periods: int | None = None,
+                     rebalance_every: int = walk_forward_rebalance_every,
+                     refresh_every: int = walk_forward_refresh_every) -> WalkForwardResult:
+    """
+    Walk-forward backtest of the minimum variance portfolio without look-ahead: at every rebalance date the weights
+    are estimated from the returns up to and including that date (rolling or expanding window) and held over the
+    following periods. Between rebalances the weights drift with the asset returns.
+
+    The inverse covariance matrix is carried from period to period with Sherman-Morrison rank-1 updates
+    (new observation) and downdates (observation leaving a rolling window), see IncrementalCovarianceInverse.
+    To bound the accumulation of rounding errors it is recomputed from scratch every refresh_every periods,
+    and whenever an update is numerically unreliable.
+
+    Parameters
+    ----------
+    returns_df : pd.DataFrame
+        Returns of each asset (columns = assets, rows = time periods in chronological order).
+    window : int, optional
+        Number of periods of the rolling estimation window. None uses an expanding window.
+        Defaults to walk_forward_window from config.py.
+    min_periods : int, optional
+        Number of periods before the first rebalance. Must exceed the number of assets.
+        Defaults to window (rolling) or the number of assets + 1 (expanding).
+    rebalance_every : int, optional
+        Number of periods between rebalances. Defaults to walk_forward_rebalance_every from config.py.
+    refresh_every : int, optional
+        Number of incremental updates after which the inverse is recomputed from scratch.
+        Defaults to walk_forward_refresh_every from config.py.
+
+    Raises
+    ------
+    TypeError
+        If returns_df is not a pandas DataFrame, or window/min_periods/rebalance_every/refresh_every are not integers.
+    ValueError
+        If returns_df is empty, contains NaNs or has fewer than 2 assets, the window parameters are invalid
+        (e.g., not more periods than assets), there are no periods after the first rebalance, or the covariance
+        matrix of a window is singular.
+
+    Returns
+    -------
+    WalkForwardResult
+        Out-of-sample returns, weights history and turnover.
+    """
+
+    # Input validation
+    if not isinstance(returns_df, pd.DataFrame):
+        raise TypeError("Input must be a pd.DataFrame object with stock returns.")
+    if returns_df.empty:
+        raise ValueError("Input DataFrame cannot be empty.")
+    if returns_df.isnull().values.any():
+        raise ValueError("Input DataFrame contains NaN values. Please handle missing data before proceeding.")
+    if returns_df.shape[1] < 2:
+        raise ValueError("At least two assets are required to compute the minimum variance portfolio.")
+    for name, value in (("window", window), ("min_periods", min_periods), ("rebalance_every", rebalance_every),
+                        ("refresh_every", refresh_every)):
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool)):
+            raise TypeError(f"{name} must be an integer.")
+    if rebalance_every < 1 or refresh_every < 1:
+        raise ValueError("rebalance_every and refresh_every must be positive.")
+
+    X = returns_df.to_numpy(dtype=float)
+    T, N = X.shape
+    min_periods = (window if window is not None else N + 1) if min_periods is None else min_periods
+    if min_periods <= N:
+        raise ValueError(f"min_periods must exceed the number of assets ({N}) to ensure covariance matrix invertibility.")
+    if window is not None and window < min_periods:
+        raise ValueError("window must be at least min_periods.")
+    if min_periods >= T:
+        raise ValueError("Not enough periods for an out-of-sample return after the first rebalance.")
+
+    first = min_periods - 1 # Index of the first rebalance date
+    state = IncrementalCovarianceInverse(X[:first + 1])
+    updates = 0
+
+    weights = np.zeros(N)
+    oos_returns = np.empty(T - first - 1)
+    rebalance_rows, target_weights, turnover = [], [], []
+
+    for t in range(first, T):
+        if t > first:
+            # Move the window forward: add the newest observation, then drop the oldest one once the rolling window is full
+            # (with min_periods < window, the window grows until it reaches its full length)
+            start = 0 if window is None else max(0, t - window + 1)
+            updates += 1
+            ok = updates < refresh_every and state.add(X[t])
+            if ok and window is not None and t >= window:
+                ok = state.remove(X[t - window])
+            if not ok:
+                state.reset(X[start:t + 1]) # Periodic refresh or unreliable update
+                updates = 0
+
+        if (t - first) % rebalance_every == 0:
+            target = state.mvp_weights()
+            rebalance_rows.append(t)
+            target_weights.append(target)
+            turnover.append(np.abs(target - weights).sum())
+            weights = target
+
+        if t + 1 < T:
+            # Out-of-sample return of the next period, after which the weights drift with the asset returns
+            portfolio_return = weights @ X[t + 1]
+            oos_returns[t - first] = portfolio_return
+            weights = weights * (1 + X[t + 1]) / (1 + portfolio_return)
+
+    index = returns_df.index
+    return WalkForwardResult(
+        returns=pd.Series(oos_returns, index=index[first + 1:], name="MVP"),
+        weights=pd.DataFrame(target_weights, index=index[rebalance_rows], columns=returns_df.columns),
+        turnover=pd.Series(turnover, index=index[rebalance_rows], name="turnover")
+    )
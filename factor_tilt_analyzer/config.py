@@ -3,4 +3,68 @@
 # ^GSPC -> S&P 500 Index
 # ^RUT -> Russell 2000 Index
 valid_mkt_benchmarks = ["^IXIC", "^GSPC", "^RUT"]
-benchmark_names = ["NASDAQ Composite Index", "S&P 500 Index", "Russell 2000 Index"]
\ No newline at end of file
+benchmark_names = ["NASDAQ Composite Index", "S&P 500 Index", "Russell 2000 Index"]
+
+# Local price cache for downloaded price histories (see data/price_cache.py)
+# Repeated runs only download the months that are missing in the cache
+price_cache_enabled = True
+price_cache_dir = "cache/prices"
+price_cache_max_bytes = 50 * 1024 * 1024 # 50 MB, least recently used entries are evicted first
+price_cache_empty_ttl = 12 * 60 * 60 # Seconds, date ranges without data (e.g., before an IPO) are not downloaded again within this time
+
+# Maximum number of tickers per multi-symbol API call in the bulk download mode of fetch_returns
+bulk_chunk_size = 50
+
+# Concurrent fetching of stock and benchmark returns (see data/concurrent_fetcher.py)
+fetch_max_workers = 8 # Maximum number of parallel downloads
+fetch_requests_per_second = 4.0 # Token bucket rate limit for API requests, None disables the limit
+fetch_max_retries = 3 # Retries per ticker after the first failed attempt
+fetch_backoff_base = 0.5 # Maximum delay in seconds before the first retry, doubled for every further retry
+fetch_backoff_max = 8.0 # Upper bound of the retry delay in seconds
+
+# Backend of the price data: "yahoo" (Yahoo Finance API) or "local" (offline Parquet/CSV files, see data/price_sources.py)
+price_source = "yahoo"
+local_price_dir = "input/prices" # One file per ticker, e.g., input/prices/AAPL.parquet or input/prices/^GSPC.csv
+
+# Ticker validation (see utils/validity_input_check.py)
+validation_cache_enabled = True
+validation_cache_path = "cache/ticker_validity.json"
+validation_cache_ttl_valid = 7 * 24 * 3600 # Valid tickers are re-checked after 7 days
+validation_cache_ttl_invalid = 24 * 3600 # Invalid tickers are re-checked after 1 day
+validation_max_workers = 8 # Maximum number of concurrent API checks
+ticker_validation_probe = "history" # "history" (cheap price probe) or "info" (full quote summary)
+single_pass_validation = True # Validate tickers by downloading their data instead of a separate API check per ticker
+
+# Binary cache of the parsed Fama-French CSV files (see data/factor_cache.py)
+# The cache is rebuilt automatically when a CSV file in the input folder changes
+factor_cache_enabled = True
+factor_cache_dir = "cache/factors"
+
+# Rolling factor regression (see analysis/rolling_regression.py)
+rolling_beta_window = 12 # Months per window for the factor exposure drift shown by main.py
+
+# Block bootstrap of the factor exposures (see analysis/bootstrap.py)
+bootstrap_replicates = 10_000
+bootstrap_chunk_size = 1_000 # Replicates per random stream; fixed, so results do not depend on the number of processes
+
+# Minimum variance portfolio solver (see analysis/covariance_factorization.py)
+mvp_max_condition = 1e10 # Covariance matrices with a larger condition number use the fallback solver
+mvp_fallback = "ridge" # "ridge" (regularized Cholesky) or "pinv" (pseudo-inverse)
+# Covariance estimator of the MVP (see analysis/covariance_estimators.py): "sample", "ledoit_wolf", "constant_correlation", "oas"
+# or "factor" (Fama-French/Carhart factor model, see analysis/factor_covariance.py)
+# The shrinkage estimators also support more stocks than return periods (e.g., more than 23 stocks with in_period="2y")
+mvp_cov_estimator = "sample"
+
+# Investment constraints of the MVP (see analysis/constrained_mvp.py)
+# The unconstrained closed-form MVP is used if short positions are allowed and there is no weight cap
+mvp_long_only = False # True: no short positions
+mvp_max_weight = None # Maximum weight per stock (e.g., 0.2 for 20%), None for no cap
+
+# Factor exposure targets of the MVP, e.g., {"HML": 0.3} or {"SMB": 0.0, "HML": 0.0, "Mom": 0.0} for a style-neutral portfolio
+# Supported factors: Mkt_rf, SMB, HML, Mom. None for the plain minimum variance portfolio
+mvp_factor_targets = None
+
+# Walk-forward MVP backtest (see analysis/walk_forward.py)
+walk_forward_window = 36 # Months of the rolling estimation window, None for an expanding window
+walk_forward_rebalance_every = 1 # Months between rebalances
+walk_forward_refresh_every = 60 # Incremental covariance updates before the inverse is recomputed from scratch
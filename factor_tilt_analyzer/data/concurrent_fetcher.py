@@ -0,0 +1,524 @@
+import time
+import random
+import threading
+from dataclasses import dataclass
+from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from requests.exceptions import HTTPError
+from config import valid_mkt_benchmarks, fetch_max_workers, fetch_requests_per_second, fetch_max_retries, fetch_backoff_base, fetch_backoff_max
+from data.data_fetcher import get_start_date, validate_ticker_list, validate_benchmark_ticker, get_price_source, NoDataError
+from data.price_cache import fetch_cached_prices
+from data.price_sources import PriceSource
+
+
+@dataclass(frozen=True)
+class FetchFailure:
+    """
+    Reason why the returns of a ticker could not be fetched (see fetch_and_validate_returns()).
+    """
+
+    error: Exception                # Exception of the last attempt (NoDataError if the source has no data for the ticker)
+    message: str                    # Description for the user
+
+    @property
+    def no_data(self) -> bool:
+        """
+        True if the ticker has no data (invalid, delisted or unavailable), False if the download failed (e.g., network error).
+        """
+
+        return isinstance(self.error, NoDataError)
+
+
+def collect_fetch_failures(tickers: list[str], errors: dict[str, Exception]) -> dict[str, FetchFailure]:
+    """
+    Converts the errors of fetch_returns_concurrently() into FetchFailure records in input order (helper function).
+
+    Parameters
+    ----------
+    tickers : list[str]
+        Stock tickers in input order.
+    errors : dict[str, Exception]
+        Exception of the last attempt per ticker that could not be fetched.
+
+    Returns
+    -------
+    dict[str, FetchFailure]
+        Failure per ticker with an error. Empty if all tickers were fetched.
+    """
+
+    failures = {}
+    for ticker in dict.fromkeys(tickers):
+        if ticker not in errors:
+            continue
+        error = errors[ticker]
+        if isinstance(error, NoDataError):
+            message = "No data returned. The ticker may be invalid, delisted or unavailable."
+        else:
+            message = f"Download failed: {error}"
+        failures[ticker] = FetchFailure(error, message)
+
+    return failures
+
+
+def split_fetch_failures(failures: dict[str, FetchFailure]) -> tuple[dict[str, FetchFailure], dict[str, FetchFailure]]:
+    """
+    Splits the failures of fetch_and_validate_returns() or fetch_returns_with_benchmarks() into tickers without data
+    (invalid, delisted or unavailable) and tickers whose download failed (e.g., network errors), which may be valid
+    and can be retried later.
+
+    Parameters
+    ----------
+    failures : dict[str, FetchFailure]
+        Failure per ticker.
+
+    Returns
+    -------
+    invalid : dict[str, FetchFailure]
+        Failures of tickers without data.
+    download_errors : dict[str, FetchFailure]
+        Failures of tickers whose download failed.
+    """
+
+    invalid = {ticker: failure for ticker, failure in failures.items() if failure.no_data}
+    download_errors = {ticker: failure for ticker, failure in failures.items() if not failure.no_data}
+
+    return invalid, download_errors
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter. Tokens are refilled continuously at a fixed rate up to the capacity,
+    and every API request consumes one token. Bursts up to the capacity are allowed; afterwards the requests are
+    spread out to the configured rate.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """
+        Parameters
+        ----------
+        rate : float
+            Number of tokens (requests) added per second. Must be positive.
+        capacity : float, optional
+            Maximum number of tokens in the bucket. Defaults to max(1, rate).
+
+        Raises
+        ------
+        TypeError
+            If rate or capacity are not numeric.
+        ValueError
+            If rate or capacity are not positive.
+        """
+
+        if not isinstance(rate, (int, float)) or isinstance(rate, bool):
+            raise TypeError("Rate must be numeric.")
+        if rate <= 0:
+            raise ValueError("Rate must be positive.")
+        capacity = max(1.0, float(rate)) if capacity is None else capacity
+        if not isinstance(capacity, (int, float)) or isinstance(capacity, bool):
+            raise TypeError("Capacity must be numeric.")
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive.")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = self.capacity # Start with a full bucket
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Blocks until the requested number of tokens is available and consumes them.
+
+        Parameters
+        ----------
+        tokens : float, optional
+            Number of tokens to consume. The default is 1. Must not exceed the capacity.
+
+        Raises
+        ------
+        ValueError
+            If more tokens are requested than the bucket can hold.
+
+        Returns
+        -------
+        float
+            Seconds spent waiting for tokens.
+        """
+
+        if tokens > self.capacity:
+            raise ValueError("Cannot acquire more tokens than the capacity of the bucket.")
+
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                # Refill the bucket based on the time passed since the last update
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                wait = (tokens - self.tokens) / self.rate
+            # Sleep outside of the lock, so other threads can refill and check in the meantime
+            time.sleep(wait)
+            waited += wait
+
+
+def retry_with_backoff(func: Callable[[], object], max_retries: int = fetch_max_retries, backoff_base: float = fetch_backoff_base,
+                       backoff_max: float = fetch_backoff_max, rng: random.Random | None = None,
+                       sleep: Callable[[float], None] | None = None) -> tuple[object, int]:
+    """
+    Calls a function and retries it with exponential backoff and full jitter if it raises an exception.
+    The delay before retry n is drawn uniformly from [0, min(backoff_max, backoff_base * 2**n)], which avoids
+    synchronized retry waves of many workers after a common failure (e.g., rate limiting by the API).
+
+    Parameters
+    ----------
+    func : Callable[[], object]
+        Function without arguments to call.
+    max_retries : int, optional
+        Number of retries after the first attempt. Defaults to fetch_max_retries from config.py.
+    backoff_base : float, optional
+        Maximum delay in seconds before the first retry. Defaults to fetch_backoff_base from config.py.
+    backoff_max : float, optional
+        Upper bound of the delay in seconds. Defaults to fetch_backoff_max from config.py.
+    rng : random.Random, optional
+        Random number generator for the jitter. A new generator is used by default.
+    sleep : Callable[[float], None], optional
+        Function used to wait. The default is time.sleep.
+
+    Raises
+    ------
+    TypeError, ValueError, NoDataError
+        Raised immediately without retry, as invalid inputs and missing data do not resolve by themselves.
+    Exception
+        The exception of the last attempt if all attempts failed.
+
+    Returns
+    -------
+    tuple[object, int]
+        The return value of func and the number of attempts that were needed.
+    """
+
+    if not isinstance(max_retries, int) or max_retries < 0:
+        raise ValueError("max_retries must be a non-negative integer.")
+    rng = random.Random() if rng is None else rng
+    sleep = time.sleep if sleep is None else sleep
+
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            return func(), attempt
+        except (TypeError, ValueError, NoDataError):
+            raise
+        except Exception:
+            if attempt > max_retries:
+                raise
+            delay = min(backoff_max, backoff_base * 2 ** (attempt - 1))
+            sleep(rng.uniform(0, delay))
+
+
+def fetch_returns_concurrently(tickers: list[str], in_start: str, in_end: str, in_interval: str = "1mo", in_auto_adjust: bool = False,
+                               use_cache: bool = False, max_workers: int = fetch_max_workers,
+                               requests_per_second: float | None = fetch_requests_per_second, max_retries: int = fetch_max_retries,
+                               source: PriceSource | None = None) -> tuple[dict[str, pd.Series], dict[str, Exception], dict[str, float]]:
+    """
+    Concurrent fetch engine shared by fetch_all_returns() and fetch_and_validate_returns(). Every ticker is fetched by a bounded
+    pool of worker threads; API requests are throttled by a token bucket and retried with exponential backoff and jitter.
+
+    Parameters
+    ----------
+    tickers : list[str]
+        Tickers to fetch. They are submitted in the given order, so tickers that are needed in any case (e.g., the benchmark)
+        should come first.
+    in_start : str
+        First date of the window, e.g., the output of get_start_date().
+    in_end : str
+        End of the window (exclusive).
+    in_interval, in_auto_adjust, use_cache, max_workers, requests_per_second, max_retries, source
+        See fetch_all_returns().
+
+    Raises
+    ------
+    TypeError
+        If max_workers is not an integer.
+    ValueError
+        If max_workers is not positive.
+
+    Returns
+    -------
+    returns : dict[str, pd.Series]
+        Return series of the successfully fetched tickers, calculated as in fetch_returns().
+    errors : dict[str, Exception]
+        Exception of the last attempt for each ticker that could not be fetched. NoDataError marks tickers without data.
+    latencies : dict[str, float]
+        Seconds spent per ticker, covering rate limiting, retries and downloads.
+    """
+
+    if not isinstance(max_workers, int) or isinstance(max_workers, bool):
+        raise TypeError("max_workers must be an integer.")
+    if max_workers <= 0:
+        raise ValueError("max_workers must be a positive integer.")
+
+    bucket = TokenBucket(requests_per_second) if requests_per_second is not None else None
+    source = get_price_source(threadsafe=True) if source is None else source
+    use_cache = use_cache and source.cacheable
+    source_lock = threading.Lock()
+
+    def download(ticker: str, start: str, end: str) -> pd.Series:
+        # Only actual API requests consume tokens, cache hits are not rate limited
+        if bucket is not None:
+            bucket.acquire()
+        if source.thread_safe:
+            return source.fetch_prices(ticker, start, end, in_interval, in_auto_adjust)
+        with source_lock:
+            return source.fetch_prices(ticker, start, end, in_interval, in_auto_adjust)
+
+    def fetch_one(ticker: str) -> pd.Series:
+        if use_cache:
+            prices = fetch_cached_prices(ticker, in_start, in_end, in_interval, in_auto_adjust, downloader=download)
+        else:
+            prices = download(ticker, in_start, in_end)
+        if prices.empty:
+            raise NoDataError(f"No data returned for ticker '{ticker}'. It may be delisted or unavailable.")
+        # Same return calculation as in fetch_returns
+        return_series = prices.pct_change().dropna()
+        return_series.name = ticker
+        return return_series
+
+    latencies = {}
+
+    def timed_fetch(ticker: str) -> pd.Series:
+        started = time.perf_counter()
+        try:
+            return retry_with_backoff(lambda: fetch_one(ticker), max_retries=max_retries)[0]
+        finally:
+            latencies[ticker] = time.perf_counter() - started
+
+    unique_tickers = list(dict.fromkeys(tickers))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {ticker: executor.submit(timed_fetch, ticker) for ticker in unique_tickers}
+
+    returns, errors = {}, {}
+    for ticker, future in futures.items():
+        try:
+            returns[ticker] = future.result()
+        except Exception as e:
+            errors[ticker] = e
+
+    return returns, errors, latencies
+
+
+def fetch_all_returns(tickers: list[str], mkt_benchmark_ticker: str, in_period: str = "2y", in_interval: str = "1mo", in_auto_adjust: bool = False,
+                      in_end: str = "2025-01-01", use_cache: bool = False, max_workers: int = fetch_max_workers,
+                      requests_per_second: float | None = fetch_requests_per_second, max_retries: int = fetch_max_retries,
+                      source: PriceSource | None = None) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, float]]:
+    """
+    Fetches the return time series of all stock tickers and the market benchmark in parallel. Requests are executed by a
+    bounded pool of worker threads, throttled by a token bucket and retried with exponential backoff and jitter.
+    The returned frames are identical to the outputs of fetch_returns(tickers) and fetch_benchmark_returns(mkt_benchmark_ticker).
+
+    Parameters
+    ----------
+    tickers : list[str]
+        List with stock tickers, e.g., ["AAPL", "TSLA"].
+    mkt_benchmark_ticker : str
+        The market benchmark ticker (e.g., "^GSPC"). Must be contained in valid_mkt_benchmarks in config.py.
+    in_period : str, optional
+        Input period, determines how far back the time series should go. The default is "2y".
+    in_interval : str, optional
+        Input interval, determines the data frequency. The default is "1mo".
+    in_auto_adjust : bool, optional
+        Passed to yfinance. The default is False, which is required to download the Adjusted Closing Price.
+    in_end : str, optional
+        Last included date. Default "2025-01-01".
+    use_cache : bool, optional
+        If True, prices are served from the local price cache and only missing ranges are downloaded. The default is False.
+    max_workers : int, optional
+        Maximum number of concurrent downloads. Defaults to fetch_max_workers from config.py.
+    requests_per_second : float | None, optional
+        Maximum rate of API requests. None disables the rate limit. Defaults to fetch_requests_per_second from config.py.
+    max_retries : int, optional
+        Number of retries per ticker after the first attempt. Defaults to fetch_max_retries from config.py.
+    source : PriceSource, optional
+        Backend that provides the prices. Defaults to a thread-safe instance of price_source from config.py.
+        Sources that are not thread-safe are called by one worker at a time.
+
+    Raises
+    ------
+    TypeError
+        If the tickers or the benchmark ticker have invalid types, or max_workers is not an integer.
+    ValueError
+        If the tickers or the benchmark ticker are invalid, or max_workers is not positive.
+    HTTPError
+        If the data for a stock ticker could not be fetched after all retries.
+    RuntimeError
+        If the data for the market benchmark could not be fetched after all retries.
+
+    Returns
+    -------
+    returns_df : pd.DataFrame
+        DataFrame of % returns with tickers as columns and datetime index, as returned by fetch_returns().
+    mkt_returns_df : pd.DataFrame
+        DataFrame with the single column "MKT", as returned by fetch_benchmark_returns().
+    latencies : dict[str, float]
+        Seconds spent per ticker (including the benchmark), covering rate limiting, retries and downloads.
+    """
+
+    validate_ticker_list(tickers)
+    mkt_benchmark_ticker = validate_benchmark_ticker(mkt_benchmark_ticker)
+    if not isinstance(max_workers, int) or isinstance(max_workers, bool):
+        raise TypeError("max_workers must be an integer.")
+    if max_workers <= 0:
+        raise ValueError("max_workers must be a positive integer.")
+
+    in_start = get_start_date(in_end = in_end, in_period = in_period)
+    # The benchmark is submitted first, so it is not queued behind a long list of stocks
+    returns, errors, latencies = fetch_returns_concurrently(
+        [mkt_benchmark_ticker] + tickers, in_start, in_end, in_interval, in_auto_adjust, use_cache=use_cache,
+        max_workers=max_workers, requests_per_second=requests_per_second, max_retries=max_retries, source=source
+    )
+
+    # Raise the errors in input order, as fetch_returns() would
+    for ticker in tickers:
+        if ticker in errors:
+            raise HTTPError(f"Failed to fetch data for '{ticker}': {errors[ticker]}")
+    if mkt_benchmark_ticker in errors:
+        raise RuntimeError(f"Failed to fetch benchmark returns for '{mkt_benchmark_ticker}': {errors[mkt_benchmark_ticker]}") from errors[mkt_benchmark_ticker]
+
+    # Collect the results in input order, so the frames match the serial functions
+    returns_df = pd.concat([returns[ticker] for ticker in dict.fromkeys(tickers)], axis=1)
+    mkt_returns_df = returns[mkt_benchmark_ticker].to_frame(name="MKT")
+
+    return returns_df, mkt_returns_df, latencies
+
+
+def fetch_and_validate_returns(tickers: list[str], mkt_benchmark_ticker: str, in_period: str = "2y", in_interval: str = "1mo", in_auto_adjust: bool = False,
+                               in_end: str = "2025-01-01", use_cache: bool = False, max_workers: int = fetch_max_workers,
+                               requests_per_second: float | None = fetch_requests_per_second, max_retries: int = fetch_max_retries,
+                               source: PriceSource | None = None) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, FetchFailure], dict[str, float]]:
+    """
+    Single-pass pipeline that validates the stock tickers by downloading their data. A separate pre-flight call to the
+    Yahoo Finance API per ticker (check_valid_ticker_with_API) is not needed: a ticker that returns data is valid, and a
+    ticker without data becomes a validation failure with a reason. This roughly halves the number of API calls per run.
+    Only the format of the tickers needs to be checked beforehand (check_validity_tickers with check_api=False).
+
+    Parameters
+    ----------
+    tickers : list[str]
+        List with stock tickers, e.g., ["AAPL", "TSLA"].
+    mkt_benchmark_ticker : str
+        The market benchmark ticker (e.g., "^GSPC"). Must be contained in valid_mkt_benchmarks in config.py.
+    in_period, in_interval, in_auto_adjust, in_end, use_cache, max_workers, requests_per_second, max_retries, source
+        See fetch_all_returns().
+
+    Raises
+    ------
+    TypeError
+        If the tickers or the benchmark ticker have invalid types.
+    ValueError
+        If the tickers or the benchmark ticker are invalid.
+    RuntimeError
+        If the data for the market benchmark could not be fetched.
+
+    Returns
+    -------
+    returns_df : pd.DataFrame
+        DataFrame of % returns of the valid tickers (in input order). Empty if no ticker is valid.
+    mkt_returns_df : pd.DataFrame
+        DataFrame with the single column "MKT", as returned by fetch_benchmark_returns().
+    failures : dict[str, FetchFailure]
+        Failure for each ticker that did not return data, with the exception and a message. Empty if all tickers are valid.
+        Tickers without data (failure.no_data) are invalid; other failures are download errors that may be retried.
+    latencies : dict[str, float]
+        Seconds spent per ticker (including the benchmark).
+    """
+
+    validate_ticker_list(tickers)
+    mkt_benchmark_ticker = validate_benchmark_ticker(mkt_benchmark_ticker)
+
+    in_start = get_start_date(in_end = in_end, in_period = in_period)
+    returns, errors, latencies = fetch_returns_concurrently(
+        [mkt_benchmark_ticker] + tickers, in_start, in_end, in_interval, in_auto_adjust, use_cache=use_cache,
+        max_workers=max_workers, requests_per_second=requests_per_second, max_retries=max_retries, source=source
+    )
+
+    if mkt_benchmark_ticker in errors:
+        raise RuntimeError(f"Failed to fetch benchmark returns for '{mkt_benchmark_ticker}': {errors[mkt_benchmark_ticker]}") from errors[mkt_benchmark_ticker]
+
+    failures = collect_fetch_failures(tickers, errors)
+
+    valid_returns = [returns[ticker] for ticker in dict.fromkeys(tickers) if ticker in returns]
+    returns_df = pd.concat(valid_returns, axis=1) if valid_returns else pd.DataFrame()
+    mkt_returns_df = returns[mkt_benchmark_ticker].to_frame(name="MKT")
+
+    return returns_df, mkt_returns_df, failures, latencies
+
+
+def fetch_returns_with_benchmarks(tickers: list[str], benchmark_tickers: list[str] | None = None, in_period: str = "2y", in_interval: str = "1mo",
+                                  in_auto_adjust: bool = False, in_end: str = "2025-01-01", use_cache: bool = False, max_workers: int = fetch_max_workers,
+                                  requests_per_second: float | None = fetch_requests_per_second, max_retries: int = fetch_max_retries,
+                                  source: PriceSource | None = None) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, FetchFailure], dict[str, float]]:
+    """
+    Fetches the stock returns and the returns of several market benchmarks (by default all of valid_mkt_benchmarks in
+    config.py) in one concurrent pass, so all benchmarks can be analyzed without downloading the stocks again.
+    Stock tickers are validated by their download, as in fetch_and_validate_returns().
+
+    Parameters
+    ----------
+    tickers : list[str]
+        List with stock tickers, e.g., ["AAPL", "TSLA"].
+    benchmark_tickers : list[str], optional
+        Market benchmark tickers, each contained in valid_mkt_benchmarks in config.py. Defaults to valid_mkt_benchmarks.
+    in_period, in_interval, in_auto_adjust, in_end, use_cache, max_workers, requests_per_second, max_retries, source
+        See fetch_all_returns().
+
+    Raises
+    ------
+    TypeError
+        If the tickers or the benchmark tickers have invalid types.
+    ValueError
+        If the tickers or the benchmark tickers are invalid, or no benchmark ticker is given.
+    RuntimeError
+        If the data for a market benchmark could not be fetched.
+
+    Returns
+    -------
+    returns_df : pd.DataFrame
+        DataFrame of % returns of the valid tickers (in input order). Empty if no ticker is valid.
+    benchmark_returns_df : pd.DataFrame
+        DataFrame of % returns with one column per benchmark ticker (in input order).
+    failures : dict[str, FetchFailure]
+        Failure for each stock ticker that did not return data, see fetch_and_validate_returns(). Empty if all tickers are valid.
+    latencies : dict[str, float]
+        Seconds spent per ticker (including the benchmarks).
+    """
+
+    validate_ticker_list(tickers)
+    benchmark_tickers = list(valid_mkt_benchmarks) if benchmark_tickers is None else benchmark_tickers
+    if not isinstance(benchmark_tickers, list):
+        raise TypeError("Benchmark tickers must be provided as a list.")
+    if len(benchmark_tickers) == 0:
+        raise ValueError("At least one benchmark ticker is required.")
+    benchmark_tickers = list(dict.fromkeys(validate_benchmark_ticker(ticker) for ticker in benchmark_tickers))
+
+    in_start = get_start_date(in_end = in_end, in_period = in_period)
+    # The benchmarks are submitted first, so they are not queued behind a long list of stocks
+    returns, errors, latencies = fetch_returns_concurrently(
+        benchmark_tickers + tickers, in_start, in_end, in_interval, in_auto_adjust, use_cache=use_cache,
+        max_workers=max_workers, requests_per_second=requests_per_second, max_retries=max_retries, source=source
+    )
+
+    for ticker in benchmark_tickers:
+        if ticker in errors:
+            raise RuntimeError(f"Failed to fetch benchmark returns for '{ticker}': {errors[ticker]}") from errors[ticker]
+
+    failures = collect_fetch_failures(tickers, errors)
+
+    valid_returns = [returns[ticker] for ticker in dict.fromkeys(tickers) if ticker in returns]
+    returns_df = pd.concat(valid_returns, axis=1) if valid_returns else pd.DataFrame()
+    benchmark_returns_df = pd.concat([returns[ticker] for ticker in benchmark_tickers], axis=1)
+
+    return returns_df, benchmark_returns_df, failures, latencies
@@ -1,7 +1,46 @@
 import yfinance as yf
+import yfinance.shared as yf_shared
+from yfinance.exceptions import YFTickerMissingError
 import pandas as pd
 from requests.exceptions import HTTPError
-from config import valid_mkt_benchmarks
+from config import valid_mkt_benchmarks, bulk_chunk_size, price_source, local_price_dir
+from data.price_cache import fetch_cached_prices, get_cached_missing_ranges, update_cached_prices
+from data.price_sources import PriceSource, LocalDirectoryPriceSource
+
+
+class NoDataError(HTTPError):
+    """
+    Raised when a price source returns no data for a ticker, e.g., because the ticker does not exist or is delisted.
+    Unlike network errors, this answer is definitive and is not retried.
+    """
+
+# Names of the yfinance errors that mean the ticker has no data (invalid or delisted), as opposed to a failed request
+missing_data_errors = ("YFTickerMissingError", "YFPricesMissingError", "YFTzMissingError")
+
+
+def get_download_error(ticker: str) -> str | None:
+    """
+    Returns the transport error (e.g., timeout, HTTP 429, DNS failure) that the last yf.download call recorded for a ticker
+    (helper function). yf.download does not raise such errors but returns an empty frame, so they would otherwise be
+    indistinguishable from a ticker without data. Errors that mean the ticker has no data are not returned.
+
+    Parameters
+    ----------
+    ticker : str
+        Stock or index ticker.
+
+    Returns
+    -------
+    str | None
+        The recorded error, or None if the download succeeded or the ticker has no data.
+    """
+
+    error = yf_shared._ERRORS.get(ticker.upper())
+    if error is None or any(name in str(error) for name in missing_data_errors):
+        return None
+
+    return str(error)
+
 
 def get_start_date(in_end: str, in_period: str) -> str:
     """
@@ -62,12 +101,415 @@ def get_start_date(in_end: str, in_period: str) -> str:
         raise ValueError(f"Unsupported period unit: '{unit}'. Only 'y', 'mo', and 'd' are supported.")
 
     return start.strftime("%Y-%m-%d")
- 
 
-def fetch_returns(tickers: list[str], in_period: str = "2y", in_interval: str = "1mo", in_auto_adjust: bool = False, in_end: str = "2025-01-01") -> pd.DataFrame:
+
+def extract_adjusted_close(df: pd.DataFrame, ticker: str) -> pd.Series:
+    """
+    Extracts the Adjusted Closing Price of a single ticker from a DataFrame returned by yf.download (helper function).
+    Depending on the yfinance version, single-ticker downloads either have flat columns or (Price, Ticker) MultiIndex columns.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame returned by yf.download for a single ticker.
+    ticker : str
+        The downloaded ticker, used to name the resulting Series.
+
+    Raises
+    ------
+    KeyError
+        If the DataFrame does not contain an "Adj Close" column.
+
+    Returns
+    -------
+    prices : pd.Series
+        Adjusted Closing Prices with datetime index, named after the ticker. Missing values are dropped.
+    """
+
+    prices = df["Adj Close"]
+    # MultiIndex columns result in a DataFrame with one column per ticker
+    if isinstance(prices, pd.DataFrame):
+        prices = prices.iloc[:, 0]
+
+    prices = prices.dropna()
+    prices.name = ticker
+
+    return prices
+
+
+def download_adjusted_close(ticker: str, in_start: str, in_end: str, in_interval: str = "1mo", in_auto_adjust: bool = False) -> pd.Series:
+    """
+    Downloads the Adjusted Closing Prices of a single ticker from the Yahoo Finance API (helper function).
+
+    Parameters
+    ----------
+    ticker : str
+        Stock or index ticker, e.g., "AAPL".
+    in_start : str
+        First date of the download window, e.g., "2023-01-01".
+    in_end : str
+        End of the download window (exclusive).
+    in_interval : str, optional
+        Data frequency. The default is "1mo".
+    in_auto_adjust : bool, optional
+        Passed to yfinance. The default is False, which is required to receive the Adjusted Closing Price.
+
+    Raises
+    ------
+    ConnectionError
+        If the request failed (e.g., timeout or rate limit), so the caller can retry it.
+
+    Returns
+    -------
+    pd.Series
+        Adjusted Closing Prices named after the ticker. Empty if the API returned no data.
+    """
+
+    # Call the Yahoo Finance API via the yfinance package
+    # For documentation of arguments: see fetch_returns, or alternatively, the YFinance documentation
+    # The period argument is not passed, since yfinance ignores it whenever a start date is provided
+    df = yf.download(ticker, interval=in_interval, auto_adjust=in_auto_adjust, start=in_start, end=in_end)
+
+    if df.empty:
+        # yf.download returns an empty frame for failed requests as well, only a real empty answer means no data
+        error = get_download_error(ticker)
+        if error is not None:
+            raise ConnectionError(f"Download of '{ticker}' failed: {error}")
+        return pd.Series(dtype=float, index=pd.DatetimeIndex([]), name=ticker)
+
+    return extract_adjusted_close(df, ticker)
+
+
+def download_adjusted_close_history(ticker: str, in_start: str, in_end: str, in_interval: str = "1mo", in_auto_adjust: bool = False) -> pd.Series:
+    """
+    Thread-safe variant of download_adjusted_close() based on yf.Ticker.history (helper function).
+    yf.download keeps its results in module-level state that is shared between calls, so it must not be called
+    from several threads at once. The history endpoint of a Ticker object has no shared state.
+
+    Parameters
+    ----------
+    ticker : str
+        Stock or index ticker, e.g., "AAPL".
+    in_start : str
+        First date of the download window, e.g., "2023-01-01".
+    in_end : str
+        End of the download window (exclusive).
+    in_interval : str, optional
+        Data frequency. The default is "1mo".
+    in_auto_adjust : bool, optional
+        Passed to yfinance. The default is False, which is required to receive the Adjusted Closing Price.
+
+    Raises
+    ------
+    Exception
+        Errors of the request (e.g., timeout or rate limit) are propagated, so the caller can retry it.
+
+    Returns
+    -------
+    pd.Series
+        Adjusted Closing Prices named after the ticker. Empty if the API returned no data.
+    """
+
+    # With raise_errors=True, failed requests raise instead of returning an empty frame
+    try:
+        df = yf.Ticker(ticker).history(start=in_start, end=in_end, interval=in_interval, auto_adjust=in_auto_adjust, raise_errors=True)
+    except YFTickerMissingError:
+        df = None # No data for the ticker (invalid or delisted)
+
+    if df is None or df.empty:
+        return pd.Series(dtype=float, index=pd.DatetimeIndex([]), name=ticker)
+
+    prices = extract_adjusted_close(df, ticker)
+    # The history endpoint returns exchange-local timestamps, yf.download returns timezone-naive dates
+    if isinstance(prices.index, pd.DatetimeIndex) and prices.index.tz is not None:
+        prices.index = prices.index.tz_localize(None)
+
+    return prices
+
+
+def download_adjusted_close_bulk(tickers: list[str], in_start: str, in_end: str, in_interval: str = "1mo", in_auto_adjust: bool = False) -> dict[str, pd.Series]:
+    """
+    Downloads the Adjusted Closing Prices of several tickers with a single multi-symbol call to the Yahoo Finance API (helper function).
+    The (Price, Ticker) MultiIndex result of yf.download is split into one price Series per ticker.
+
+    Parameters
+    ----------
+    tickers : list[str]
+        Stock or index tickers downloaded together.
+    in_start : str
+        First date of the download window, e.g., "2023-01-01".
+    in_end : str
+        End of the download window (exclusive).
+    in_interval : str, optional
+        Data frequency. The default is "1mo".
+    in_auto_adjust : bool, optional
+        Passed to yfinance. The default is False, which is required to receive the Adjusted Closing Price.
+
+    Raises
+    ------
+    KeyError
+        If the downloaded data does not contain an "Adj Close" column.
+    Exception
+        Errors of the API call itself are propagated, since they affect all tickers of the call.
+
+    Returns
+    -------
+    prices : dict[str, pd.Series]
+        Adjusted Closing Prices per ticker. Tickers without any data are not contained in the dictionary.
+    """
+
+    df = yf.download(tickers, interval=in_interval, auto_adjust=in_auto_adjust, start=in_start, end=in_end, group_by="column", progress=False)
+
+    if df is None or df.empty:
+        return {}
+
+    # Flat columns are only returned for a single ticker by some yfinance versions
+    if not isinstance(df.columns, pd.MultiIndex):
+        series = extract_adjusted_close(df, tickers[0])
+        return {tickers[0]: series} if not series.empty else {}
+
+    adj_close = df["Adj Close"]
+    prices = {}
+    for ticker in tickers:
+        # yfinance reports the tickers in upper case
+        column = ticker if ticker in adj_close.columns else ticker.upper()
+        if column not in adj_close.columns:
+            continue
+        # The MultiIndex result is aligned on the union of all dates, so each ticker's own history is recovered by dropping NaNs
+        series = adj_close[column].dropna()
+        if not series.empty:
+            series.name = ticker
+            prices[ticker] = series
+
+    return prices
+
+
+class YahooPriceSource(PriceSource):
+    """
+    Price source backed by the Yahoo Finance API via yfinance. Prices of this source are stored in the local price cache.
+    """
+
+    cacheable = True
+
+    def __init__(self, threadsafe: bool = False):
+        """
+        Parameters
+        ----------
+        threadsafe : bool, optional
+            If True, single tickers are downloaded via yf.Ticker.history, which may be called from several threads at once.
+            Otherwise yf.download is used. The default is False.
+        """
+
+        self.thread_safe = threadsafe
+
+    def fetch_prices(self, ticker: str, in_start: str, in_end: str, in_interval: str = "1mo", in_auto_adjust: bool = False) -> pd.Series:
+        """
+        Downloads the Adjusted Closing Prices of a single ticker. See PriceSource.fetch_prices().
+        """
+
+        if self.thread_safe:
+            return download_adjusted_close_history(ticker, in_start, in_end, in_interval, in_auto_adjust)
+        return download_adjusted_close(ticker, in_start, in_end, in_interval, in_auto_adjust)
+
+    def fetch_prices_bulk(self, tickers: list[str], in_start: str, in_end: str, in_interval: str = "1mo", in_auto_adjust: bool = False) -> dict[str, pd.Series]:
+        """
+        Downloads the Adjusted Closing Prices of several tickers with a single multi-symbol call. See PriceSource.fetch_prices_bulk().
+        """
+
+        return download_adjusted_close_bulk(tickers, in_start, in_end, in_interval, in_auto_adjust)
+
+
+def get_price_source(name: str | None = None, threadsafe: bool = False) -> PriceSource:
+    """
+    Creates the price source with the given name (helper function).
+
+    Parameters
+    ----------
+    name : str, optional
+        "yahoo" for the Yahoo Finance API, or "local" for the Parquet/CSV files in local_price_dir from config.py.
+        Defaults to price_source from config.py.
+    threadsafe : bool, optional
+        Request a source that may be used from several threads at once. The default is False.
+
+    Raises
+    ------
+    TypeError
+        If name is not a string.
+    ValueError
+        If the name is not a known price source.
+
+    Returns
+    -------
+    PriceSource
+        The price source.
+    """
+
+    name = price_source if name is None else name
+    if not isinstance(name, str):
+        raise TypeError("Price source name must be a string.")
+
+    name = name.strip().lower()
+    if name == "yahoo":
+        return YahooPriceSource(threadsafe=threadsafe)
+    if name == "local":
+        return LocalDirectoryPriceSource(local_price_dir)
+
+    raise ValueError(f"Unknown price source '{name}'. Valid options: 'yahoo', 'local'.")
+
+
+def validate_ticker_list(tickers: list[str]) -> None:
+    """
+    Validates the ticker list passed to fetch_returns() and fetch_returns_bulk() (helper function).
+
+    Parameters
+    ----------
+    tickers : list[str]
+        List of stock tickers.
+
+    Raises
+    ------
+    TypeError
+        If variable tickers is not of type list, or stock tickers in list tickers are not strings.
+    ValueError
+        If list tickers is empty, or the list contains individual stock tickers with length 0.
+
+    Returns
+    -------
+    None
+    """
+
+    # Type checks
+    if not isinstance(tickers, list):
+        raise TypeError("Tickers must be a list.")
+    if not all(isinstance(ticker, str) for ticker in tickers):
+        raise TypeError("All tickers must be strings.")
+    # Value checks
+    if not tickers:
+        raise ValueError("Ticker list cannot be empty.")
+    if not all(len(ticker.strip()) > 0 for ticker in tickers):
+        raise ValueError("Each ticker must be a non-empty string.")
+
+
+def fetch_returns_bulk(tickers: list[str], in_period: str = "2y", in_interval: str = "1mo", in_auto_adjust: bool = False, in_end: str = "2025-01-01",
+                       chunk_size: int = bulk_chunk_size, use_cache: bool = False, source: PriceSource | None = None) -> tuple[pd.DataFrame, dict[str, str]]:
+    """
+    Fetches return time series for many tickers with chunked multi-symbol calls to the Yahoo Finance API instead of one call per ticker.
+    Unlike fetch_returns(), a ticker without data does not abort the whole batch; it is reported in the failures instead.
+
+    Parameters
+    ----------
+    tickers : list[str]
+        List with stock tickers, e.g., ["AAPL", "TSLA"].
+    in_period : str, optional
+        Input period, determines how far back the time series should go. The default is "2y".
+    in_interval : str, optional
+        Input interval, determines the data frequency. The default is "1mo".
+    in_auto_adjust : bool, optional
+        Passed to yfinance. The default is False, which is required to download the Adjusted Closing Price.
+    in_end : str, optional
+        Last included date. Default "2025-01-01".
+    chunk_size : int, optional
+        Maximum number of tickers per API call. Defaults to bulk_chunk_size from config.py.
+    use_cache : bool, optional
+        If True, only the date ranges missing in the local price cache are downloaded. The default is False.
+    source : PriceSource, optional
+        Backend that provides the prices. Defaults to price_source from config.py.
+
+    Raises
+    ------
+    TypeError
+        If tickers is not a list of strings, or chunk_size is not an integer.
+    ValueError
+        If the ticker list is empty, contains empty tickers, or chunk_size is not positive.
+
+    Returns
+    -------
+    returns_df : pd.DataFrame
+        DataFrame of % returns with the successfully fetched tickers as columns (in input order) and datetime index.
+    failures : dict[str, str]
+        Reason of the failure for each ticker that could not be fetched.
+    """
+
+    validate_ticker_list(tickers)
+    if not isinstance(chunk_size, int) or isinstance(chunk_size, bool):
+        raise TypeError("Chunk size must be an integer.")
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be a positive integer.")
+
+    in_start = get_start_date(in_end = in_end, in_period = in_period)
+    unique_tickers = list(dict.fromkeys(tickers)) # Remove duplicates, keep the input order
+    source = get_price_source() if source is None else source
+    use_cache = use_cache and source.cacheable # Local files are not copied into the cache
+
+    # Date ranges to download per ticker: the whole window, or only the ranges missing in the cache
+    if use_cache:
+        plans = {ticker: tuple(get_cached_missing_ranges(ticker, in_start, in_end, in_interval, in_auto_adjust)) for ticker in unique_tickers}
+    else:
+        plans = {ticker: ((in_start, in_end),) for ticker in unique_tickers}
+
+    # Tickers with identical ranges are downloaded together in the same multi-symbol calls
+    groups = {}
+    for ticker, ranges in plans.items():
+        groups.setdefault(ranges, []).append(ticker)
+
+    downloaded = {ticker: [] for ticker in unique_tickers}
+    failures = {}
+    for ranges, group in groups.items():
+        for range_start, range_end in ranges:
+            pending = [ticker for ticker in group if ticker not in failures]
+            for i in range(0, len(pending), chunk_size):
+                chunk = pending[i:i + chunk_size]
+                try:
+                    chunk_prices = source.fetch_prices_bulk(chunk, range_start, range_end, in_interval, in_auto_adjust)
+                except Exception as e:
+                    # A failed call only affects the tickers of this chunk
+                    failures.update({ticker: f"Download failed: {e}" for ticker in chunk})
+                    continue
+                for ticker, series in chunk_prices.items():
+                    downloaded[ticker].append(series)
+
+    returns = {}
+    for ticker in unique_tickers:
+        if ticker in failures:
+            continue
+        new_prices = pd.concat(downloaded[ticker]) if downloaded[ticker] else None
+        if use_cache:
+            prices = update_cached_prices(ticker, in_start, in_end, in_interval, in_auto_adjust, new_prices)
+            if prices is None:
+                # A dividend or split rescaled the cached history, so the whole window is downloaded again
+                try:
+                    new_prices = source.fetch_prices(ticker, in_start, in_end, in_interval, in_auto_adjust)
+                except Exception as e:
+                    failures[ticker] = f"Download failed: {e}"
+                    continue
+                prices = update_cached_prices(ticker, in_start, in_end, in_interval, in_auto_adjust, new_prices)
+                prices = new_prices if prices is None else prices
+        else:
+            prices = new_prices if new_prices is not None else pd.Series(dtype=float, index=pd.DatetimeIndex([]), name=ticker)
+
+        if prices.empty:
+            failures[ticker] = "No data returned. The ticker may be delisted or unavailable."
+            continue
+
+        # Same return calculation as in fetch_returns
+        return_series = prices.pct_change().dropna()
+        return_series.name = ticker
+        returns[ticker] = return_series
+
+    if returns:
+        returns_df = pd.concat(returns.values(), axis=1)
+    else:
+        returns_df = pd.DataFrame()
+
+    return returns_df, failures
+
+
+def fetch_returns(tickers: list[str], in_period: str = "2y", in_interval: str = "1mo", in_auto_adjust: bool = False, in_end: str = "2025-01-01", use_cache: bool = False,
+                  bulk: bool = False, chunk_size: int = bulk_chunk_size, source: PriceSource | None = None) -> pd.DataFrame:
     """
     Fetches return time series for one or more tickers using the Yahoo Finance API (via yfinance). Financial data is retrieved from Yahoo Finance and the Adjusted Closing 
-    Price is used to calculate the time series of returns for individual stocks and market indices.
+    Price is used to calculate the time series of returns for individual stocks and market indices. Alternatively, the prices can be read from
+    local Parquet/CSV files (see data/price_sources.py).
 
     Parameters
     ----------
@@ -84,6 +526,16 @@ def fetch_returns(tickers: list[str], in_period: str = "2y", in_interval: str =
         stock splits and dividends.
     end : str
         Last included date. Default "2025-01-01".
+    use_cache : bool, optional
+        If True, prices are served from the local price cache (see data/price_cache.py) and only the missing
+        months are downloaded. The default is False.
+    bulk : bool, optional
+        If True, the tickers are downloaded with chunked multi-symbol calls (see fetch_returns_bulk) instead of one call per ticker.
+        The default is False.
+    chunk_size : int, optional
+        Maximum number of tickers per API call in bulk mode. Defaults to bulk_chunk_size from config.py.
+    source : PriceSource, optional
+        Backend that provides the prices. Defaults to price_source from config.py (the Yahoo Finance API).
 
     Raises
     ------
@@ -92,7 +544,7 @@ def fetch_returns(tickers: list[str], in_period: str = "2y", in_interval: str =
     ValueError
         If list tickers is empty, or the list contains individual stock tickers with length 0.
     HTTPError
-        If call to the Yahoo Finance API returns an empty DataFrame, meaning no data was found.
+        If call to the Yahoo Finance API returns an empty DataFrame, meaning no data was found. In bulk mode, if any ticker failed.
 
     Returns
     -------
@@ -101,35 +553,41 @@ def fetch_returns(tickers: list[str], in_period: str = "2y", in_interval: str =
         
     """
     
-    # Type checks
-    if not isinstance(tickers, list):
-        raise TypeError("Tickers must be a list.")
-    if not all(isinstance(ticker, str) for ticker in tickers):
-        raise TypeError("All tickers must be strings.")
-    # Value checks
-    if not tickers:
-        raise ValueError("Ticker list cannot be empty.")
-    if not all(len(ticker.strip()) > 0 for ticker in tickers):
-        raise ValueError("Each ticker must be a non-empty string.")
+    validate_ticker_list(tickers)
+
+    if bulk:
+        returns_df, failures = fetch_returns_bulk(tickers, in_period, in_interval, in_auto_adjust, in_end, chunk_size=chunk_size, use_cache=use_cache, source=source)
+        # Keep the all-or-nothing behaviour of the per-ticker path
+        if failures:
+            details = "; ".join(f"'{ticker}': {reason}" for ticker, reason in failures.items())
+            raise HTTPError(f"Failed to fetch data for {len(failures)} ticker(s): {details}")
+        return returns_df
 
     # Get end and start date for download
     in_start = get_start_date(in_end = in_end, in_period = in_period)
+    source = get_price_source() if source is None else source
+    use_cache = use_cache and source.cacheable # Local files are not copied into the cache
     # Download the return series for the stock ticker(s) and first store them in a dictionary
     returns = {}
     
     for ticker in tickers:
         try:
-            # Call the Yahoo Finance API via the yfinance package
-            # For documentation of arguments: see above, or alternatively, the YFinance documentation
-            df = yf.download(ticker, period=in_period, interval=in_interval, auto_adjust=in_auto_adjust, start=in_start, end=in_end)
+            if use_cache:
+                # Serve the prices from the local cache and only download the missing date ranges
+                prices = fetch_cached_prices(
+                    ticker, in_start, in_end, in_interval, in_auto_adjust,
+                    downloader=lambda t, start, end: source.fetch_prices(t, start, end, in_interval, in_auto_adjust)
+                )
+            else:
+                prices = source.fetch_prices(ticker, in_start, in_end, in_interval, in_auto_adjust)
             
             # Abort the program if the API returns an empty DataFrame (implying no data was found)
-            if df.empty:
-                raise HTTPError(f"No data returned for ticker '{ticker}'. It may be delisted or unavailable.")
+            if prices.empty:
+                raise NoDataError(f"No data returned for ticker '{ticker}'. It may be delisted or unavailable.")
             
             # Calculate returns based on the Adjusted Closing Price (Adjusted for Stock Splits and Dividends)
             # Drop the first row with NaN values, because no % change can be calculated as the month before the first month is not downloaded
-            return_series = df["Adj Close"].pct_change().dropna()
+            return_series = prices.pct_change().dropna()
             return_series.name = ticker
             
             returns[ticker] = return_series # Add to the dictionary
@@ -146,7 +604,47 @@ def fetch_returns(tickers: list[str], in_period: str = "2y", in_interval: str =
     return returns_df
 
 
-def fetch_benchmark_returns(mkt_benchmark_ticker: str, in_period: str = "2y", in_interval: str = "1mo", in_auto_adjust: bool = False, in_end: str = "2025-01-01") -> pd.DataFrame:
+def validate_benchmark_ticker(mkt_benchmark_ticker: str) -> str:
+    """
+    Validates a market benchmark ticker against the valid market benchmarks in config.py (helper function).
+
+    Parameters
+    ----------
+    mkt_benchmark_ticker : str
+        The market benchmark ticker (e.g., "^RUT", "^GSPC").
+
+    Raises
+    ------
+    TypeError
+        Market benchmark ticker is not of type string.
+    ValueError
+        If the ticker is empty or not in the predefined list of valid market benchmarks.
+
+    Returns
+    -------
+    str
+        The ticker without surrounding whitespace.
+    """
+
+    # Type checks
+    if not isinstance(mkt_benchmark_ticker, str):
+        raise TypeError("Ticker of the market benchmark must be a string.")
+
+    mkt_benchmark_ticker = mkt_benchmark_ticker.strip()
+
+    # Value checks
+    if len(mkt_benchmark_ticker) == 0:
+        raise ValueError("Market benchmark ticker must contain at least one character.")
+    if not hasattr(valid_mkt_benchmarks, "__contains__"):
+        raise TypeError("'valid_mkt_benchmarks' must be an iterable like a list or set.")
+    if mkt_benchmark_ticker not in valid_mkt_benchmarks:
+        raise ValueError(f"Invalid benchmark ticker '{mkt_benchmark_ticker}'. Valid options: {valid_mkt_benchmarks}")
+
+    return mkt_benchmark_ticker
+
+
+def fetch_benchmark_returns(mkt_benchmark_ticker: str, in_period: str = "2y", in_interval: str = "1mo", in_auto_adjust: bool = False, in_end: str = "2025-01-01", use_cache: bool = False,
+                            bulk: bool = False, source: PriceSource | None = None) -> pd.DataFrame:
     """
     Fetches the return time series for a specified market benchmark ticker using the same structure as fetch_returns().
     Default arguments are set identically as in fetch_returns.
@@ -163,6 +661,12 @@ def fetch_benchmark_returns(mkt_benchmark_ticker: str, in_period: str = "2y", in
         Boolean value required to download the Adjusted Closing Price (default = False).
     end : str
         Last included date. Default "2025-01-01".
+    use_cache : bool, optional
+        If True, prices are served from the local price cache (default = False).
+    bulk : bool, optional
+        If True, the benchmark is downloaded through the bulk path of fetch_returns (default = False).
+    source : PriceSource, optional
+        Backend that provides the prices (default = price_source from config.py).
 
     Raises
     ------
@@ -179,19 +683,7 @@ def fetch_benchmark_returns(mkt_benchmark_ticker: str, in_period: str = "2y", in
         DataFrame containing monthly returns for the specified market benchmark.
     """
     
-    # Type checks
-    if not isinstance(mkt_benchmark_ticker, str):
-        raise TypeError("Ticker of the market benchmark must be a string.")
-
-    mkt_benchmark_ticker = mkt_benchmark_ticker.strip()
-
-    # Value checks
-    if len(mkt_benchmark_ticker) == 0:
-        raise ValueError("Market benchmark ticker must contain at least one character.")
-    if not hasattr(valid_mkt_benchmarks, "__contains__"):
-        raise TypeError("'valid_mkt_benchmarks' must be an iterable like a list or set.")
-    if mkt_benchmark_ticker not in valid_mkt_benchmarks:
-        raise ValueError(f"Invalid benchmark ticker '{mkt_benchmark_ticker}'. Valid options: {valid_mkt_benchmarks}")
+    mkt_benchmark_ticker = validate_benchmark_ticker(mkt_benchmark_ticker)
 
     # Call the fetch_returns function with the default parameters and return a DataFrame with the return time series for the market benchmark
     try:
@@ -200,7 +692,10 @@ def fetch_benchmark_returns(mkt_benchmark_ticker: str, in_period: str = "2y", in
             in_period=in_period,
             in_interval=in_interval,
             in_auto_adjust=in_auto_adjust,
-            in_end=in_end
+            in_end=in_end,
+            use_cache=use_cache,
+            bulk=bulk,
+            source=source
         )
     # Catch potential Exceptions
     except Exception as e:
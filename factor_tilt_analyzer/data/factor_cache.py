@@ -0,0 +1,153 @@
+import os
+import json
+import hashlib
+import numpy as np
+from config import factor_cache_dir
+
+# Files of a cache entry: data values, datetime index and the signature of the source CSV file
+VALUES_SUFFIX = ".values.npy"
+INDEX_SUFFIX = ".index.npy"
+META_SUFFIX = ".meta.json"
+
+
+def get_factor_cache_prefix(path_name: str, cache_dir: str | None = None) -> str:
+    """
+    Builds the common path prefix of the cache files of a factor CSV file (helper function).
+    The prefix contains a hash of the absolute path, so files with the same name in different directories do not collide.
+
+    Parameters
+    ----------
+    path_name : str
+        Path of the source CSV file.
+    cache_dir : str, optional
+        Directory of the factor cache. Defaults to factor_cache_dir from config.py.
+
+    Returns
+    -------
+    str
+        Path prefix of the cache files.
+    """
+
+    cache_dir = factor_cache_dir if cache_dir is None else cache_dir
+    base_name = os.path.splitext(os.path.basename(path_name))[0]
+    path_hash = hashlib.sha1(os.path.abspath(path_name).encode("utf-8")).hexdigest()[:8]
+
+    return os.path.join(cache_dir, f"{base_name}-{path_hash}")
+
+
+def get_file_sha256(path_name: str) -> str:
+    """
+    Returns the SHA-256 hash of a file (helper function). The file is read in blocks of 1 MB.
+    """
+
+    sha256 = hashlib.sha256()
+    with open(path_name, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(block)
+
+    return sha256.hexdigest()
+
+
+def read_factor_cache(path_name: str, cache_dir: str | None = None) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    Returns the parsed contents of a factor CSV file from the binary cache.
+    The arrays are memory-mapped (read-only), so loading neither parses text nor copies the data.
+
+    The entry is valid as long as the modification time and size of the CSV file are unchanged. If only the
+    modification time changed (e.g., the file was copied or touched), the content hash decides, and the signature
+    of a still valid entry is updated.
+
+    Parameters
+    ----------
+    path_name : str
+        Path of the source CSV file.
+    cache_dir : str, optional
+        Directory of the factor cache. Defaults to factor_cache_dir from config.py.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray] | None
+        Data values (2D float array) and index (datetime64 array), or None if there is no valid entry.
+    """
+
+    prefix = get_factor_cache_prefix(path_name, cache_dir)
+    try:
+        with open(prefix + META_SUFFIX, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        stat = os.stat(path_name)
+
+        if (meta["mtime_ns"], meta["size"]) != (stat.st_mtime_ns, stat.st_size):
+            if meta["size"] != stat.st_size or meta["sha256"] != get_file_sha256(path_name):
+                return None
+            # Same content, so only the signature is refreshed
+            meta["mtime_ns"] = stat.st_mtime_ns
+            write_json_atomic(prefix + META_SUFFIX, meta)
+
+        values = np.load(prefix + VALUES_SUFFIX, mmap_mode="r")
+        index = np.load(prefix + INDEX_SUFFIX, mmap_mode="r")
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing, incomplete or corrupted entry -> parse the CSV file
+        return None
+
+    if values.ndim != 2 or values.shape[0] != index.shape[0] or list(values.shape) != meta.get("shape"):
+        return None
+
+    return values, index
+
+
+def write_factor_cache(path_name: str, values: np.ndarray, index: np.ndarray, cache_dir: str | None = None) -> None:
+    """
+    Stores the parsed contents of a factor CSV file in the binary cache. All files are replaced atomically and the
+    signature file is written last, so readers never accept a partially written entry.
+
+    Parameters
+    ----------
+    path_name : str
+        Path of the source CSV file.
+    values : np.ndarray
+        Data values as 2D float array.
+    index : np.ndarray
+        Index as datetime64 array.
+    cache_dir : str, optional
+        Directory of the factor cache. Defaults to factor_cache_dir from config.py.
+
+    Raises
+    ------
+    OSError
+        If the cache files cannot be written.
+
+    Returns
+    -------
+    None
+    """
+
+    prefix = get_factor_cache_prefix(path_name, cache_dir)
+    os.makedirs(os.path.dirname(prefix) or ".", exist_ok=True)
+
+    # Signature of the source file before it is hashed, so a concurrent change invalidates the entry
+    stat = os.stat(path_name)
+    meta = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": get_file_sha256(path_name),
+        "shape": list(values.shape)
+    }
+
+    for suffix, array in ((VALUES_SUFFIX, values), (INDEX_SUFFIX, index)):
+        tmp_path = f"{prefix}{suffix}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(array))
+        os.replace(tmp_path, prefix + suffix) # Atomic on Windows and POSIX
+
+    write_json_atomic(prefix + META_SUFFIX, meta)
+
+
+def write_json_atomic(path: str, data: dict) -> None:
+    """
+    Writes a dictionary as JSON file atomically (helper function).
+    """
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
@@ -0,0 +1,702 @@
+import os
+import re
+import glob
+from typing import Callable
+import numpy as np
+import pandas as pd
+from config import price_cache_dir, price_cache_max_bytes, price_cache_empty_ttl
+from utils.file_lock import file_lock
+
+# File extension of the cache entries; each entry stores the raw price history of one ticker/interval/auto_adjust key
+CACHE_EXTENSION = ".pkl"
+
+
+def get_cache_path(ticker: str, in_interval: str, in_auto_adjust: bool, cache_dir: str | None = None) -> str:
+    """
+    Builds the file path of the cache entry for a ticker/interval/auto_adjust key (helper function).
+
+    Parameters
+    ----------
+    ticker : str
+        Stock or index ticker, e.g., "AAPL" or "^GSPC".
+    in_interval : str
+        Data frequency as passed to yfinance, e.g., "1mo".
+    in_auto_adjust : bool
+        The auto_adjust flag as passed to yfinance.
+    cache_dir : str, optional
+        Directory of the price cache. Defaults to price_cache_dir from config.py.
+
+    Raises
+    ------
+    TypeError
+        If ticker or in_interval is not a string.
+    ValueError
+        If ticker or in_interval is empty.
+
+    Returns
+    -------
+    str
+        Path of the cache file for the given key.
+    """
+
+    if not isinstance(ticker, str) or not isinstance(in_interval, str):
+        raise TypeError("Ticker and interval must be strings.")
+    if not ticker.strip() or not in_interval.strip():
+        raise ValueError("Ticker and interval must be non-empty strings.")
+
+    adjust_tag = "adj" if in_auto_adjust else "raw"
+
+    return f"{get_cache_prefix(ticker, cache_dir)}_{in_interval}_{adjust_tag}{CACHE_EXTENSION}"
+
+
+def get_cache_prefix(ticker: str, cache_dir: str | None = None) -> str:
+    """
+    Builds the common path prefix of all cache entries of a ticker (helper function).
+
+    Parameters
+    ----------
+    ticker : str
+        Stock or index ticker, e.g., "AAPL" or "^GSPC".
+    cache_dir : str, optional
+        Directory of the price cache. Defaults to price_cache_dir from config.py.
+
+    Returns
+    -------
+    str
+        Path prefix shared by all entries of the ticker.
+    """
+
+    cache_dir = price_cache_dir if cache_dir is None else cache_dir
+    # Characters such as '^' are replaced, so every ticker maps to a portable file name
+    safe_ticker = re.sub(r"[^A-Za-z0-9.\-]", "_", ticker.strip().upper())
+
+    return os.path.join(cache_dir, safe_ticker)
+
+
+def align_window(in_start: str, in_end: str, in_interval: str) -> tuple[pd.Timestamp, pd.Timestamp]:
+    """
+    Converts the requested download window into timestamps. For monthly data the start date is moved to the
+    first day of its month, because Yahoo Finance labels monthly observations with the first day of the month.
+
+    Parameters
+    ----------
+    in_start : str
+        First requested date, e.g., "2023-01-01".
+    in_end : str
+        End of the requested window (exclusive, as in yfinance).
+    in_interval : str
+        Data frequency, e.g., "1mo" or "1d".
+
+    Returns
+    -------
+    tuple[pd.Timestamp, pd.Timestamp]
+        Start and end timestamps of the window.
+    """
+
+    start = pd.Timestamp(in_start)
+    end = pd.Timestamp(in_end)
+    if in_interval.endswith("mo"):
+        start = start.to_period("M").start_time
+
+    return start, end
+
+
+def get_missing_ranges(cached_start: pd.Timestamp, cached_end: pd.Timestamp, start: pd.Timestamp, end: pd.Timestamp) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+    """
+    Determines which parts of the requested window are not covered by the cached window.
+
+    Parameters
+    ----------
+    cached_start, cached_end : pd.Timestamp
+        Window that has already been downloaded (end exclusive).
+    start, end : pd.Timestamp
+        Requested window (end exclusive).
+
+    Returns
+    -------
+    list[tuple[pd.Timestamp, pd.Timestamp]]
+        Ranges that still need to be downloaded. Empty if the cache covers the whole request.
+        Every range adjoins the cached window, so the window stays contiguous when a range is added to it
+        (a request that does not overlap the cached window also downloads the gap in between).
+    """
+
+    missing = []
+    # Gap before the cached history
+    if start < cached_start:
+        missing.append((start, cached_start))
+    # Gap after the cached history
+    if end > cached_end:
+        missing.append((cached_end, end))
+
+    return missing
+
+
+def read_cache_entry(path: str) -> dict | None:
+    """
+    Reads a cache entry from disk. Corrupted entries are treated as missing.
+
+    Parameters
+    ----------
+    path : str
+        Path of the cache file.
+
+    Returns
+    -------
+    dict | None
+        Dictionary with the keys "prices" (pd.Series), "start" and "end" (pd.Timestamp, None if no range had data yet)
+        and "empty" (see fresh_empty_ranges()), or None if no valid entry exists.
+    """
+
+    if not os.path.isfile(path):
+        return None
+    try:
+        entry = pd.read_pickle(path)
+    except Exception:
+        return None
+    if not isinstance(entry, dict) or not {"prices", "start", "end"}.issubset(entry):
+        return None
+    entry.setdefault("empty", []) # Entries written before empty ranges were recorded
+
+    return entry
+
+
+def write_cache_entry(path: str, entry: dict) -> None:
+    """
+    Writes a cache entry atomically, so concurrent readers never observe a partially written file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the cache file.
+    entry : dict
+        Dictionary with the keys "prices", "start", "end" and "empty".
+
+    Returns
+    -------
+    None
+    """
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    pd.to_pickle(entry, tmp_path)
+    os.replace(tmp_path, path) # Atomic on Windows and POSIX
+
+
+def widen_covered_window(cached_start: pd.Timestamp | None, cached_end: pd.Timestamp | None, range_start: pd.Timestamp,
+                         range_end: pd.Timestamp) -> tuple[pd.Timestamp, pd.Timestamp]:
+    """
+    Adds a downloaded range that adjoins the covered window of a cache entry to that window (helper function).
+    Only ranges whose download returned data may be added, so failed or empty downloads are retried later.
+
+    Parameters
+    ----------
+    cached_start, cached_end : pd.Timestamp | None
+        Window covered by the cache entry (end exclusive). None for a new entry.
+    range_start, range_end : pd.Timestamp
+        Downloaded range (end exclusive), e.g., from get_missing_ranges().
+
+    Returns
+    -------
+    tuple[pd.Timestamp, pd.Timestamp]
+        Covered window including the range.
+    """
+
+    if cached_start is None or cached_end is None:
+        return range_start, range_end
+
+    return min(cached_start, range_start), max(cached_end, range_end)
+
+
+def get_top_up_range(prices: pd.Series, cached_end: pd.Timestamp | None, range_start: pd.Timestamp,
+                     range_end: pd.Timestamp) -> tuple[pd.Timestamp, pd.Timestamp, pd.Timestamp | None]:
+    """
+    Extends a missing range so that its download overlaps the cached history by one complete observation, the anchor
+    (helper function). Adjusted prices are rescaled over the whole history after every dividend or split, so prices of
+    different download dates may only be stitched together if they agree on the anchor (see adjustment_changed()).
+
+    Parameters
+    ----------
+    prices : pd.Series
+        Cached price history.
+    cached_end : pd.Timestamp | None
+        End of the window covered by the cache entry (exclusive). None for a new entry.
+    range_start, range_end : pd.Timestamp
+        Missing range (end exclusive), e.g., from get_missing_ranges().
+
+    Returns
+    -------
+    tuple[pd.Timestamp, pd.Timestamp, pd.Timestamp | None]
+        Start and end of the range to download and the anchor date, which is None if there is no cached history.
+    """
+
+    if prices.empty or cached_end is None:
+        return range_start, range_end, None
+
+    if range_start >= cached_end:
+        # Range after the cached history: the last cached observation may be a partial period (e.g., the current month),
+        # so the one before it is the anchor, and the partial period is downloaded again as well
+        anchor = prices.index[-2] if len(prices) > 1 else prices.index[-1]
+        return min(range_start, anchor), range_end, anchor
+
+    # Range before the cached history: the first cached observation is the anchor
+    anchor = prices.index[0]
+    return range_start, max(range_end, anchor + pd.Timedelta(days=1)), anchor
+
+
+def adjustment_changed(prices: pd.Series, new_prices: pd.Series, anchor: pd.Timestamp, rtol: float = 1e-6) -> bool:
+    """
+    Checks whether a download is adjusted differently than the cached history, i.e., whether a dividend or split
+    occurred between the two downloads (helper function).
+
+    Parameters
+    ----------
+    prices : pd.Series
+        Cached price history.
+    new_prices : pd.Series
+        Downloaded prices of a range from get_top_up_range().
+    anchor : pd.Timestamp
+        Date at which both series are compared.
+    rtol : float, optional
+        Relative tolerance of the comparison (default = 1e-6).
+
+    Returns
+    -------
+    bool
+        True if both series have a price at the anchor and the prices differ. Without a common price, nothing can be
+        compared and False is returned.
+    """
+
+    if anchor not in prices.index or anchor not in new_prices.index:
+        return False
+    cached, downloaded = prices.loc[anchor], new_prices.loc[anchor]
+    if pd.isna(cached) or pd.isna(downloaded):
+        return False
+
+    return not np.isclose(downloaded, cached, rtol=rtol, atol=0.0)
+
+
+def fresh_empty_ranges(entry: dict | None, empty_ttl: float | None = None) -> list[tuple[pd.Timestamp, pd.Timestamp, pd.Timestamp]]:
+    """
+    Returns the ranges of a cache entry whose download succeeded without data (e.g., the window before an IPO, or the
+    days after today) and that were checked within the last empty_ttl seconds (helper function).
+
+    Parameters
+    ----------
+    entry : dict | None
+        Cache entry from read_cache_entry(). None for a new entry.
+    empty_ttl : float, optional
+        Time in seconds for which a range without data is not downloaded again. Defaults to price_cache_empty_ttl from config.py.
+
+    Returns
+    -------
+    list[tuple[pd.Timestamp, pd.Timestamp, pd.Timestamp]]
+        (start, end, checked_at) of every range without data that has not expired yet.
+    """
+
+    empty_ttl = price_cache_empty_ttl if empty_ttl is None else empty_ttl
+    if entry is None:
+        return []
+    cutoff = pd.Timestamp.now() - pd.Timedelta(seconds=empty_ttl)
+
+    return [(range_start, range_end, checked_at) for range_start, range_end, checked_at in entry["empty"] if checked_at > cutoff]
+
+
+def get_entry_missing_ranges(entry: dict | None, start: pd.Timestamp, end: pd.Timestamp,
+                             empty_ttl: float | None = None) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+    """
+    Determines the ranges of the requested window that need to be downloaded for a cache entry (helper function):
+    the ranges of get_missing_ranges(), except those that recently returned no data (see fresh_empty_ranges()).
+
+    Parameters
+    ----------
+    entry : dict | None
+        Cache entry from read_cache_entry(). None for a new entry.
+    start, end : pd.Timestamp
+        Requested window (end exclusive).
+    empty_ttl : float, optional
+        Time in seconds for which a range without data is not downloaded again. Defaults to price_cache_empty_ttl from config.py.
+
+    Returns
+    -------
+    list[tuple[pd.Timestamp, pd.Timestamp]]
+        Ranges that still need to be downloaded. Empty if the cache covers the whole request.
+    """
+
+    if entry is None or entry["start"] is None:
+        missing = [(start, end)]
+    else:
+        missing = get_missing_ranges(entry["start"], entry["end"], start, end)
+    empty = fresh_empty_ranges(entry, empty_ttl)
+
+    return [(range_start, range_end) for range_start, range_end in missing
+            if not any(empty_start <= range_start and range_end <= empty_end for empty_start, empty_end, _ in empty)]
+
+
+def fetch_cached_prices(ticker: str, in_start: str, in_end: str, in_interval: str, in_auto_adjust: bool,
+                        downloader: Callable[[str, str, str], pd.Series], cache_dir: str | None = None,
+                        max_bytes: int | None = None, empty_ttl: float | None = None) -> pd.Series:
+    """
+    Returns the price history of a ticker for the requested window, served from the local price cache where possible.
+    Only the parts of the window that are missing in the cache are downloaded (incremental top-up) and merged into the entry.
+    Ranges that were downloaded successfully but without data (e.g., before an IPO) are remembered for empty_ttl seconds.
+
+    Parameters
+    ----------
+    ticker : str
+        Stock or index ticker.
+    in_start : str
+        First requested date, e.g., the output of get_start_date().
+    in_end : str
+        End of the requested window (exclusive).
+    in_interval : str
+        Data frequency, e.g., "1mo".
+    in_auto_adjust : bool
+        The auto_adjust flag as passed to yfinance. Part of the cache key.
+    downloader : Callable[[str, str, str], pd.Series]
+        Function called as downloader(ticker, start, end) that returns the prices for a date range. May return an empty Series.
+    cache_dir : str, optional
+        Directory of the price cache. Defaults to price_cache_dir from config.py.
+    max_bytes : int, optional
+        Size limit of the cache directory, enforced after writing. Defaults to price_cache_max_bytes from config.py.
+    empty_ttl : float, optional
+        Time in seconds for which a range without data is not downloaded again. Defaults to price_cache_empty_ttl from config.py.
+
+    Raises
+    ------
+    TimeoutError
+        If the cache entry is locked by another process for too long.
+    Exception
+        Any exception raised by the downloader is propagated; nothing is cached in that case.
+
+    Returns
+    -------
+    pd.Series
+        Prices within the requested window, named after the ticker.
+    """
+
+    path = get_cache_path(ticker, in_interval, in_auto_adjust, cache_dir)
+    start, end = align_window(in_start, in_end, in_interval)
+    # Data after today cannot be downloaded yet, so the cached window must not claim to cover it
+    covered_end = min(end, pd.Timestamp.today().normalize())
+
+    with file_lock(path + ".lock"):
+        entry = read_cache_entry(path)
+        missing = get_entry_missing_ranges(entry, start, end, empty_ttl)
+        empty = fresh_empty_ranges(entry, empty_ttl)
+        if entry is None:
+            prices = pd.Series(dtype=float, index=pd.DatetimeIndex([]), name=ticker)
+            cached_start, cached_end = None, None
+        else:
+            prices = entry["prices"]
+            cached_start, cached_end = entry["start"], entry["end"]
+
+        # Top up the cache with the missing ranges only, each overlapping the cached history by one observation.
+        # Every download with data is written back, as it may revise cached values or widen the covered window
+        # without adding rows
+        rescaled = False
+        updated = False
+        for range_start, range_end in missing:
+            download_start, download_end, anchor = get_top_up_range(prices, cached_end, range_start, range_end)
+            new_prices = downloader(ticker, download_start.strftime("%Y-%m-%d"), download_end.strftime("%Y-%m-%d"))
+            updated = True
+            if new_prices is None or new_prices.empty:
+                # The download succeeded without data (failures raise), so the range is not downloaded again until the
+                # record expires. It is not added to the covered window, as data may still appear (e.g., after an IPO)
+                empty.append((range_start, range_end, pd.Timestamp.now()))
+                continue
+            if anchor is not None and adjustment_changed(prices, new_prices, anchor):
+                rescaled = True
+                break
+            prices = merge_prices(prices, new_prices, ticker)
+            cached_start, cached_end = widen_covered_window(cached_start, cached_end, range_start, min(range_end, covered_end))
+            if range_end > covered_end:
+                empty.append((covered_end, range_end, pd.Timestamp.now())) # Days after today have no data yet
+
+        if rescaled:
+            # A dividend or split since the cached download rescaled the adjusted history, so the cached prices cannot
+            # be stitched to new ones and the entry is rebuilt from one download of the requested window
+            new_prices = downloader(ticker, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+            prices = merge_prices(pd.Series(dtype=float, index=pd.DatetimeIndex([]), name=ticker), new_prices, ticker)
+            cached_start, cached_end = (start, covered_end) if not prices.empty else (None, None)
+            if prices.empty:
+                empty = [(start, end, pd.Timestamp.now())]
+            else:
+                empty = [(covered_end, end, pd.Timestamp.now())] if end > covered_end else []
+
+        if updated:
+            write_cache_entry(path, {"prices": prices, "start": cached_start, "end": cached_end, "empty": empty})
+        elif entry is not None:
+            # Refresh the modification time, which serves as the recency for the LRU eviction
+            os.utime(path)
+
+    if updated:
+        evict_price_cache(max_bytes=max_bytes, cache_dir=cache_dir, keep=[path])
+
+    window = prices[(prices.index >= start) & (prices.index < end)]
+    window.name = ticker
+
+    return window
+
+
+def merge_prices(prices: pd.Series, new_prices: pd.Series | None, ticker: str) -> pd.Series:
+    """
+    Merges newly downloaded prices into the cached price history (helper function).
+
+    Parameters
+    ----------
+    prices : pd.Series
+        Cached price history.
+    new_prices : pd.Series | None
+        Newly downloaded prices. None or an empty Series leave the history unchanged.
+    ticker : str
+        Ticker used to name the merged Series.
+
+    Returns
+    -------
+    pd.Series
+        Sorted price history without duplicate dates.
+    """
+
+    if new_prices is None or new_prices.empty:
+        return prices
+
+    merged = pd.concat([prices, new_prices]) if not prices.empty else new_prices
+    # Newer downloads overwrite older observations of the same date
+    merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+    merged.name = ticker
+
+    return merged
+
+
+def get_cached_missing_ranges(ticker: str, in_start: str, in_end: str, in_interval: str, in_auto_adjust: bool,
+                              cache_dir: str | None = None, empty_ttl: float | None = None) -> list[tuple[str, str]]:
+    """
+    Determines which date ranges of the requested window are missing in the price cache, without downloading anything.
+    Used by bulk downloads, which fetch the missing ranges of many tickers at once and store them via update_cached_prices().
+
+    Parameters
+    ----------
+    ticker : str
+        Stock or index ticker.
+    in_start : str
+        First requested date.
+    in_end : str
+        End of the requested window (exclusive).
+    in_interval : str
+        Data frequency, e.g., "1mo".
+    in_auto_adjust : bool
+        The auto_adjust flag as passed to yfinance.
+    cache_dir : str, optional
+        Directory of the price cache. Defaults to price_cache_dir from config.py.
+    empty_ttl : float, optional
+        Time in seconds for which a range without data is not downloaded again. Defaults to price_cache_empty_ttl from config.py.
+
+    Returns
+    -------
+    list[tuple[str, str]]
+        Missing (start, end) ranges in YYYY-MM-DD format. Empty if the cache covers the whole window.
+    """
+
+    path = get_cache_path(ticker, in_interval, in_auto_adjust, cache_dir)
+    start, end = align_window(in_start, in_end, in_interval)
+    entry = read_cache_entry(path)
+
+    missing = get_entry_missing_ranges(entry, start, end, empty_ttl)
+    if entry is not None:
+        # Every range overlaps the cached history by one observation, see get_top_up_range()
+        missing = [get_top_up_range(entry["prices"], entry["end"], range_start, range_end)[:2] for range_start, range_end in missing]
+        if not missing:
+            os.utime(path) # Cache hit, refresh the recency for the LRU eviction
+
+    return [(range_start.strftime("%Y-%m-%d"), range_end.strftime("%Y-%m-%d")) for range_start, range_end in missing]
+
+
+def update_cached_prices(ticker: str, in_start: str, in_end: str, in_interval: str, in_auto_adjust: bool,
+                         new_prices: pd.Series | None, cache_dir: str | None = None, max_bytes: int | None = None) -> pd.Series | None:
+    """
+    Merges prices that were downloaded for the missing ranges of a window into the cache entry and returns the full window.
+    The entry is only marked as covering a missing range if new_prices contains data within that range, so tickers
+    without data in a bulk download (e.g., a NaN column, which may also be a swallowed error) are downloaded again on
+    the next run. Only the days after today are recorded as a range without data (see fresh_empty_ranges()).
+    If new_prices is adjusted differently than the cached history at the anchor of a range (see get_top_up_range()),
+    a dividend or split occurred since the cached download. The entry is then removed and None is returned, so the
+    caller downloads the whole window again.
+
+    Parameters
+    ----------
+    ticker : str
+        Stock or index ticker.
+    in_start : str
+        First requested date.
+    in_end : str
+        End of the requested window (exclusive).
+    in_interval : str
+        Data frequency, e.g., "1mo".
+    in_auto_adjust : bool
+        The auto_adjust flag as passed to yfinance.
+    new_prices : pd.Series | None
+        Prices downloaded for the missing ranges. May be None or empty if nothing was missing.
+    cache_dir : str, optional
+        Directory of the price cache. Defaults to price_cache_dir from config.py.
+    max_bytes : int, optional
+        Size limit of the cache directory, enforced after writing. Defaults to price_cache_max_bytes from config.py.
+
+    Returns
+    -------
+    pd.Series | None
+        Prices within the requested window, named after the ticker, or None if the cached history was rescaled.
+    """
+
+    path = get_cache_path(ticker, in_interval, in_auto_adjust, cache_dir)
+    start, end = align_window(in_start, in_end, in_interval)
+    covered_end = min(end, pd.Timestamp.today().normalize())
+
+    with file_lock(path + ".lock"):
+        # Re-read the entry, another process may have updated it in the meantime
+        entry = read_cache_entry(path)
+        missing = get_entry_missing_ranges(entry, start, end)
+        empty = fresh_empty_ranges(entry)
+        if entry is None:
+            prices = pd.Series(dtype=float, index=pd.DatetimeIndex([]), name=ticker)
+            cached_start, cached_end = None, None
+        else:
+            prices = entry["prices"]
+            cached_start, cached_end = entry["start"], entry["end"]
+
+        # Only the missing ranges with downloaded data become covered. Downloaded data is always written back, as it
+        # may revise cached values or widen the covered window without adding rows
+        updated = new_prices is not None and not new_prices.empty
+        if updated:
+            for range_start, range_end in missing:
+                anchor = get_top_up_range(prices, cached_end, range_start, range_end)[2]
+                if anchor is not None and adjustment_changed(prices, new_prices, anchor):
+                    os.remove(path) # The rescaled history must not be served again
+                    return None
+                in_range = (new_prices.index >= range_start) & (new_prices.index < range_end)
+                if new_prices[in_range].notna().any():
+                    cached_start, cached_end = widen_covered_window(cached_start, cached_end, range_start, min(range_end, covered_end))
+                    if range_end > covered_end:
+                        empty.append((covered_end, range_end, pd.Timestamp.now())) # Days after today have no data yet
+            prices = merge_prices(prices, new_prices, ticker)
+
+        if updated:
+            write_cache_entry(path, {"prices": prices, "start": cached_start, "end": cached_end, "empty": empty})
+
+    if updated:
+        evict_price_cache(max_bytes=max_bytes, cache_dir=cache_dir, keep=[path])
+
+    window = prices[(prices.index >= start) & (prices.index < end)]
+    window.name = ticker
+
+    return window
+
+
+def evict_price_cache(max_bytes: int | None = None, cache_dir: str | None = None, keep: list[str] | None = None) -> int:
+    """
+    Enforces the size limit of the price cache by removing the least recently used entries.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Maximum total size of all cache entries in bytes. Defaults to price_cache_max_bytes from config.py.
+    cache_dir : str, optional
+        Directory of the price cache. Defaults to price_cache_dir from config.py.
+    keep : list[str], optional
+        Paths that must not be evicted (e.g., the entry that was just written).
+
+    Raises
+    ------
+    ValueError
+        If max_bytes is negative.
+
+    Returns
+    -------
+    int
+        Number of evicted entries.
+    """
+
+    max_bytes = price_cache_max_bytes if max_bytes is None else max_bytes
+    cache_dir = price_cache_dir if cache_dir is None else cache_dir
+    if max_bytes < 0:
+        raise ValueError("max_bytes must be non-negative.")
+
+    keep = {os.path.abspath(path) for path in (keep or [])}
+    entries = []
+    for path in glob.glob(os.path.join(cache_dir, f"*{CACHE_EXTENSION}")):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue # Removed by another process in the meantime
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total_size = sum(size for _, size, _ in entries)
+    evicted = 0
+    # Oldest entries first
+    for _, size, path in sorted(entries):
+        if total_size <= max_bytes:
+            break
+        if os.path.abspath(path) in keep:
+            continue
+        with file_lock(path + ".lock"):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+        total_size -= size
+        evicted += 1
+
+    return evicted
+
+
+def invalidate_price_cache(ticker: str | None = None, in_interval: str | None = None, in_auto_adjust: bool | None = None,
+                           cache_dir: str | None = None) -> int:
+    """
+    Removes entries from the price cache. Without arguments, the whole cache is cleared.
+
+    Parameters
+    ----------
+    ticker : str, optional
+        Only remove entries of this ticker.
+    in_interval : str, optional
+        Only remove entries with this interval. Requires a ticker.
+    in_auto_adjust : bool, optional
+        Only remove entries with this auto_adjust flag. Requires a ticker and an interval.
+    cache_dir : str, optional
+        Directory of the price cache. Defaults to price_cache_dir from config.py.
+
+    Raises
+    ------
+    ValueError
+        If a more specific key part is given without the less specific ones.
+
+    Returns
+    -------
+    int
+        Number of removed entries.
+    """
+
+    cache_dir = price_cache_dir if cache_dir is None else cache_dir
+
+    if ticker is None:
+        if in_interval is not None or in_auto_adjust is not None:
+            raise ValueError("An interval or auto_adjust filter requires a ticker.")
+        paths = glob.glob(os.path.join(cache_dir, f"*{CACHE_EXTENSION}"))
+    elif in_interval is None:
+        if in_auto_adjust is not None:
+            raise ValueError("An auto_adjust filter requires an interval.")
+        paths = glob.glob(glob.escape(get_cache_prefix(ticker, cache_dir)) + f"_*{CACHE_EXTENSION}")
+    elif in_auto_adjust is None:
+        paths = [get_cache_path(ticker, in_interval, flag, cache_dir) for flag in (True, False)]
+    else:
+        paths = [get_cache_path(ticker, in_interval, in_auto_adjust, cache_dir)]
+
+    removed = 0
+    for path in paths:
+        with file_lock(path + ".lock"):
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                continue
+
+    return removed
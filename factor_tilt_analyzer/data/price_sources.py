@@ -0,0 +1,226 @@
+import os
+import re
+from abc import ABC, abstractmethod
+import pandas as pd
+
+
+class PriceSource(ABC):
+    """
+    Interface of the price-source backends behind fetch_returns() and fetch_benchmark_returns().
+    A price source returns the Adjusted Closing Prices of a ticker for a date window; the calculation of returns
+    is done by the callers, so every backend yields identical return frames for identical prices.
+    """
+
+    # Whether the prices of this source should be stored in the local price cache (remote sources only)
+    cacheable = False
+    # Whether fetch_prices may be called from several threads at once
+    thread_safe = True
+
+    @abstractmethod
+    def fetch_prices(self, ticker: str, in_start: str, in_end: str, in_interval: str = "1mo", in_auto_adjust: bool = False) -> pd.Series:
+        """
+        Returns the Adjusted Closing Prices of a single ticker.
+
+        Parameters
+        ----------
+        ticker : str
+            Stock or index ticker, e.g., "AAPL".
+        in_start : str
+            First date of the window, e.g., "2023-01-01".
+        in_end : str
+            End of the window (exclusive).
+        in_interval : str, optional
+            Data frequency. The default is "1mo".
+        in_auto_adjust : bool, optional
+            The auto_adjust flag of yfinance. The default is False.
+
+        Returns
+        -------
+        pd.Series
+            Prices with datetime index, named after the ticker. Empty if no data is available.
+        """
+
+    def fetch_prices_bulk(self, tickers: list[str], in_start: str, in_end: str, in_interval: str = "1mo", in_auto_adjust: bool = False) -> dict[str, pd.Series]:
+        """
+        Returns the Adjusted Closing Prices of several tickers. Backends with a native multi-symbol request override
+        this method; the default implementation calls fetch_prices() for each ticker.
+
+        Parameters
+        ----------
+        tickers : list[str]
+            Stock or index tickers.
+        in_start, in_end, in_interval, in_auto_adjust
+            See fetch_prices().
+
+        Returns
+        -------
+        dict[str, pd.Series]
+            Prices per ticker. Tickers without any data are not contained in the dictionary.
+        """
+
+        prices = {}
+        for ticker in tickers:
+            series = self.fetch_prices(ticker, in_start, in_end, in_interval, in_auto_adjust)
+            if not series.empty:
+                prices[ticker] = series
+
+        return prices
+
+
+class LocalDirectoryPriceSource(PriceSource):
+    """
+    Offline price source that reads one Parquet or CSV file per ticker from a directory, e.g., "prices/AAPL.parquet"
+    or "prices/^GSPC.csv". Only the date and price columns are read (column projection), and only the rows inside the
+    requested window are loaded (predicate pushdown via Parquet filters, or chunked reading for CSV files).
+    """
+
+    supported_formats = ("parquet", "csv")
+
+    def __init__(self, directory: str, file_format: str = "auto", date_column: str = "Date", price_column: str = "Adj Close",
+                 csv_chunksize: int = 100_000):
+        """
+        Parameters
+        ----------
+        directory : str
+            Directory with one file per ticker.
+        file_format : str, optional
+            "parquet", "csv", or "auto" (default), which prefers a Parquet file if both exist.
+        date_column : str, optional
+            Name of the date column (or of the stored index). The default is "Date".
+        price_column : str, optional
+            Name of the price column. The default is "Adj Close".
+        csv_chunksize : int, optional
+            Number of CSV rows parsed at once. The default is 100,000.
+
+        Raises
+        ------
+        TypeError
+            If directory, file_format or the column names are not strings.
+        ValueError
+            If the file format is not supported, or csv_chunksize is not positive.
+        """
+
+        if not all(isinstance(arg, str) for arg in (directory, file_format, date_column, price_column)):
+            raise TypeError("Directory, file format and column names must be strings.")
+        if file_format not in self.supported_formats + ("auto",):
+            raise ValueError(f"Unsupported file format '{file_format}'. Use 'parquet', 'csv', or 'auto'.")
+        if not isinstance(csv_chunksize, int) or csv_chunksize <= 0:
+            raise ValueError("csv_chunksize must be a positive integer.")
+
+        self.directory = directory
+        self.file_format = file_format
+        self.date_column = date_column
+        self.price_column = price_column
+        self.csv_chunksize = csv_chunksize
+
+    def find_file(self, ticker: str) -> tuple[str, str] | None:
+        """
+        Locates the file of a ticker. Characters that are not portable in file names (such as '^') may be replaced by '_'.
+
+        Parameters
+        ----------
+        ticker : str
+            Stock or index ticker.
+
+        Returns
+        -------
+        tuple[str, str] | None
+            Path and format of the file, or None if no file exists.
+        """
+
+        names = [ticker, re.sub(r"[^A-Za-z0-9.\-]", "_", ticker)]
+        formats = self.supported_formats if self.file_format == "auto" else (self.file_format,)
+        for file_format in formats:
+            for name in names:
+                path = os.path.join(self.directory, f"{name}.{file_format}")
+                if os.path.isfile(path):
+                    return path, file_format
+
+        return None
+
+    def read_parquet(self, path: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        """
+        Reads the date and price columns of a Parquet file, restricted to the window [start, end).
+
+        Raises
+        ------
+        ImportError
+            If pyarrow is not installed.
+        """
+
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Reading Parquet price files requires pyarrow. Install it via 'pip install pyarrow' or use CSV files.") from e
+
+        # The filters are evaluated on the row groups and pages, so rows outside the window are not decoded
+        table = pq.read_table(
+            path,
+            columns=[self.date_column, self.price_column],
+            filters=[(self.date_column, ">=", start), (self.date_column, "<", end)]
+        )
+        # ignore_metadata -> keep the date as a regular column, even if it was written as the pandas index
+        return table.to_pandas(ignore_metadata=True)
+
+    def read_csv(self, path: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        """
+        Reads the date and price columns of a CSV file chunk by chunk and keeps only the rows in the window [start, end).
+        For files sorted by date, reading stops at the first chunk that lies completely after the window.
+        """
+
+        chunks = []
+        reader = pd.read_csv(path, usecols=[self.date_column, self.price_column], parse_dates=[self.date_column], chunksize=self.csv_chunksize)
+        with reader:
+            for chunk in reader:
+                dates = chunk[self.date_column]
+                chunks.append(chunk[(dates >= start) & (dates < end)])
+                if dates.is_monotonic_increasing and len(dates) and dates.iloc[0] >= end:
+                    break
+
+        if not chunks:
+            return pd.DataFrame(columns=[self.date_column, self.price_column])
+
+        return pd.concat(chunks, ignore_index=True)
+
+    def fetch_prices(self, ticker: str, in_start: str, in_end: str, in_interval: str = "1mo", in_auto_adjust: bool = False) -> pd.Series:
+        """
+        Returns the prices of a ticker from its local file. See PriceSource.fetch_prices().
+        Daily files are converted to monthly observations (last price of each month, labeled with the first day of the
+        month as on Yahoo Finance) if a monthly interval is requested.
+
+        Raises
+        ------
+        KeyError
+            If the file does not contain the configured date or price column.
+        """
+
+        empty = pd.Series(dtype=float, index=pd.DatetimeIndex([]), name=ticker)
+        located = self.find_file(ticker)
+        if located is None:
+            return empty
+        path, file_format = located
+
+        start, end = pd.Timestamp(in_start), pd.Timestamp(in_end)
+        try:
+            if file_format == "parquet":
+                df = self.read_parquet(path, start, end)
+            else:
+                df = self.read_csv(path, start, end)
+        except ValueError as e:
+            # pandas reports missing usecols as ValueError
+            raise KeyError(f"File '{path}' must contain the columns '{self.date_column}' and '{self.price_column}': {e}") from e
+
+        if df.empty:
+            return empty
+
+        prices = pd.Series(df[self.price_column].to_numpy(dtype=float), index=pd.DatetimeIndex(df[self.date_column]), name=ticker)
+        if prices.index.tz is not None:
+            prices.index = prices.index.tz_localize(None)
+        prices = prices.dropna().sort_index()
+
+        if in_interval == "1mo":
+            prices = prices.groupby(prices.index.to_period("M")).last()
+            prices.index = prices.index.to_timestamp()
+            prices.name = ticker
+
+        return prices
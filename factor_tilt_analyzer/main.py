@@ -1,10 +1,14 @@
 import time
-from config import valid_mkt_benchmarks, benchmark_names
-from utils.validity_input_check import check_validity_tickers
-from data.data_fetcher import fetch_returns, fetch_benchmark_returns
+from config import valid_mkt_benchmarks, benchmark_names, price_cache_enabled, validation_cache_enabled, single_pass_validation, rolling_beta_window, mvp_long_only, mvp_max_weight
+from utils.validity_input_check import check_validity_tickers, update_validation_cache
+from data.concurrent_fetcher import fetch_all_returns, fetch_and_validate_returns, fetch_returns_with_benchmarks, split_fetch_failures
 from analysis.portfolio_statistics import compare_portfolio_with_market_benchmark
+from analysis.benchmark_comparison import compare_portfolio_with_benchmarks, print_benchmark_comparison
+from analysis.factor_covariance import factor_model_columns
 from analysis.minimum_variance_portfolio import calculate_mvp_portfolio
+from analysis.constrained_mvp import calculate_constrained_mvp_portfolio
 from analysis.portfolio_analyzer import factor_analysis_regression, analyze_factor_exposures
+from analysis.rolling_regression import rolling_factor_regression
 
 """
 For testing purposes:
@@ -22,10 +26,11 @@ def main() -> None:
 
     This function interacts with the user to:
     - Prompt for a list of stock tickers to analyze
-    - Prompt for a market benchmark selection (e.g., S&P 500, Russell 2000)
-    - Download historical monthly return data for the selected stocks and benchmark
+    - Prompt for a market benchmark selection (e.g., S&P 500, Russell 2000), or all benchmarks at once
+    - Download historical monthly return data for the selected stocks and benchmark(s)
     - Construct the minimum variance portfolio (MVP) using historical returns
     - Compare performance statistics between the MVP and the benchmark
+      (with all benchmarks: one combined table of statistics, relative statistics and factor exposures)
     - Analyze the MVP’s factor exposures using a regression on Fama-French + Momentum factors
 
     The function performs input validation, error handling, and graceful exits 
@@ -51,8 +56,9 @@ def main() -> None:
             return # Gracefully exit without stack trace
         
         print(f"\nYou selected: {tickers}\n")
-        # Check the validity of the tickers: 
-        if not check_validity_tickers(tickers):
+        # Check the validity of the tickers:
+        # In single-pass mode only the format is checked here, the existence of the tickers is verified by the download
+        if not check_validity_tickers(tickers, use_cache = validation_cache_enabled, check_api = not single_pass_validation):
             # Abort the program if some tickers are invalid
             print("The program failed because of invalid tickers. Please make sure to provide valid tickers and restart the program.")
             return # Gracefully exit without stack trace
@@ -61,29 +67,60 @@ def main() -> None:
         print("What market index would you like to choose as a benchmark?\n")
         for i, name in enumerate(benchmark_names, start=1):
             print(f"Option {i}: {name}")
+        # Last option: compare the MVP with all benchmarks in one run (stocks are downloaded and the MVP is built once)
+        all_option = len(valid_mkt_benchmarks) + 1
+        print(f"Option {all_option}: All benchmarks")
         
         # Get and validate user input
         while True:
-            user_input = input("\nEnter a number between 1 and 3 for the corresponding market benchmark: ").strip()
+            user_input = input(f"\nEnter a number between 1 and {all_option} for the corresponding market benchmark: ").strip()
             if user_input.isdigit():
                 selection = int(user_input)
-                if 1 <= selection <= len(valid_mkt_benchmarks):
-                    mkt_benchmark_ticker = valid_mkt_benchmarks[selection - 1]
+                if 1 <= selection <= all_option:
                     break
-            print("Invalid input. Please enter 1, 2, or 3.")
-            
-        print(f"\nYou selected: {benchmark_names[selection - 1]} ({mkt_benchmark_ticker})\n")
+            print(f"Invalid input. Please enter a number between 1 and {all_option}.")
+        
+        all_benchmarks = selection == all_option
+        if all_benchmarks:
+            mkt_benchmark_ticker = None
+            print(f"\nYou selected: All benchmarks ({', '.join(valid_mkt_benchmarks)})\n")
+        else:
+            mkt_benchmark_ticker = valid_mkt_benchmarks[selection - 1]
+            print(f"\nYou selected: {benchmark_names[selection - 1]} ({mkt_benchmark_ticker})\n")
     
         print("\nDownloading return data...")
         time.sleep(2) # Small break so printing is consistent
     
         # Function call to retrieve returns from the Yahoo Finance API via yfinance 
+        # Stocks and benchmark are downloaded in parallel (rate limit and number of workers are set in config.py)
         try:
-            returns_df = fetch_returns(tickers, in_end = "2025-01-01") # Return time series for all stocks
-            mkt_returns_df = fetch_benchmark_returns(mkt_benchmark_ticker, in_end = "2025-01-01") # Return time series for the market benchmark
+            if all_benchmarks:
+                # All benchmarks and stocks in one concurrent pass; the stock tickers are validated by their download
+                returns_df, mkt_returns_df, failures, _ = fetch_returns_with_benchmarks(tickers, in_end = "2025-01-01", use_cache = price_cache_enabled)
+            elif single_pass_validation:
+                returns_df, mkt_returns_df, failures, _ = fetch_and_validate_returns(tickers, mkt_benchmark_ticker, in_end = "2025-01-01", use_cache = price_cache_enabled)
+            else:
+                returns_df, mkt_returns_df, _ = fetch_all_returns(tickers, mkt_benchmark_ticker, in_end = "2025-01-01", use_cache = price_cache_enabled)
+                failures = {}
         except Exception as e:
             print(f"\nFailed to download return data: {e}. Program terminated.")
             return # Gracefully exit without stack trace
+
+        if validation_cache_enabled and not returns_df.empty:
+            # Tickers with data are valid, so later runs can skip them in the validation
+            update_validation_cache({ticker: True for ticker in returns_df.columns})
+        if failures:
+            # Tickers without data are invalid, failed downloads (e.g., network errors) say nothing about the ticker
+            invalid, download_errors = split_fetch_failures(failures)
+            for ticker, failure in invalid.items():
+                print(f"Invalid ticker '{ticker}': {failure.message}")
+            for ticker, failure in download_errors.items():
+                print(f"Could not download ticker '{ticker}': {failure.message}")
+            if invalid:
+                print("The program failed because of invalid tickers. Please make sure to provide valid tickers and restart the program.")
+            if download_errors:
+                print("The download failed because of network or API errors. Please check your internet connection and restart the program to retry.")
+            return # Gracefully exit without stack trace
         
         if returns_df.empty:
             print("\nNo return data found for the selected tickers. Program terminated.")
@@ -96,8 +133,36 @@ def main() -> None:
             return
         
         # Calculate the minimum variance portfolio based on the time series of returns for the individual stocks
-        portfolio_returns = calculate_mvp_portfolio(returns_df)
+        # With investment constraints (config.py), the weights come from the constrained QP solver instead of the closed-form solution
+        # Both solvers apply the factor targets of config.py (mvp_factor_targets)
+        if mvp_long_only or mvp_max_weight is not None:
+            portfolio_returns = calculate_constrained_mvp_portfolio(returns_df)
+        else:
+            portfolio_returns = calculate_mvp_portfolio(returns_df)
+            
+        if all_benchmarks:
+            # Validate date overlap
+            if portfolio_returns.index.intersection(mkt_returns_df.dropna().index).empty:
+                print("\nNo overlapping dates between portfolio and market benchmarks. Program terminated.")
+                return
             
+            time.sleep(1) # Small break
+            
+            # One combined table: statistics, relative statistics and factor exposures of the MVP and all benchmarks
+            for ticker, name in zip(valid_mkt_benchmarks, benchmark_names):
+                print(f"{ticker:<6} = {name}")
+            comparison_df = compare_portfolio_with_benchmarks(portfolio_returns, mkt_returns_df)
+            print_benchmark_comparison(comparison_df)
+            
+            # The factor exposures of the MVP do not depend on the benchmark, so the betas of its row in the batch
+            # regression (on the dates shared with all benchmarks) are analyzed once
+            betas = comparison_df.loc["MVP", factor_model_columns].astype(float)
+            beta_history = None
+            if len(portfolio_returns) > rolling_beta_window:
+                beta_history = rolling_factor_regression(portfolio_returns, window = rolling_beta_window)
+            analyze_factor_exposures(betas, beta_history = beta_history)
+            return
+        
         # Compare key portfolio statistics across the constructed minimum variance portfolio and the market benchmark:
         mkt_returns = mkt_returns_df["MKT"] # Convert pd.DataFrame into pd.Series
         
@@ -116,8 +181,13 @@ def main() -> None:
         # Function call constructs the necessary datasets, fits the regression, and returns the regression outputs
         betas = factor_analysis_regression(portfolio_returns, mkt_returns)
         
+        # Time-varying exposures over rolling windows (only if the history covers more than one window)
+        beta_history = None
+        if len(portfolio_returns) > rolling_beta_window:
+            beta_history = rolling_factor_regression(portfolio_returns, window = rolling_beta_window)
+        
         # Function call to analyze the betas (factor exposures) in an intuitive, visual way inside the console
-        analyze_factor_exposures(betas)
+        analyze_factor_exposures(betas, beta_history = beta_history)
     
     except Exception as e:
         print(f"\nAn unexpected error occurred: {e}. Program terminated.")
@@ -0,0 +1,10 @@
+import pytest
+from ..analysis.portfolio_analyzer import reset_factor_panel
+
+
+@pytest.fixture(autouse=True)
+def fresh_factor_panel():
+    # The factor panel is memoized per process, so every test starts without a panel (and sees its own mocks)
+    reset_factor_panel()
+    yield
+    reset_factor_panel()
@@ -0,0 +1,88 @@
+import pytest
+import numpy as np
+import pandas as pd
+from ..analysis.benchmark_comparison import compare_portfolio_with_benchmarks, print_benchmark_comparison, benchmark_comparison_keys
+from ..analysis.factor_panel import FactorPanel
+from ..analysis.portfolio_analyzer import factor_analysis_regression
+from ..analysis.portfolio_statistics import calculate_portfolio_statistics
+from ..analysis.relative_statistics import calculate_relative_statistics
+
+# ------------------ Fixtures ------------------
+
+@pytest.fixture
+def universe():
+    rng = np.random.default_rng(25)
+    idx = pd.date_range("2019-01-31", periods=48, freq="ME")
+    factors = pd.DataFrame(rng.normal(0.5, 4, (48, 5)), index=idx, columns=["Mkt_rf", "SMB", "HML", "Rf", "Mom"])
+    factors["Rf"] = 0.1
+    benchmarks = pd.DataFrame(rng.normal(0.008, 0.05, (48, 3)), index=idx, columns=["^IXIC", "^GSPC", "^RUT"])
+    portfolio = (0.7 * benchmarks["^GSPC"] + rng.normal(0.001, 0.02, 48)).rename("MVP")
+    return portfolio, benchmarks, FactorPanel(factors)
+
+# ------------------ Tests ------------------
+
+def test_compare_portfolio_with_benchmarks_matches_single_benchmark_functions(universe):
+    portfolio, benchmarks, panel = universe
+    comparison_df = compare_portfolio_with_benchmarks(portfolio, benchmarks, factor_panel=panel)
+    assert list(comparison_df.columns) == benchmark_comparison_keys
+    assert list(comparison_df.index) == ["MVP", "^IXIC", "^GSPC", "^RUT"]
+
+    for name, series in [("MVP", portfolio)] + list(benchmarks.items()):
+        stats = calculate_portfolio_statistics(series)
+        for key, value in stats.items():
+            assert comparison_df.loc[name, key] == pytest.approx(value)
+        betas = factor_analysis_regression(series, series, log=False, factor_panel=panel)
+        np.testing.assert_allclose(comparison_df.loc[name, betas.index].to_numpy(dtype=float), betas.to_numpy())
+
+    relative_df = calculate_relative_statistics(portfolio, benchmarks)
+    for benchmark in benchmarks.columns:
+        assert comparison_df.loc[benchmark, "tracking_error"] == pytest.approx(relative_df.loc[("MVP", benchmark), "tracking_error"])
+        assert comparison_df.loc[benchmark, "beta"] == pytest.approx(relative_df.loc[("MVP", benchmark), "beta"])
+    assert comparison_df.loc["MVP", "sortino_ratio"] == pytest.approx(relative_df["sortino_ratio"].iloc[0])
+    assert comparison_df.loc["MVP", ["tracking_error", "information_ratio", "beta"]].isna().all()
+
+def test_compare_portfolio_with_benchmarks_uses_common_dates(universe):
+    portfolio, benchmarks, panel = universe
+    benchmarks = benchmarks.copy()
+    benchmarks.iloc[:6, 2] = np.nan # Shorter history of one benchmark
+    comparison_df = compare_portfolio_with_benchmarks(portfolio, benchmarks, factor_panel=panel)
+    stats = calculate_portfolio_statistics(portfolio.iloc[6:])
+    assert comparison_df.loc["MVP", "cumulative_return"] == pytest.approx(stats["cumulative_return"])
+
+def test_compare_portfolio_with_benchmarks_without_factor_regression(universe):
+    portfolio, benchmarks, _ = universe
+    comparison_df = compare_portfolio_with_benchmarks(portfolio, benchmarks, interval="yearly")
+    assert comparison_df[["factor_alpha", "Mkt_rf", "r_squared"]].isna().all().all()
+
+def test_compare_portfolio_with_benchmarks_invalid_inputs(universe):
+    portfolio, benchmarks, panel = universe
+    with pytest.raises(TypeError):
+        compare_portfolio_with_benchmarks(portfolio.to_frame(), benchmarks, factor_panel=panel)
+    with pytest.raises(TypeError):
+        compare_portfolio_with_benchmarks(portfolio, benchmarks["^GSPC"], factor_panel=panel)
+    with pytest.raises(ValueError):
+        compare_portfolio_with_benchmarks(portfolio, benchmarks.iloc[:, :0], factor_panel=panel)
+    with pytest.raises(ValueError):
+        compare_portfolio_with_benchmarks(portfolio, benchmarks, portfolio_name="^GSPC", factor_panel=panel)
+
+def test_print_benchmark_comparison(universe, capsys):
+    portfolio, benchmarks, panel = universe
+    comparison_df = compare_portfolio_with_benchmarks(portfolio, benchmarks, factor_panel=panel)
+    print_benchmark_comparison(comparison_df)
+    output = capsys.readouterr().out
+    assert "Portfolio vs. All Benchmarks" in output
+    assert "Tracking Error" in output and "HML" in output
+    assert "^RUT" in output
+    # Relative statistics of the portfolio against itself are undefined
+    tracking_line = next(line for line in output.splitlines() if line.startswith("Tracking Error"))
+    assert tracking_line.split()[2] == "-"
+
+def test_print_benchmark_comparison_invalid_inputs(universe):
+    portfolio, benchmarks, panel = universe
+    comparison_df = compare_portfolio_with_benchmarks(portfolio, benchmarks, factor_panel=panel)
+    with pytest.raises(TypeError):
+        print_benchmark_comparison(comparison_df.to_dict())
+    with pytest.raises(ValueError):
+        print_benchmark_comparison(comparison_df, column_width=0)
+    with pytest.raises(KeyError):
+        print_benchmark_comparison(comparison_df.drop(columns="beta"))
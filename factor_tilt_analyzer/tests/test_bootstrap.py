@@ -0,0 +1,91 @@
+import pytest
+import numpy as np
+import pandas as pd
+from ..analysis.bootstrap import bootstrap_indices, bootstrap_ols_coefficients, bootstrap_factor_exposures
+from ..analysis.factor_panel import FactorPanel
+
+# ------------------ Fixtures ------------------
+
+@pytest.fixture
+def factor_data():
+    rng = np.random.default_rng(21)
+    idx = pd.date_range("2005-01-01", periods=120, freq="MS")
+    factors = pd.DataFrame(rng.normal(0, 4, (120, 5)), index=idx, columns=["Mom", "Mkt_rf", "SMB", "HML", "Rf"])
+    factors["Rf"] = 0.1
+    excess = 0.2 + factors[["Mkt_rf", "SMB", "HML", "Mom"]] @ np.array([1.0, 0.3, -0.2, 0.1]) + rng.normal(0, 1, 120)
+    returns = (excess + factors["Rf"]) / 100
+    return FactorPanel(factors), returns
+
+# ------------------ Tests for bootstrap_indices ------------------
+
+@pytest.mark.parametrize("method", ["stationary", "moving"])
+def test_bootstrap_indices_shape_and_range(method):
+    indices = bootstrap_indices(50, 200, block_length=5, method=method, rng=np.random.default_rng(0))
+    assert indices.shape == (200, 50)
+    assert indices.min() >= 0 and indices.max() < 50
+
+def test_bootstrap_indices_block_structure():
+    indices = bootstrap_indices(100, 500, block_length=10, method="stationary", rng=np.random.default_rng(1))
+    # Within blocks consecutive indices follow each other (circularly)
+    continued = np.mean((indices[:, 1:] - indices[:, :-1]) % 100 == 1)
+    assert 0.85 < continued < 0.95 # Expected share of continued blocks: 1 - 1/10
+
+    moving = bootstrap_indices(100, 10, block_length=10, method="moving", rng=np.random.default_rng(2))
+    assert ((moving[:, 1:10] - moving[:, :9]) % 100 == 1).all()
+
+@pytest.mark.parametrize("kwargs", [
+    {"n_obs": 0, "n_replicates": 10, "block_length": 2},
+    {"n_obs": 10, "n_replicates": 10, "block_length": 0.5},
+    {"n_obs": 10, "n_replicates": 10, "block_length": 2, "method": "wild"}
+])
+def test_bootstrap_indices_invalid(kwargs):
+    with pytest.raises(ValueError):
+        bootstrap_indices(**kwargs)
+
+# ------------------ Tests for bootstrap_ols_coefficients ------------------
+
+def test_bootstrap_ols_coefficients_match_resampled_fits():
+    rng = np.random.default_rng(3)
+    X = np.column_stack([np.ones(40), rng.normal(size=(40, 2))])
+    y = X @ np.array([0.5, 1.0, -1.0]) + rng.normal(size=40)
+    indices = bootstrap_indices(40, 5, block_length=3, rng=rng)
+
+    coef = bootstrap_ols_coefficients(y, X, indices)
+    for b in range(5):
+        expected = np.linalg.lstsq(X[indices[b]], y[indices[b]], rcond=None)[0]
+        np.testing.assert_allclose(coef[b], expected)
+
+# ------------------ Tests for bootstrap_factor_exposures ------------------
+
+def test_bootstrap_factor_exposures(factor_data):
+    panel, returns = factor_data
+    result = bootstrap_factor_exposures(returns, n_replicates=2000, seed=7, factor_panel=panel)
+
+    assert list(result.index) == ["alpha", "Mkt_rf", "SMB", "HML", "Mom"]
+    assert list(result.columns) == ["estimate", "std_err", "ci_lower", "ci_upper"]
+    assert (result["ci_lower"] < result["estimate"]).all() and (result["estimate"] < result["ci_upper"]).all()
+    assert result.loc["Mkt_rf", "ci_lower"] < 1.0 < result.loc["Mkt_rf", "ci_upper"]
+
+def test_bootstrap_factor_exposures_reproducible_across_jobs(factor_data, monkeypatch):
+    panel, returns = factor_data
+    monkeypatch.setattr("factor_tilt_analyzer.analysis.bootstrap.bootstrap_chunk_size", 300)
+    serial = bootstrap_factor_exposures(returns, n_replicates=1000, seed=11, factor_panel=panel)
+    parallel = bootstrap_factor_exposures(returns, n_replicates=1000, seed=11, factor_panel=panel, n_jobs=2)
+    pd.testing.assert_frame_equal(serial, parallel)
+
+@pytest.mark.parametrize("kwargs, error", [
+    ({"n_replicates": 0}, ValueError),
+    ({"n_replicates": 10.0}, TypeError),
+    ({"confidence": 1.5}, ValueError),
+    ({"method": "wild"}, ValueError),
+    ({"block_length": 0.5}, ValueError)
+])
+def test_bootstrap_factor_exposures_invalid(factor_data, kwargs, error):
+    panel, returns = factor_data
+    with pytest.raises(error):
+        bootstrap_factor_exposures(returns, factor_panel=panel, **kwargs)
+
+def test_bootstrap_factor_exposures_too_short(factor_data):
+    panel, returns = factor_data
+    with pytest.raises(ValueError):
+        bootstrap_factor_exposures(returns.iloc[:8], factor_panel=panel)
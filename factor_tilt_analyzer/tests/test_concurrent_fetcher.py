@@ -0,0 +1,272 @@
+import time
+import random
+import pytest
+import pandas as pd
+from unittest.mock import patch
+from requests.exceptions import HTTPError
+from ..data.concurrent_fetcher import TokenBucket, retry_with_backoff, fetch_all_returns, fetch_and_validate_returns, fetch_returns_with_benchmarks, split_fetch_failures
+from ..data.data_fetcher import fetch_returns, fetch_benchmark_returns, YahooPriceSource
+from yfinance.exceptions import YFPricesMissingError
+# Imported via concurrent_fetcher, which loads the data package without the factor_tilt_analyzer prefix
+from ..data.concurrent_fetcher import NoDataError
+
+# ------------------ Helpers ------------------
+
+def make_history(ticker, start=None, end=None, interval="1mo", auto_adjust=False):
+    """Returns a monthly price history like yf.Ticker.history, with a different price path per ticker."""
+    idx = pd.date_range("2023-01-01", periods=6, freq="MS", tz="America/New_York")
+    step = 1 + len(ticker)
+    return pd.DataFrame({"Adj Close": [100.0 + step * i for i in range(6)]}, index=idx)
+
+def make_download(ticker, **kwargs):
+    """Returns the same prices as make_history in the format of yf.download."""
+    df = make_history(ticker)
+    df.index = df.index.tz_localize(None)
+    return df
+
+# ------------------ Tests for TokenBucket ------------------
+
+@pytest.mark.parametrize("rate, error", [(0, ValueError), (-1, ValueError), ("fast", TypeError)])
+def test_token_bucket_invalid_rate(rate, error):
+    with pytest.raises(error):
+        TokenBucket(rate)
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=50, capacity=1)
+    started = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    # First token is available immediately, the following five need 1/50 s each
+    assert time.monotonic() - started >= 0.09
+
+def test_token_bucket_too_many_tokens():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, capacity=2).acquire(3)
+
+# ------------------ Tests for retry_with_backoff ------------------
+
+def test_retry_with_backoff_succeeds_after_failures():
+    calls, delays = [], []
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ConnectionError("Temporary error")
+        return "ok"
+
+    result, attempts = retry_with_backoff(flaky, max_retries=3, backoff_base=1.0, backoff_max=10.0, rng=random.Random(0), sleep=delays.append)
+    assert result == "ok"
+    assert attempts == 3
+    # Full jitter: the n-th delay lies within [0, base * 2**(n-1)]
+    assert 0 <= delays[0] <= 1.0 and 0 <= delays[1] <= 2.0
+
+def test_retry_with_backoff_gives_up():
+    def failing():
+        raise ConnectionError("Permanent error")
+    with pytest.raises(ConnectionError):
+        retry_with_backoff(failing, max_retries=2, sleep=lambda _: None)
+
+def test_retry_with_backoff_does_not_retry_value_errors():
+    calls = []
+    def invalid():
+        calls.append(1)
+        raise ValueError("Invalid input")
+    with pytest.raises(ValueError):
+        retry_with_backoff(invalid, max_retries=3, sleep=lambda _: None)
+    assert len(calls) == 1
+
+def test_retry_with_backoff_does_not_retry_missing_data():
+    calls = []
+    def no_data():
+        calls.append(1)
+        raise NoDataError("No data")
+    with pytest.raises(NoDataError):
+        retry_with_backoff(no_data, max_retries=3, sleep=lambda _: None)
+    assert len(calls) == 1
+
+# ------------------ Tests for fetch_all_returns ------------------
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.download")
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.Ticker")
+def test_fetch_all_returns_matches_serial_functions(mock_ticker, mock_download):
+    mock_ticker.side_effect = lambda ticker: type("FakeTicker", (), {"history": lambda self, **kwargs: make_history(ticker)})()
+    mock_download.side_effect = make_download
+    tickers = ["AAPL", "MSFT", "KO"]
+
+    returns_df, mkt_returns_df, latencies = fetch_all_returns(tickers, "^GSPC", in_end="2024-01-01", requests_per_second=None)
+
+    pd.testing.assert_frame_equal(returns_df, fetch_returns(tickers, in_end="2024-01-01"))
+    pd.testing.assert_frame_equal(mkt_returns_df, fetch_benchmark_returns("^GSPC", in_end="2024-01-01"))
+    assert set(latencies) == {"AAPL", "MSFT", "KO", "^GSPC"}
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.Ticker")
+def test_fetch_all_returns_retries_transient_errors(mock_ticker):
+    failures = {"MSFT": 1}
+    def history(ticker):
+        if failures.get(ticker, 0) > 0:
+            failures[ticker] -= 1
+            raise ConnectionError("Temporary error")
+        return make_history(ticker)
+    mock_ticker.side_effect = lambda ticker: type("FakeTicker", (), {"history": lambda self, **kwargs: history(ticker)})()
+
+    with patch("factor_tilt_analyzer.data.concurrent_fetcher.time.sleep"):
+        returns_df, _, _ = fetch_all_returns(["AAPL", "MSFT"], "^GSPC", in_end="2024-01-01", requests_per_second=None)
+    assert list(returns_df.columns) == ["AAPL", "MSFT"]
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.download")
+def test_fetch_all_returns_retries_swallowed_transport_errors(mock_download):
+    # yf.download returns an empty frame for a failed request and only records the error
+    attempts = {"MSFT": 0}
+    def download(ticker, **kwargs):
+        if ticker == "MSFT" and attempts["MSFT"] == 0:
+            attempts["MSFT"] += 1
+            errors.update({"MSFT": "ConnectionError('Read timed out')"})
+            return pd.DataFrame()
+        errors.clear()
+        return make_download(ticker)
+    mock_download.side_effect = download
+
+    with patch.dict("yfinance.shared._ERRORS", clear=True) as errors, patch("factor_tilt_analyzer.data.concurrent_fetcher.time.sleep"):
+        returns_df, _, _ = fetch_all_returns(["AAPL", "MSFT"], "^GSPC", in_end="2024-01-01", requests_per_second=None,
+                                             max_workers=1, source=YahooPriceSource(threadsafe=False))
+    assert list(returns_df.columns) == ["AAPL", "MSFT"]
+    assert attempts["MSFT"] == 1
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.Ticker")
+def test_fetch_and_validate_returns_history_errors(mock_ticker):
+    calls = []
+    def history(ticker, **kwargs):
+        calls.append(ticker)
+        assert kwargs.get("raise_errors") is True # Failed requests must raise instead of returning an empty frame
+        if ticker == "XXXX":
+            raise YFPricesMissingError(ticker, "")
+        if ticker == "MSFT":
+            raise ConnectionError("Read timed out")
+        return make_history(ticker)
+    mock_ticker.side_effect = lambda ticker: type("FakeTicker", (), {"history": lambda self, **kwargs: history(ticker, **kwargs)})()
+
+    with patch("factor_tilt_analyzer.data.concurrent_fetcher.time.sleep"):
+        _, _, failures, _ = fetch_and_validate_returns(["AAPL", "MSFT", "XXXX"], "^GSPC", in_end="2024-01-01", requests_per_second=None, max_retries=2)
+    invalid, download_errors = split_fetch_failures(failures)
+    assert list(invalid) == ["XXXX"] and list(download_errors) == ["MSFT"]
+    # Missing data is not retried, transport errors are
+    assert calls.count("XXXX") == 1
+    assert calls.count("MSFT") == 3
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.Ticker")
+def test_fetch_all_returns_raises_for_missing_data(mock_ticker):
+    mock_ticker.return_value.history.return_value = pd.DataFrame()
+    with pytest.raises(HTTPError):
+        fetch_all_returns(["AAPL"], "^GSPC", in_end="2024-01-01", requests_per_second=None, max_retries=0)
+
+@pytest.mark.parametrize("max_workers, error", [(0, ValueError), (2.5, TypeError)])
+def test_fetch_all_returns_invalid_workers(max_workers, error):
+    with pytest.raises(error):
+        fetch_all_returns(["AAPL"], "^GSPC", max_workers=max_workers)
+
+def test_fetch_all_returns_invalid_benchmark():
+    with pytest.raises(ValueError):
+        fetch_all_returns(["AAPL"], "INVALID")
+
+# ------------------ Tests for fetch_and_validate_returns ------------------
+
+def fake_ticker_with_invalid(invalid, calls):
+    """Returns a yf.Ticker replacement that has no data for the tickers in invalid and counts the API calls."""
+    def history(ticker):
+        calls.append(ticker)
+        return pd.DataFrame() if ticker in invalid else make_history(ticker)
+    return lambda ticker: type("FakeTicker", (), {"history": lambda self, **kwargs: history(ticker)})()
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.Ticker")
+def test_fetch_and_validate_returns_single_call_per_ticker(mock_ticker):
+    calls = []
+    mock_ticker.side_effect = fake_ticker_with_invalid(set(), calls)
+
+    returns_df, mkt_returns_df, failures, _ = fetch_and_validate_returns(["AAPL", "MSFT"], "^GSPC", in_end="2024-01-01", requests_per_second=None)
+
+    assert failures == {}
+    assert list(returns_df.columns) == ["AAPL", "MSFT"]
+    assert list(mkt_returns_df.columns) == ["MKT"]
+    # One API call per ticker, no separate validation request
+    assert sorted(calls) == ["AAPL", "MSFT", "^GSPC"]
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.Ticker")
+def test_fetch_and_validate_returns_reports_invalid_tickers(mock_ticker):
+    calls = []
+    mock_ticker.side_effect = fake_ticker_with_invalid({"XXXX"}, calls)
+
+    returns_df, _, failures, _ = fetch_and_validate_returns(["AAPL", "XXXX", "MSFT"], "^GSPC", in_end="2024-01-01", requests_per_second=None, max_retries=3)
+
+    assert list(returns_df.columns) == ["AAPL", "MSFT"]
+    assert list(failures) == ["XXXX"]
+    assert "No data" in failures["XXXX"].message
+    assert failures["XXXX"].no_data and isinstance(failures["XXXX"].error, NoDataError)
+    # Missing data is definitive and not retried
+    assert calls.count("XXXX") == 1
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.Ticker")
+def test_fetch_and_validate_returns_reports_download_errors(mock_ticker):
+    def history(ticker):
+        if ticker == "MSFT":
+            raise ConnectionError("Network down")
+        return make_history(ticker)
+    mock_ticker.side_effect = lambda ticker: type("FakeTicker", (), {"history": lambda self, **kwargs: history(ticker)})()
+
+    _, _, failures, _ = fetch_and_validate_returns(["AAPL", "MSFT"], "^GSPC", in_end="2024-01-01", requests_per_second=None, max_retries=0)
+    assert not failures["MSFT"].no_data
+    assert isinstance(failures["MSFT"].error, ConnectionError)
+    assert "Network down" in failures["MSFT"].message
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.Ticker")
+def test_split_fetch_failures_separates_download_errors(mock_ticker):
+    def history(ticker):
+        if ticker == "MSFT":
+            raise ConnectionError("Network down")
+        return pd.DataFrame() if ticker == "XXXX" else make_history(ticker)
+    mock_ticker.side_effect = lambda ticker: type("FakeTicker", (), {"history": lambda self, **kwargs: history(ticker)})()
+
+    _, _, failures, _ = fetch_and_validate_returns(["AAPL", "MSFT", "XXXX"], "^GSPC", in_end="2024-01-01", requests_per_second=None, max_retries=0)
+    invalid, download_errors = split_fetch_failures(failures)
+    assert list(invalid) == ["XXXX"]
+    assert list(download_errors) == ["MSFT"]
+    assert "Network down" in download_errors["MSFT"].message
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.Ticker")
+def test_fetch_and_validate_returns_benchmark_failure(mock_ticker):
+    mock_ticker.side_effect = fake_ticker_with_invalid({"^GSPC"}, [])
+    with pytest.raises(RuntimeError):
+        fetch_and_validate_returns(["AAPL", "MSFT"], "^GSPC", in_end="2024-01-01", requests_per_second=None)
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.Ticker")
+def test_fetch_and_validate_returns_all_invalid(mock_ticker):
+    mock_ticker.side_effect = fake_ticker_with_invalid({"AAPL", "MSFT"}, [])
+    returns_df, _, failures, _ = fetch_and_validate_returns(["AAPL", "MSFT"], "^GSPC", in_end="2024-01-01", requests_per_second=None)
+    assert returns_df.empty
+    assert set(failures) == {"AAPL", "MSFT"}
+
+# ------------------ Tests for fetch_returns_with_benchmarks ------------------
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.Ticker")
+def test_fetch_returns_with_benchmarks_fetches_all_benchmarks_once(mock_ticker):
+    calls = []
+    mock_ticker.side_effect = fake_ticker_with_invalid({"XXXX"}, calls)
+
+    returns_df, benchmark_returns_df, failures, _ = fetch_returns_with_benchmarks(["AAPL", "XXXX", "MSFT"], in_end="2024-01-01", requests_per_second=None)
+
+    assert list(returns_df.columns) == ["AAPL", "MSFT"]
+    assert list(benchmark_returns_df.columns) == ["^IXIC", "^GSPC", "^RUT"]
+    assert list(failures) == ["XXXX"]
+    # Every benchmark equals the single-benchmark download
+    _, mkt_returns_df, _, _ = fetch_and_validate_returns(["AAPL"], "^RUT", in_end="2024-01-01", requests_per_second=None)
+    pd.testing.assert_series_equal(benchmark_returns_df["^RUT"], mkt_returns_df["MKT"], check_names=False)
+    assert sorted(calls[:6]) == ["AAPL", "MSFT", "XXXX", "^GSPC", "^IXIC", "^RUT"]
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.Ticker")
+def test_fetch_returns_with_benchmarks_benchmark_failure(mock_ticker):
+    mock_ticker.side_effect = fake_ticker_with_invalid({"^RUT"}, [])
+    with pytest.raises(RuntimeError):
+        fetch_returns_with_benchmarks(["AAPL", "MSFT"], in_end="2024-01-01", requests_per_second=None)
+
+@pytest.mark.parametrize("benchmark_tickers, error", [([], ValueError), (["INVALID"], ValueError), ("^GSPC", TypeError)])
+def test_fetch_returns_with_benchmarks_invalid_benchmarks(benchmark_tickers, error):
+    with pytest.raises(error):
+        fetch_returns_with_benchmarks(["AAPL"], benchmark_tickers)
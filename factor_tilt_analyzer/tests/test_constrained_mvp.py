@@ -0,0 +1,151 @@
+import pytest
+import numpy as np
+import pandas as pd
+from scipy import optimize
+from ..analysis.constrained_mvp import (
+    ActiveSetResult,
+    solve_active_set_qp,
+    solve_constrained_mvp,
+    calculate_constrained_mvp_weights,
+    calculate_constrained_mvp_portfolio
+)
+from ..analysis.minimum_variance_portfolio import calculate_mvp_weights, get_asset_factor_betas
+from ..analysis.factor_panel import FactorPanel
+
+# ------------------ Fixtures ------------------
+
+@pytest.fixture
+def returns_df():
+    # 120 months, 12 assets with a common factor, so the unconstrained MVP holds short positions
+    rng = np.random.default_rng(5)
+    market = rng.normal(0.01, 0.04, size=(120, 1))
+    data = market * rng.uniform(0.3, 1.7, size=12) + rng.normal(0, 0.02, size=(120, 12)) * rng.uniform(0.5, 2.0, size=12)
+    return pd.DataFrame(data, columns=[f"S{i}" for i in range(12)])
+
+@pytest.fixture
+def factor_universe(monkeypatch):
+    rng = np.random.default_rng(17)
+    idx = pd.date_range("2018-01-31", periods=60, freq="ME")
+    factors = pd.DataFrame(rng.normal(0.5, 4, (60, 5)), index=idx, columns=["Mkt_rf", "SMB", "HML", "Rf", "Mom"])
+    factors["Rf"] = 0.2
+    panel = FactorPanel(factors)
+    monkeypatch.setattr("analysis.portfolio_analyzer.get_factor_panel", lambda: panel)
+    loadings = rng.normal([1.0, 0.2, 0.0, 0.1], 0.5, size=(15, 4))
+    data = factors[["Mkt_rf", "SMB", "HML", "Mom"]].to_numpy() / 100 @ loadings.T + rng.normal(0, 0.02, (60, 15))
+    return pd.DataFrame(data, index=idx, columns=[f"S{i}" for i in range(15)])
+
+def reference_solution(H, lower, upper, C=None, d=None):
+    n = len(H)
+    constraints = [{"type": "eq", "fun": lambda x: x.sum() - 1}]
+    if C is not None:
+        constraints.append({"type": "ineq", "fun": lambda x: d - C @ x})
+    result = optimize.minimize(lambda x: 0.5 * x @ H @ x, np.full(n, 1 / n), jac=lambda x: H @ x,
+                               bounds=list(zip(lower, upper)), constraints=constraints, method="SLSQP",
+                               options={"ftol": 1e-15, "maxiter": 1000})
+    return result.x
+
+# ------------------ Tests for solve_active_set_qp ------------------
+
+def test_qp_matches_reference_solver():
+    rng = np.random.default_rng(0)
+    A = rng.normal(size=(30, 8))
+    H = A.T @ A / 30
+    lower, upper = np.zeros(8), np.full(8, 0.3)
+    C, d = np.array([[1, 1, 1, 0, 0, 0, 0, 0.0]]), np.array([0.2])
+    result = solve_active_set_qp(H, np.zeros(8), lower, upper, np.ones((1, 8)), np.ones(1), C, d)
+    assert isinstance(result, ActiveSetResult)
+    np.testing.assert_allclose(result.x, reference_solution(H, lower, upper, C, d), atol=1e-6)
+    assert result.objective == pytest.approx(0.5 * result.x @ H @ result.x)
+
+def test_qp_unconstrained_matches_closed_form():
+    rng = np.random.default_rng(1)
+    A = rng.normal(size=(40, 5))
+    H = A.T @ A / 40
+    result = solve_active_set_qp(H, np.zeros(5), np.full(5, -np.inf), np.full(5, np.inf), np.ones((1, 5)), np.ones(1))
+    expected = np.linalg.solve(H, np.ones(5))
+    np.testing.assert_allclose(result.x, expected / expected.sum(), rtol=1e-10)
+
+def test_qp_infeasible_constraints():
+    with pytest.raises(ValueError):
+        solve_active_set_qp(np.eye(3), np.zeros(3), np.zeros(3), np.full(3, 0.2), np.ones((1, 3)), np.ones(1))
+
+# ------------------ Tests for the constrained MVP ------------------
+
+def test_long_only_mvp(returns_df):
+    assert (calculate_mvp_weights(returns_df) < 0).any() # The closed-form solution is short some assets
+    weights, result = solve_constrained_mvp(returns_df)
+    H = returns_df.cov().to_numpy()
+    assert isinstance(weights, pd.Series)
+    assert list(weights.index) == list(returns_df.columns)
+    assert weights.sum() == pytest.approx(1.0)
+    assert (weights >= 0).all()
+    np.testing.assert_allclose(weights.to_numpy(), reference_solution(H, np.zeros(12), np.ones(12)), atol=1e-6)
+
+def test_box_and_group_constraints(returns_df):
+    groups = {f"S{i}": ("A" if i < 4 else "B") for i in range(12)}
+    weights = calculate_constrained_mvp_weights(returns_df, max_weight=0.15, groups=groups, group_caps={"A": 0.25})
+    assert weights.sum() == pytest.approx(1.0)
+    assert weights.max() <= 0.15 + 1e-12
+    assert weights.iloc[:4].sum() <= 0.25 + 1e-12
+    H = returns_df.cov().to_numpy()
+    C = np.array([[1.0] * 4 + [0.0] * 8])
+    np.testing.assert_allclose(weights.to_numpy(), reference_solution(H, np.zeros(12), np.full(12, 0.15), C, np.array([0.25])), atol=1e-6)
+
+def test_per_asset_limits(returns_df):
+    weights = calculate_constrained_mvp_weights(returns_df, min_weight=pd.Series({"S0": 0.1}), max_weight=pd.Series({"S1": 0.05}))
+    assert weights["S0"] >= 0.1 - 1e-12
+    assert weights["S1"] <= 0.05 + 1e-12
+    assert (weights >= -1e-12).all()
+
+def test_short_selling_allowed_matches_closed_form(returns_df):
+    weights = calculate_constrained_mvp_weights(returns_df, long_only=False)
+    np.testing.assert_allclose(weights.to_numpy(), calculate_mvp_weights(returns_df).to_numpy(), atol=1e-10)
+
+def test_warm_start_converges_faster(returns_df):
+    weights, cold = solve_constrained_mvp(returns_df.iloc[:-1], max_weight=0.2)
+    warm_weights, warm = solve_constrained_mvp(returns_df.iloc[1:], max_weight=0.2, previous_weights=weights)
+    _, cold_next = solve_constrained_mvp(returns_df.iloc[1:], max_weight=0.2)
+    assert warm.iterations < cold_next.iterations
+    np.testing.assert_allclose(warm_weights.to_numpy(), cold_next.x, atol=1e-9)
+
+def test_constrained_mvp_portfolio(returns_df):
+    portfolio_returns = calculate_constrained_mvp_portfolio(returns_df, long_only=True)
+    assert len(portfolio_returns) == len(returns_df)
+
+def test_constrained_mvp_factor_targets(factor_universe):
+    targets = {"HML": 0.0, "SMB": 0.1}
+    weights = calculate_constrained_mvp_weights(factor_universe, long_only=True, max_weight=0.3, factor_targets=targets)
+    assert np.isclose(weights.sum(), 1.0)
+    assert (weights >= -1e-10).all() and (weights <= 0.3 + 1e-10).all()
+    betas = get_asset_factor_betas(factor_universe)
+    np.testing.assert_allclose(weights @ betas[["HML", "SMB"]], [0.0, 0.1], atol=1e-8)
+
+    # Same solution as a general-purpose solver with the beta rows as equality constraints
+    cov = factor_universe.cov().to_numpy()
+    A = betas[["HML", "SMB"]].to_numpy().T
+    reference = optimize.minimize(lambda w: w @ cov @ w, np.full(15, 1 / 15), jac=lambda w: 2 * cov @ w, method="SLSQP",
+                                  bounds=[(0.0, 0.3)] * 15,
+                                  constraints=[{"type": "eq", "fun": lambda w: np.concatenate([[w.sum() - 1], A @ w - [0.0, 0.1]])}],
+                                  options={"ftol": 1e-15, "maxiter": 1000})
+    np.testing.assert_allclose(weights.to_numpy(), reference.x, atol=1e-5)
+
+    # Without bounds, the constrained solver matches the closed-form solution with factor targets
+    free = calculate_constrained_mvp_weights(factor_universe, long_only=False, factor_targets=targets)
+    np.testing.assert_allclose(free.to_numpy(), calculate_mvp_weights(factor_universe, factor_targets=targets).to_numpy(), atol=1e-8)
+
+def test_constrained_mvp_portfolio_factor_targets(factor_universe):
+    portfolio_returns = calculate_constrained_mvp_portfolio(factor_universe, long_only=True, factor_targets={"Mom": 0.0})
+    betas = get_asset_factor_betas(portfolio_returns.to_frame("MVP")).loc["MVP"]
+    assert betas["Mom"] == pytest.approx(0.0, abs=1e-8)
+
+def test_constrained_mvp_invalid_inputs(returns_df):
+    with pytest.raises(TypeError):
+        solve_constrained_mvp(returns_df.to_numpy())
+    with pytest.raises(ValueError):
+        solve_constrained_mvp(returns_df, max_weight=0.05) # 12 x 5% < 100%
+    with pytest.raises(ValueError):
+        solve_constrained_mvp(returns_df, groups={"S0": "A"}, group_caps={"C": 0.5})
+    with pytest.raises(ValueError):
+        solve_constrained_mvp(returns_df, cov_estimator="shrunk")
+    with pytest.raises(ValueError):
+        solve_constrained_mvp(returns_df, factor_targets={"RMW": 0.1})
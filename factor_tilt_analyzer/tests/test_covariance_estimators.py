@@ -0,0 +1,111 @@
+import pytest
+import pandas as pd
+import numpy as np
+from ..analysis.covariance_estimators import (
+    covariance_estimators,
+    estimate_covariance,
+    ledoit_wolf_covariance,
+    oas_covariance,
+    constant_correlation_covariance
+)
+
+
+# ------------------ Fixtures ------------------
+@pytest.fixture
+def short_returns():
+    # 24 months, 60 assets with a common market factor -> more assets than observations
+    rng = np.random.default_rng(3)
+    market = rng.normal(0.01, 0.04, size=(24, 1))
+    return market * rng.uniform(0.5, 1.5, size=60) + rng.normal(0, 0.03, size=(24, 60))
+
+@pytest.fixture
+def returns_df(short_returns):
+    return pd.DataFrame(short_returns[:, :5], columns=["AAPL", "MSFT", "GOOG", "AMZN", "TSLA"])
+
+
+# ------------------ Reference implementations (loops over periods) ------------------
+def reference_ledoit_wolf(returns):
+    T, N = returns.shape
+    X = returns - returns.mean(axis=0)
+    S = X.T @ X / T
+    mu = np.trace(S) / N
+    d2 = np.sum((S - mu * np.eye(N)) ** 2)
+    b2 = sum(np.sum((np.outer(x, x) - S) ** 2) for x in X) / T ** 2
+    delta = min(b2, d2) / d2
+    return delta * mu * np.eye(N) + (1 - delta) * S, delta
+
+def reference_constant_correlation(returns):
+    T, N = returns.shape
+    X = returns - returns.mean(axis=0)
+    S = X.T @ X / T
+    std = np.sqrt(np.diag(S))
+    corr = S / np.outer(std, std)
+    r_bar = (corr.sum() - N) / (N * (N - 1))
+    F = r_bar * np.outer(std, std)
+    np.fill_diagonal(F, np.diag(S))
+    pi_mat = np.zeros((N, N))
+    theta_ii = np.zeros((N, N))
+    for x in X:
+        pi_mat += (np.outer(x, x) - S) ** 2 / T
+        theta_ii += (x ** 2 - np.diag(S))[:, None] * (np.outer(x, x) - S) / T
+    rho = np.trace(pi_mat)
+    for i in range(N):
+        for j in range(N):
+            if i != j:
+                rho += r_bar / 2 * (std[j] / std[i] * theta_ii[i, j] + std[i] / std[j] * theta_ii[j, i])
+    delta = max(0.0, min(1.0, (pi_mat.sum() - rho) / np.sum((F - S) ** 2) / T))
+    return delta * F + (1 - delta) * S, delta
+
+
+# ------------------ Tests ------------------
+def test_sample_estimator_matches_pandas(returns_df):
+    cov, shrinkage = estimate_covariance(returns_df, "sample")
+    assert shrinkage == 0.0
+    pd.testing.assert_frame_equal(cov, returns_df.cov())
+
+def test_ledoit_wolf_matches_reference(short_returns):
+    cov, shrinkage = ledoit_wolf_covariance(short_returns)
+    expected_cov, expected_shrinkage = reference_ledoit_wolf(short_returns)
+    assert np.isclose(shrinkage, expected_shrinkage)
+    np.testing.assert_allclose(cov, expected_cov, rtol=1e-10, atol=1e-14)
+
+def test_constant_correlation_matches_reference(short_returns):
+    returns = short_returns[:, :8] # Small universe, so the target is not a perfect fit
+    cov, shrinkage = constant_correlation_covariance(returns)
+    expected_cov, expected_shrinkage = reference_constant_correlation(returns)
+    assert 0 <= shrinkage <= 1
+    assert np.isclose(shrinkage, expected_shrinkage)
+    np.testing.assert_allclose(cov, expected_cov, rtol=1e-10, atol=1e-14)
+
+def test_oas_shrinkage_formula(short_returns):
+    T, N = short_returns.shape
+    cov, shrinkage = oas_covariance(short_returns)
+    S = np.cov(short_returns, rowvar=False, bias=True)
+    mu = np.trace(S) / N
+    alpha = np.mean(S ** 2)
+    expected = min((alpha + mu ** 2) / ((T + 1) * (alpha - mu ** 2 / N)), 1.0)
+    assert np.isclose(shrinkage, expected)
+    np.testing.assert_allclose(cov, (1 - expected) * S + expected * mu * np.eye(N), rtol=1e-10, atol=1e-14)
+
+@pytest.mark.parametrize("estimator", ["ledoit_wolf", "constant_correlation", "oas"])
+def test_shrinkage_estimators_positive_definite_with_more_assets_than_periods(short_returns, estimator):
+    cov, shrinkage = covariance_estimators[estimator](short_returns)
+    assert cov.shape == (60, 60)
+    assert 0 < shrinkage <= 1
+    np.testing.assert_allclose(cov, cov.T)
+    assert np.linalg.eigvalsh(cov).min() > 0
+
+def test_estimate_covariance_invalid_inputs(returns_df):
+    with pytest.raises(TypeError):
+        estimate_covariance(returns_df.values)
+    with pytest.raises(ValueError):
+        estimate_covariance(returns_df, "shrunk")
+    with pytest.raises(ValueError):
+        estimate_covariance(returns_df.iloc[:1])
+    with pytest.raises(ValueError):
+        estimate_covariance(returns_df.where(returns_df > 0))
+
+def test_constant_correlation_zero_variance():
+    returns = np.column_stack([np.linspace(0, 1, 10), np.full(10, 0.01)])
+    with pytest.raises(ValueError):
+        constant_correlation_covariance(returns)
@@ -0,0 +1,70 @@
+import pytest
+import numpy as np
+from ..analysis.covariance_factorization import CovarianceFactorization, factorize_covariance
+
+
+# ------------------ Fixtures ------------------
+@pytest.fixture
+def cov_matrix():
+    rng = np.random.default_rng(0)
+    returns = rng.normal(0.01, 0.05, size=(120, 5))
+    return np.cov(returns, rowvar=False)
+
+@pytest.fixture
+def collinear_cov():
+    rng = np.random.default_rng(1)
+    returns = rng.normal(0.01, 0.05, size=(120, 3))
+    returns = np.column_stack([returns, returns[:, 0] + returns[:, 1]]) # Fourth asset is a combination of two others
+    return np.cov(returns, rowvar=False)
+
+
+# ------------------ Tests ------------------
+def test_cholesky_solve_matches_numpy(cov_matrix):
+    fact = factorize_covariance(cov_matrix)
+    b = np.arange(1.0, 6.0)
+    assert isinstance(fact, CovarianceFactorization)
+    assert fact.method == "cholesky"
+    assert fact.ridge == 0.0
+    assert fact.size == 5
+    np.testing.assert_allclose(fact.solve(b), np.linalg.solve(cov_matrix, b), rtol=1e-10)
+    np.testing.assert_allclose(fact.solve(np.eye(5)), np.linalg.inv(cov_matrix), rtol=1e-8)
+
+def test_condition_number_estimate(cov_matrix):
+    fact = factorize_covariance(cov_matrix)
+    exact = np.linalg.cond(cov_matrix, 1)
+    # LAPACK's estimate is a lower bound that is usually within a small factor of the exact value
+    assert exact / 10 <= fact.condition_number <= exact * (1 + 1e-8)
+
+def test_ridge_fallback_on_collinear_matrix(collinear_cov):
+    fact = factorize_covariance(collinear_cov, max_condition=1e8)
+    assert fact.method == "ridge"
+    assert fact.ridge > 0
+    assert fact.condition_number > 1e8
+    x = fact.solve(np.ones(4))
+    assert np.isfinite(x).all()
+    np.testing.assert_allclose((collinear_cov + fact.ridge * np.eye(4)) @ x, np.ones(4), rtol=1e-6)
+
+def test_pinv_fallback_on_collinear_matrix(collinear_cov):
+    fact = factorize_covariance(collinear_cov, max_condition=1e8, fallback="pinv")
+    assert fact.method == "pinv"
+    assert fact.cholesky is None
+    np.testing.assert_allclose(fact.solve(np.ones(4)), np.linalg.pinv(collinear_cov, rcond=1e-8) @ np.ones(4), rtol=1e-8)
+
+def test_low_threshold_triggers_fallback(cov_matrix):
+    assert factorize_covariance(cov_matrix, max_condition=1.5).method == "ridge"
+
+def test_invalid_inputs(cov_matrix):
+    with pytest.raises(TypeError):
+        factorize_covariance(np.ones(3))
+    with pytest.raises(TypeError):
+        factorize_covariance(np.ones((2, 3)))
+    with pytest.raises(ValueError):
+        factorize_covariance(np.zeros((3, 3)))
+    with pytest.raises(ValueError):
+        factorize_covariance(np.array([[1.0, np.nan], [np.nan, 1.0]]))
+    with pytest.raises(ValueError):
+        factorize_covariance(cov_matrix, max_condition=1)
+    with pytest.raises(ValueError):
+        factorize_covariance(cov_matrix, fallback="svd")
+    with pytest.raises(ValueError):
+        factorize_covariance(-np.eye(3))
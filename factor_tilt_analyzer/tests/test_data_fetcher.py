@@ -2,7 +2,7 @@ import pytest
 from unittest.mock import patch
 import pandas as pd
 from requests.exceptions import HTTPError
-from ..data.data_fetcher import get_start_date, fetch_returns, fetch_benchmark_returns
+from ..data.data_fetcher import get_start_date, fetch_returns, fetch_returns_bulk, fetch_benchmark_returns
 
 # === Tests for get_start_date ===
 
@@ -100,3 +100,93 @@ def test_fetch_benchmark_returns_multiple_columns(mock_fetch_returns):
 
     with pytest.raises(ValueError):
         fetch_benchmark_returns("^GSPC") # must contain exactly one column
+
+@patch("factor_tilt_analyzer.data.data_fetcher.fetch_cached_prices")
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.download")
+def test_fetch_returns_uses_cache(mock_download, mock_cached_prices):
+    date_index = pd.date_range(start="2023-01-01", periods=5, freq="MS")
+    mock_cached_prices.return_value = pd.Series([100, 105, 110, 120, 130], index=date_index, dtype=float, name="AAPL")
+
+    df = fetch_returns(["AAPL"], in_end="2024-01-01", use_cache=True)
+    assert list(df.columns) == ["AAPL"]
+    assert len(df) == 4
+    mock_download.assert_not_called()
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.download")
+def test_fetch_returns_multiindex_columns(mock_download):
+    date_index = pd.date_range(start="2023-01-01", periods=3, freq="MS")
+    columns = pd.MultiIndex.from_tuples([("Adj Close", "AAPL"), ("Close", "AAPL")], names=["Price", "Ticker"])
+    mock_download.return_value = pd.DataFrame([[100, 100], [110, 110], [121, 121]], index=date_index, columns=columns)
+
+    df = fetch_returns(["AAPL"], in_end="2024-01-01")
+    assert list(df.columns) == ["AAPL"]
+    assert df["AAPL"].round(4).tolist() == [0.1, 0.1]
+
+# === Tests for fetch_returns_bulk ===
+
+def make_bulk_download(tickers, periods=5):
+    """Builds a (Price, Ticker) MultiIndex DataFrame as returned by yf.download for several tickers."""
+    date_index = pd.date_range(start="2023-01-01", periods=periods, freq="MS")
+    columns = pd.MultiIndex.from_product([["Adj Close", "Close"], tickers], names=["Price", "Ticker"])
+    data = [[100 + i * (j + 1) for _ in range(2) for j in range(len(tickers))] for i in range(periods)]
+    return pd.DataFrame(data, index=date_index, columns=columns, dtype=float)
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.download")
+def test_fetch_returns_bulk_chunks_and_matches_per_ticker(mock_download):
+    mock_download.side_effect = lambda tickers, **kwargs: make_bulk_download(tickers)
+
+    returns_df, failures = fetch_returns_bulk(["AAPL", "MSFT", "KO"], in_end="2024-01-01", chunk_size=2)
+    assert failures == {}
+    assert list(returns_df.columns) == ["AAPL", "MSFT", "KO"]
+    assert mock_download.call_count == 2 # [AAPL, MSFT] and [KO]
+    assert len(returns_df) == 4
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.download")
+def test_fetch_returns_bulk_reports_missing_ticker(mock_download):
+    def download(tickers, **kwargs):
+        df = make_bulk_download(tickers)
+        df.loc[:, (slice(None), "BAD")] = float("nan") # No data for BAD
+        return df
+    mock_download.side_effect = download
+
+    returns_df, failures = fetch_returns_bulk(["AAPL", "BAD"], in_end="2024-01-01")
+    assert list(returns_df.columns) == ["AAPL"]
+    assert set(failures) == {"BAD"}
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.download")
+def test_fetch_returns_bulk_failed_chunk_does_not_abort(mock_download):
+    def download(tickers, **kwargs):
+        if "KO" in tickers:
+            raise ConnectionError("Network error")
+        return make_bulk_download(tickers)
+    mock_download.side_effect = download
+
+    returns_df, failures = fetch_returns_bulk(["AAPL", "MSFT", "KO"], in_end="2024-01-01", chunk_size=2)
+    assert list(returns_df.columns) == ["AAPL", "MSFT"]
+    assert "Network error" in failures["KO"]
+
+@patch("factor_tilt_analyzer.data.data_fetcher.update_cached_prices")
+@patch("factor_tilt_analyzer.data.data_fetcher.get_cached_missing_ranges")
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.download")
+def test_fetch_returns_bulk_redownloads_rescaled_cache(mock_download, mock_missing_ranges, mock_update):
+    mock_download.side_effect = lambda tickers, **kwargs: make_bulk_download(tickers if isinstance(tickers, list) else [tickers])
+    mock_missing_ranges.return_value = [("2023-11-01", "2024-01-01")]
+    # The cached history was rescaled (see update_cached_prices()), the second call stores the full window
+    mock_update.side_effect = [None, make_bulk_download(["AAPL"])[("Adj Close", "AAPL")]]
+
+    returns_df, failures = fetch_returns_bulk(["AAPL"], in_end="2024-01-01", use_cache=True)
+    assert failures == {}
+    assert len(returns_df) == 4
+    assert mock_download.call_count == 2
+    assert mock_download.call_args.kwargs["start"] == "2022-01-01" # Whole default 2y window
+
+@pytest.mark.parametrize("chunk_size, error", [(0, ValueError), (1.5, TypeError)])
+def test_fetch_returns_bulk_invalid_chunk_size(chunk_size, error):
+    with pytest.raises(error):
+        fetch_returns_bulk(["AAPL"], chunk_size=chunk_size)
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.download")
+def test_fetch_returns_bulk_mode_raises_on_failure(mock_download):
+    mock_download.return_value = pd.DataFrame()
+    with pytest.raises(HTTPError):
+        fetch_returns(["AAPL", "MSFT"], in_end="2024-01-01", bulk=True)
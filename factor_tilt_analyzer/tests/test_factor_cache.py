@@ -0,0 +1,60 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from ..data.factor_cache import read_factor_cache, write_factor_cache, get_factor_cache_prefix, META_SUFFIX
+
+# ------------------ Fixtures ------------------
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "factors.csv"
+    path.write_text(",A,B\n202001,1.0,2.0\n202002,3.0,4.0\n")
+    return str(path)
+
+@pytest.fixture
+def arrays():
+    values = np.array([[1.0, 2.0], [3.0, 4.0]])
+    index = pd.to_datetime(["2020-01-01", "2020-02-01"]).to_numpy()
+    return values, index
+
+# ------------------ Tests for read_factor_cache and write_factor_cache ------------------
+
+def test_factor_cache_roundtrip_is_memory_mapped(csv_path, arrays, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    write_factor_cache(csv_path, *arrays, cache_dir=cache_dir)
+
+    values, index = read_factor_cache(csv_path, cache_dir=cache_dir)
+    np.testing.assert_array_equal(values, arrays[0])
+    np.testing.assert_array_equal(index, arrays[1])
+    assert isinstance(values, np.memmap)
+
+def test_factor_cache_missing_entry(csv_path, tmp_path):
+    assert read_factor_cache(csv_path, cache_dir=str(tmp_path / "cache")) is None
+
+def test_factor_cache_invalidated_by_content_change(csv_path, arrays, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    write_factor_cache(csv_path, *arrays, cache_dir=cache_dir)
+    with open(csv_path, "a") as f:
+        f.write("202003,5.0,6.0\n")
+    assert read_factor_cache(csv_path, cache_dir=cache_dir) is None
+
+def test_factor_cache_survives_touch(csv_path, arrays, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    write_factor_cache(csv_path, *arrays, cache_dir=cache_dir)
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    # Same content -> the content hash keeps the entry valid
+    assert read_factor_cache(csv_path, cache_dir=cache_dir) is not None
+
+def test_factor_cache_corrupted_meta(csv_path, arrays, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    write_factor_cache(csv_path, *arrays, cache_dir=cache_dir)
+    with open(get_factor_cache_prefix(csv_path, cache_dir) + META_SUFFIX, "w") as f:
+        f.write("{not json")
+    assert read_factor_cache(csv_path, cache_dir=cache_dir) is None
+
+def test_factor_cache_prefix_depends_on_directory(tmp_path):
+    first = get_factor_cache_prefix(str(tmp_path / "a" / "factors.csv"), cache_dir="cache")
+    second = get_factor_cache_prefix(str(tmp_path / "b" / "factors.csv"), cache_dir="cache")
+    assert first != second
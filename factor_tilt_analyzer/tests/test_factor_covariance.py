@@ -0,0 +1,60 @@
+import pytest
+import numpy as np
+import pandas as pd
+from ..analysis.factor_covariance import FactorCovariance, estimate_factor_covariance
+from ..analysis.factor_panel import FactorPanel
+from ..analysis.ols_engine import fit_ols
+
+# ------------------ Fixtures ------------------
+
+@pytest.fixture
+def factor_panel():
+    rng = np.random.default_rng(21)
+    idx = pd.date_range("2015-01-01", periods=84, freq="MS")
+    return FactorPanel(pd.DataFrame(rng.normal(0.5, 4, (84, 5)), index=idx, columns=["Mkt_rf", "SMB", "HML", "Rf", "Mom"]))
+
+@pytest.fixture
+def asset_returns(factor_panel):
+    # 60 months of 40 assets driven by the factors (in percent in the panel, decimal returns here)
+    rng = np.random.default_rng(22)
+    idx = pd.date_range("2017-01-31", periods=60, freq="ME")
+    factors = factor_panel.to_frame().loc["2017-01":"2021-12", ["Mkt_rf", "SMB", "HML", "Mom"]].to_numpy() / 100
+    loadings = rng.normal([1.0, 0.2, 0.1, 0.0], 0.3, size=(40, 4))
+    returns = 0.002 + factors @ loadings.T + rng.normal(0, 0.02, size=(60, 40))
+    return pd.DataFrame(returns, index=idx, columns=[f"S{i}" for i in range(40)])
+
+# ------------------ Tests ------------------
+
+def test_loadings_match_single_regressions(asset_returns, factor_panel):
+    fc = estimate_factor_covariance(asset_returns, factor_panel)
+    factors = factor_panel.to_frame().loc["2017-01":"2021-12", ["Mkt_rf", "SMB", "HML", "Mom"]].reset_index(drop=True) / 100
+    fit = fit_ols(asset_returns["S3"].reset_index(drop=True), factors)
+    assert isinstance(fc, FactorCovariance)
+    assert fc.size == 40
+    np.testing.assert_allclose(fc.loadings.loc["S3"].to_numpy(), fit.betas.to_numpy(), rtol=1e-8)
+    assert fc.specific_var["S3"] == pytest.approx(fit.ssr / fit.df_resid)
+    np.testing.assert_allclose(fc.factor_cov.to_numpy(), np.cov(factors.to_numpy(), rowvar=False), rtol=1e-10)
+
+def test_woodbury_solve_matches_dense(asset_returns, factor_panel):
+    fc = estimate_factor_covariance(asset_returns, factor_panel)
+    dense = fc.to_dense().to_numpy()
+    b = np.random.default_rng(0).normal(size=(40, 3))
+    np.testing.assert_allclose(fc.solve(b), np.linalg.solve(dense, b), rtol=1e-7)
+    np.testing.assert_allclose(fc.solve(b[:, 0]), np.linalg.solve(dense, b[:, 0]), rtol=1e-7)
+    w = np.full(40, 1 / 40)
+    assert fc.portfolio_variance(w) == pytest.approx(w @ dense @ w)
+
+def test_months_without_factor_data_are_skipped(asset_returns, factor_panel):
+    extended = pd.concat([asset_returns, asset_returns.iloc[:3].set_axis(pd.date_range("2030-01-31", periods=3, freq="ME"))])
+    fc = estimate_factor_covariance(extended, factor_panel)
+    pd.testing.assert_frame_equal(fc.loadings, estimate_factor_covariance(asset_returns, factor_panel).loadings)
+
+def test_invalid_inputs(asset_returns, factor_panel):
+    with pytest.raises(TypeError):
+        estimate_factor_covariance(asset_returns.to_numpy(), factor_panel)
+    with pytest.raises(TypeError):
+        estimate_factor_covariance(asset_returns.reset_index(drop=True), factor_panel)
+    with pytest.raises(ValueError):
+        estimate_factor_covariance(asset_returns.iloc[:5], factor_panel)
+    with pytest.raises(ValueError):
+        estimate_factor_covariance(asset_returns.where(asset_returns > 0), factor_panel)
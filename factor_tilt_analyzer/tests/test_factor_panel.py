@@ -0,0 +1,59 @@
+import pytest
+import numpy as np
+import pandas as pd
+from ..analysis.factor_panel import FactorPanel, to_period_ordinals
+
+# ------------------ Fixtures ------------------
+
+@pytest.fixture
+def factors():
+    # Monthly factors with a gap in April 2020
+    idx = pd.to_datetime(["2020-01-01", "2020-02-01", "2020-03-01", "2020-05-01", "2020-06-01"])
+    return pd.DataFrame({"A": [1.0, 2.0, 3.0, 5.0, 6.0], "B": [10.0, 20.0, 30.0, 50.0, 60.0]}, index=idx)
+
+# ------------------ Tests for to_period_ordinals ------------------
+
+def test_to_period_ordinals_same_month():
+    dates = pd.to_datetime(["2020-01-01", "2020-01-31", "2020-02-01"])
+    assert list(to_period_ordinals(dates)) == [2020 * 12, 2020 * 12, 2020 * 12 + 1]
+
+def test_to_period_ordinals_invalid_type():
+    with pytest.raises(TypeError):
+        to_period_ordinals(["2020-01-01"])
+
+# ------------------ Tests for FactorPanel ------------------
+
+def test_factor_panel_dense_grid(factors):
+    panel = FactorPanel(factors)
+    assert len(panel) == 6
+    assert np.isnan(panel.values[3]).all() # April is missing
+    assert not panel.values.flags.writeable
+
+def test_factor_panel_window_is_view(factors):
+    panel = FactorPanel(factors)
+    window = panel.window("2020-02-15", "2020-03-31")
+    np.testing.assert_array_equal(window, [[2.0, 20.0], [3.0, 30.0]])
+    assert np.shares_memory(window, panel.values)
+    # Windows are clipped to the panel
+    assert panel.window("2019-01-01", "2020-01-01").shape == (1, 2)
+    assert panel.window("2021-01-01", "2021-12-01").shape == (0, 2)
+
+def test_factor_panel_lookup(factors):
+    panel = FactorPanel(factors)
+    dates = pd.to_datetime(["2019-12-31", "2020-01-31", "2020-04-30", "2020-06-30"])
+    values, found = panel.lookup(dates)
+    assert list(found) == [False, True, False, True]
+    np.testing.assert_array_equal(values[found], [[1.0, 10.0], [6.0, 60.0]])
+
+def test_factor_panel_to_frame(factors):
+    frame = FactorPanel(factors).to_frame()
+    pd.testing.assert_frame_equal(frame.dropna(), factors, check_freq=False)
+
+@pytest.mark.parametrize("factors_df, error", [
+    (pd.DataFrame({"A": [1.0]}), TypeError),
+    (pd.DataFrame({"A": []}, index=pd.DatetimeIndex([])), ValueError),
+    (pd.DataFrame({"A": [1.0, 2.0]}, index=pd.to_datetime(["2020-01-01", "2020-01-15"])), ValueError)
+])
+def test_factor_panel_invalid_input(factors_df, error):
+    with pytest.raises(error):
+        FactorPanel(factors_df)
@@ -0,0 +1,81 @@
+import pytest
+import numpy as np
+import pandas as pd
+from ..analysis.factor_regression_index import FactorRegressionIndex, build_factor_regression_index
+from ..analysis.ols_engine import fit_ols
+from ..analysis.factor_panel import FactorPanel
+
+# ------------------ Fixtures ------------------
+
+@pytest.fixture
+def regression_data():
+    rng = np.random.default_rng(11)
+    idx = pd.date_range("2000-01-01", periods=240, freq="MS")
+    # Large offsets test the accuracy of the differences of prefix sums
+    X = pd.DataFrame(rng.normal(100, 2, (240, 3)), index=idx, columns=["A", "B", "C"])
+    y = pd.Series(1.0 + X @ np.array([0.8, -0.3, 0.5]) + rng.normal(0, 1, 240), index=idx)
+    return y, X
+
+# ------------------ Tests for FactorRegressionIndex ------------------
+
+@pytest.mark.parametrize("start, end", [("2008-01", "2009-12"), ("2000-01-15", "2019-12-31"), ("2015-03", "2016-01")])
+def test_query_matches_direct_fit(regression_data, start, end):
+    y, X = regression_data
+    result = FactorRegressionIndex(y, X).query(start, end)
+
+    mask = (y.index >= pd.Timestamp(start).to_period("M").to_timestamp()) & (y.index <= pd.Timestamp(end))
+    direct = fit_ols(y[mask], X[mask])
+    np.testing.assert_allclose(result[direct.params.index].to_numpy(float), direct.params.to_numpy(), rtol=1e-7)
+    assert result["r_squared"] == pytest.approx(direct.rsquared, rel=1e-7)
+    assert result["nobs"] == direct.nobs
+
+def test_query_many_matches_query(regression_data):
+    index = FactorRegressionIndex(*regression_data)
+    intervals = [("2008-01", "2009-12"), ("2020-01", "2020-12"), ("2001-06", "2003-06"), ("2005-01", "2005-02")]
+    results_df = index.query_many(intervals)
+
+    assert list(results_df.columns) == ["start", "end", "const", "A", "B", "C", "r_squared", "nobs"]
+    for row, (start, end) in zip(results_df.itertuples(index=False), intervals):
+        single = index.query(start, end)
+        np.testing.assert_allclose(np.array(row[2:], dtype=float), single.to_numpy(float), equal_nan=True)
+    # Intervals without data or with too few observations have no estimate
+    assert results_df.loc[1, "nobs"] == 0 and np.isnan(results_df.loc[1, "const"])
+    assert np.isnan(results_df.loc[3, "A"])
+
+def test_query_singular_interval():
+    idx = pd.date_range("2020-01-01", periods=12, freq="MS")
+    X = pd.DataFrame({"A": [1.0] * 6 + list(range(6)), "B": np.arange(12.0) ** 2}, index=idx)
+    y = pd.Series(np.arange(12.0), index=idx)
+    results_df = FactorRegressionIndex(y, X).query_many([("2020-01", "2020-06"), ("2020-01", "2020-12")])
+    assert np.isnan(results_df.loc[0, "A"]) # A is constant in the first half
+    assert not np.isnan(results_df.loc[1, "A"])
+
+def test_unsorted_input_is_sorted(regression_data):
+    y, X = regression_data
+    shuffled = np.random.default_rng(0).permutation(len(y))
+    pd.testing.assert_series_equal(
+        FactorRegressionIndex(y.iloc[shuffled], X.iloc[shuffled]).query("2008-01", "2009-12"),
+        FactorRegressionIndex(y, X).query("2008-01", "2009-12")
+    )
+
+@pytest.mark.parametrize("make_input, error", [
+    (lambda y, X: (y.to_numpy(), X), TypeError),
+    (lambda y, X: (y.iloc[1:], X), ValueError),
+    (lambda y, X: (y.where(y.index != y.index[3]), X), ValueError)
+])
+def test_invalid_inputs(regression_data, make_input, error):
+    with pytest.raises(error):
+        FactorRegressionIndex(*make_input(*regression_data))
+
+# ------------------ Tests for build_factor_regression_index ------------------
+
+def test_build_factor_regression_index():
+    rng = np.random.default_rng(12)
+    idx = pd.date_range("2006-01-01", periods=72, freq="MS")
+    panel = FactorPanel(pd.DataFrame(rng.normal(0, 1, (72, 5)), index=idx, columns=["Mom", "Mkt_rf", "SMB", "HML", "Rf"]))
+    returns = pd.Series(rng.normal(0, 0.03, 72), index=idx)
+
+    index = build_factor_regression_index(returns, factor_panel=panel)
+    result = index.query("2008-01", "2009-12")
+    assert list(result.index) == ["alpha", "Mkt_rf", "SMB", "HML", "Mom", "r_squared", "nobs"]
+    assert result["nobs"] == 24
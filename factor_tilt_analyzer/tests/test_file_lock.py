@@ -0,0 +1,80 @@
+import os
+import time
+import pytest
+from ..utils import file_lock as file_lock_module
+from ..utils.file_lock import file_lock, read_lock_state, is_lock_stale
+
+# ------------------ Helpers ------------------
+
+def write_lock(lock_path, owner, age=0.0):
+    """Writes a lock file of another holder with the given age in seconds."""
+    with open(lock_path, "w") as f:
+        f.write(owner)
+    mtime = time.time() - age
+    os.utime(lock_path, (mtime, mtime))
+
+# ------------------ Tests for is_lock_stale ------------------
+
+def test_lock_is_stale_only_if_old_and_owner_not_running(tmp_path):
+    lock_path = str(tmp_path / "entry.lock")
+    write_lock(lock_path, "999999999:dead", age=600)
+    assert is_lock_stale(read_lock_state(lock_path), stale_after=120)
+    assert not is_lock_stale(read_lock_state(lock_path), stale_after=1200)
+
+@pytest.mark.skipif(os.name != "posix", reason="Process liveness is only probed on POSIX systems")
+def test_lock_of_running_owner_is_not_stale(tmp_path):
+    lock_path = str(tmp_path / "entry.lock")
+    write_lock(lock_path, f"{os.getpid()}:other", age=600)
+    assert not is_lock_stale(read_lock_state(lock_path), stale_after=120)
+
+# ------------------ Tests for file_lock ------------------
+
+def test_file_lock_writes_owner_and_releases(tmp_path):
+    lock_path = str(tmp_path / "sub" / "entry.lock")
+    with file_lock(lock_path):
+        owner = read_lock_state(lock_path)[0]
+        assert owner.startswith(f"{os.getpid()}:")
+    assert not os.path.exists(lock_path)
+
+def test_file_lock_removes_abandoned_lock(tmp_path):
+    lock_path = str(tmp_path / "entry.lock")
+    write_lock(lock_path, "999999999:dead", age=600)
+    with file_lock(lock_path, timeout=1.0):
+        assert read_lock_state(lock_path)[0].startswith(f"{os.getpid()}:")
+
+def test_file_lock_times_out_on_held_lock(tmp_path):
+    lock_path = str(tmp_path / "entry.lock")
+    write_lock(lock_path, f"{os.getpid()}:other")
+    with pytest.raises(TimeoutError):
+        with file_lock(lock_path, timeout=0.1):
+            pass
+    assert read_lock_state(lock_path)[0] == f"{os.getpid()}:other"
+
+def test_file_lock_keeps_lock_taken_over_by_another_holder(tmp_path):
+    lock_path = str(tmp_path / "entry.lock")
+    with file_lock(lock_path):
+        # Another holder took over the lock, e.g., after this one was considered abandoned
+        os.remove(lock_path)
+        write_lock(lock_path, "12345:other")
+    assert read_lock_state(lock_path)[0] == "12345:other"
+
+def test_file_lock_rechecks_stale_lock_before_removal(tmp_path, monkeypatch):
+    lock_path = str(tmp_path / "entry.lock")
+    write_lock(lock_path, "999999999:dead", age=600)
+
+    # Between the staleness check and the removal, another waiter removes the stale lock and acquires it
+    read_state = file_lock_module.read_lock_state
+    calls = []
+    def racing_read_lock_state(path):
+        state = read_state(path)
+        calls.append(state)
+        if len(calls) == 1:
+            os.remove(path)
+            write_lock(path, f"{os.getpid()}:waiter")
+        return state
+    monkeypatch.setattr(file_lock_module, "read_lock_state", racing_read_lock_state)
+
+    with pytest.raises(TimeoutError):
+        with file_lock(lock_path, timeout=0.1):
+            pass
+    assert read_state(lock_path)[0] == f"{os.getpid()}:waiter"
@@ -1,10 +1,14 @@
 import pytest
 import pandas as pd
 import numpy as np
+from scipy import optimize
 from ..analysis.minimum_variance_portfolio import (
     calculate_mvp_weights,
-    calculate_mvp_portfolio
+    calculate_mvp_portfolio,
+    solve_mvp,
+    get_asset_factor_betas
 )
+from ..analysis.factor_panel import FactorPanel
 
 
 # ------------------ Fixtures ------------------
@@ -81,3 +85,112 @@ def test_mvp_portfolio_nan_input(mock_returns_df_with_nan):
 def test_mvp_portfolio_invalid_input_type():
     with pytest.raises(TypeError):
         calculate_mvp_portfolio([0.01, 0.02, 0.03])
+
+def test_mvp_weights_match_closed_form(mock_returns_df):
+    inv_cov = np.linalg.inv(mock_returns_df.cov().values)
+    expected = inv_cov @ np.ones(3) / (np.ones(3) @ inv_cov @ np.ones(3))
+    np.testing.assert_allclose(calculate_mvp_weights(mock_returns_df).values, expected, rtol=1e-10)
+
+def test_solve_mvp_reports_factorization(mock_returns_df):
+    weights, factorization = solve_mvp(mock_returns_df)
+    assert factorization.method == "cholesky"
+    assert np.isfinite(factorization.condition_number)
+    pd.testing.assert_series_equal(weights, calculate_mvp_weights(mock_returns_df))
+
+def test_mvp_weights_collinear_assets_use_fallback(mock_returns_df):
+    df = mock_returns_df.assign(MIX=mock_returns_df["AAPL"] + mock_returns_df["GOOG"])
+    for fallback in ("ridge", "pinv"):
+        weights, factorization = solve_mvp(df, fallback=fallback)
+        assert factorization.method == fallback
+        assert np.isfinite(weights).all()
+        assert np.isclose(weights.sum(), 1.0)
+
+def test_mvp_weights_many_assets():
+    rng = np.random.default_rng(7)
+    factor = rng.normal(0.01, 0.04, size=(1500, 1))
+    df = pd.DataFrame(factor + rng.normal(0, 0.02, size=(1500, 1000)))
+    weights, factorization = solve_mvp(df)
+    cov = df.cov().values
+    # Optimality: Σw is proportional to the vector of ones
+    gradient = cov @ weights.values
+    assert np.isclose(weights.sum(), 1.0)
+    np.testing.assert_allclose(gradient, gradient.mean(), rtol=1e-6)
+
+@pytest.mark.parametrize("estimator", ["ledoit_wolf", "constant_correlation", "oas"])
+def test_mvp_weights_more_assets_than_periods(estimator):
+    rng = np.random.default_rng(11)
+    df = pd.DataFrame(rng.normal(0.01, 0.04, size=(24, 1)) + rng.normal(0, 0.03, size=(24, 100)))
+    with pytest.raises(ValueError):
+        calculate_mvp_weights(df, cov_estimator="sample")
+    weights = calculate_mvp_weights(df, cov_estimator=estimator)
+    assert np.isfinite(weights).all()
+    assert np.isclose(weights.sum(), 1.0)
+    assert len(calculate_mvp_portfolio(df, cov_estimator=estimator)) == 24
+
+def test_mvp_weights_invalid_estimator(mock_returns_df):
+    with pytest.raises(ValueError):
+        calculate_mvp_weights(mock_returns_df, cov_estimator="shrunk")
+
+def test_mvp_weights_factor_model_many_assets(monkeypatch):
+    rng = np.random.default_rng(13)
+    idx = pd.date_range("2019-01-31", periods=36, freq="ME")
+    factors = pd.DataFrame(rng.normal(0.5, 4, (36, 5)), index=idx, columns=["Mkt_rf", "SMB", "HML", "Rf", "Mom"])
+    monkeypatch.setattr("analysis.factor_covariance.get_factor_panel", lambda: FactorPanel(factors))
+
+    # 2,000 assets on 36 months: the sample covariance is singular, the factor model is not
+    loadings = rng.normal(1.0, 0.3, size=(2000, 4))
+    df = pd.DataFrame(factors[["Mkt_rf", "SMB", "HML", "Mom"]].to_numpy() / 100 @ loadings.T + rng.normal(0, 0.02, (36, 2000)), index=idx)
+    weights, factor_cov = solve_mvp(df, cov_estimator="factor")
+    assert np.isclose(weights.sum(), 1.0)
+
+    # Optimality on a subset: Σw is proportional to the vector of ones
+    B, F, D = factor_cov.loadings.to_numpy(), factor_cov.factor_cov.to_numpy(), factor_cov.specific_var.to_numpy()
+    gradient = B @ (F @ (B.T @ weights.to_numpy())) + D * weights.to_numpy()
+    np.testing.assert_allclose(gradient, gradient.mean(), rtol=1e-8)
+
+@pytest.fixture
+def factor_universe(monkeypatch):
+    rng = np.random.default_rng(17)
+    idx = pd.date_range("2018-01-31", periods=60, freq="ME")
+    factors = pd.DataFrame(rng.normal(0.5, 4, (60, 5)), index=idx, columns=["Mkt_rf", "SMB", "HML", "Rf", "Mom"])
+    factors["Rf"] = 0.2
+    panel = FactorPanel(factors)
+    monkeypatch.setattr("analysis.portfolio_analyzer.get_factor_panel", lambda: panel)
+    monkeypatch.setattr("analysis.factor_covariance.get_factor_panel", lambda: panel)
+    loadings = rng.normal([1.0, 0.2, 0.0, 0.1], 0.5, size=(15, 4))
+    data = factors[["Mkt_rf", "SMB", "HML", "Mom"]].to_numpy() / 100 @ loadings.T + rng.normal(0, 0.02, (60, 15))
+    return pd.DataFrame(data, index=idx, columns=[f"S{i}" for i in range(15)])
+
+def test_mvp_factor_targets_are_met(factor_universe):
+    targets = {"HML": 0.3, "SMB": 0.0}
+    weights = calculate_mvp_weights(factor_universe, factor_targets=targets)
+    assert np.isclose(weights.sum(), 1.0)
+    betas = get_asset_factor_betas(factor_universe)
+    assert list(betas.columns) == ["Mkt_rf", "SMB", "HML", "Mom"]
+    np.testing.assert_allclose(weights @ betas[["HML", "SMB"]], [0.3, 0.0], atol=1e-10)
+
+    # The regression of the resulting portfolio has the targeted betas
+    portfolio_returns = calculate_mvp_portfolio(factor_universe, factor_targets=targets)
+    portfolio_betas = get_asset_factor_betas(portfolio_returns.to_frame("MVP")).loc["MVP"]
+    assert portfolio_betas["HML"] == pytest.approx(0.3)
+    assert portfolio_betas["SMB"] == pytest.approx(0.0, abs=1e-10)
+
+def test_mvp_factor_targets_match_reference_solver(factor_universe):
+    weights = calculate_mvp_weights(factor_universe, factor_targets={"Mom": -0.2})
+    cov = factor_universe.cov().to_numpy()
+    mom = get_asset_factor_betas(factor_universe)["Mom"].to_numpy()
+    reference = optimize.minimize(lambda w: w @ cov @ w, np.full(15, 1 / 15), jac=lambda w: 2 * cov @ w, method="SLSQP",
+                                  constraints=[{"type": "eq", "fun": lambda w: [w.sum() - 1, w @ mom + 0.2]}],
+                                  options={"ftol": 1e-15, "maxiter": 500})
+    np.testing.assert_allclose(weights.to_numpy(), reference.x, atol=1e-5)
+
+def test_mvp_factor_targets_with_factor_covariance(factor_universe):
+    weights = calculate_mvp_weights(factor_universe, cov_estimator="factor", factor_targets={"HML": 0.0})
+    assert np.isclose(weights.sum(), 1.0)
+    assert weights @ get_asset_factor_betas(factor_universe)["HML"] == pytest.approx(0.0, abs=1e-10)
+
+def test_mvp_factor_targets_invalid(factor_universe):
+    with pytest.raises(ValueError):
+        calculate_mvp_weights(factor_universe, factor_targets={"RMW": 0.1})
+    with pytest.raises(ValueError):
+        calculate_mvp_weights(factor_universe.iloc[:, :2], factor_targets={"HML": 0.1, "SMB": 0.0})
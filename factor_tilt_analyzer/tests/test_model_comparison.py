@@ -0,0 +1,42 @@
+import pytest
+import numpy as np
+import pandas as pd
+from ..analysis.model_comparison import compare_factor_models
+from ..analysis.factor_panel import FactorPanel
+
+# ------------------ Fixtures ------------------
+
+@pytest.fixture
+def factor_data():
+    rng = np.random.default_rng(31)
+    idx = pd.date_range("2010-01-01", periods=96, freq="MS")
+    factors = pd.DataFrame(rng.normal(0, 4, (96, 5)), index=idx, columns=["Mom", "Mkt_rf", "SMB", "HML", "Rf"])
+    # Strong momentum tilt, so the Carhart model clearly improves on FF3
+    excess = factors["Mkt_rf"] + 0.8 * factors["Mom"] + rng.normal(0, 1, 96)
+    returns = (excess + factors["Rf"]) / 100
+    return FactorPanel(factors), returns
+
+# ------------------ Tests for compare_factor_models ------------------
+
+def test_compare_factor_models(factor_data):
+    panel, returns = factor_data
+    comparison = compare_factor_models(returns, factor_panel=panel)
+
+    assert list(comparison.index) == ["CAPM", "FF3", "Carhart"]
+    assert list(comparison.columns) == ["alpha", "Mkt_rf", "SMB", "HML", "Mom", "r_squared", "adj_r_squared", "f_stat", "f_pvalue", "nobs"]
+    assert np.isnan(comparison.loc["CAPM", "SMB"]) and np.isnan(comparison.loc["FF3", "Mom"])
+    assert np.isnan(comparison.loc["CAPM", "f_pvalue"])
+    assert comparison.loc["Carhart", "f_pvalue"] < 0.001
+    assert comparison.loc["Carhart", "Mom"] == pytest.approx(0.8, abs=0.1)
+    # R² never decreases for nested models
+    assert comparison["r_squared"].is_monotonic_increasing
+
+def test_compare_factor_models_too_short(factor_data):
+    panel, returns = factor_data
+    with pytest.raises(ValueError):
+        compare_factor_models(returns.iloc[:4], factor_panel=panel)
+
+def test_compare_factor_models_invalid_input(factor_data):
+    panel, _ = factor_data
+    with pytest.raises(TypeError):
+        compare_factor_models([0.01, 0.02], factor_panel=panel)
@@ -0,0 +1,131 @@
+import pytest
+import numpy as np
+import pandas as pd
+import statsmodels.api as sm
+from ..analysis.ols_engine import fit_ols, fit_ols_batch, fit_nested_ols, nested_f_test, format_ols_summary
+
+# ------------------ Fixtures ------------------
+
+@pytest.fixture
+def regression_data():
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(rng.normal(0, 4, (60, 4)), columns=["Mkt_rf", "SMB", "HML", "Mom"])
+    y = pd.Series(0.3 + X @ np.array([1.1, 0.4, -0.2, 0.1]) + rng.normal(0, 2, 60))
+    return y, X
+
+# ------------------ Parity tests against statsmodels ------------------
+
+@pytest.mark.parametrize("add_constant", [True, False])
+def test_fit_ols_matches_statsmodels(regression_data, add_constant):
+    y, X = regression_data
+    result = fit_ols(y, X, add_constant=add_constant)
+    model = sm.OLS(y, sm.add_constant(X) if add_constant else X).fit()
+
+    pd.testing.assert_series_equal(result.params, model.params, check_names=False)
+    pd.testing.assert_series_equal(result.bse, model.bse, check_names=False)
+    pd.testing.assert_series_equal(result.tvalues, model.tvalues, check_names=False)
+    assert result.rsquared == pytest.approx(model.rsquared)
+    assert result.rsquared_adj == pytest.approx(model.rsquared_adj)
+    assert result.ssr == pytest.approx(model.ssr)
+    assert result.nobs == model.nobs
+    assert result.df_resid == model.df_resid
+
+def test_fit_ols_matches_statsmodels_ill_conditioned():
+    rng = np.random.default_rng(1)
+    base = rng.normal(0, 1, 40)
+    X = np.column_stack([base, base + rng.normal(0, 1e-4, 40), rng.normal(0, 1, 40)])
+    y = X @ np.array([1.0, 2.0, -1.0]) + rng.normal(0, 0.1, 40)
+    result = fit_ols(y, X)
+    model = sm.OLS(y, sm.add_constant(X)).fit()
+    np.testing.assert_allclose(result.params.to_numpy(), model.params, rtol=1e-6)
+    np.testing.assert_allclose(result.bse.to_numpy(), model.bse, rtol=1e-6)
+
+def test_fit_ols_alpha_and_betas(regression_data):
+    y, X = regression_data
+    result = fit_ols(y, X)
+    assert result.alpha == result.params["const"]
+    assert list(result.betas.index) == ["Mkt_rf", "SMB", "HML", "Mom"]
+    assert np.isnan(fit_ols(y, X, add_constant=False).alpha)
+
+def test_fit_ols_array_names():
+    rng = np.random.default_rng(0)
+    result = fit_ols(rng.normal(size=20), rng.normal(size=(20, 2)))
+    assert list(result.params.index) == ["const", "x1", "x2"]
+
+# ------------------ Tests for fit_ols_batch ------------------
+
+def test_fit_ols_batch_matches_single_fits(regression_data):
+    y, X = regression_data
+    Y = pd.DataFrame({"A": y, "B": 2 * y - X["SMB"], "C": X["Mom"] + y.to_numpy()[::-1]})
+    batch = fit_ols_batch(Y, X)
+
+    for col in Y.columns:
+        single = fit_ols(Y[col], X)
+        pd.testing.assert_series_equal(batch.params[col], single.params, check_names=False)
+        pd.testing.assert_series_equal(batch.bse[col], single.bse, check_names=False)
+        pd.testing.assert_series_equal(batch.tvalues[col], single.tvalues, check_names=False)
+        assert batch.rsquared[col] == pytest.approx(single.rsquared)
+        assert batch.rsquared_adj[col] == pytest.approx(single.rsquared_adj)
+
+def test_fit_ols_batch_invalid_shape(regression_data):
+    y, X = regression_data
+    with pytest.raises(ValueError):
+        fit_ols_batch(y.to_numpy(), X) # One-dimensional Y
+
+# ------------------ Tests for fit_nested_ols and nested_f_test ------------------
+
+def test_fit_nested_ols_matches_statsmodels(regression_data):
+    y, X = regression_data
+    results = fit_nested_ols(y, X, [1, 3, 4])
+
+    for result, j in zip(results, [1, 3, 4]):
+        model = sm.OLS(y, sm.add_constant(X.iloc[:, :j])).fit()
+        pd.testing.assert_series_equal(result.params, model.params, check_names=False)
+        pd.testing.assert_series_equal(result.bse, model.bse, check_names=False)
+        assert result.rsquared_adj == pytest.approx(model.rsquared_adj)
+        assert result.ssr == pytest.approx(model.ssr)
+
+def test_nested_f_test_matches_statsmodels(regression_data):
+    y, X = regression_data
+    restricted, unrestricted = fit_nested_ols(y, X, [1, 4])
+    f_stat, p_value, df_num, df_denom = nested_f_test(restricted, unrestricted)
+
+    small = sm.OLS(y, sm.add_constant(X.iloc[:, :1])).fit()
+    large = sm.OLS(y, sm.add_constant(X)).fit()
+    expected_f, expected_p, expected_df = large.compare_f_test(small)
+    assert f_stat == pytest.approx(expected_f)
+    assert p_value == pytest.approx(expected_p)
+    assert df_num == expected_df and df_denom == large.df_resid
+
+    with pytest.raises(ValueError):
+        nested_f_test(unrestricted, restricted)
+
+@pytest.mark.parametrize("n_regressors", [[], [3, 1], [0, 2], [1, 5]])
+def test_fit_nested_ols_invalid_models(regression_data, n_regressors):
+    with pytest.raises(ValueError):
+        fit_nested_ols(*regression_data, n_regressors)
+
+# ------------------ Tests for invalid inputs ------------------
+
+def test_fit_ols_collinear_regressors():
+    x = np.arange(10, dtype=float)
+    with pytest.raises(ValueError):
+        fit_ols(np.arange(10, dtype=float), np.column_stack([x, 2 * x]))
+
+@pytest.mark.parametrize("y, X", [
+    (np.ones(5), np.ones((4, 2))),           # Shape mismatch
+    (np.ones(3), np.arange(6.0).reshape(3, 2)), # Not more observations than coefficients
+    (np.array([1.0, np.nan, 2.0, 3.0]), np.arange(4.0))
+])
+def test_fit_ols_invalid_shapes_and_values(y, X):
+    with pytest.raises(ValueError):
+        fit_ols(y, X)
+
+def test_fit_ols_non_numeric():
+    with pytest.raises(TypeError):
+        fit_ols(["a", "b", "c"], np.ones(3))
+
+def test_format_ols_summary(regression_data):
+    summary = format_ols_summary(fit_ols(*regression_data))
+    assert "R²" in summary
+    assert all(name in summary for name in ["const", "Mkt_rf", "SMB", "HML", "Mom"])
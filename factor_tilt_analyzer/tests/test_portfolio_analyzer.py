@@ -6,7 +6,10 @@ from ..analysis.portfolio_analyzer import (
     read_fama_french_csv,
     create_factor_dataset,
     factor_analysis_regression,
+    factor_analysis_regression_batch,
+    get_factor_panel,
     analyze_factor_exposures,
+    render_sparkline,
     interpret_exposure
 )
 
@@ -45,6 +48,21 @@ def test_read_fama_french_csv_invalid_date(tmp_path):
     with pytest.raises(ValueError):
         read_fama_french_csv(str(path), ["Val"])
 
+def test_read_fama_french_csv_cache_matches_csv(tmp_path, monkeypatch):
+    monkeypatch.setattr("data.factor_cache.factor_cache_dir", str(tmp_path / "cache"))
+    path = tmp_path / "test.csv"
+    path.write_text(",A,B\n202001,1.0,2.0\n202002,3.0,4.0")
+
+    parsed = read_fama_french_csv(str(path), ["A", "B"], use_cache=True) # Builds the cache
+    with mock.patch("factor_tilt_analyzer.analysis.portfolio_analyzer.pd.read_csv") as mock_read_csv:
+        cached = read_fama_french_csv(str(path), ["A", "B"], use_cache=True)
+        mock_read_csv.assert_not_called()
+    pd.testing.assert_frame_equal(parsed, cached)
+
+    # Renaming columns does not need a new cache entry, but the column count is still checked
+    with pytest.raises(ValueError):
+        read_fama_french_csv(str(path), ["OnlyOne"], use_cache=True)
+
 # ---------- Tests for create_factor_dataset ----------
 
 @mock.patch("factor_tilt_analyzer.analysis.portfolio_analyzer.read_fama_french_csv")
@@ -136,6 +154,96 @@ def test_factor_analysis_regression_success(mock_factors):
     assert isinstance(betas, pd.Series)
     assert all(factor in betas.index for factor in ["Mom", "Mkt_rf", "SMB", "HML"])
 
+@pytest.mark.filterwarnings("ignore::UserWarning")
+@mock.patch("factor_tilt_analyzer.analysis.portfolio_analyzer.create_factor_dataset")
+def test_factor_analysis_regression_shares_factor_panel(mock_factors):
+    rng = np.random.default_rng(0)
+    idx = pd.date_range("2020-01-01", periods=24, freq="MS")
+    factors = pd.DataFrame(rng.normal(0, 1, (24, 5)), index=idx, columns=["Mom", "Mkt_rf", "SMB", "HML", "Rf"])
+    mock_factors.return_value = factors
+    # Month-end dates are aligned with the month-start factor dates by their period
+    month_end = pd.date_range("2020-01-31", periods=24, freq="ME")
+    port = pd.Series(rng.normal(0, 0.02, 24), index=month_end)
+    market = pd.Series(rng.normal(0, 0.02, 24), index=month_end)
+
+    betas = factor_analysis_regression(port, market, log=False)
+    factor_analysis_regression(port, market, log=False)
+    assert mock_factors.call_count == 1 # Loaded once per process
+    assert get_factor_panel() is get_factor_panel()
+
+    # Same betas as a regression on the datetime-joined data
+    X = factors[["Mkt_rf", "SMB", "HML", "Mom"]].to_numpy()
+    y = port.to_numpy() * 100 - factors["Rf"].to_numpy()
+    coef = np.linalg.lstsq(np.column_stack([np.ones(24), X]), y, rcond=None)[0]
+    np.testing.assert_allclose(betas[["Mkt_rf", "SMB", "HML", "Mom"]].to_numpy(), coef[1:])
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+@mock.patch("factor_tilt_analyzer.analysis.portfolio_analyzer.logging.info")
+@mock.patch("factor_tilt_analyzer.analysis.portfolio_analyzer.create_factor_dataset")
+def test_factor_analysis_regression_summary_on_request(mock_factors, mock_log):
+    rng = np.random.default_rng(0)
+    idx = pd.date_range("2020-01-01", periods=12, freq="MS")
+    mock_factors.return_value = pd.DataFrame(rng.normal(0, 1, (12, 5)), index=idx, columns=["Mom", "Mkt_rf", "SMB", "HML", "Rf"])
+    port = pd.Series(rng.normal(0, 0.02, 12), index=idx)
+    market = pd.Series(rng.normal(0, 0.02, 12), index=idx)
+
+    with mock.patch("factor_tilt_analyzer.analysis.portfolio_analyzer.sm.OLS") as mock_sm:
+        compact = factor_analysis_regression(port, market)
+        mock_sm.assert_not_called() # The fast path does not build a statsmodels model
+    assert "OLS regression" in mock_log.call_args[0][0]
+
+    full = factor_analysis_regression(port, market, full_summary=True)
+    assert "OLS Regression Results" in mock_log.call_args[0][0]
+    pd.testing.assert_series_equal(compact, full)
+
+@mock.patch("factor_tilt_analyzer.analysis.portfolio_analyzer.create_factor_dataset")
+def test_factor_analysis_regression_duplicate_months(mock_factors):
+    idx = pd.to_datetime(["2020-01-01", "2020-01-15"] + [f"2020-{m:02d}-01" for m in range(2, 8)])
+    port = pd.Series([0.01] * 8, index=idx)
+    market = pd.Series([0.02] * 8, index=idx)
+    with pytest.raises(ValueError):
+        factor_analysis_regression(port, market)
+    mock_factors.assert_not_called()
+
+@pytest.fixture
+def random_factors():
+    rng = np.random.default_rng(3)
+    idx = pd.date_range("2020-01-01", periods=36, freq="MS")
+    return pd.DataFrame(rng.normal(0, 1, (36, 5)), index=idx, columns=["Mom", "Mkt_rf", "SMB", "HML", "Rf"])
+
+@mock.patch("factor_tilt_analyzer.analysis.portfolio_analyzer.create_factor_dataset")
+def test_factor_analysis_regression_batch_matches_single(mock_factors, random_factors):
+    mock_factors.return_value = random_factors
+    rng = np.random.default_rng(4)
+    returns_df = pd.DataFrame(rng.normal(0, 0.03, (36, 3)), index=random_factors.index, columns=["AAPL", "MSFT", "KO"])
+    returns_df.iloc[:6, 1] = np.nan # Shorter history -> separate factorization
+
+    tidy_df = factor_analysis_regression_batch(returns_df)
+    assert list(tidy_df.columns) == ["portfolio", "term", "coef", "std_err", "t_stat", "r_squared", "nobs"]
+    assert list(tidy_df["portfolio"].unique()) == ["AAPL", "MSFT", "KO"]
+    assert tidy_df.groupby("portfolio")["nobs"].first().to_dict() == {"AAPL": 36, "KO": 36, "MSFT": 30}
+
+    for ticker in returns_df.columns:
+        series = returns_df[ticker].dropna()
+        betas = factor_analysis_regression(series, series, log=False)
+        coef = tidy_df[tidy_df["portfolio"] == ticker].set_index("term")["coef"]
+        np.testing.assert_allclose(coef[betas.index].to_numpy(), betas.to_numpy())
+
+@mock.patch("factor_tilt_analyzer.analysis.portfolio_analyzer.create_factor_dataset")
+def test_factor_analysis_regression_batch_too_short(mock_factors, random_factors):
+    mock_factors.return_value = random_factors
+    returns_df = pd.DataFrame({"A": [0.01] * 36, "B": [np.nan] * 33 + [0.01] * 3}, index=random_factors.index)
+    with pytest.raises(ValueError, match="B"):
+        factor_analysis_regression_batch(returns_df)
+
+def test_factor_analysis_regression_batch_invalid_inputs():
+    with pytest.raises(TypeError):
+        factor_analysis_regression_batch(pd.Series([0.01]))
+    with pytest.raises(TypeError):
+        factor_analysis_regression_batch(pd.DataFrame({"A": [0.01]}))
+    with pytest.raises(ValueError):
+        factor_analysis_regression_batch(pd.DataFrame({"A": []}, index=pd.DatetimeIndex([])))
+
 def test_factor_analysis_regression_invalid_inputs():
     with pytest.raises(TypeError):
         factor_analysis_regression("not_series", pd.Series([0.01], index=pd.date_range("2020-01", periods=1, freq="ME")))
@@ -151,6 +259,26 @@ def test_analyze_factor_exposures_valid(capsys): # Check printing to console
     assert "Mkt_rf" in captured.out
     assert "Strong exposure" in captured.out or "Mild exposure" in captured.out
 
+def test_analyze_factor_exposures_with_history(capsys):
+    betas = pd.Series({"Mkt_rf": 1.0, "SMB": -0.2})
+    history = pd.DataFrame({"Mkt_rf": [np.nan, 0.0, 0.5, 1.0], "SMB": [np.nan, -0.2, -0.2, -0.2]})
+    analyze_factor_exposures(betas, beta_history=history)
+    captured = capsys.readouterr()
+    assert "Factor Exposure Drift" in captured.out
+    assert "▁▅█" in captured.out
+    assert "(+0.00 → +1.00)" in captured.out
+
+def test_analyze_factor_exposures_history_missing_factor():
+    with pytest.raises(ValueError):
+        analyze_factor_exposures(pd.Series({"Mkt_rf": 0.5}), beta_history=pd.DataFrame({"SMB": [0.1]}))
+    with pytest.raises(TypeError):
+        analyze_factor_exposures(pd.Series({"Mkt_rf": 0.5}), beta_history=[0.1, 0.2])
+
+def test_render_sparkline():
+    assert render_sparkline(np.array([0.0, 0.5, 1.0])) == "▁▅█"
+    assert render_sparkline(np.array([2.0, 2.0])) == "▁▁"
+    assert render_sparkline(np.array([])) == ""
+
 def test_analyze_factor_exposures_invalid_type():
     with pytest.raises(TypeError):
         analyze_factor_exposures([1, 2, 3], width=20, scale=1.0)
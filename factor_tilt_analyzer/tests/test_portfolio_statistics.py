@@ -4,6 +4,7 @@ import numpy as np
 from ..analysis.portfolio_statistics import (
     compare_portfolio_with_market_benchmark,
     calculate_portfolio_statistics,
+    calculate_portfolio_statistics_frame,
     print_portfolio_statistics
 )
 
@@ -108,3 +109,43 @@ def test_compare_with_no_overlap():
     s2 = pd.Series([0.01], index=pd.to_datetime(["2021-01-31"]))
     with pytest.raises(ValueError):
         compare_portfolio_with_market_benchmark(s1, s2)
+
+# ----------- Tests for calculate_portfolio_statistics_frame -----------
+
+@pytest.fixture
+def many_portfolios():
+    rng = np.random.default_rng(4)
+    idx = pd.date_range("2015-01-01", periods=60, freq="ME")
+    return pd.DataFrame(rng.normal(0.006, 0.05, size=(60, 50)), index=idx, columns=[f"P{i}" for i in range(50)])
+
+@pytest.mark.parametrize("interval", ["daily", "monthly", "yearly"])
+def test_statistics_frame_matches_single_calls(many_portfolios, interval):
+    stats_df = calculate_portfolio_statistics_frame(many_portfolios, interval=interval)
+    assert list(stats_df.index) == list(many_portfolios.columns)
+    for name in ["P0", "P17", "P49"]:
+        expected = calculate_portfolio_statistics(many_portfolios[name], interval=interval)
+        assert list(stats_df.columns) == list(expected)
+        np.testing.assert_allclose(stats_df.loc[name].to_numpy(), np.array(list(expected.values())), rtol=1e-12)
+
+def test_statistics_frame_ndarray_input(many_portfolios):
+    stats_df = calculate_portfolio_statistics_frame(many_portfolios.to_numpy())
+    assert list(stats_df.index) == list(range(50))
+    np.testing.assert_allclose(stats_df.to_numpy(), calculate_portfolio_statistics_frame(many_portfolios).to_numpy())
+
+def test_statistics_frame_zero_volatility():
+    stats_df = calculate_portfolio_statistics_frame(pd.DataFrame({"cash": [0.0] * 12, "risky": np.linspace(-0.05, 0.05, 12)}))
+    assert np.isnan(stats_df.loc["cash", "sharpe_ratio"])
+    assert stats_df.loc["cash", "max_drawdown"] == 0
+    assert stats_df.loc["risky", "max_drawdown"] < 0
+
+def test_statistics_frame_invalid_inputs(many_portfolios):
+    with pytest.raises(TypeError):
+        calculate_portfolio_statistics_frame(many_portfolios["P0"])
+    with pytest.raises(TypeError):
+        calculate_portfolio_statistics_frame(many_portfolios, interval=12)
+    with pytest.raises(ValueError):
+        calculate_portfolio_statistics_frame(pd.DataFrame())
+    with pytest.raises(ValueError):
+        calculate_portfolio_statistics_frame(many_portfolios.where(many_portfolios > -0.1))
+    with pytest.raises(ValueError):
+        calculate_portfolio_statistics_frame(many_portfolios, interval="weekly")
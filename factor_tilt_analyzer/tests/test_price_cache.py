@@ -0,0 +1,255 @@
+import os
+import pytest
+import pandas as pd
+from ..data.price_cache import (
+    get_cache_path,
+    align_window,
+    get_missing_ranges,
+    fetch_cached_prices,
+    get_cached_missing_ranges,
+    update_cached_prices,
+    evict_price_cache,
+    invalidate_price_cache
+)
+
+# ------------------ Helpers ------------------
+
+class FakeDownloader:
+    """Returns monthly prices for any requested range and records the calls. Each month has a fixed price times scale,
+    so a change of scale mimics the rescaling of the adjusted history after a dividend or split."""
+
+    def __init__(self):
+        self.calls = []
+        self.scale = 1.0
+
+    def __call__(self, ticker, start, end):
+        self.calls.append((ticker, start, end))
+        idx = pd.date_range(start, end, freq="MS", inclusive="left")
+        return pd.Series([(100 + 12 * (d.year - 2020) + d.month) * self.scale for d in idx], index=idx, dtype=float, name=ticker)
+
+# ------------------ Tests for helpers ------------------
+
+def test_cache_path_is_keyed_and_portable(tmp_path):
+    path_raw = get_cache_path("^GSPC", "1mo", False, str(tmp_path))
+    path_adj = get_cache_path("^GSPC", "1mo", True, str(tmp_path))
+    assert path_raw != path_adj
+    assert "^" not in os.path.basename(path_raw)
+
+@pytest.mark.parametrize("ticker, interval", [(None, "1mo"), ("AAPL", 1)])
+def test_cache_path_invalid_type(ticker, interval, tmp_path):
+    with pytest.raises(TypeError):
+        get_cache_path(ticker, interval, False, str(tmp_path))
+
+def test_align_window_monthly():
+    start, end = align_window("2024-12-02", "2025-01-01", "1mo")
+    assert start == pd.Timestamp("2024-12-01")
+    assert end == pd.Timestamp("2025-01-01")
+
+def test_missing_ranges():
+    cached = (pd.Timestamp("2023-01-01"), pd.Timestamp("2024-01-01"))
+    assert get_missing_ranges(*cached, pd.Timestamp("2023-03-01"), pd.Timestamp("2023-09-01")) == []
+    assert get_missing_ranges(*cached, pd.Timestamp("2022-01-01"), pd.Timestamp("2025-01-01")) == [
+        (pd.Timestamp("2022-01-01"), pd.Timestamp("2023-01-01")),
+        (pd.Timestamp("2024-01-01"), pd.Timestamp("2025-01-01"))
+    ]
+    # A request after the cached window also covers the gap, so the cached window stays contiguous
+    assert get_missing_ranges(*cached, pd.Timestamp("2024-06-01"), pd.Timestamp("2025-01-01")) == [
+        (pd.Timestamp("2024-01-01"), pd.Timestamp("2025-01-01"))
+    ]
+
+# ------------------ Tests for fetch_cached_prices ------------------
+
+def test_fetch_cached_prices_hit_and_top_up(tmp_path):
+    downloader = FakeDownloader()
+    first = fetch_cached_prices("AAPL", "2023-01-01", "2024-01-01", "1mo", False, downloader, cache_dir=str(tmp_path))
+    assert len(first) == 12
+    assert len(downloader.calls) == 1
+
+    # Same window again -> served from disk without a download
+    second = fetch_cached_prices("AAPL", "2023-01-01", "2024-01-01", "1mo", False, downloader, cache_dir=str(tmp_path))
+    pd.testing.assert_series_equal(first, second)
+    assert len(downloader.calls) == 1
+
+    # Longer window -> only the missing months are downloaded, overlapping the cached history by the anchor month
+    # (and the last, possibly partial month)
+    third = fetch_cached_prices("AAPL", "2023-01-01", "2024-04-01", "1mo", False, downloader, cache_dir=str(tmp_path))
+    assert len(third) == 15
+    assert downloader.calls[-1] == ("AAPL", "2023-11-01", "2024-04-01")
+
+    # Earlier start -> the download ends with the first cached month
+    fourth = fetch_cached_prices("AAPL", "2022-10-01", "2024-04-01", "1mo", False, downloader, cache_dir=str(tmp_path))
+    assert len(fourth) == 18
+    assert downloader.calls[-1] == ("AAPL", "2022-10-01", "2023-01-02")
+    assert len(downloader.calls) == 3
+
+def test_fetch_cached_prices_rescaled_history_is_rebuilt(tmp_path):
+    downloader = FakeDownloader()
+    fetch_cached_prices("AAPL", "2023-01-01", "2024-01-01", "1mo", False, downloader, cache_dir=str(tmp_path))
+
+    # A dividend after the first download rescales all adjusted prices, so the cached prices cannot be stitched
+    downloader.scale = 0.98
+    prices = fetch_cached_prices("AAPL", "2023-01-01", "2024-04-01", "1mo", False, downloader, cache_dir=str(tmp_path))
+    assert downloader.calls[-1] == ("AAPL", "2023-01-01", "2024-04-01")
+    pd.testing.assert_series_equal(prices, downloader("AAPL", "2023-01-01", "2024-04-01"))
+
+    # The rebuilt entry covers the whole window
+    calls = len(downloader.calls)
+    fetch_cached_prices("AAPL", "2023-01-01", "2024-04-01", "1mo", False, downloader, cache_dir=str(tmp_path))
+    assert len(downloader.calls) == calls
+
+def test_fetch_cached_prices_empty_download_is_remembered(tmp_path):
+    calls = []
+    def empty_downloader(ticker, start, end):
+        calls.append(ticker)
+        return pd.Series(dtype=float, name=ticker)
+
+    # A successful download without data (e.g., before an IPO) is not repeated until the record expires
+    for _ in range(2):
+        prices = fetch_cached_prices("NEWIPO", "2023-01-01", "2024-01-01", "1mo", False, empty_downloader, cache_dir=str(tmp_path))
+        assert prices.empty
+    assert len(calls) == 1
+
+    prices = fetch_cached_prices("NEWIPO", "2023-01-01", "2024-01-01", "1mo", False, empty_downloader, cache_dir=str(tmp_path), empty_ttl=0)
+    assert prices.empty
+    assert len(calls) == 2
+
+def test_fetch_cached_prices_empty_top_up_is_remembered(tmp_path):
+    downloader = FakeDownloader()
+    fetch_cached_prices("AAPL", "2023-01-01", "2024-01-01", "1mo", False, downloader, cache_dir=str(tmp_path))
+
+    # The top-up of the later months returns no data
+    empty_calls = []
+    def empty_downloader(ticker, start, end):
+        empty_calls.append((start, end))
+        return pd.Series(dtype=float, name=ticker)
+    for _ in range(2):
+        prices = fetch_cached_prices("AAPL", "2023-01-01", "2024-04-01", "1mo", False, empty_downloader, cache_dir=str(tmp_path))
+        assert len(prices) == 12
+    assert empty_calls == [("2023-11-01", "2024-04-01")]
+
+    # The range is still missing, so it is downloaded again once the record has expired
+    prices = fetch_cached_prices("AAPL", "2023-01-01", "2024-04-01", "1mo", False, downloader, cache_dir=str(tmp_path), empty_ttl=0)
+    assert len(prices) == 15
+    assert downloader.calls[-1] == ("AAPL", "2023-11-01", "2024-04-01")
+
+def test_fetch_cached_prices_days_after_today_are_remembered(tmp_path):
+    downloader = FakeDownloader()
+    end = (pd.Timestamp.today() + pd.DateOffset(months=2)).strftime("%Y-%m-01")
+    fetch_cached_prices("AAPL", "2023-01-01", end, "1mo", False, downloader, cache_dir=str(tmp_path))
+
+    # The window ends after today, but the same request is served from the cache until the record expires
+    fetch_cached_prices("AAPL", "2023-01-01", end, "1mo", False, downloader, cache_dir=str(tmp_path))
+    assert len(downloader.calls) == 1
+    assert get_cached_missing_ranges("AAPL", "2023-01-01", end, "1mo", False, str(tmp_path)) == []
+    fetch_cached_prices("AAPL", "2023-01-01", end, "1mo", False, downloader, cache_dir=str(tmp_path), empty_ttl=0)
+    assert len(downloader.calls) == 2
+
+def test_fetch_cached_prices_persists_revisions_without_new_rows(tmp_path):
+    downloader = FakeDownloader()
+    fetch_cached_prices("AAPL", "2023-01-01", "2024-01-01", "1mo", False, downloader, cache_dir=str(tmp_path))
+
+    # The top-up has no new months, but revises the last cached month (e.g., a partial month that has since closed)
+    def revising_downloader(ticker, start, end):
+        prices = downloader(ticker, start, "2024-01-01")
+        prices.iloc[-1] += 1.0
+        return prices
+    revised = fetch_cached_prices("AAPL", "2023-01-01", "2024-02-01", "1mo", False, revising_downloader, cache_dir=str(tmp_path))
+    assert len(revised) == 12
+
+    # Both the revision and the wider covered window were written
+    def failing_downloader(ticker, start, end):
+        raise AssertionError("Unexpected download")
+    cached = fetch_cached_prices("AAPL", "2023-01-01", "2024-02-01", "1mo", False, failing_downloader, cache_dir=str(tmp_path))
+    pd.testing.assert_series_equal(cached, revised)
+
+def test_fetch_cached_prices_downloader_error_propagates(tmp_path):
+    def failing_downloader(ticker, start, end):
+        raise ConnectionError("Network error")
+
+    with pytest.raises(ConnectionError):
+        fetch_cached_prices("AAPL", "2023-01-01", "2024-01-01", "1mo", False, failing_downloader, cache_dir=str(tmp_path))
+    assert not os.path.exists(get_cache_path("AAPL", "1mo", False, str(tmp_path)))
+
+# ------------------ Tests for the bulk helpers ------------------
+
+def test_missing_ranges_and_update_for_bulk(tmp_path):
+    downloader = FakeDownloader()
+    assert get_cached_missing_ranges("AAPL", "2023-01-01", "2024-01-01", "1mo", False, str(tmp_path)) == [("2023-01-01", "2024-01-01")]
+
+    new_prices = downloader("AAPL", "2023-01-01", "2024-01-01")
+    window = update_cached_prices("AAPL", "2023-01-01", "2024-01-01", "1mo", False, new_prices, cache_dir=str(tmp_path))
+    assert len(window) == 12
+    assert get_cached_missing_ranges("AAPL", "2023-01-01", "2024-01-01", "1mo", False, str(tmp_path)) == []
+    assert get_cached_missing_ranges("AAPL", "2022-06-01", "2024-01-01", "1mo", False, str(tmp_path)) == [("2022-06-01", "2023-01-02")]
+
+def test_update_cached_prices_rescaled_history_returns_none(tmp_path):
+    downloader = FakeDownloader()
+    update_cached_prices("AAPL", "2023-01-01", "2024-01-01", "1mo", False, downloader("AAPL", "2023-01-01", "2024-01-01"), cache_dir=str(tmp_path))
+    ranges = get_cached_missing_ranges("AAPL", "2023-01-01", "2024-04-01", "1mo", False, str(tmp_path))
+    assert ranges == [("2023-11-01", "2024-04-01")]
+
+    # The bulk download overlaps the cached history and reveals the rescaling, so the entry is dropped
+    downloader.scale = 0.98
+    assert update_cached_prices("AAPL", "2023-01-01", "2024-04-01", "1mo", False, downloader("AAPL", *ranges[0]), cache_dir=str(tmp_path)) is None
+    assert not os.path.exists(get_cache_path("AAPL", "1mo", False, str(tmp_path)))
+
+def test_update_cached_prices_empty_download_keeps_range_missing(tmp_path):
+    downloader = FakeDownloader()
+    update_cached_prices("AAPL", "2023-01-01", "2024-01-01", "1mo", False, downloader("AAPL", "2023-01-01", "2024-01-01"), cache_dir=str(tmp_path))
+
+    # The bulk download of the later months had no data for this ticker
+    for new_prices in (None, pd.Series(dtype=float, name="AAPL")):
+        window = update_cached_prices("AAPL", "2023-01-01", "2024-04-01", "1mo", False, new_prices, cache_dir=str(tmp_path))
+        assert len(window) == 12
+        assert get_cached_missing_ranges("AAPL", "2023-01-01", "2024-04-01", "1mo", False, str(tmp_path)) == [("2023-11-01", "2024-04-01")]
+
+    # Data for only one of two missing ranges covers only that range
+    new_prices = downloader("AAPL", "2022-10-01", "2023-01-01")
+    update_cached_prices("AAPL", "2022-10-01", "2024-04-01", "1mo", False, new_prices, cache_dir=str(tmp_path))
+    assert get_cached_missing_ranges("AAPL", "2022-10-01", "2024-04-01", "1mo", False, str(tmp_path)) == [("2023-11-01", "2024-04-01")]
+
+def test_update_cached_prices_persists_revisions_without_new_rows(tmp_path):
+    downloader = FakeDownloader()
+    update_cached_prices("AAPL", "2023-01-01", "2024-01-01", "1mo", False, downloader("AAPL", "2023-01-01", "2024-01-01"), cache_dir=str(tmp_path))
+
+    new_prices = downloader("AAPL", "2023-11-01", "2024-01-01")
+    new_prices.iloc[-1] += 1.0
+    revised = update_cached_prices("AAPL", "2023-01-01", "2024-01-01", "1mo", False, new_prices, cache_dir=str(tmp_path))
+    assert revised.iloc[-1] == new_prices.iloc[-1]
+    pd.testing.assert_series_equal(update_cached_prices("AAPL", "2023-01-01", "2024-01-01", "1mo", False, None, cache_dir=str(tmp_path)), revised)
+
+def test_update_cached_prices_new_entry_without_data(tmp_path):
+    window = update_cached_prices("AAPL", "2023-01-01", "2024-01-01", "1mo", False, None, cache_dir=str(tmp_path))
+    assert window.empty
+    assert not os.path.exists(get_cache_path("AAPL", "1mo", False, str(tmp_path)))
+
+# ------------------ Tests for eviction and invalidation ------------------
+
+def test_evict_price_cache_removes_oldest(tmp_path):
+    downloader = FakeDownloader()
+    for ticker in ["AAPL", "MSFT", "KO"]:
+        fetch_cached_prices(ticker, "2023-01-01", "2024-01-01", "1mo", False, downloader, cache_dir=str(tmp_path))
+    oldest = get_cache_path("AAPL", "1mo", False, str(tmp_path))
+    os.utime(oldest, (0, 0))
+
+    entry_size = os.path.getsize(oldest)
+    evicted = evict_price_cache(max_bytes=2 * entry_size + 100, cache_dir=str(tmp_path))
+    assert evicted == 1
+    assert not os.path.exists(oldest)
+
+def test_evict_price_cache_negative_limit(tmp_path):
+    with pytest.raises(ValueError):
+        evict_price_cache(max_bytes=-1, cache_dir=str(tmp_path))
+
+def test_invalidate_price_cache(tmp_path):
+    downloader = FakeDownloader()
+    for ticker in ["AAPL", "MSFT"]:
+        fetch_cached_prices(ticker, "2023-01-01", "2024-01-01", "1mo", False, downloader, cache_dir=str(tmp_path))
+
+    assert invalidate_price_cache("AAPL", cache_dir=str(tmp_path)) == 1
+    assert not os.path.exists(get_cache_path("AAPL", "1mo", False, str(tmp_path)))
+    assert invalidate_price_cache(cache_dir=str(tmp_path)) == 1
+
+def test_invalidate_price_cache_invalid_filter(tmp_path):
+    with pytest.raises(ValueError):
+        invalidate_price_cache(in_interval="1mo", cache_dir=str(tmp_path))
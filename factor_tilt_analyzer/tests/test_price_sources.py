@@ -0,0 +1,87 @@
+import pytest
+import numpy as np
+import pandas as pd
+from unittest.mock import patch
+from ..data.price_sources import LocalDirectoryPriceSource
+from ..data.data_fetcher import fetch_returns, fetch_benchmark_returns, get_price_source, YahooPriceSource
+
+# ------------------ Fixtures ------------------
+
+@pytest.fixture
+def daily_prices():
+    idx = pd.bdate_range("2022-01-03", "2024-12-31")
+    prices = 100 * np.cumprod(1 + np.random.default_rng(0).normal(0, 0.01, len(idx)))
+    return pd.DataFrame({"Date": idx, "Open": prices, "Adj Close": prices})
+
+@pytest.fixture
+def price_dir(tmp_path, daily_prices):
+    daily_prices.to_csv(tmp_path / "AAPL.csv", index=False)
+    daily_prices.to_csv(tmp_path / "^GSPC.csv", index=False)
+    return tmp_path
+
+# ------------------ Tests for LocalDirectoryPriceSource ------------------
+
+def test_local_csv_window_and_monthly_resampling(price_dir, daily_prices):
+    source = LocalDirectoryPriceSource(str(price_dir), file_format="csv")
+    prices = source.fetch_prices("AAPL", "2023-01-01", "2024-01-01", in_interval="1mo")
+
+    assert len(prices) == 12
+    assert prices.index[0] == pd.Timestamp("2023-01-01")
+    # Monthly observation = last daily price of the month
+    january = daily_prices[(daily_prices["Date"] >= "2023-01-01") & (daily_prices["Date"] < "2023-02-01")]
+    assert prices.iloc[0] == pytest.approx(january["Adj Close"].iloc[-1])
+
+def test_local_csv_daily_window(price_dir):
+    source = LocalDirectoryPriceSource(str(price_dir), file_format="csv", csv_chunksize=50)
+    prices = source.fetch_prices("AAPL", "2023-03-01", "2023-04-01", in_interval="1d")
+    assert prices.index.min() >= pd.Timestamp("2023-03-01")
+    assert prices.index.max() < pd.Timestamp("2023-04-01")
+
+def test_local_parquet_predicate_pushdown(tmp_path, daily_prices):
+    pytest.importorskip("pyarrow")
+    daily_prices.set_index("Date").to_parquet(tmp_path / "AAPL.parquet", row_group_size=100)
+    source = LocalDirectoryPriceSource(str(tmp_path))
+
+    prices = source.fetch_prices("AAPL", "2023-01-01", "2024-01-01", in_interval="1mo")
+    csv_source = LocalDirectoryPriceSource(str(tmp_path), file_format="csv")
+    daily_prices.to_csv(tmp_path / "AAPL.csv", index=False)
+    pd.testing.assert_series_equal(prices, csv_source.fetch_prices("AAPL", "2023-01-01", "2024-01-01", in_interval="1mo"))
+
+def test_local_missing_file_returns_empty(tmp_path):
+    source = LocalDirectoryPriceSource(str(tmp_path))
+    assert source.fetch_prices("MISSING", "2023-01-01", "2024-01-01").empty
+
+def test_local_missing_column(tmp_path):
+    pd.DataFrame({"Date": ["2023-01-02"], "Close": [1.0]}).to_csv(tmp_path / "AAPL.csv", index=False)
+    source = LocalDirectoryPriceSource(str(tmp_path))
+    with pytest.raises(KeyError):
+        source.fetch_prices("AAPL", "2023-01-01", "2024-01-01")
+
+@pytest.mark.parametrize("kwargs, error", [
+    ({"directory": 1}, TypeError),
+    ({"directory": "prices", "file_format": "xlsx"}, ValueError),
+    ({"directory": "prices", "csv_chunksize": 0}, ValueError)
+])
+def test_local_invalid_arguments(kwargs, error):
+    with pytest.raises(error):
+        LocalDirectoryPriceSource(**kwargs)
+
+# ------------------ Tests for the integration into fetch_returns ------------------
+
+@patch("factor_tilt_analyzer.data.data_fetcher.yf.download")
+def test_fetch_returns_with_local_source(mock_download, price_dir):
+    source = LocalDirectoryPriceSource(str(price_dir))
+    returns_df = fetch_returns(["AAPL"], in_period="1y", in_end="2024-01-01", source=source, use_cache=True)
+    mkt_returns_df = fetch_benchmark_returns("^GSPC", in_period="1y", in_end="2024-01-01", source=source)
+
+    assert len(returns_df) == 11 # 12 monthly prices -> 11 returns
+    assert list(mkt_returns_df.columns) == ["MKT"]
+    mock_download.assert_not_called()
+
+def test_get_price_source():
+    assert isinstance(get_price_source("yahoo"), YahooPriceSource)
+    assert get_price_source("yahoo", threadsafe=True).thread_safe
+    # Compared by name, as the application modules import the data package without the factor_tilt_analyzer prefix
+    assert type(get_price_source("local")).__name__ == "LocalDirectoryPriceSource"
+    with pytest.raises(ValueError):
+        get_price_source("bloomberg")
@@ -0,0 +1,83 @@
+import pytest
+import numpy as np
+import pandas as pd
+from ..analysis.relative_statistics import align_return_panels, calculate_relative_statistics, relative_statistics_keys
+from ..analysis.ols_engine import fit_ols
+
+# ------------------ Fixtures ------------------
+
+@pytest.fixture
+def panels():
+    rng = np.random.default_rng(40)
+    idx = pd.date_range("2016-01-31", periods=72, freq="ME")
+    benchmarks = pd.DataFrame(rng.normal(0.007, 0.045, size=(72, 3)), index=idx, columns=["^IXIC", "^GSPC", "^RUT"])
+    portfolios = pd.DataFrame({
+        "MVP": 0.6 * benchmarks["^GSPC"] + rng.normal(0.002, 0.02, 72),
+        "Growth": 1.3 * benchmarks["^IXIC"] + rng.normal(0.0, 0.03, 72)
+    }, index=idx)
+    return portfolios, benchmarks
+
+def reference_pair(p, b, factor=12):
+    active = p - b
+    up, down = b > 0, b < 0
+    downside = np.sqrt(np.mean(np.minimum(p, 0) ** 2) * factor)
+    fit = fit_ols(p.to_numpy(), b.to_numpy())
+    return {
+        "tracking_error": active.std() * np.sqrt(factor),
+        "information_ratio": active.mean() * factor / (active.std() * np.sqrt(factor)),
+        "beta": fit.params["x1"],
+        "alpha": fit.params["const"] * factor,
+        "up_capture": p[up].mean() / b[up].mean(),
+        "down_capture": p[down].mean() / b[down].mean(),
+        "sortino_ratio": p.mean() * factor / downside
+    }
+
+# ------------------ Tests ------------------
+
+def test_relative_statistics_match_pairwise_reference(panels):
+    portfolios, benchmarks = panels
+    relative_df = calculate_relative_statistics(portfolios, benchmarks)
+    assert list(relative_df.columns) == relative_statistics_keys
+    assert relative_df.index.names == ["portfolio", "benchmark"]
+    assert len(relative_df) == 6
+    for portfolio in portfolios.columns:
+        for benchmark in benchmarks.columns:
+            expected = reference_pair(portfolios[portfolio], benchmarks[benchmark])
+            for key, value in expected.items():
+                assert relative_df.loc[(portfolio, benchmark), key] == pytest.approx(value, rel=1e-10), key
+
+def test_relative_statistics_series_inputs_and_alignment(panels):
+    portfolios, benchmarks = panels
+    mvp = portfolios["MVP"].iloc[10:]
+    relative_df = calculate_relative_statistics(mvp, benchmarks["^GSPC"], interval="yearly")
+    expected = reference_pair(mvp, benchmarks["^GSPC"].iloc[10:], factor=1)
+    assert relative_df.loc[("MVP", "^GSPC"), "tracking_error"] == pytest.approx(expected["tracking_error"])
+
+def test_align_return_panels_drops_incomplete_dates(panels):
+    portfolios, benchmarks = panels
+    benchmarks = benchmarks.copy()
+    benchmarks.iloc[5, 2] = np.nan
+    aligned_portfolios, aligned_benchmarks = align_return_panels(portfolios, benchmarks)
+    assert len(aligned_portfolios) == len(aligned_benchmarks) == 71
+    assert aligned_portfolios.index.equals(aligned_benchmarks.index)
+
+def test_relative_statistics_identical_series(panels):
+    _, benchmarks = panels
+    relative_df = calculate_relative_statistics(benchmarks[["^GSPC"]], benchmarks[["^GSPC"]])
+    row = relative_df.loc[("^GSPC", "^GSPC")]
+    assert row["tracking_error"] == pytest.approx(0.0, abs=1e-12)
+    assert np.isnan(row["information_ratio"])
+    assert row["beta"] == pytest.approx(1.0)
+    assert row["up_capture"] == pytest.approx(1.0)
+    assert row["down_capture"] == pytest.approx(1.0)
+
+def test_relative_statistics_invalid_inputs(panels):
+    portfolios, benchmarks = panels
+    with pytest.raises(TypeError):
+        calculate_relative_statistics(portfolios.to_numpy(), benchmarks)
+    with pytest.raises(TypeError):
+        calculate_relative_statistics(portfolios, benchmarks, interval=12)
+    with pytest.raises(ValueError):
+        calculate_relative_statistics(portfolios, benchmarks, interval="weekly")
+    with pytest.raises(ValueError):
+        calculate_relative_statistics(portfolios.iloc[:1], benchmarks)
@@ -0,0 +1,80 @@
+import pytest
+import numpy as np
+import pandas as pd
+from ..analysis.rolling_regression import rolling_ols, rolling_factor_regression
+from ..analysis.ols_engine import fit_ols
+from ..analysis.factor_panel import FactorPanel
+
+# ------------------ Fixtures ------------------
+
+@pytest.fixture
+def regression_data():
+    rng = np.random.default_rng(7)
+    X = pd.DataFrame(rng.normal(0, 4, (48, 3)), columns=["A", "B", "C"])
+    y = pd.Series(0.5 + X @ np.array([1.0, -0.5, 0.2]) + rng.normal(0, 1, 48))
+    return y, X
+
+@pytest.fixture
+def factor_panel():
+    rng = np.random.default_rng(8)
+    idx = pd.date_range("2018-01-01", periods=60, freq="MS")
+    return FactorPanel(pd.DataFrame(rng.normal(0, 1, (60, 5)), index=idx, columns=["Mom", "Mkt_rf", "SMB", "HML", "Rf"]))
+
+# ------------------ Tests for rolling_ols ------------------
+
+def test_rolling_ols_matches_refits(regression_data):
+    y, X = regression_data
+    rolling_df = rolling_ols(y, X, window=12)
+
+    assert rolling_df.iloc[:11].drop(columns="nobs").isnull().all().all()
+    for t in [11, 20, 47]:
+        window_fit = fit_ols(y.iloc[t - 11:t + 1], X.iloc[t - 11:t + 1])
+        np.testing.assert_allclose(rolling_df.loc[t, window_fit.params.index].to_numpy(float), window_fit.params.to_numpy(), rtol=1e-8)
+        assert rolling_df.loc[t, "r_squared"] == pytest.approx(window_fit.rsquared)
+        assert rolling_df.loc[t, "nobs"] == 12
+
+def test_rolling_ols_expanding(regression_data):
+    y, X = regression_data
+    rolling_df = rolling_ols(y, X, window=None, min_periods=10)
+    assert rolling_df["const"].first_valid_index() == 9
+    full_fit = fit_ols(y, X)
+    np.testing.assert_allclose(rolling_df.iloc[-1][full_fit.params.index].to_numpy(float), full_fit.params.to_numpy(), rtol=1e-8)
+    assert rolling_df.iloc[-1]["nobs"] == 48
+
+@pytest.mark.parametrize("kwargs, error", [
+    ({"window": 3}, ValueError),                    # Not more observations than coefficients
+    ({"window": 12, "min_periods": 20}, ValueError),
+    ({"window": 12.5}, TypeError)
+])
+def test_rolling_ols_invalid_windows(regression_data, kwargs, error):
+    with pytest.raises(error):
+        rolling_ols(*regression_data, **kwargs)
+
+def test_rolling_ols_missing_values(regression_data):
+    y, X = regression_data
+    y = y.copy()
+    y.iloc[3] = np.nan
+    with pytest.raises(ValueError):
+        rolling_ols(y, X, window=12)
+
+# ------------------ Tests for rolling_factor_regression ------------------
+
+def test_rolling_factor_regression(factor_panel):
+    idx = pd.date_range("2019-01-31", periods=30, freq="ME")
+    returns = pd.Series(np.random.default_rng(9).normal(0, 0.03, 30), index=idx)
+
+    rolling_df = rolling_factor_regression(returns, window=12, factor_panel=factor_panel)
+    assert list(rolling_df.columns) == ["alpha", "Mkt_rf", "SMB", "HML", "Mom", "r_squared", "nobs"]
+    assert rolling_df.index.equals(idx)
+    assert rolling_df["Mkt_rf"].notnull().sum() == 19
+
+def test_rolling_factor_regression_no_overlap(factor_panel):
+    returns = pd.Series([0.01] * 12, index=pd.date_range("2030-01-01", periods=12, freq="MS"))
+    with pytest.raises(ValueError):
+        rolling_factor_regression(returns, window=12, factor_panel=factor_panel)
+
+def test_rolling_factor_regression_invalid_inputs(factor_panel):
+    with pytest.raises(TypeError):
+        rolling_factor_regression([0.01, 0.02], factor_panel=factor_panel)
+    with pytest.raises(ValueError):
+        rolling_factor_regression(pd.Series([], dtype=float, index=pd.DatetimeIndex([])), factor_panel=factor_panel)
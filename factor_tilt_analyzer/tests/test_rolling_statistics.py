@@ -0,0 +1,79 @@
+import pytest
+import numpy as np
+import pandas as pd
+from ..analysis.rolling_statistics import rolling_max_drawdown, rolling_portfolio_statistics
+from ..analysis.portfolio_statistics import calculate_portfolio_statistics
+
+# ------------------ Fixtures ------------------
+
+@pytest.fixture
+def returns_df():
+    rng = np.random.default_rng(12)
+    idx = pd.date_range("2015-01-31", periods=50, freq="ME")
+    return pd.DataFrame(rng.normal(0.005, 0.06, size=(50, 3)), index=idx, columns=["MVP", "MKT", "ALT"])
+
+# ------------------ Tests ------------------
+
+@pytest.mark.parametrize("window", [1, 2, 7, 12, 50])
+def test_rolling_statistics_match_full_recomputation(returns_df, window):
+    stats_df = rolling_portfolio_statistics(returns_df, window=window)
+    assert stats_df.columns.names == ["metric", "series"]
+    assert stats_df.iloc[:window - 1].isnull().all().all()
+    for t in sorted({window - 1, 20, 49} - set(range(window - 1))):
+        for series in returns_df.columns:
+            expected = calculate_portfolio_statistics(returns_df[series].iloc[t - window + 1:t + 1])
+            actual = stats_df.iloc[t].xs(series, level="series")
+            for key, value in expected.items():
+                if np.isnan(value):
+                    assert np.isnan(actual[key])
+                else:
+                    assert actual[key] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+
+def test_expanding_statistics_match_full_recomputation(returns_df):
+    stats_df = rolling_portfolio_statistics(returns_df, window=None, interval="daily")
+    assert stats_df.iloc[0].isnull().all()
+    for t in [1, 25, 49]:
+        expected = calculate_portfolio_statistics(returns_df["MKT"].iloc[:t + 1], interval="daily")
+        actual = stats_df.iloc[t].xs("MKT", level="series")
+        for key, value in expected.items():
+            assert actual[key] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+
+def test_rolling_statistics_min_periods(returns_df):
+    stats_df = rolling_portfolio_statistics(returns_df, window=12, min_periods=6)
+    assert stats_df.iloc[4].isnull().all()
+    expected = calculate_portfolio_statistics(returns_df["ALT"].iloc[:8])
+    assert stats_df.iloc[7][("max_drawdown", "ALT")] == pytest.approx(expected["max_drawdown"])
+    assert stats_df.iloc[7][("std_dev", "ALT")] == pytest.approx(expected["std_dev"])
+
+def test_rolling_max_drawdown_matches_brute_force():
+    rng = np.random.default_rng(3)
+    log_wealth = np.cumsum(rng.normal(0, 0.05, size=(200, 4)), axis=0)
+    window = 17
+    result = rolling_max_drawdown(log_wealth, window)
+    for t in range(window - 1, 200):
+        segment = log_wealth[t - window + 1:t + 1]
+        expected = np.expm1((segment - np.maximum.accumulate(segment, axis=0)).min(axis=0))
+        np.testing.assert_allclose(result[t], expected, rtol=1e-12, atol=1e-15)
+
+def test_rolling_statistics_series_input(returns_df):
+    stats_df = rolling_portfolio_statistics(returns_df["MVP"], window=12)
+    assert list(stats_df.columns.get_level_values("series").unique()) == ["MVP"]
+
+@pytest.mark.parametrize("kwargs, error", [
+    ({"window": 0}, ValueError),
+    ({"window": 5, "min_periods": 6}, ValueError),
+    ({"window": 5.0}, TypeError),
+    ({"interval": "weekly"}, ValueError),
+    ({"interval": 12}, TypeError),
+])
+def test_rolling_statistics_invalid_parameters(returns_df, kwargs, error):
+    with pytest.raises(error):
+        rolling_portfolio_statistics(returns_df, **kwargs)
+
+def test_rolling_statistics_invalid_inputs(returns_df):
+    with pytest.raises(TypeError):
+        rolling_portfolio_statistics(returns_df.to_numpy())
+    with pytest.raises(ValueError):
+        rolling_portfolio_statistics(returns_df.where(returns_df > 0))
+    with pytest.raises(ValueError):
+        rolling_portfolio_statistics(pd.DataFrame({"A": [0.1, -1.0, 0.2]}))
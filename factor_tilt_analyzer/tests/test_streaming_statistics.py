@@ -0,0 +1,80 @@
+import pytest
+import numpy as np
+import pandas as pd
+from functools import reduce
+from ..analysis.streaming_statistics import StreamingPortfolioStatistics
+from ..analysis.portfolio_statistics import calculate_portfolio_statistics
+
+# ------------------ Fixtures ------------------
+
+@pytest.fixture
+def returns():
+    rng = np.random.default_rng(9)
+    idx = pd.date_range("2010-01-31", periods=120, freq="ME")
+    return pd.Series(rng.normal(0.006, 0.05, size=120), index=idx)
+
+def assert_statistics_equal(actual, expected):
+    assert list(actual) == list(expected)
+    for key, value in expected.items():
+        if np.isnan(value):
+            assert np.isnan(actual[key]), key
+        else:
+            assert actual[key] == pytest.approx(value, rel=1e-10, abs=1e-14), key
+
+# ------------------ Tests ------------------
+
+@pytest.mark.parametrize("interval", ["daily", "monthly", "yearly"])
+def test_updates_match_batch_statistics(returns, interval):
+    accumulator = StreamingPortfolioStatistics()
+    for t, value in enumerate(returns):
+        accumulator.update(value)
+        if t in (0, 1, 59, 119):
+            assert_statistics_equal(accumulator.statistics(interval), calculate_portfolio_statistics(returns.iloc[:t + 1], interval))
+    assert len(accumulator) == 120
+
+def test_from_returns_matches_updates(returns):
+    streamed = StreamingPortfolioStatistics()
+    for value in returns:
+        streamed.update(value)
+    assert_statistics_equal(StreamingPortfolioStatistics.from_returns(returns).statistics(), streamed.statistics())
+
+def test_ordered_merge_of_shards(returns):
+    shards = [StreamingPortfolioStatistics.from_returns(returns.iloc[start:start + 17]) for start in range(0, 120, 17)]
+    merged = reduce(StreamingPortfolioStatistics.merge, shards)
+    assert len(merged) == 120
+    assert_statistics_equal(merged.statistics(), calculate_portfolio_statistics(returns))
+
+    # Tree-shaped merge (as with results from several processes) gives the same result
+    left = reduce(StreamingPortfolioStatistics.merge, shards[:3])
+    right = reduce(StreamingPortfolioStatistics.merge, shards[3:])
+    assert_statistics_equal(left.merge(right).statistics(), merged.statistics())
+
+def test_merge_drawdown_spans_shards():
+    # Peak in the first shard, trough in the second shard
+    first = StreamingPortfolioStatistics.from_returns([0.1, 0.1, -0.05])
+    second = StreamingPortfolioStatistics.from_returns([-0.2, 0.05])
+    expected = calculate_portfolio_statistics(pd.Series([0.1, 0.1, -0.05, -0.2, 0.05]))
+    assert first.merge(second).statistics()["max_drawdown"] == pytest.approx(expected["max_drawdown"])
+
+def test_merge_with_empty_accumulator(returns):
+    accumulator = StreamingPortfolioStatistics.from_returns(returns)
+    empty = StreamingPortfolioStatistics()
+    assert_statistics_equal(accumulator.merge(empty).statistics(), accumulator.statistics())
+    assert_statistics_equal(empty.merge(accumulator).statistics(), accumulator.statistics())
+
+def test_streaming_invalid_inputs():
+    accumulator = StreamingPortfolioStatistics()
+    with pytest.raises(ValueError):
+        accumulator.statistics()
+    with pytest.raises(TypeError):
+        accumulator.update("0.01")
+    with pytest.raises(ValueError):
+        accumulator.update(np.nan)
+    with pytest.raises(ValueError):
+        accumulator.update(-1.0)
+    with pytest.raises(TypeError):
+        accumulator.merge([0.01])
+    with pytest.raises(ValueError):
+        StreamingPortfolioStatistics.from_returns([0.01, np.inf])
+    with pytest.raises(ValueError):
+        accumulator.update(0.01).statistics(interval="weekly")
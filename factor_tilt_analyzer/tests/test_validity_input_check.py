@@ -1,8 +1,15 @@
+import os
 import pytest
 from unittest import mock
+import json
+import threading
+from yfinance.exceptions import YFPricesMissingError
 from ..utils.validity_input_check import (
     check_validity_tickers,
-    check_valid_ticker_with_API
+    check_valid_ticker_with_API,
+    read_validation_cache,
+    update_validation_cache,
+    clear_validation_cache
 )
 
 # -------- Tests for check_validity_tickers --------
@@ -51,6 +58,12 @@ def test_api_raises_exception(mock_check):
     tickers = ["AAPL"]
     assert check_validity_tickers(tickers) is False
 
+@mock.patch("factor_tilt_analyzer.utils.validity_input_check.check_valid_ticker_with_API")
+def test_format_check_only(mock_check):
+    assert check_validity_tickers(["AAPL", "XXXX"], check_api=False) is True
+    assert check_validity_tickers(["AAPL", "BAD!"], check_api=False) is False
+    mock_check.assert_not_called()
+
 
 # -------- Tests for check_valid_ticker_with_API --------
 
@@ -74,5 +87,116 @@ def test_check_valid_ticker_with_API_invalid(mock_ticker):
 
 @mock.patch("factor_tilt_analyzer.utils.validity_input_check.yf.Ticker")
 def test_check_valid_ticker_with_API_exception(mock_ticker):
-    mock_ticker.side_effect = Exception("Network error")
-    assert check_valid_ticker_with_API("ERROR") is False
+    # Network errors do not tell whether the ticker exists, so they are raised instead of reported as invalid
+    mock_ticker.side_effect = ConnectionError("Network error")
+    with pytest.raises(ConnectionError):
+        check_valid_ticker_with_API("ERROR")
+    with pytest.raises(ConnectionError):
+        check_valid_ticker_with_API("ERROR", probe="history")
+
+@mock.patch("factor_tilt_analyzer.utils.validity_input_check.yf.Ticker")
+def test_check_valid_ticker_with_API_info_attribute_error(mock_ticker):
+    type(mock_ticker.return_value).info = mock.PropertyMock(side_effect=AttributeError("No quote"))
+    assert check_valid_ticker_with_API("INVALID") is False
+
+@mock.patch("factor_tilt_analyzer.utils.validity_input_check.yf.Ticker")
+def test_check_valid_ticker_with_API_history_probe(mock_ticker):
+    mock_ticker.return_value.history.return_value.empty = False
+    assert check_valid_ticker_with_API("AAPL", probe="history") is True
+    mock_ticker.return_value.history.return_value.empty = True
+    assert check_valid_ticker_with_API("INVALID", probe="history") is False
+
+@mock.patch("factor_tilt_analyzer.utils.validity_input_check.yf.Ticker")
+def test_check_valid_ticker_with_API_history_probe_errors(mock_ticker):
+    # Delisted or invalid tickers raise a missing-data error, transport errors propagate
+    mock_ticker.return_value.history.side_effect = YFPricesMissingError("XXXX", "")
+    assert check_valid_ticker_with_API("XXXX", probe="history") is False
+    assert mock_ticker.return_value.history.call_args.kwargs["raise_errors"] is True
+    mock_ticker.return_value.history.side_effect = ConnectionError("Read timed out")
+    with pytest.raises(ConnectionError):
+        check_valid_ticker_with_API("AAPL", probe="history")
+
+@mock.patch("factor_tilt_analyzer.utils.validity_input_check.yf.Ticker")
+def test_check_validity_tickers_history_outage_not_cached(mock_ticker, cache_path):
+    mock_ticker.return_value.history.side_effect = ConnectionError("Read timed out")
+    assert check_validity_tickers(["AAPL", "MSFT"], use_cache=True, probe="history") is False
+    assert read_validation_cache(path=cache_path) == {}
+
+def test_check_valid_ticker_with_API_invalid_probe():
+    with pytest.raises(ValueError):
+        check_valid_ticker_with_API("AAPL", probe="quote")
+
+
+# -------- Tests for the validation cache --------
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "ticker_validity.json")
+    monkeypatch.setattr("factor_tilt_analyzer.utils.validity_input_check.validation_cache_path", path)
+    return path
+
+def test_validation_cache_ttl(tmp_path):
+    path = str(tmp_path / "cache.json")
+    update_validation_cache({"aapl": True, "BAD": False}, path=path, now=0)
+    assert read_validation_cache(path=path, now=60) == {"AAPL": True, "BAD": False}
+    # Negative results expire earlier than positive results
+    assert read_validation_cache(path=path, now=2 * 24 * 3600) == {"AAPL": True}
+    assert read_validation_cache(path=path, now=30 * 24 * 3600) == {}
+
+def test_validation_cache_corrupted_file(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not json")
+    assert read_validation_cache(path=str(path)) == {}
+
+def test_clear_validation_cache(tmp_path):
+    path = str(tmp_path / "cache.json")
+    update_validation_cache({"AAPL": True}, path=path)
+    clear_validation_cache(path=path)
+    assert read_validation_cache(path=path) == {}
+
+@mock.patch("factor_tilt_analyzer.utils.validity_input_check.check_valid_ticker_with_API")
+def test_check_validity_tickers_uses_cache(mock_check, cache_path):
+    mock_check.return_value = True
+    assert check_validity_tickers(["AAPL", "MSFT"], use_cache=True) is True
+    assert mock_check.call_count == 2
+    with open(cache_path) as f:
+        assert set(json.load(f)) == {"AAPL", "MSFT"}
+
+    # Second run is answered from the cache
+    assert check_validity_tickers(["AAPL", "MSFT"], use_cache=True) is True
+    assert mock_check.call_count == 2
+
+@mock.patch("factor_tilt_analyzer.utils.validity_input_check.check_valid_ticker_with_API")
+def test_check_validity_tickers_negative_cache(mock_check, cache_path):
+    update_validation_cache({"BAD": False}, path=cache_path)
+    assert check_validity_tickers(["AAPL", "BAD"], use_cache=True) is False
+    mock_check.assert_not_called()
+
+@mock.patch("factor_tilt_analyzer.utils.validity_input_check.check_valid_ticker_with_API")
+def test_check_validity_tickers_errors_not_cached(mock_check, cache_path):
+    mock_check.side_effect = Exception("API error")
+    assert check_validity_tickers(["AAPL"], use_cache=True) is False
+    assert read_validation_cache(path=cache_path) == {}
+
+@mock.patch("factor_tilt_analyzer.utils.validity_input_check.yf.Ticker")
+def test_check_validity_tickers_network_errors_not_cached(mock_ticker, cache_path):
+    mock_ticker.side_effect = ConnectionError("Network down")
+    for probe in ("info", "history"):
+        assert check_validity_tickers(["AAPL"], use_cache=True, probe=probe) is False
+        assert read_validation_cache(path=cache_path) == {}
+        assert not os.path.exists(cache_path)
+
+@mock.patch("factor_tilt_analyzer.utils.validity_input_check.check_valid_ticker_with_API")
+def test_check_validity_tickers_runs_in_parallel(mock_check):
+    barrier = threading.Barrier(3, timeout=5)
+    def check(ticker, probe):
+        barrier.wait() # Only passes if three checks run at the same time
+        return True
+    mock_check.side_effect = check
+    assert check_validity_tickers(["AAPL", "MSFT", "KO"], max_workers=3) is True
+
+@mock.patch("factor_tilt_analyzer.utils.validity_input_check.check_valid_ticker_with_API")
+def test_check_validity_tickers_format_check_uses_negative_cache(mock_check, cache_path):
+    update_validation_cache({"BAD": False}, path=cache_path)
+    assert check_validity_tickers(["AAPL", "BAD"], use_cache=True, check_api=False) is False
+    mock_check.assert_not_called()
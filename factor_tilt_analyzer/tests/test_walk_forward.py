@@ -0,0 +1,104 @@
+import pytest
+import numpy as np
+import pandas as pd
+from ..analysis.walk_forward import IncrementalCovarianceInverse, WalkForwardResult, walk_forward_mvp
+from ..analysis.minimum_variance_portfolio import calculate_mvp_weights
+
+# ------------------ Fixtures ------------------
+
+@pytest.fixture
+def returns_df():
+    rng = np.random.default_rng(31)
+    idx = pd.date_range("2010-01-31", periods=120, freq="ME")
+    market = rng.normal(0.008, 0.04, size=(120, 1))
+    data = market * rng.uniform(0.5, 1.5, size=6) + rng.normal(0, 0.03, size=(120, 6))
+    return pd.DataFrame(data, index=idx, columns=["AAPL", "MSFT", "KO", "WMT", "F", "INTC"])
+
+# ------------------ Tests for IncrementalCovarianceInverse ------------------
+
+def test_incremental_inverse_matches_direct(returns_df):
+    X = returns_df.to_numpy()
+    state = IncrementalCovarianceInverse(X[:20])
+    for t in range(20, 50):
+        assert state.add(X[t])
+        assert state.remove(X[t - 20])
+    expected = np.linalg.inv(np.cov(X[30:50], rowvar=False) * 19)
+    np.testing.assert_allclose(state.inverse, expected, rtol=1e-8)
+    np.testing.assert_allclose(state.mean, X[30:50].mean(axis=0), rtol=1e-12)
+    assert state.n == 20
+
+def test_incremental_inverse_rejects_singular_downdate():
+    X = np.random.default_rng(0).normal(size=(3, 2))
+    state = IncrementalCovarianceInverse(X)
+    assert not state.remove(X[0]) # Two observations cannot give an invertible 2 x 2 scatter matrix
+    assert state.n == 3
+
+def test_incremental_inverse_singular_window():
+    with pytest.raises(ValueError):
+        IncrementalCovarianceInverse(np.ones((10, 3)))
+
+# ------------------ Tests for walk_forward_mvp ------------------
+
+def test_rolling_weights_match_refits(returns_df):
+    result = walk_forward_mvp(returns_df, window=24)
+    assert isinstance(result, WalkForwardResult)
+    assert result.weights.index[0] == returns_df.index[23]
+    assert len(result.weights) == 120 - 23
+    for date in [returns_df.index[23], returns_df.index[60], returns_df.index[-1]]:
+        end = returns_df.index.get_loc(date)
+        expected = calculate_mvp_weights(returns_df.iloc[end - 23:end + 1])
+        np.testing.assert_allclose(result.weights.loc[date].to_numpy(), expected.to_numpy(), rtol=1e-8)
+
+@pytest.mark.parametrize("refresh_every", [1000, 7])
+def test_rolling_window_with_fewer_min_periods_matches_refits(returns_df, refresh_every):
+    # The window grows from min_periods to its full length before observations are dropped
+    result = walk_forward_mvp(returns_df, window=36, min_periods=12, refresh_every=refresh_every)
+    assert result.weights.index[0] == returns_df.index[11]
+    for end in [11, 20, 35, 36, 37, 80, 119]:
+        expected = calculate_mvp_weights(returns_df.iloc[max(0, end - 35):end + 1])
+        np.testing.assert_allclose(result.weights.loc[returns_df.index[end]].to_numpy(), expected.to_numpy(), rtol=1e-8)
+
+def test_expanding_weights_match_refits(returns_df):
+    result = walk_forward_mvp(returns_df, window=None, min_periods=12, refresh_every=1000)
+    expected = calculate_mvp_weights(returns_df)
+    np.testing.assert_allclose(result.weights.iloc[-1].to_numpy(), expected.to_numpy(), rtol=1e-8)
+
+def test_out_of_sample_returns_and_turnover(returns_df):
+    result = walk_forward_mvp(returns_df, window=36, rebalance_every=3)
+    assert result.returns.index[0] == returns_df.index[36]
+    assert len(result.returns) == 120 - 36
+    assert list(result.weights.index) == list(returns_df.index[35::3])
+
+    # First period after a rebalance uses the target weights estimated without that period
+    first_weights = result.weights.iloc[0]
+    assert result.returns.iloc[0] == pytest.approx(returns_df.iloc[36] @ first_weights)
+
+    # Weights drift until the next rebalance, and turnover measures the trade back to the targets
+    drifted = first_weights.to_numpy()
+    for t in (36, 37, 38):
+        r = returns_df.iloc[t].to_numpy()
+        drifted = drifted * (1 + r) / (1 + drifted @ r)
+    assert result.turnover.iloc[0] == pytest.approx(np.abs(first_weights).sum())
+    assert result.turnover.iloc[1] == pytest.approx(np.abs(result.weights.iloc[1].to_numpy() - drifted).sum())
+
+def test_refresh_does_not_change_results(returns_df):
+    frequent = walk_forward_mvp(returns_df, window=24, refresh_every=1)
+    rare = walk_forward_mvp(returns_df, window=24, refresh_every=500)
+    pd.testing.assert_frame_equal(frequent.weights, rare.weights, rtol=1e-8)
+
+@pytest.mark.parametrize("kwargs, error", [
+    ({"window": 5}, ValueError),                    # Not more periods than assets
+    ({"window": 120}, ValueError),                  # No out-of-sample period
+    ({"window": 24, "min_periods": 30}, ValueError),
+    ({"rebalance_every": 0}, ValueError),
+    ({"window": 24.0}, TypeError),
+])
+def test_walk_forward_invalid_parameters(returns_df, kwargs, error):
+    with pytest.raises(error):
+        walk_forward_mvp(returns_df, **kwargs)
+
+def test_walk_forward_invalid_inputs(returns_df):
+    with pytest.raises(TypeError):
+        walk_forward_mvp(returns_df.to_numpy())
+    with pytest.raises(ValueError):
+        walk_forward_mvp(returns_df.where(returns_df > -0.05))
@@ -0,0 +1,160 @@
+import os
+import time
+import uuid
+from contextlib import contextmanager
+
+
+def read_lock_state(lock_path: str) -> tuple[str, int, int] | None:
+    """
+    Reads the owner and the identity of a lock file (helper function).
+
+    Parameters
+    ----------
+    lock_path : str
+        Path of the lock file.
+
+    Returns
+    -------
+    tuple[str, int, int] | None
+        Owner written by file_lock() ("<pid>:<token>", empty while the owner has not written it yet), inode and
+        modification time in nanoseconds, or None if there is no lock file.
+    """
+
+    try:
+        with open(lock_path, "r") as f:
+            owner = f.read()
+        stat = os.stat(lock_path)
+    except OSError:
+        return None
+
+    return owner, stat.st_ino, stat.st_mtime_ns
+
+
+def is_process_alive(pid: int) -> bool | None:
+    """
+    Checks whether a process with the given PID is running (helper function).
+
+    Parameters
+    ----------
+    pid : int
+        Process ID.
+
+    Returns
+    -------
+    bool | None
+        Whether the process is running, or None if this cannot be determined (on Windows, os.kill() would terminate
+        the process instead of probing it).
+    """
+
+    if os.name != "posix":
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True # The process exists, but belongs to another user
+    except OSError:
+        return None
+
+    return True
+
+
+def is_lock_stale(state: tuple[str, int, int], stale_after: float) -> bool:
+    """
+    Decides whether a lock file was abandoned, i.e., it is older than stale_after seconds and its owner is not
+    known to be running (helper function). A running owner keeps its lock, however long it holds it.
+
+    Parameters
+    ----------
+    state : tuple[str, int, int]
+        Output of read_lock_state().
+    stale_after : float
+        Age in seconds after which a lock file without a running owner is considered abandoned.
+
+    Returns
+    -------
+    bool
+        True if the lock file may be removed.
+    """
+
+    owner, _, mtime_ns = state
+    if time.time() - mtime_ns / 1e9 <= stale_after:
+        return False
+    pid = owner.split(":")[0]
+
+    return not (pid.isdigit() and is_process_alive(int(pid)))
+
+
+@contextmanager
+def file_lock(lock_path: str, timeout: float = 30.0, stale_after: float = 120.0, poll_interval: float = 0.05):
+    """
+    Cross-process lock based on the atomic creation of a lock file. Works on Windows and POSIX systems
+    without additional dependencies, so several analyzer processes can safely share on-disk caches.
+
+    Parameters
+    ----------
+    lock_path : str
+        Path of the lock file. The parent directory is created if it does not exist.
+    timeout : float, optional
+        Maximum number of seconds to wait for the lock. The default is 30 seconds.
+    stale_after : float, optional
+        Age in seconds after which an existing lock file is considered abandoned and is removed, unless its owning
+        process is known to be running (see is_lock_stale()). The default is 120 seconds.
+    poll_interval : float, optional
+        Seconds to sleep between attempts to acquire the lock. The default is 0.05 seconds.
+
+    Raises
+    ------
+    TimeoutError
+        If the lock could not be acquired within the timeout.
+
+    Yields
+    ------
+    None
+        The lock is held for the duration of the with-block and released afterwards.
+    """
+
+    directory = os.path.dirname(lock_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # The token tells apart several holders of the same process (e.g., threads)
+    owner = f"{os.getpid()}:{uuid.uuid4().hex}"
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            # O_EXCL guarantees that only one process can create the lock file
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            state = read_lock_state(lock_path)
+            if state is None:
+                continue # Lock was released in the meantime
+            # Remove locks left behind by crashed processes. The lock is read again right before the removal, so a lock
+            # that another waiter removed and acquired in the meantime (new owner and inode) is kept
+            if is_lock_stale(state, stale_after):
+                if read_lock_state(lock_path) == state:
+                    try:
+                        os.remove(lock_path)
+                    except OSError:
+                        pass
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Could not acquire lock '{lock_path}' within {timeout} seconds.")
+            time.sleep(poll_interval)
+
+    try:
+        try:
+            os.write(fd, owner.encode())
+        finally:
+            os.close(fd)
+        yield
+    finally:
+        # Only remove the lock file if it is still ours, never the lock of a process that took over in the meantime
+        state = read_lock_state(lock_path)
+        if state is not None and state[0] == owner:
+            try:
+                os.remove(lock_path)
+            except OSError:
+                pass
@@ -1,14 +1,38 @@
-import yfinance as yf
+import os
 import re
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+import yfinance as yf
+from yfinance.exceptions import YFTickerMissingError
+from config import validation_cache_path, validation_cache_ttl_valid, validation_cache_ttl_invalid, validation_max_workers, ticker_validation_probe
+from utils.file_lock import file_lock
+
+# Supported ways of asking Yahoo Finance whether a ticker exists
+valid_probes = ("info", "history")
+
 
-def check_validity_tickers(tickers: list[str]) -> bool:
+def check_validity_tickers(tickers: list[str], use_cache: bool = False, max_workers: int = validation_max_workers, probe: str = ticker_validation_probe,
+                           check_api: bool = True) -> bool:
     """
     Runs a number of checks to validate the input provided by the user before the input is passed to other functions.
+    Tickers that are not answered by the validation cache are checked against the Yahoo Finance API in parallel.
 
     Parameters
     ----------
     tickers : list[str]
         List of stock tickers, in string format.
+    use_cache : bool, optional
+        If True, results of earlier runs are reused until their TTL expires (see validation_cache_* in config.py),
+        and new results are stored. The default is False.
+    max_workers : int, optional
+        Maximum number of concurrent API checks. Defaults to validation_max_workers from config.py.
+    probe : str, optional
+        API endpoint used by check_valid_ticker_with_API(). Defaults to ticker_validation_probe from config.py.
+    check_api : bool, optional
+        If False, only the format of the tickers (and the validation cache, if enabled) is checked and no API call is made.
+        Used by the single-pass pipeline, where the download itself validates the tickers (see fetch_and_validate_returns()
+        in data/concurrent_fetcher.py). The default is True.
 
     Returns
     -------
@@ -41,18 +65,32 @@ def check_validity_tickers(tickers: list[str]) -> bool:
         return False
     
     # Individual tickers must be valid:
-    # Check if Yahoo Finance has a valid record for each individual ticker by calling the API
-    for ticker in tickers:
+    # Reuse the answers of earlier runs, so only unknown tickers need an API call
+    unique_tickers = list(dict.fromkeys(tickers))
+    cached = read_validation_cache() if use_cache else {}
+    if any(cached.get(ticker.upper()) is False for ticker in unique_tickers):
+        return False
+    pending = [ticker for ticker in unique_tickers if ticker.upper() not in cached]
+    if not pending or not check_api:
+        return True
+
+    # Check if Yahoo Finance has a valid record for each remaining ticker by calling the API in parallel
+    def check(ticker: str) -> bool | None:
         try:
-            if not check_valid_ticker_with_API(ticker):
-                return False
+            return bool(check_valid_ticker_with_API(ticker, probe=probe))
         except Exception:
-            return False
+            return None # Unknown (e.g., network error), not cached
 
-    return True
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+        results = dict(zip(pending, executor.map(check, pending)))
+
+    if use_cache:
+        update_validation_cache({ticker: valid for ticker, valid in results.items() if valid is not None})
+
+    return all(results.values())
 
     
-def check_valid_ticker_with_API(ticker: str) -> bool:  
+def check_valid_ticker_with_API(ticker: str, probe: str = "info") -> bool:  
     """
     Checks whether a stock ticker is valid by querying Yahoo Finance via yfinance.
     
@@ -60,20 +98,25 @@ def check_valid_ticker_with_API(ticker: str) -> bool:
     ----------
     ticker : str
         A single stock ticker symbol.
+    probe : str, optional
+        "info" (default) requests the full quote summary of the ticker, which is one of the slowest Yahoo Finance endpoints.
+        "history" only requests the last few days of prices, which is much cheaper and equally reliable to prove that a ticker exists.
     
     Raises
     ------
     TypeError
         If input is not a string.
     ValueError
-        If input is an empty string.
+        If input is an empty string, or the probe is not supported.
     Exception
-        Yahoo Finance API will raise an AttributeError for invalid stock tickers. 
+        Errors of the API call (e.g., network errors) are raised, as they do not tell whether the ticker exists.
+        Only the missing-data errors of yfinance (invalid or delisted tickers) and the AttributeError that the "info"
+        endpoint raises for invalid stock tickers are mapped to False.
     
     Returns
     -------
     bool
-        True if ticker is valid (i.e., info is returned), False otherwise.
+        True if ticker is valid (i.e., info or prices are returned), False otherwise.
     """
     
     
@@ -82,6 +125,18 @@ def check_valid_ticker_with_API(ticker: str) -> bool:
     ticker = ticker.strip()
     if not ticker:
         raise ValueError("Ticker cannot be an empty string.")
+    if probe not in valid_probes:
+        raise ValueError(f"Unsupported probe '{probe}'. Valid options: {valid_probes}")
+        
+    if probe == "history":
+        # Cheap existence probe: invalid tickers return an empty price history
+        # With raise_errors=True, failed requests raise instead of returning an empty frame, and invalid or delisted
+        # tickers raise a YFTickerMissingError
+        try:
+            history = yf.Ticker(ticker).history(period="5d", interval="1d", raise_errors=True)
+        except YFTickerMissingError:
+            return False
+        return history is not None and not history.empty
         
     # Call the Yahoo Finance API
     # API will raise an AttributeError for invalid stock tickers
@@ -90,6 +145,111 @@ def check_valid_ticker_with_API(ticker: str) -> bool:
         # Sometimes yf.Ticker(ticker).info does not raise an error but returns an empty dict {}
         # Handle this here
         return info is not None and len(info) > 0
-    except:
+    except AttributeError:
         return False
 
+
+def read_validation_cache(path: str | None = None, now: float | None = None) -> dict[str, bool]:
+    """
+    Reads the validation results of earlier runs that have not expired yet. Valid and invalid tickers have separate
+    TTLs (validation_cache_ttl_valid and validation_cache_ttl_invalid in config.py).
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the JSON cache file. Defaults to validation_cache_path from config.py.
+    now : float, optional
+        Current time as Unix timestamp. Defaults to time.time().
+
+    Returns
+    -------
+    dict[str, bool]
+        Validity per upper-case ticker. Missing or corrupted cache files result in an empty dictionary.
+    """
+
+    path = validation_cache_path if path is None else path
+    now = time.time() if now is None else now
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(entries, dict):
+        return {}
+
+    results = {}
+    for ticker, entry in entries.items():
+        try:
+            valid, checked_at = bool(entry["valid"]), float(entry["checked_at"])
+        except (TypeError, KeyError, ValueError):
+            continue
+        ttl = validation_cache_ttl_valid if valid else validation_cache_ttl_invalid
+        if now - checked_at <= ttl:
+            results[ticker] = valid
+
+    return results
+
+
+def update_validation_cache(results: dict[str, bool], path: str | None = None, now: float | None = None) -> None:
+    """
+    Stores validation results in the cache file. The file is shared by all runs and processes, so it is updated
+    under a file lock and replaced atomically.
+
+    Parameters
+    ----------
+    results : dict[str, bool]
+        Validity per ticker.
+    path : str, optional
+        Path of the JSON cache file. Defaults to validation_cache_path from config.py.
+    now : float, optional
+        Time of the check as Unix timestamp. Defaults to time.time().
+
+    Returns
+    -------
+    None
+    """
+
+    if not results:
+        return
+    path = validation_cache_path if path is None else path
+    now = time.time() if now is None else now
+
+    with file_lock(path + ".lock"):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            if not isinstance(entries, dict):
+                entries = {}
+        except (OSError, ValueError):
+            entries = {}
+
+        for ticker, valid in results.items():
+            entries[ticker.strip().upper()] = {"valid": bool(valid), "checked_at": now}
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, path)
+
+
+def clear_validation_cache(path: str | None = None) -> None:
+    """
+    Deletes all cached validation results.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the JSON cache file. Defaults to validation_cache_path from config.py.
+
+    Returns
+    -------
+    None
+    """
+
+    path = validation_cache_path if path is None else path
+    with file_lock(path + ".lock"):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass